@@ -9,9 +9,9 @@ from typing import TYPE_CHECKING
 
 from monty.json import MSONable
 
+from pymatgen.analysis.structure_index import StructureIndex
 from pymatgen.analysis.structure_matcher import ElementComparator, StructureMatcher
 from pymatgen.core import get_el_sp
-from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -189,6 +189,7 @@ class RemoveDuplicatesFilter(AbstractStructureFilter):
             self.structure_matcher = StructureMatcher.from_dict(structure_matcher)
         else:
             self.structure_matcher = structure_matcher or StructureMatcher(comparator=ElementComparator())
+        self.structure_index = StructureIndex(self.structure_matcher, symprec=symprec)
 
     def test(self, structure: Structure) -> bool:
         """
@@ -198,21 +199,10 @@ class RemoveDuplicatesFilter(AbstractStructureFilter):
         Returns:
             bool: True if structure is not in list.
         """
-        hash_comp = self.structure_matcher._comparator.get_hash(structure.composition)
-        if not self.structure_list[hash_comp]:
-            self.structure_list[hash_comp].append(structure)
-            return True
-
-        def get_spg_num(struct: Structure) -> int:
-            finder = SpacegroupAnalyzer(struct, symprec=self.symprec)  # type:ignore[arg-type]
-            return finder.get_space_group_number()
-
-        for struct in self.structure_list[hash_comp]:
-            if (self.symprec is None or get_spg_num(struct) == get_spg_num(structure)) and self.structure_matcher.fit(
-                struct, structure
-            ):
-                return False
+        if self.structure_index.add(structure, skip_duplicates=True) is None:
+            return False
 
+        hash_comp = self.structure_matcher._comparator.get_hash(structure.composition)
         self.structure_list[hash_comp].append(structure)
         return True
 
@@ -222,7 +212,7 @@ class RemoveExistingFilter(AbstractStructureFilter):
 
     def __init__(
         self,
-        existing_structures: list[Structure],
+        existing_structures: list[Structure] | StructureIndex,
         structure_matcher: dict | StructureMatcher | None = None,
         symprec: float | None = None,
     ) -> None:
@@ -230,7 +220,9 @@ class RemoveExistingFilter(AbstractStructureFilter):
         and symmetry (if symprec is given).
 
         Args:
-            existing_structures (list[Structure]): Existing structures to compare with.
+            existing_structures (list[Structure] | StructureIndex): Existing structures
+                to compare with. If a StructureIndex (e.g. loaded from disk) is given,
+                its structure matcher and symprec are used instead of the arguments below.
             structure_matcher (dict | StructureMatcher, optional): Will be used for
                 structure comparison.
             symprec (float | None): The precision in the symmetry finder algorithm.
@@ -240,28 +232,26 @@ class RemoveExistingFilter(AbstractStructureFilter):
         self.symprec = symprec
         self.structure_list: list = []
         self.existing_structures = existing_structures
-        if isinstance(structure_matcher, dict):
-            self.structure_matcher = StructureMatcher.from_dict(structure_matcher)
+        if isinstance(existing_structures, StructureIndex):
+            self.structure_matcher = existing_structures.structure_matcher
+            self.symprec = existing_structures.symprec
+            self._existing_index: StructureIndex | None = existing_structures
         else:
-            self.structure_matcher = structure_matcher or StructureMatcher(comparator=ElementComparator())
+            if isinstance(structure_matcher, dict):
+                self.structure_matcher = StructureMatcher.from_dict(structure_matcher)
+            else:
+                self.structure_matcher = structure_matcher or StructureMatcher(comparator=ElementComparator())
+            self._existing_index = None
 
     def test(self, structure: Structure):
         """True if structure is not in existing list."""
+        # The existing structures are only indexed on the first test
+        if self._existing_index is None:
+            self._existing_index = StructureIndex(self.structure_matcher, symprec=self.symprec)
+            self._existing_index.add_structures(self.existing_structures)  # type: ignore[arg-type]
 
-        def get_sg(s):
-            finder = SpacegroupAnalyzer(s, symprec=self.symprec)
-            return finder.get_space_group_number()
-
-        for struct in self.existing_structures:
-            if (
-                (
-                    self.structure_matcher._comparator.get_hash(structure.composition)
-                    == self.structure_matcher._comparator.get_hash(struct.composition)
-                    and self.symprec is None
-                )
-                or get_sg(struct) == get_sg(structure)
-            ) and self.structure_matcher.fit(struct, structure):
-                return False
+        if self._existing_index.find_match(structure) is not None:
+            return False
 
         self.structure_list.append(structure)
         return True
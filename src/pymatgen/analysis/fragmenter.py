@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import copy
+from collections import Counter
 from typing import TYPE_CHECKING
 
+import networkx as nx
+import networkx.algorithms.isomorphism as iso
 from monty.json import MSONable
 
 from pymatgen.analysis.graphs import MoleculeGraph, MolGraphSplitError
 from pymatgen.analysis.local_env import OpenBabelNN, metal_edge_extender
 from pymatgen.io.babel import BabelMolAdaptor
+from pymatgen.util.graph_hashing import hash_label, neighborhood_aggregate
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pymatgen.core.structure import Molecule
 
 __author__ = "Samuel Blau"
@@ -23,6 +29,235 @@ __status__ = "Beta"
 __date__ = "8/21/19"
 
 
+class FragmentRegistry(MSONable):
+    """Registry of unique molecule fragments indexed by Weisfeiler-Lehman graph hash.
+
+    Fragments are hashed with the same labels as
+    pymatgen.util.graph_hashing.weisfeiler_lehman_graph_hash (species as node labels,
+    including their oxidation states),
+    so a lookup only runs a full isomorphism check against the fragments that share
+    a hash. When a fragment is obtained by breaking a bond of a parent fragment, its
+    node labels are derived from the parent's, recomputing only the labels of atoms
+    close enough to the broken bond to be affected.
+
+    A registry can be shared by several Fragmenter runs so that the fragments found
+    for one molecule are not searched again for the next, and it can be saved and
+    reloaded with monty's dumpfn and loadfn.
+    """
+
+    def __init__(self, fragments: dict[str, list[MoleculeGraph]] | None = None, iterations: int = 3) -> None:
+        """
+        Args:
+            fragments (dict): Unique fragments as lists of MoleculeGraphs keyed by their
+                Weisfeiler-Lehman hash, e.g. from a previously saved registry. Defaults to None.
+            iterations (int): Number of Weisfeiler-Lehman neighbor aggregations used for
+                hashing. Defaults to 3.
+        """
+        self.fragments = fragments or {}
+        self.iterations = iterations
+        # Node labels and labelled graphs of registered fragments, keyed by the hash and
+        # position of the fragment in self.fragments
+        self._node_labels: dict[tuple[str, int], list[dict[int, str]]] = {}
+        self._labelled_graphs: dict[tuple[str, int], nx.Graph | None] = {}
+
+    def __len__(self) -> int:
+        return sum(len(frags) for frags in self.fragments.values())
+
+    def __iter__(self) -> Iterator[MoleculeGraph]:
+        for frags in self.fragments.values():
+            yield from frags
+
+    def get_node_labels(self, mol_graph: MoleculeGraph) -> list[dict[int, str]]:
+        """Get the Weisfeiler-Lehman node labels of a molecule graph.
+
+        Args:
+            mol_graph (MoleculeGraph): The molecule graph.
+
+        Returns:
+            list[dict[int, str]]: Node labels for the initial species labels and for
+                each of the self.iterations aggregations.
+        """
+        graph = nx.Graph(mol_graph.graph.to_undirected())
+        return self._update_node_labels(graph, mol_graph, None, set(graph))
+
+    def get_fragment_node_labels(
+        self,
+        mol_graph: MoleculeGraph,
+        bond: tuple[int, int],
+        fragments: list[MoleculeGraph],
+        index_map: dict[int, int],
+        node_labels: list[dict[int, str]] | None = None,
+        graph: nx.Graph | None = None,
+    ) -> list[list[dict[int, str]]]:
+        """Get the Weisfeiler-Lehman node labels of the fragments obtained by breaking a
+        bond, starting from the node labels of the parent molecule graph.
+
+        Args:
+            mol_graph (MoleculeGraph): The parent molecule graph.
+            bond (tuple[int, int]): The broken bond, as indices in mol_graph.
+            fragments (list[MoleculeGraph]): The fragments returned by
+                mol_graph.split_molecule_subgraphs([bond], return_index_map=True).
+            index_map (dict[int, int]): The index map returned alongside the fragments.
+            node_labels (list[dict[int, str]]): The node labels of mol_graph. Defaults to
+                None, in which case they are computed with get_node_labels.
+            graph (nx.Graph): The undirected simple graph of mol_graph, i.e.
+                nx.Graph(mol_graph.graph.to_undirected()), to build it once for all the
+                bonds of mol_graph. The bond is removed while the labels are updated and
+                restored afterwards. Defaults to None, in which case it is built here.
+
+        Returns:
+            list[list[dict[int, str]]]: The node labels of each fragment.
+        """
+        if node_labels is None:
+            node_labels = self.get_node_labels(mol_graph)
+        if graph is None:
+            graph = nx.Graph(mol_graph.graph.to_undirected())
+        edge_data = graph.edges[bond]
+        graph.remove_edge(*bond)
+        try:
+            # Labels only change within `iterations` bonds of the broken bond
+            split_labels = self._update_node_labels(graph, mol_graph, node_labels, set(bond))
+        finally:
+            graph.add_edge(*bond, **edge_data)
+
+        frag_node_labels = []
+        offset = 0
+        for fragment in fragments:
+            old_indices = [index_map[offset + idx] for idx in range(len(fragment.molecule))]
+            offset += len(fragment.molecule)
+            frag_node_labels.append(
+                [{idx: labels[old_idx] for idx, old_idx in enumerate(old_indices)} for labels in split_labels]
+            )
+        return frag_node_labels
+
+    def _update_node_labels(
+        self,
+        graph: nx.Graph,
+        mol_graph: MoleculeGraph,
+        node_labels: list[dict[int, str]] | None,
+        changed: set[int],
+    ) -> list[dict[int, str]]:
+        """Recompute the node labels of the changed nodes and of the nodes they affect,
+        reusing node_labels for all other nodes.
+        """
+        new_labels = [{idx: str(mol_graph.molecule[idx].specie) for idx in graph}]
+        stale: set[int] = set()
+        for iteration in range(1, self.iterations + 1):
+            stale |= changed | {nbr for node in stale for nbr in graph.neighbors(node)}
+            labels = {} if node_labels is None else dict(node_labels[iteration])
+            for node in stale:
+                labels[node] = hash_label(neighborhood_aggregate(graph, node, new_labels[-1]), 16)
+            new_labels.append(labels)
+        return new_labels
+
+    def get_hash(self, mol_graph: MoleculeGraph, node_labels: list[dict[int, str]] | None = None) -> str:
+        """Get the Weisfeiler-Lehman hash of a molecule graph.
+
+        Args:
+            mol_graph (MoleculeGraph): The molecule graph.
+            node_labels (list[dict[int, str]]): Precomputed node labels of mol_graph.
+                Defaults to None.
+
+        Returns:
+            str: Hash identical to weisfeiler_lehman_graph_hash of the undirected graph
+                with str(specie) of each site as node labels and the same number of
+                iterations.
+        """
+        if node_labels is None:
+            node_labels = self.get_node_labels(mol_graph)
+        subgraph_hash_counts = []
+        for labels in node_labels[1:]:
+            subgraph_hash_counts.extend(sorted(Counter(labels.values()).items(), key=lambda x: x[0]))
+        return hash_label(str(tuple(subgraph_hash_counts)), 16)
+
+    def find(self, mol_graph: MoleculeGraph, node_labels: list[dict[int, str]] | None = None) -> MoleculeGraph | None:
+        """Find a registered fragment isomorphic to a molecule graph.
+
+        Args:
+            mol_graph (MoleculeGraph): The molecule graph to look up.
+            node_labels (list[dict[int, str]]): Precomputed node labels of mol_graph.
+                Defaults to None.
+
+        Returns:
+            MoleculeGraph | None: The registered fragment, or None if there is none.
+        """
+        if not self.fragments:
+            return None
+        if node_labels is None:
+            node_labels = self.get_node_labels(mol_graph)
+        return self._find(mol_graph, node_labels, self.get_hash(mol_graph, node_labels))
+
+    def add(self, mol_graph: MoleculeGraph, node_labels: list[dict[int, str]] | None = None) -> bool:
+        """Register a fragment unless an isomorphic one is already registered.
+
+        Args:
+            mol_graph (MoleculeGraph): The fragment to register.
+            node_labels (list[dict[int, str]]): Precomputed node labels of mol_graph.
+                Defaults to None.
+
+        Returns:
+            bool: Whether the fragment was new.
+        """
+        if node_labels is None:
+            node_labels = self.get_node_labels(mol_graph)
+        frag_hash = self.get_hash(mol_graph, node_labels)
+        if self._find(mol_graph, node_labels, frag_hash) is not None:
+            return False
+        fragments = self.fragments.setdefault(frag_hash, [])
+        self._node_labels[frag_hash, len(fragments)] = node_labels
+        fragments.append(mol_graph)
+        return True
+
+    def _find(
+        self,
+        mol_graph: MoleculeGraph,
+        node_labels: list[dict[int, str]],
+        frag_hash: str,
+    ) -> MoleculeGraph | None:
+        """Find a registered fragment with the given hash that is isomorphic to mol_graph."""
+        fragments = self.fragments.get(frag_hash, [])
+        if not fragments:
+            return None
+        graph = self._get_labelled_graph(mol_graph, node_labels)
+        for idx, fragment in enumerate(fragments):
+            key = (frag_hash, idx)
+            if key not in self._labelled_graphs:
+                if key not in self._node_labels:
+                    self._node_labels[key] = self.get_node_labels(fragment)
+                self._labelled_graphs[key] = self._get_labelled_graph(fragment, self._node_labels[key])
+            frag_graph = self._labelled_graphs[key]
+            if graph is None or frag_graph is None:
+                if fragment.isomorphic_to(mol_graph):
+                    return fragment
+            # Isomorphisms preserve Weisfeiler-Lehman labels, so only equally labelled atoms need to be matched
+            elif nx.is_isomorphic(graph, frag_graph, node_match=iso.categorical_node_match("label", None)):
+                return fragment
+        return None
+
+    @staticmethod
+    def _get_labelled_graph(mol_graph: MoleculeGraph, node_labels: list[dict[int, str]]) -> nx.Graph | None:
+        """Get a simple undirected graph of mol_graph with its final node labels as "label"
+        node attributes, or None if mol_graph has parallel edges.
+        """
+        graph = nx.Graph()
+        graph.add_nodes_from((idx, {"label": label}) for idx, label in node_labels[-1].items())
+        graph.add_edges_from(mol_graph.graph.edges())
+        return graph if len(graph.edges) == len(mol_graph.graph.edges) else None
+
+    def get_unique_frag_dict(self) -> dict[str, list[MoleculeGraph]]:
+        """Get the registered fragments in the format of Fragmenter.unique_frag_dict.
+
+        Returns:
+            dict[str, list[MoleculeGraph]]: Fragments keyed by alphabetical formula and
+                number of edges.
+        """
+        unique_frag_dict: dict[str, list[MoleculeGraph]] = {}
+        for fragment in self:
+            alph_formula = fragment.molecule.composition.alphabetical_formula
+            unique_frag_dict.setdefault(f"{alph_formula} E{len(fragment.graph.edges())}", []).append(fragment)
+        return unique_frag_dict
+
+
 class Fragmenter(MSONable):
     """Molecule fragmenter class."""
 
@@ -36,6 +271,7 @@ class Fragmenter(MSONable):
         opt_steps: int = 10000,
         prev_unique_frag_dict: dict | None = None,
         assume_previous_thoroughness: bool = True,
+        registry: FragmentRegistry | None = None,
     ):
         """Standard constructor for molecule fragmentation.
 
@@ -70,6 +306,10 @@ class Fragmenter(MSONable):
                 of a different molecule that you aim to find all possible subfragments of and which has
                 common subfragments with the previous molecule, this optimization will cause you to
                 miss some unique subfragments.
+            registry (FragmentRegistry): A registry of previously identified unique fragments, which
+                is treated like prev_unique_frag_dict and extended with the new unique fragments found
+                for the given molecule. Share one registry between Fragmenters to fragment a set of
+                molecules, and save it with dumpfn to reuse it later. Defaults to None.
         """
         self.assume_previous_thoroughness = assume_previous_thoroughness
         self.open_rings = open_rings
@@ -84,9 +324,18 @@ class Fragmenter(MSONable):
         if ("Li" in molecule.composition or "Mg" in molecule.composition) and use_metal_edge_extender:
             self.mol_graph = metal_edge_extender(self.mol_graph)
 
-        self.prev_unique_frag_dict = prev_unique_frag_dict or {}
+        self.registry = FragmentRegistry() if registry is None else registry
+        for prev_frags in (prev_unique_frag_dict or {}).values():
+            for prev_frag in prev_frags:
+                self.registry.add(prev_frag)
+        # fragments found for the given molecule, used for hash-indexed duplicate checks
+        self._frag_registry = FragmentRegistry(iterations=self.registry.iterations)
+
+        self.prev_unique_frag_dict = self.registry.get_unique_frag_dict()
         self.new_unique_frag_dict = {}  # new fragments from the given molecule not contained in prev_unique_frag_dict
         self.all_unique_frag_dict = {}  # all fragments from just the given molecule
+        # node labels of the fragments in all_unique_frag_dict found by iterative fragmentation
+        self._all_unique_node_labels: dict[str, list[list[dict[int, str]]]] = {}
         self.unique_frag_dict = {}  # all fragments from both the given molecule and prev_unique_frag_dict
 
         if depth == 0:  # Non-iterative, find all possible fragments:
@@ -100,13 +349,15 @@ class Fragmenter(MSONable):
 
         else:  # Iterative fragment generation:
             self.fragments_by_level = {}
+            # Node labels of the fragments of the last level, in the layout of fragments_by_level
+            level_node_labels: dict[str, list[list[dict[int, str]]]] = {}
 
             # Loop through the number of levels,
             for level in range(depth):
                 # If on the first level, perform one level of fragmentation on the principle molecule graph:
                 if level == 0:
                     alph_formula = self.mol_graph.molecule.composition.alphabetical_formula
-                    self.fragments_by_level["0"] = self._fragment_one_level(
+                    self.fragments_by_level["0"], level_node_labels = self._fragment_one_level(
                         {f"{alph_formula} E{len(self.mol_graph.graph.edges())}": [self.mol_graph]}
                     )
                 else:
@@ -118,8 +369,8 @@ class Fragmenter(MSONable):
                         break
                     # If not on the first level, and there are fragments present in the previous level, then
                     # perform one level of fragmentation on all fragments present in the previous level:
-                    self.fragments_by_level[str(level)] = self._fragment_one_level(
-                        self.fragments_by_level[str(level - 1)]
+                    self.fragments_by_level[str(level)], level_node_labels = self._fragment_one_level(
+                        self.fragments_by_level[str(level - 1)], level_node_labels
                     )
 
         if self.prev_unique_frag_dict == {}:
@@ -129,17 +380,19 @@ class Fragmenter(MSONable):
                 if frag_key not in self.prev_unique_frag_dict:
                     self.new_unique_frag_dict[frag_key] = copy.deepcopy(self.all_unique_frag_dict[frag_key])
                 else:
-                    for fragment in self.all_unique_frag_dict[frag_key]:
-                        found = False
-                        for prev_frag in self.prev_unique_frag_dict[frag_key]:
-                            if fragment.isomorphic_to(prev_frag):
-                                found = True
-                        if not found:
+                    frag_node_labels = self._all_unique_node_labels.get(frag_key)
+                    for idx, fragment in enumerate(self.all_unique_frag_dict[frag_key]):
+                        node_labels = None if frag_node_labels is None else frag_node_labels[idx]
+                        if self.registry.find(fragment, node_labels) is None:
                             if frag_key not in self.new_unique_frag_dict:
                                 self.new_unique_frag_dict[frag_key] = [fragment]
                             else:
                                 self.new_unique_frag_dict[frag_key].append(fragment)
 
+        for new_frags in self.new_unique_frag_dict.values():
+            for new_frag in new_frags:
+                self.registry.add(new_frag)
+
         self.new_unique_fragments = 0
         for frag_key in self.new_unique_frag_dict:
             self.new_unique_fragments += len(self.new_unique_frag_dict[frag_key])
@@ -159,7 +412,11 @@ class Fragmenter(MSONable):
             for frag_key in self.unique_frag_dict:
                 self.total_unique_fragments += len(self.unique_frag_dict[frag_key])
 
-    def _fragment_one_level(self, old_frag_dict: dict) -> dict:
+    def _fragment_one_level(
+        self,
+        old_frag_dict: dict,
+        old_node_labels: dict[str, list[list[dict[int, str]]]] | None = None,
+    ) -> tuple[dict, dict[str, list[list[dict[int, str]]]]]:
         """
         Perform one step of iterative fragmentation on a list of molecule graphs. Loop through the graphs,
         then loop through each graph's edges and attempt to remove that edge in order to obtain two
@@ -167,48 +424,45 @@ class Fragmenter(MSONable):
         are already present in self.unique_fragments, and append them if not. If unsuccessful, we know
         that edge belongs to a ring. If we are opening rings, do so with that bond, and then again
         check if the resulting fragment is present in self.unique_fragments and add it if it is not.
+
+        The node labels of the graphs in old_frag_dict can be given in old_node_labels, in the same
+        layout. The new fragments are returned with their node labels, in that layout too.
         """
-        new_frag_dict = {}
-        for old_frags in old_frag_dict.values():
-            for old_frag in old_frags:
+        new_frag_dict: dict = {}
+        new_node_labels: dict[str, list[list[dict[int, str]]]] = {}
+        for key, old_frags in old_frag_dict.items():
+            key_node_labels = (old_node_labels or {}).get(key)
+            for idx, old_frag in enumerate(old_frags):
+                if key_node_labels is None:
+                    old_labels = self._frag_registry.get_node_labels(old_frag)
+                else:
+                    old_labels = key_node_labels[idx]
+                old_graph = nx.Graph(old_frag.graph.to_undirected())
                 for edge in old_frag.graph.edges:
                     bond = [(edge[0], edge[1])]
-                    fragments = []
+                    fragments, frag_node_labels = [], []
                     try:
-                        fragments = old_frag.split_molecule_subgraphs(bond, allow_reverse=True)
+                        fragments, index_map = old_frag.split_molecule_subgraphs(
+                            bond, allow_reverse=True, return_index_map=True
+                        )
+                        frag_node_labels = self._frag_registry.get_fragment_node_labels(
+                            old_frag, bond[0], fragments, index_map, old_labels, old_graph
+                        )
                     except MolGraphSplitError:
                         if self.open_rings:
                             fragments = [open_ring(old_frag, bond, self.opt_steps)]
-                    for fragment in fragments:
-                        alph_formula = fragment.molecule.composition.alphabetical_formula
-                        new_frag_key = f"{alph_formula} E{len(fragment.graph.edges())}"
-                        proceed = True
-                        if (
-                            self.assume_previous_thoroughness
-                            and self.prev_unique_frag_dict != {}
-                            and new_frag_key in self.prev_unique_frag_dict
-                        ):
-                            for unique_fragment in self.prev_unique_frag_dict[new_frag_key]:
-                                if unique_fragment.isomorphic_to(fragment):
-                                    proceed = False
-                                    break
-                        if proceed:
-                            if new_frag_key not in self.all_unique_frag_dict:
-                                self.all_unique_frag_dict[new_frag_key] = [fragment]
-                                new_frag_dict[new_frag_key] = [fragment]
-                            else:
-                                found = False
-                                for unique_fragment in self.all_unique_frag_dict[new_frag_key]:
-                                    if unique_fragment.isomorphic_to(fragment):
-                                        found = True
-                                        break
-                                if not found:
-                                    self.all_unique_frag_dict[new_frag_key].append(fragment)
-                                    if new_frag_key in new_frag_dict:
-                                        new_frag_dict[new_frag_key].append(fragment)
-                                    else:
-                                        new_frag_dict[new_frag_key] = [fragment]
-        return new_frag_dict
+                            frag_node_labels = [self._frag_registry.get_node_labels(fragments[0])]
+                    for fragment, node_labels in zip(fragments, frag_node_labels, strict=True):
+                        if self.assume_previous_thoroughness and self.registry.find(fragment, node_labels) is not None:
+                            continue
+                        if self._frag_registry.add(fragment, node_labels):
+                            alph_formula = fragment.molecule.composition.alphabetical_formula
+                            new_frag_key = f"{alph_formula} E{len(fragment.graph.edges())}"
+                            self.all_unique_frag_dict.setdefault(new_frag_key, []).append(fragment)
+                            self._all_unique_node_labels.setdefault(new_frag_key, []).append(node_labels)
+                            new_frag_dict.setdefault(new_frag_key, []).append(fragment)
+                            new_node_labels.setdefault(new_frag_key, []).append(node_labels)
+        return new_frag_dict, new_node_labels
 
     def _open_all_rings(self) -> None:
         """
@@ -8,7 +8,6 @@ import os.path
 import subprocess
 import warnings
 from collections import defaultdict
-from itertools import combinations
 from operator import itemgetter
 from shutil import which
 from typing import TYPE_CHECKING, NamedTuple, cast
@@ -26,6 +25,7 @@ from scipy.stats import describe
 from pymatgen.core import Lattice, Molecule, PeriodicSite, Structure
 from pymatgen.core.structure import FunctionalGroups
 from pymatgen.util.coord import lattice_points_in_supercell
+from pymatgen.util.graph_hashing import weisfeiler_lehman_graph_hash
 from pymatgen.vis.structure_vtk import EL_COLORS
 
 try:
@@ -34,7 +34,7 @@ except ImportError:
     igraph = None
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterator, Sequence
     from typing import Any
 
     from igraph import Graph
@@ -114,6 +114,44 @@ def _isomorphic(frag1: nx.Graph, frag2: nx.Graph) -> bool:
     return nx.is_isomorphic(frag1.to_undirected(), frag2.to_undirected(), node_match=nm)
 
 
+def _connected_induced_subgraphs(graph: nx.Graph, max_size: int | None = None) -> Iterator[tuple]:
+    """Enumerate the node sets of all connected induced subgraphs of a graph.
+
+    Uses the ESU algorithm (Wernicke, IEEE/ACM TCBB 3, 347 (2006)): every connected
+    set is grown one neighbor at a time from its lowest-indexed node, and only nodes
+    that are not adjacent to the current set are allowed to extend it further down,
+    so that each connected set is produced exactly once and disconnected sets are
+    never visited. The work per yielded set is polynomial in the graph size.
+
+    Args:
+        graph (nx.Graph): Graph with sortable node labels.
+        max_size (int | None): Largest number of nodes in a yielded set. Defaults to
+            None, meaning no limit.
+
+    Yields:
+        tuple: Sorted node labels of one connected induced subgraph.
+    """
+    max_size = len(graph) if max_size is None else max_size
+    adjacency = {node: set(graph.neighbors(node)) - {node} for node in graph.nodes}
+    for root in sorted(adjacency):
+        # Each stack entry is (nodes in the set, candidate extensions, set plus its neighbors)
+        stack = [((root,), sorted(nbr for nbr in adjacency[root] if nbr > root), adjacency[root] | {root})]
+        while stack:
+            nodes, extension, neighborhood = stack.pop()
+            yield tuple(sorted(nodes))
+            if len(nodes) == max_size:
+                continue
+            for idx, node in enumerate(extension):
+                exclusive = [nbr for nbr in adjacency[node] if nbr > root and nbr not in neighborhood]
+                stack.append(
+                    (
+                        (*nodes, node),
+                        extension[idx + 1 :] + sorted(exclusive),
+                        neighborhood | adjacency[node],
+                    )
+                )
+
+
 class StructureGraph(MSONable):
     """
     This is a class for annotating a Structure with bond information, stored in the form
@@ -2058,7 +2096,7 @@ class MoleculeGraph(MSONable):
             return sub_mols, dict(enumerate(new_to_old_index))
         return sub_mols
 
-    def split_molecule_subgraphs(self, bonds, allow_reverse=False, alterations=None):
+    def split_molecule_subgraphs(self, bonds, allow_reverse=False, alterations=None, return_index_map: bool = False):
         """Split MoleculeGraph into two or more MoleculeGraphs by
         breaking a set of bonds. This function uses
         MoleculeGraph.break_edge repeatedly to create
@@ -2086,6 +2124,9 @@ class MoleculeGraph(MSONable):
             allow_reverse: If allow_reverse is True, then break_edge will
                 attempt to break both (from_index, to_index) and, failing that,
                 will attempt to break (to_index, from_index).
+            return_index_map (bool): If True, also return a dictionary that maps the
+                new indices to the original indices, as in get_disconnected_fragments.
+                Defaults to False.
 
         Returns:
             list of MoleculeGraphs.
@@ -2109,43 +2150,47 @@ class MoleculeGraph(MSONable):
                 else:
                     original.alter_edge(u, v, new_edge_properties=alterations[u, v])
 
-        return original.get_disconnected_fragments()
+        return original.get_disconnected_fragments(return_index_map=return_index_map)
 
     def build_unique_fragments(self):
         """Find all possible fragment combinations of the MoleculeGraphs (in other
         words, all connected induced subgraphs).
+
+        Only connected node sets are enumerated, and fragments are compared by
+        Weisfeiler-Lehman hash first, so full isomorphism checks are only run
+        between fragments whose hashes collide.
         """
         self.set_node_attributes()
 
         graph = self.graph.to_undirected()
 
-        # find all possible fragments, aka connected induced subgraphs
-        frag_dict = {}
-        for ii in range(1, len(self.molecule)):
-            for combination in combinations(graph.nodes, ii):
-                comp = [str(self.molecule[idx].specie) for idx in combination]
-                comp = "".join(sorted(comp))
-                subgraph = nx.subgraph(graph, combination)
-                if nx.is_connected(subgraph):
-                    key = f"{comp} {len(subgraph.edges())}"
-                    if key not in frag_dict:
-                        frag_dict[key] = [copy.deepcopy(subgraph)]
-                    else:
-                        frag_dict[key].append(copy.deepcopy(subgraph))
-
-        # narrow to all unique fragments using graph isomorphism
-        unique_frag_dict = {}
-        for key, fragments in frag_dict.items():
-            unique_frags = []
-            for frag in fragments:
-                found = False
-                for fragment in unique_frags:
-                    if _isomorphic(frag, fragment):
-                        found = True
-                        break
-                if not found:
-                    unique_frags.append(frag)
-            unique_frag_dict[key] = copy.deepcopy(unique_frags)
+        # find all unique fragments, aka connected induced subgraphs, bucketed by WL hash. Each
+        # fragment is represented by its lowest node combination, as with exhaustive enumeration.
+        frag_dict: dict[str, dict[str, list[tuple[tuple, nx.Graph]]]] = {}
+        for combination in _connected_induced_subgraphs(graph, max_size=len(self.molecule) - 1):
+            comp = [str(self.molecule[idx].specie) for idx in combination]
+            comp = "".join(sorted(comp))
+            subgraph = nx.subgraph(graph, combination)
+            key = f"{comp} {len(subgraph.edges())}"
+            frag_hash = weisfeiler_lehman_graph_hash(subgraph, node_attr="specie")
+            unique_frags = frag_dict.setdefault(key, {}).setdefault(frag_hash, [])
+            for idx, (frag_combination, fragment) in enumerate(unique_frags):
+                if _isomorphic(subgraph, fragment):
+                    if combination < frag_combination:
+                        unique_frags[idx] = (combination, subgraph)
+                    break
+            else:
+                unique_frags.append((combination, subgraph))
+
+        # order fragments by size, then by their lowest node combination
+        frags_by_key = {
+            key: sorted(frag for frags in frags_by_hash.values() for frag in frags)
+            for key, frags_by_hash in frag_dict.items()
+        }
+        unique_frag_dict = {
+            key: [fragment for _, fragment in frags_by_key[key]]
+            for key in sorted(frags_by_key, key=lambda key: (len(frags_by_key[key][0][0]), frags_by_key[key][0][0]))
+        }
 
         # convert back to molecule graphs
         unique_mol_graph_dict = {}
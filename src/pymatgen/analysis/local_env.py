@@ -11,22 +11,27 @@ import os
 import warnings
 from bisect import bisect_left
 from collections import defaultdict
+from collections.abc import Sized
 from copy import deepcopy
 from functools import lru_cache
-from itertools import pairwise
+from itertools import islice, pairwise
 from typing import TYPE_CHECKING, Literal, NamedTuple, cast, get_args, overload
 
 import numpy as np
 import orjson
+from joblib import Parallel, delayed, effective_n_jobs
 from monty.dev import deprecated, requires
 from monty.serialization import loadfn
 from ruamel.yaml import YAML
 from scipy.spatial import Voronoi
+from scipy.special import lpmv
+from tqdm import tqdm
 
 from pymatgen.analysis.bond_valence import BV_PARAMS, BVAnalyzer
 from pymatgen.analysis.graphs import StructureGraph
 from pymatgen.analysis.molecule_structure_comparator import CovalentRadius
 from pymatgen.core import Element, IStructure, PeriodicNeighbor, PeriodicSite, Site, Species, Structure
+from pymatgen.util.joblib import tqdm_joblib
 
 try:
     from openbabel import openbabel
@@ -34,12 +39,15 @@ except Exception:
     openbabel = None
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from typing import Any, TypeAlias
 
+    from numpy.typing import ArrayLike, NDArray
     from typing_extensions import Self
 
     from pymatgen.analysis.graphs import MoleculeGraph
     from pymatgen.core.composition import SpeciesLike
+    from pymatgen.core.structure import NeighborArrays
 
 
 __author__ = "Shyue Ping Ong, Geoffroy Hautier, Sai Jayaraman, "
@@ -600,6 +608,55 @@ class NearNeighbors:
                 return idx
         raise ValueError("Site not found in structure")
 
+    @staticmethod
+    def _get_nn_info_from_arrays(
+        structure: Structure,
+        nn_arrays: NeighborArrays,
+        selected: NDArray[np.bool_],
+        weights: NDArray[np.float64],
+    ) -> list[list[dict[str, Any]]]:
+        """Private convenience method for get_all_nn_info, builds the NN site
+        information of all sites from the neighbor arrays of a structure.
+        PeriodicNeighbor objects are only created for the selected neighbors.
+
+        Args:
+            structure (Structure): Structure Object
+            nn_arrays (NeighborArrays): from Structure.get_all_neighbor_arrays
+            selected (NDArray): (n_neighbors,) mask of the neighbors to keep
+            weights (NDArray): (n_neighbors,) weight of each neighbor
+
+        Returns:
+            List of NN site information for each site in the structure, in the
+                same format as `get_nn_info`
+        """
+        counts = np.bincount(nn_arrays.center_indices[selected], minlength=len(nn_arrays.offsets) - 1)
+        indices = nn_arrays.indices[selected].tolist()
+        images = nn_arrays.images[selected]
+        distances = nn_arrays.distances[selected].tolist()
+        weights = weights[selected].tolist()
+        f_coords = structure.frac_coords[indices] + images
+        sites = structure.sites
+        lattice = structure.lattice
+
+        nn_info = []
+        for pindex, image, f_coord, dist, weight in zip(indices, images, f_coords, distances, weights, strict=True):
+            site = sites[pindex]
+            image = tuple(image)
+            neighbor = PeriodicNeighbor(
+                species=site.species,
+                coords=f_coord,
+                lattice=lattice,
+                properties=site.properties,
+                nn_distance=dist,
+                index=pindex,
+                image=image,
+                label=site.label,
+            )
+            nn_info.append({"site": neighbor, "image": image, "weight": weight, "site_index": pindex})
+
+        offsets = [0, *np.cumsum(counts).tolist()]
+        return [nn_info[start:end] for start, end in pairwise(offsets)]
+
     def get_bonded_structure(
         self,
         structure: Structure,
@@ -1414,6 +1471,37 @@ class MinimumDistanceNN(NearNeighbors):
                     )
         return siw
 
+    def get_all_nn_info(self, structure: Structure) -> list[list[dict[str, Any]]]:
+        """Get a listing of all neighbors for all sites in a structure.
+
+        For periodic structures, the neighbors of all sites are found in a single
+        pass and only the retained ones are turned into PeriodicNeighbor objects.
+        The neighbors of each site are the same as from `get_nn_info`, but may be
+        listed in a different order.
+
+        Args:
+            structure (Structure): Input structure
+
+        Returns:
+            List of NN site information for each site in the structure. Each
+                entry has the same format as `get_nn_info`
+        """
+        if not isinstance(structure, Structure | IStructure):
+            return super().get_all_nn_info(structure)
+
+        nn_arrays = structure.get_all_neighbor_arrays(self.cutoff)
+        distances = nn_arrays.distances
+        if self.get_all_sites:
+            return self._get_nn_info_from_arrays(structure, nn_arrays, np.ones(len(distances), dtype=bool), distances)
+
+        counts = np.diff(nn_arrays.offsets)
+        if not counts.all():
+            # Sites without neighbors raise the same error as in get_nn_info
+            return super().get_all_nn_info(structure)
+        min_dists = np.repeat(np.minimum.reduceat(distances, nn_arrays.offsets[:-1]), counts)
+        selected = distances < (1 + self.tol) * min_dists
+        return self._get_nn_info_from_arrays(structure, nn_arrays, selected, min_dists / distances)
+
 
 class OpenBabelNN(NearNeighbors):
     """
@@ -2035,6 +2123,85 @@ def get_okeeffe_distance_prediction(el1, el2):
     return r1 + r2 - r1 * r2 * math.pow(math.sqrt(c1) - math.sqrt(c2), 2) / (c1 * r1 + c2 * r2)
 
 
+def iter_all_nn_info(
+    structures: Iterable[Structure],
+    strategy: NearNeighbors,
+    n_jobs: int = 1,
+    chunk_size: int = 8,
+    verbose: bool = False,
+    on_error: Literal["ignore", "warn", "raise"] = "raise",
+) -> Iterator[list[list[dict]] | None]:
+    """Get the near neighbors of all sites in many structures with a single
+    NearNeighbors strategy, optionally in parallel.
+
+    The results are yielded in the order of the structures, so that structures can
+    be streamed from a generator. The structures are sent to the workers in chunks,
+    and the warnings raised in a worker are emitted again in the calling process,
+    once per distinct warning and structure.
+
+    Args:
+        structures (Iterable[Structure]): structures to evaluate.
+        strategy (NearNeighbors): near neighbor strategy, e.g. CrystalNN().
+        n_jobs (int): number of parallel workers, see joblib.Parallel. Defaults to 1.
+        chunk_size (int): number of structures sent to a worker at once. Defaults to 8.
+        verbose (bool): whether to show a progress bar. Defaults to False.
+        on_error ("ignore" | "warn" | "raise"): What to do when get_all_nn_info
+            raises an exception for a structure. With "ignore" and "warn", None is
+            yielded for that structure. Defaults to "raise".
+
+    Yields:
+        list[list[dict]] | None: get_all_nn_info of each structure.
+    """
+    total = len(structures) if isinstance(structures, Sized) else None
+    structures = iter(structures)
+    n_workers = effective_n_jobs(n_jobs)
+
+    def handle_result(idx, result):
+        nn_info, exc, caught = result
+        for message, category, filename, lineno in caught:
+            warnings.warn_explicit(message, category, filename, lineno)
+        if exc is not None:
+            if on_error == "raise":
+                raise exc
+            if on_error == "warn":
+                warnings.warn(f"Failed to get the near neighbors of structure {idx}: {exc!r}", stacklevel=2)
+        return nn_info
+
+    if n_workers == 1:
+        for idx, structure in enumerate(tqdm(structures, total=total, disable=not verbose)):
+            yield handle_result(idx, _get_all_nn_info_with_warnings(strategy, structure))
+        return
+
+    # Dispatch a few chunks per worker at a time, to yield the results as they come
+    idx = 0
+    with (
+        tqdm_joblib(tqdm(total=total, disable=not verbose)),
+        Parallel(n_jobs=n_jobs, batch_size=chunk_size) as parallel,
+    ):
+        while window := list(islice(structures, 4 * n_workers * chunk_size)):
+            for result in parallel(delayed(_get_all_nn_info_with_warnings)(strategy, struct) for struct in window):
+                yield handle_result(idx, result)
+                idx += 1
+
+
+def _get_all_nn_info_with_warnings(
+    strategy: NearNeighbors, structure: Structure
+) -> tuple[list[list[dict]] | None, Exception | None, list[tuple]]:
+    """Worker of iter_all_nn_info, returns the near neighbors of all sites or the
+    exception raised, and the distinct warnings raised in the meantime.
+    """
+    nn_info = exc = None
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            nn_info = strategy.get_all_nn_info(structure)
+        except Exception as error:
+            exc = error
+
+    distinct = {(type(w.message), str(w.message), w.filename, w.lineno): w for w in caught}
+    return nn_info, exc, [(w.message, w.category, w.filename, w.lineno) for w in distinct.values()]
+
+
 def get_neighbors_of_site_with_index(struct, n, approach="min_dist", delta=0.1, cutoff=10):
     """Get the neighbors of a given site using a specific neighbor-finding method.
 
@@ -2203,6 +2370,61 @@ class LocalStructOrderParams:
         "sq_face_cap_trig_pris",
     )
 
+    # Peters-style OPs, computed from the angles between pairs and triplets of neighbors
+    _PETERS_OP_TYPES: frozenset[str] = frozenset(
+        {
+            "tet",
+            "oct",
+            "bcc",
+            "sq_pyr",
+            "sq_pyr_legacy",
+            "tri_bipyr",
+            "sq_bipyr",
+            "oct_legacy",
+            "tri_plan",
+            "sq_plan",
+            "pent_plan",
+            "tri_pyr",
+            "pent_pyr",
+            "hex_pyr",
+            "pent_bipyr",
+            "hex_bipyr",
+            "T",
+            "cuboct",
+            "oct_max",
+            "tet_max",
+            "tri_plan_max",
+            "sq_plan_max",
+            "pent_plan_max",
+            "cuboct_max",
+            "bent",
+            "see_saw_rect",
+            "hex_plan_max",
+            "sq_face_cap_trig_pris",
+        }
+    )
+    _PETERS_OP_TYPES_REQUIRING_PARAMS: frozenset[str] = frozenset(
+        {
+            "bent",
+            "sq_pyr_legacy",
+            "tri_plan",
+            "tri_plan_max",
+            "tet",
+            "tet_max",
+            "T",
+            "tri_pyr",
+            "sq_pyr",
+            "pent_pyr",
+            "hex_pyr",
+            "pent_plan",
+            "pent_plan_max",
+        }
+    )
+    # OPs with contributions of neighbors at the South pole of the (j, k) frame
+    _SOUTH_POLE_OP_TYPES: frozenset[str] = frozenset(
+        {"tri_bipyr", "sq_bipyr", "pent_bipyr", "hex_bipyr", "oct_max", "sq_plan_max", "hex_plan_max", "see_saw_rect"}
+    )
+
     def __init__(
         self,
         types: list[str],
@@ -2333,38 +2555,7 @@ class LocalStructOrderParams:
         # Add here any additional flags to be used during calculation.
         if "sgl_bd" in self._types:
             self._computerijs = True
-        if not set(self._types).isdisjoint(
-            {
-                "tet",
-                "oct",
-                "bcc",
-                "sq_pyr",
-                "sq_pyr_legacy",
-                "tri_bipyr",
-                "sq_bipyr",
-                "oct_legacy",
-                "tri_plan",
-                "sq_plan",
-                "pent_plan",
-                "tri_pyr",
-                "pent_pyr",
-                "hex_pyr",
-                "pent_bipyr",
-                "hex_bipyr",
-                "T",
-                "cuboct",
-                "oct_max",
-                "tet_max",
-                "tri_plan_max",
-                "sq_plan_max",
-                "pent_plan_max",
-                "cuboct_max",
-                "bent",
-                "see_saw_rect",
-                "hex_plan_max",
-                "sq_face_cap_trig_pris",
-            }
-        ):
+        if not set(self._types).isdisjoint(self._PETERS_OP_TYPES):
             self._computerijs = self._geomops = True
         if "sq_face_cap_trig_pris" in self._types:
             self._comp_azi = True
@@ -2824,6 +3015,27 @@ class LocalStructOrderParams:
             raise ValueError("Index for getting parameters associated with order parameter calculation out-of-bounds!")
         return self._params[index]
 
+    def _get_neighbor_sites(
+        self, structure: Structure, n: int, tol: float = 0.0, target_spec: Species | None = None
+    ) -> list[Site]:
+        """Get the neighbors of site n that contribute to the order parameters,
+        see get_order_parameters.
+        """
+        centsite = structure[n]
+        if self._voroneigh:
+            vnn = VoronoiNN(tol=tol, targets=target_spec)
+            return vnn.get_nn(structure, n)
+
+        # Structure.get_sites_in_sphere --> also other periodic images
+        neighsitestmp = [idx[0] for idx in structure.get_sites_in_sphere(centsite.coords, self._cutoff)]
+        if centsite not in neighsitestmp:
+            raise ValueError("Could not find center site!")
+        neighsitestmp.remove(centsite)
+
+        if target_spec is None:
+            return list(neighsitestmp)
+        return [site for site in neighsitestmp if site.specie.symbol == target_spec]
+
     def get_order_parameters(
         self,
         structure: Structure,
@@ -2901,21 +3113,8 @@ class LocalStructOrderParams:
         centsite = structure[n]
         if indices_neighs is not None:
             neighsites = [structure[index] for index in indices_neighs]
-        elif self._voroneigh:
-            vnn = VoronoiNN(tol=tol, targets=target_spec)
-            neighsites = vnn.get_nn(structure, n)
         else:
-            # Structure.get_sites_in_sphere --> also other periodic images
-            neighsitestmp = [idx[0] for idx in structure.get_sites_in_sphere(centsite.coords, self._cutoff)]
-            neighsites = []
-            if centsite not in neighsitestmp:
-                raise ValueError("Could not find center site!")
-            neighsitestmp.remove(centsite)
-
-            if target_spec is None:
-                neighsites = list(neighsitestmp)
-            else:
-                neighsites[:] = [site for site in neighsitestmp if site.specie.symbol == target_spec]
+            neighsites = self._get_neighbor_sites(structure, n, tol, target_spec)
         n_neighbors = len(neighsites)
         self._last_nneigh = n_neighbors
 
@@ -3431,6 +3630,428 @@ class LocalStructOrderParams:
 
         return ops
 
+    def get_all_order_parameters(
+        self,
+        structure: Structure,
+        tol: float = 0.0,
+        target_spec: Species | None = None,
+    ) -> NDArray[np.float64]:
+        """
+        Compute all order parameters of all sites in a structure.
+
+        The neighbors of each site are determined as in get_order_parameters, at once
+        for all sites of periodic structures, and the order parameters are evaluated
+        with get_order_parameters_from_vectors. The neighbors may be found in a
+        different order than by get_order_parameters, which only changes "bcc" as it
+        depends on the order of the neighbors.
+
+        Args:
+            structure (Structure): input structure.
+            tol (float): threshold of weight (= solid angle / maximal solid angle)
+                to determine if a particular pair is considered neighbors; this is
+                relevant only in the case when Voronoi polyhedra are used to
+                determine coordination.
+            target_spec (Species): target species to be considered when calculating
+                the order parameters; None includes all species of input structure.
+
+        Returns:
+            NDArray: (n_sites, num_ops) order parameters of each site, see
+                get_order_parameters_from_vectors.
+        """
+        if tol < 0.0:
+            raise ValueError("Negative tolerance for weighted solid angle!")
+
+        n_sites = len(structure)
+        all_nn_info = None
+        if isinstance(structure, Structure | IStructure) and self._voroneigh:
+            try:
+                all_nn_info = VoronoiNN(tol=tol, targets=target_spec).get_all_nn_info(structure)
+            except (RuntimeError, ValueError):
+                # The tessellation of all sites at once can fail where the one of each site does not
+                pass
+
+        if not isinstance(structure, Structure | IStructure) or (self._voroneigh and all_nn_info is None):
+            all_vectors = [
+                [site.coords - structure[n].coords for site in self._get_neighbor_sites(structure, n, tol, target_spec)]
+                for n in range(n_sites)
+            ]
+            counts = [len(vectors) for vectors in all_vectors]
+            return self.get_order_parameters_from_vectors(
+                np.reshape([vec for vectors in all_vectors for vec in vectors], (-1, 3)),
+                np.cumsum([0, *counts]),
+            )
+
+        if all_nn_info is not None:
+            centers = np.repeat(np.arange(n_sites), [len(nn_info) for nn_info in all_nn_info])
+            indices = np.array([nn["site_index"] for nn_info in all_nn_info for nn in nn_info], dtype=np.intp)
+            images = np.reshape([nn["image"] for nn_info in all_nn_info for nn in nn_info], (-1, 3))
+        else:
+            nn_arrays = structure.get_all_neighbor_arrays(self._cutoff)
+            centers, indices, images = nn_arrays.center_indices, nn_arrays.indices, nn_arrays.images
+            if target_spec is not None:
+                symbols = np.array([site.specie.symbol for site in structure])
+                keep = symbols[indices] == target_spec
+                centers, indices, images = centers[keep], indices[keep], images[keep]
+
+        frac_coords = structure.frac_coords
+        vectors = structure.lattice.get_cartesian_coords(frac_coords[indices] + images - frac_coords[centers])
+        offsets = np.cumsum([0, *np.bincount(centers, minlength=n_sites)])
+        return self.get_order_parameters_from_vectors(vectors, offsets)
+
+    def get_order_parameters_from_vectors(self, vectors: ArrayLike, offsets: ArrayLike) -> NDArray[np.float64]:
+        """
+        Compute all order parameters of many sites at once from the vectors
+        pointing from each site to its neighbors.
+
+        The sites are grouped by number of neighbors, and the order parameters of
+        each group are evaluated with array operations over all pairs and triplets
+        of neighbors rather than with loops. The values are the same as from
+        get_order_parameters with the same neighbors in the same order, up to
+        round-off.
+
+        Args:
+            vectors (ArrayLike): (n_neighbors, 3) Cartesian vectors from each site
+                to its neighbors, grouped by site.
+            offsets (ArrayLike): (n_sites + 1,) start of the neighbors of each site
+                in vectors, e.g. NeighborArrays.offsets.
+
+        Returns:
+            NDArray: (n_sites, num_ops) order parameters of each site. Order
+                parameters that cannot be computed (None in get_order_parameters)
+                are NaN.
+        """
+        vectors = np.reshape(np.asarray(vectors, dtype=float), (-1, 3))
+        offsets = np.asarray(offsets, dtype=np.intp)
+        counts = np.diff(offsets)
+        ops = np.full((len(counts), len(self._types)), np.nan)
+        for n_neighbors in np.unique(counts).tolist():
+            (sites,) = np.nonzero(counts == n_neighbors)
+            # Bound the size of the arrays over triplets of neighbors
+            chunk_size = max(1, 2**18 // max(1, n_neighbors**3))
+            for start in range(0, len(sites), chunk_size):
+                chunk = sites[start : start + chunk_size]
+                rij = vectors[offsets[chunk][:, None] + np.arange(n_neighbors)]
+                ops[chunk] = self._get_order_parameters_of_group(rij)
+        return ops
+
+    def _get_order_parameters_of_group(self, rij: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Compute all order parameters of sites with the same number of neighbors,
+        following get_order_parameters.
+
+        Args:
+            rij (NDArray): (n_sites, n_neighbors, 3) vectors from each site to its neighbors.
+
+        Returns:
+            NDArray: (n_sites, num_ops) order parameters, NaN if undefined.
+        """
+        n_sites, n_neighbors = rij.shape[:2]
+        ops = np.zeros((n_sites, len(self._types)))
+        dist = np.linalg.norm(rij, axis=2)
+        rij_norm = rij / dist[..., None]
+
+        # First, coordination number and distance-based OPs.
+        for idx, typ in enumerate(self._types):
+            if typ == "cn":
+                if (param := self._params[idx]) is None:
+                    raise RuntimeError(f"param of {idx=} is None")
+                ops[:, idx] = n_neighbors / param["norm"]
+            elif typ == "sgl_bd" and n_neighbors > 0:
+                dist_sorted = np.sort(dist, axis=1)
+                ops[:, idx] = 1 if n_neighbors == 1 else 1 - dist_sorted[:, 0] / dist_sorted[:, 1]
+
+        # Then, bond orientational OPs based on spherical harmonics.
+        if self._boops:
+            for idx, typ in enumerate(self._types):
+                if typ in {"q2", "q4", "q6"}:
+                    ops[:, idx] = self._get_boops_of_group(rij_norm, int(typ[1])) if n_neighbors > 0 else np.nan
+
+        if self._geomops or self._geomops2:
+            theta = np.arccos(np.clip(np.einsum("sjd,skd->sjk", rij_norm, rij_norm), -1.0, 1.0))
+        if self._geomops:
+            self._set_peters_ops_of_group(ops, rij_norm, dist, theta)
+
+        # Then, deal with the new-style OPs that require vectors between neighbors.
+        if self._geomops2:
+            j_idx, k_idx = np.triu_indices(n_neighbors, 1)
+            aijs = np.sort(theta[:, j_idx, k_idx], axis=1)
+            h = np.linalg.norm(rij.mean(axis=1), axis=1) if n_neighbors > 0 else np.zeros(n_sites)
+            distjk = np.linalg.norm(rij[:, k_idx] - rij[:, j_idx], axis=2)
+            for idx, typ in enumerate(self._types):
+                if typ in {"reg_tri", "sq"}:
+                    if n_neighbors < 3:
+                        ops[:, idx] = np.nan
+                        continue
+                    if (param := self._params[idx]) is None:
+                        raise RuntimeError(f"param of {idx=} is None")
+                    b = distjk.min(axis=1)
+                    if typ == "reg_tri":
+                        a = 2 * np.arcsin(b / (2 * np.sqrt(h * h + (b / (2 * math.cos(3 * math.pi / 18))) ** 2)))
+                        nmax = 3
+                    else:
+                        dhalf = distjk.max(axis=1) / 2
+                        a = 2 * np.arcsin(b / (2 * np.sqrt(h * h + dhalf * dhalf)))
+                        nmax = 4
+                    n_angles = min(n_neighbors, nmax)
+                    ops[:, idx] = np.prod(np.exp(-0.5 * ((aijs[:, :n_angles] - a[:, None]) * param[0]) ** 2), axis=1)
+
+        return ops
+
+    @staticmethod
+    def _get_boops_of_group(rij_norm: NDArray[np.float64], degree: int) -> NDArray[np.float64]:
+        """Bond orientational order parameter of weight l=degree of sites with the
+        same number of neighbors, equivalent to get_q2, get_q4 and get_q6.
+
+        Args:
+            rij_norm (NDArray): (n_sites, n_neighbors, 3) unit vectors from each site
+                to its neighbors.
+            degree (int): weight l of the order parameter.
+
+        Returns:
+            NDArray: (n_sites,) order parameters.
+        """
+        left_of_unity = 1 - 1e-12
+        x, y, z = np.moveaxis(rij_norm, 2, 0)
+        thetas = np.arccos(np.clip(z, -1.0, 1.0))
+        # phi is zero for neighbors (almost) perfectly aligned with the z-axis
+        with np.errstate(divide="ignore", invalid="ignore"):
+            phis = np.arccos(np.clip(x / np.sqrt(x * x + y * y), -1.0, 1.0))
+        phis = np.where((-left_of_unity < z) & (z < left_of_unity), np.where(y < 0.0, -phis, phis), 0.0)
+
+        # Sum over m of |sum over neighbors of Y_l_m|^2, using |Y_l_-m| = |Y_l_m|
+        cos_thetas = np.cos(thetas)
+        acc = np.zeros(len(rij_norm))
+        for order in range(degree + 1):
+            pre_y = math.sqrt(
+                (2 * degree + 1) / (4 * math.pi) * math.factorial(degree - order) / math.factorial(degree + order)
+            ) * lpmv(order, degree, cos_thetas)
+            real = np.sum(pre_y * np.cos(order * phis), axis=1)
+            imag = np.sum(pre_y * np.sin(order * phis), axis=1)
+            acc += (1 if order == 0 else 2) * (real * real + imag * imag)
+
+        return np.sqrt(4 * math.pi * acc / ((2 * degree + 1) * rij_norm.shape[1] ** 2))
+
+    def _set_peters_ops_of_group(
+        self,
+        ops: NDArray[np.float64],
+        rij_norm: NDArray[np.float64],
+        dist: NDArray[np.float64],
+        theta: NDArray[np.float64],
+    ) -> None:
+        """Set the Peters-style OPs of sites with the same number of neighbors,
+        following get_order_parameters. Neighbor j is put to the North pole and
+        neighbor k defines the prime meridian, for every neighbor m.
+
+        Args:
+            ops (NDArray): (n_sites, num_ops) order parameters, updated in place.
+            rij_norm (NDArray): (n_sites, n_neighbors, 3) unit vectors from each site
+                to its neighbors.
+            dist (NDArray): (n_sites, n_neighbors) distances to the neighbors.
+            theta (NDArray): (n_sites, n_neighbors, n_neighbors) angles between neighbors.
+        """
+        n_neighbors = rij_norm.shape[1]
+        # The following threshold has to be adapted to non-Angstrom units.
+        very_small = 1e-12
+        fac_bcc = 1 / math.exp(-0.5)
+        ipi = 1 / math.pi
+
+        def gauss(x):
+            return np.exp(-0.5 * x * x)
+
+        # Unit x-axis of each (j, k) frame, from the Gram-Schmidt orthogonalization
+        # of neighbor k against neighbor j
+        inner = np.einsum("sjd,skd->sjk", rij_norm, rij_norm)
+        norm_sq = np.einsum("sjd,sjd->sj", rij_norm, rij_norm)
+        xaxes = rij_norm[:, None, :, :] - (inner / norm_sq[:, :, None])[..., None] * rij_norm[:, :, None, :]
+        xnorms = np.linalg.norm(xaxes, axis=3)
+        has_xaxis = xnorms >= very_small
+        xaxes = np.divide(xaxes, xnorms[..., None], out=np.zeros_like(xaxes), where=has_xaxis[..., None])
+
+        # phi is the angle between the x-axes of the (j, k) and (j, m) frames
+        cos_phi = np.einsum("sjkd,sjmd->sjkm", xaxes, xaxes)
+        phi = np.arccos(np.clip(cos_phi, -1.0, 1.0))
+        if self._comp_azi:
+            yaxes = np.cross(rij_norm[:, :, None, :], xaxes)
+            ynorms = np.linalg.norm(yaxes, axis=3)
+            has_yaxis = ynorms > very_small
+            yaxes = np.divide(yaxes, ynorms[..., None], out=np.zeros_like(yaxes), where=has_yaxis[..., None])
+            phi2 = np.arctan2(np.einsum("sjkd,sjmd->sjkm", yaxes, xaxes), cos_phi)
+
+        # Pairs (j, k) and triplets (j, k, m) of distinct neighbors with a (j, k) frame,
+        # and those triplets for which the (j, m) frame exists too
+        off_diag = ~np.eye(n_neighbors, dtype=bool)
+        upper = np.triu(off_diag)
+        triplets = (off_diag[:, :, None] & off_diag[:, None, :] & off_diag[None, :, :]) & has_xaxis[..., None]
+        planes = triplets & has_xaxis[:, :, None, :]
+        theta_k = theta[..., None]
+        theta_m = theta[:, :, None, :]
+
+        for idx, typ in enumerate(self._types):
+            param = self._params[idx]
+            if typ not in self._PETERS_OP_TYPES:
+                continue
+
+            # Contributions of j-i-k angles (qsp) and of the neighbors m (qsp_m), and their weights
+            qsp = np.zeros_like(theta)
+            norms = np.zeros_like(theta)
+            qsp_m = np.zeros_like(phi)
+            norms_m = np.zeros_like(phi)
+            if param is None:
+                if typ in self._PETERS_OP_TYPES_REQUIRING_PARAMS:
+                    raise RuntimeError(f"param of {idx=} is None")
+
+            elif typ in {"bent", "sq_pyr_legacy"}:
+                qsp += gauss(param["IGW_TA"] * (theta * ipi - param["TA"]))
+                norms += 1
+
+            elif typ in {"tri_plan", "tri_plan_max", "tet", "tet_max"}:
+                gaussthetak = gauss(param["IGW_TA"] * (theta * ipi - param["TA"]))
+                if typ in {"tri_plan_max", "tet_max"}:
+                    qsp += gaussthetak
+                    norms += 1
+                tmp2 = np.cos(param["fac_AA"] * phi) ** param["exp_cos_AA"]
+                tmp3 = 1 if typ in {"tri_plan_max", "tet_max"} else gaussthetak[..., None]
+                qsp_m += np.where(planes, tmp3 * gauss(param["IGW_TA"] * (theta_m * ipi - param["TA"])) * tmp2, 0)
+                norms_m += planes
+
+            elif typ in {"T", "tri_pyr", "sq_pyr", "pent_pyr", "hex_pyr"}:
+                qsp += gauss(param["IGW_EP"] * (theta * ipi - 0.5))
+                norms += 1
+                tmp = np.cos(param["fac_AA"] * phi) ** param["exp_cos_AA"]
+                qsp_m += np.where(planes, tmp * gauss(param["IGW_EP"] * (theta_m * ipi - 0.5)), 0)
+                norms_m += planes
+
+            elif typ in {"sq_plan", "oct", "oct_legacy", "cuboct", "cuboct_max"}:
+                south = theta >= param["min_SPP"]
+                qsp += np.where(south, param["w_SPP"] * gauss(param["IGW_SPP"] * (theta * ipi - 1.0)), 0)
+                norms += np.where(south, param["w_SPP"], 0)
+                if typ in {"sq_plan", "oct", "oct_legacy"}:
+                    selected = planes & (theta_k < param["min_SPP"]) & (theta_m < param["min_SPP"])
+                    tmp = np.cos(param["fac_AA"] * phi) ** param["exp_cos_AA"]
+                    contrib = tmp * gauss(param["IGW_EP"] * (theta_m * ipi - 0.5))
+                    if typ == "oct_legacy" and selected.any():
+                        contrib -= tmp * param[6] * param[7]
+                    qsp_m += np.where(selected, contrib, 0)
+                    norms_m += selected
+                elif (
+                    selected := planes & (theta_m < param["min_SPP"]) & (param[4] < theta_k) & (theta_k < param[2])
+                ).any():
+                    middle = selected & (param[4] < theta_m) & (theta_m < param[2])
+                    tmp = np.cos(phi)
+                    qsp_m += np.where(middle, tmp * tmp * gauss(param[5] * (theta_m * ipi - 0.5)), 0)
+                    gauss_phi = gauss(0.0556 * (np.cos(phi - 0.5 * math.pi) - 0.81649658))
+                    lower = selected & (theta_m < param[4])
+                    qsp_m += np.where(lower, gauss_phi * gauss(param[6] * (theta_m * ipi - 1 / 3)), 0)
+                    upper_m = selected & (theta_m > param[2])
+                    qsp_m += np.where(upper_m, gauss_phi * gauss(param[6] * (theta_m * ipi - 2 / 3.0)), 0)
+                    norms_m += middle | lower | upper_m
+
+            elif typ in {
+                "see_saw_rect",
+                "tri_bipyr",
+                "sq_bipyr",
+                "pent_bipyr",
+                "hex_bipyr",
+                "oct_max",
+                "sq_plan_max",
+                "hex_plan_max",
+            }:
+
+                def get_tmp(angle, param=param, typ=typ):
+                    if typ == "hex_plan_max":
+                        return param["IGW_TA"] * (np.fabs(angle * ipi - 0.5) - param["TA"])
+                    return param["IGW_EP"] * (angle * ipi - 0.5)
+
+                equatorial = theta < param["min_SPP"]
+                qsp += np.where(equatorial, gauss(get_tmp(theta)), 0)
+                norms += equatorial
+                selected = planes & (theta_m < param["min_SPP"]) & (theta_k < param["min_SPP"])
+                if typ == "see_saw_rect":
+                    selected &= phi < 0.75 * math.pi
+                tmp = np.cos(param["fac_AA"] * phi) ** param["exp_cos_AA"]
+                qsp_m += np.where(selected, tmp * gauss(get_tmp(theta_m)), 0)
+                norms_m += selected
+
+            elif typ in {"pent_plan", "pent_plan_max"}:
+                tmp = param["IGW_TA"] * (theta * ipi - np.where(theta <= param["TA"] * math.pi, 0.4, 0.8))
+                gaussthetak = gauss(tmp)
+                if typ == "pent_plan_max":
+                    qsp += gaussthetak
+                    norms += 1
+                tmp2 = param["IGW_TA"] * (theta_m * ipi - np.where(theta_m <= param["TA"] * math.pi, 0.4, 0.8))
+                tmp3 = np.cos(phi)
+                tmp4 = 1 if typ == "pent_plan_max" else gaussthetak[..., None]
+                qsp_m += np.where(planes, tmp4 * gauss(tmp2) * tmp3 * tmp3, 0)
+                norms_m += planes
+
+            elif typ == "bcc":
+                south = upper & (theta >= param["min_SPP"])
+                qsp += np.where(south, param["w_SPP"] * gauss(param["IGW_SPP"] * (theta * ipi - 1.0)), 0)
+                norms += np.where(south, param["w_SPP"], 0)
+                selected = planes & upper[..., None] & (theta_k < param["min_SPP"])
+                fac = np.where(theta_k > math.pi / 2.0, 1, -1)
+                tmp = (theta_m - math.pi / 2.0) / math.asin(1 / 3)
+                qsp_m += np.where(selected, fac * np.cos(3 * phi) * fac_bcc * tmp * gauss(tmp), 0)
+                norms_m += selected
+
+            elif typ == "sq_face_cap_trig_pris":
+                cap = theta < param["TA3"]
+                qsp += np.where(cap, gauss(param["IGW_TA1"] * (theta * ipi - param["TA1"])), 0)
+                norms += cap
+                selected = planes & has_yaxis[..., None] & (theta_k < param["TA3"])
+                tmp = np.where(
+                    theta_m < param["TA3"],
+                    np.cos(param["fac_AA1"] * phi2) ** param["exp_cos_AA1"],
+                    np.cos(param["fac_AA2"] * (phi2 + param["shift_AA2"])) ** param["exp_cos_AA2"],
+                )
+                tmp2 = np.where(
+                    theta_m < param["TA3"],
+                    param["IGW_TA1"] * (theta_m * ipi - param["TA1"]),
+                    param["IGW_TA2"] * (theta_m * ipi - param["TA2"]),
+                )
+                qsp_m += np.where(selected, tmp * gauss(tmp2), 0)
+                norms_m += selected
+
+            # South pole contributions of m, which get_order_parameters applies to
+            # the last OP type only
+            if (
+                idx == len(self._types) - 1
+                and typ in self._SOUTH_POLE_OP_TYPES
+                and param is not None
+                and (south_m := triplets & (theta_m >= param["min_SPP"])).any()
+            ):
+                qsp_m += np.where(south_m, gauss(param["IGW_SPP"] * (theta_m * ipi - 1.0)), 0)
+                norms_m += south_m
+
+            qsp = np.where(off_diag, qsp + qsp_m.sum(axis=3), 0)
+            norms = np.where(off_diag, norms + norms_m.sum(axis=3), 0)
+
+            # Normalize Peters-style OPs.
+            if typ in {"tri_plan", "tet", "bent", "sq_plan", "oct", "oct_legacy", "cuboct", "pent_plan"}:
+                total = norms.sum(axis=(1, 2))
+                ops[:, idx] = np.where(total > 1e-12, qsp.sum(axis=(1, 2)) / np.where(total > 1e-12, total, 1), np.nan)
+
+            elif typ == "bcc":
+                if n_neighbors > 3:
+                    ops[:, idx] = qsp.sum(axis=(1, 2)) / (
+                        0.5 * float(n_neighbors * (6 + (n_neighbors - 2) * (n_neighbors - 3)))
+                    )
+                else:
+                    ops[:, idx] = np.nan
+
+            elif typ == "sq_pyr_legacy":
+                if n_neighbors > 1:
+                    tmp = param[2] * (dist - dist.mean(axis=1, keepdims=True))
+                    acc = gauss(tmp).sum(axis=1)
+                    ops[:, idx] = acc * np.where(off_diag, qsp, -np.inf).max(axis=(1, 2)) / float(n_neighbors)
+                else:
+                    ops[:, idx] = np.nan
+
+            elif n_neighbors > 1:
+                ratio = np.divide(qsp, norms, out=np.zeros_like(qsp), where=norms > 1e-12)
+                ops[:, idx] = np.where(off_diag, ratio, -np.inf).max(axis=(1, 2))
+            else:
+                ops[:, idx] = np.nan
+
 
 class BrunnerNNReciprocal(NearNeighbors):
     """
@@ -3932,8 +4553,27 @@ class CrystalNN(NearNeighbors):
                 to the coordination number (1 or smaller), 'site_index' gives index of
                 the corresponding site in the original structure.
         """
-        nn_data = self.get_nn_data(structure, n)
+        return self._get_nn_info_from_data(self.get_nn_data(structure, n))
 
+    def get_all_nn_info(self, structure: Structure) -> list[list[dict]]:
+        """Get a listing of all neighbors for all sites in a structure.
+
+        The near neighbors of all sites are found from a single Voronoi tessellation,
+        see `get_all_nn_data`.
+
+        Args:
+            structure (Structure): Input structure
+
+        Returns:
+            List of NN site information for each site in the structure. Each
+                entry has the same format as `get_nn_info`
+        """
+        return [self._get_nn_info_from_data(nn_data) for nn_data in self.get_all_nn_data(structure)]
+
+    def _get_nn_info_from_data(self, nn_data: NNData) -> list[dict]:
+        """Get the near-neighbor information of a site from its NNData, as
+        returned by `get_nn_info`.
+        """
         if not self.weighted_cn:
             max_key = max(nn_data.cn_weights, key=lambda k: nn_data.cn_weights[k])
             nn = nn_data.cn_nninfo[max_key]
@@ -3967,25 +4607,251 @@ class CrystalNN(NearNeighbors):
             - a dict of CN -> weight
             - a dict of CN -> associated near neighbor sites
         """
-        length = length or self.fingerprint_length
-
-        # determine possible bond targets
-        target = None
-        if self.cation_anion:
-            target = []
-            m_oxi = structure[n].specie.oxi_state
-            for site in structure:
-                oxi_state = getattr(site.specie, "oxi_state", None)
-                if oxi_state is not None and oxi_state * m_oxi <= 0:  # opposite charge
-                    target.append(site.specie)
-            if not target:
-                raise ValueError("No valid targets for site within cation_anion constraint!")
-
         # get base VoronoiNN targets
         cutoff = self.search_cutoff
-        vnn = VoronoiNN(weight="solid_angle", targets=target, cutoff=cutoff)
+        vnn = VoronoiNN(weight="solid_angle", targets=self._get_targets(structure, n), cutoff=cutoff)
         nn = vnn.get_nn_info(structure, n)
 
+        return self._get_nn_data_from_voronoi(structure, n, nn, length)
+
+    def get_all_nn_data(self, structure: Structure, length=None) -> list[NNData]:
+        """
+        Compute the near neighbor data of all sites in a structure.
+
+        Rather than one Voronoi tessellation per site as in `get_nn_data`, all sites
+        and their neighbors within search_cutoff are tessellated once and the solid
+        angles and areas of all facets are computed together. The Voronoi cell of a
+        site is only taken from this tessellation if all its facets are shared with
+        sites within search_cutoff of it, in which case it is the same cell as the
+        one `get_nn_data` builds from that sphere. The order of neighbors whose
+        weights only differ by round-off, as for symmetry equivalent neighbors,
+        depends on the tessellation, and so does the rounding of weights close to
+        halfway between two multiples of 0.001. Sites with such weights, sites whose
+        cell may differ, e.g. when search_cutoff is too small, and all sites if the
+        tessellation fails are evaluated one by one with `get_nn_data`. The result
+        is thus the same as from `get_nn_data` for every site.
+
+        Args:
+            structure: (Structure) enclosing structure object
+            length: (int) if set, will return a fixed range of CN numbers
+
+        Returns:
+            list[NNData]: the near neighbor data of each site, see `get_nn_data`
+        """
+        if not isinstance(structure, Structure | IStructure):
+            return [self.get_nn_data(structure, n, length) for n in range(len(structure))]
+
+        targets = [self._get_targets(structure, n) for n in range(len(structure))]
+        try:
+            all_nn = self._get_all_voronoi_nn(structure, targets)
+        except (RuntimeError, ValueError):
+            return [self.get_nn_data(structure, n, length) for n in range(len(structure))]
+
+        all_nn_data = []
+        for n, nn in enumerate(all_nn):
+            weighted_nn = None if nn is None else self._get_weighted_nn(structure, n, nn)
+            if weighted_nn is None or _has_ambiguous_weights(weighted_nn):
+                all_nn_data.append(self.get_nn_data(structure, n, length))
+            else:
+                all_nn_data.append(self._get_nn_data_from_weights(weighted_nn, length))
+        return all_nn_data
+
+    def _get_targets(self, structure: Structure, n: int) -> list[Species] | None:
+        """Get the possible bond targets of site n, or None if all sites are targets."""
+        if not self.cation_anion:
+            return None
+
+        target = []
+        m_oxi = structure[n].specie.oxi_state
+        for site in structure:
+            oxi_state = getattr(site.specie, "oxi_state", None)
+            if oxi_state is not None and oxi_state * m_oxi <= 0:  # opposite charge
+                target.append(site.specie)
+        if not target:
+            raise ValueError("No valid targets for site within cation_anion constraint!")
+        return target
+
+    def _get_all_voronoi_nn(self, structure: Structure, targets: list[list[Species] | None]) -> list[list[dict] | None]:
+        """Get the VoronoiNN near neighbors of all sites from a single tessellation.
+
+        Each list of neighbors has the same sites, weights and solid angle and area
+        poly_info as VoronoiNN(weight="solid_angle").get_nn_info with the targets of
+        that site and a cutoff of search_cutoff.
+
+        The tessellated points include the cutoff sphere of every site, so the cell
+        of a site is contained in the cell built from its own sphere alone. The two
+        are the same if every facet of the cell is shared with a point inside that
+        sphere. Sites with a facet shared with a point outside of it, or with an
+        infinite vertex, may have a different cell and get None instead.
+
+        Args:
+            structure (Structure): input structure
+            targets (list): the bond targets of each site, see `_get_targets`
+
+        Returns:
+            list[list[dict] | None]: the near neighbors of each site, or None if they
+                have to be computed from the cutoff sphere of that site
+        """
+        n_sites = len(structure)
+        # margin on search_cutoff to be safe from round-off in the distances
+        tol = 1e-4
+        nn_arrays = structure.get_all_neighbor_arrays(self.search_cutoff + tol)
+
+        # Tessellate the sites followed by all their distinct neighbors, such that
+        # the first n_sites points are the sites themselves
+        keys = np.concatenate(
+            [
+                np.column_stack([np.arange(n_sites), np.zeros((n_sites, 3))]),
+                np.column_stack([nn_arrays.indices, nn_arrays.images]),
+            ]
+        ).astype(np.int64)
+        _, first = np.unique(keys, axis=0, return_index=True)
+        keys = keys[np.sort(first)]
+        site_indices, images = keys[:, 0], keys[:, 1:]
+        frac_coords = structure.frac_coords[site_indices] + images
+        points = structure.lattice.get_cartesian_coords(frac_coords)
+        voro = Voronoi(points)
+
+        # Facets of the sites, grouped by site and in the order of the ridges
+        ridge_points = voro.ridge_points
+        ridge_indices = np.tile(np.arange(len(ridge_points)), 2)
+        centers = np.concatenate([ridge_points[:, 0], ridge_points[:, 1]])
+        others = np.concatenate([ridge_points[:, 1], ridge_points[:, 0]])
+        is_site = centers < n_sites
+        ridge_indices, centers, others = ridge_indices[is_site], centers[is_site], others[is_site]
+        order = np.lexsort((ridge_indices, centers))
+        ridge_indices, centers, others = ridge_indices[order], centers[order], others[order]
+
+        # Keep only the sites whose cell is the one from their own cutoff sphere
+        dists = np.linalg.norm(points[others] - points[centers], axis=1)
+        is_infinite = np.array([-1 in voro.ridge_vertices[idx] for idx in ridge_indices.tolist()], dtype=bool)
+        is_exact = np.ones(n_sites, dtype=bool)
+        is_exact[centers[is_infinite | (dists > self.search_cutoff - tol)]] = False
+        keep = is_exact[centers]
+        ridge_indices, centers, others = ridge_indices[keep], centers[keep], others[keep]
+        if len(ridge_indices) == 0:
+            return [None] * n_sites
+
+        n_verts = np.array([len(voro.ridge_vertices[idx]) for idx in ridge_indices.tolist()])
+        verts = np.concatenate([voro.ridge_vertices[idx] for idx in ridge_indices.tolist()])
+
+        # Split each facet into the triangles (0, 1, 2), (0, 2, 3), ... as in solid_angle
+        n_tri = n_verts - 2
+        tri_facets = np.repeat(np.arange(len(n_verts)), n_tri)
+        tri_starts = np.repeat(np.cumsum(n_verts) - n_verts, n_tri)
+        tri_offsets = np.arange(len(tri_facets)) - np.repeat(np.cumsum(n_tri) - n_tri, n_tri)
+        center_coords = points[centers][tri_facets]
+        disp0 = voro.vertices[verts[tri_starts]] - center_coords
+        disp1 = voro.vertices[verts[tri_starts + tri_offsets + 1]] - center_coords
+        disp2 = voro.vertices[verts[tri_starts + tri_offsets + 2]] - center_coords
+
+        # Solid angle of each triangle, following solid_angle
+        r0, r1, r2 = (np.linalg.norm(disp, axis=1) for disp in (disp0, disp1, disp2))
+        tp = np.abs(np.einsum("ij,ij->i", disp0, np.cross(disp1, disp2)))
+        de = (
+            r0 * r1 * r2
+            + r2 * np.einsum("ij,ij->i", disp0, disp1)
+            + r1 * np.einsum("ij,ij->i", disp0, disp2)
+            + r0 * np.einsum("ij,ij->i", disp1, disp2)
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tri_angles = np.where(de == 0, np.where(tp > 0, 0.5 * np.pi, -0.5 * np.pi), np.arctan(tp / de))
+        tri_angles = np.where(tri_angles > 0, tri_angles, tri_angles + np.pi) * 2
+        angles = np.bincount(tri_facets, weights=tri_angles, minlength=len(n_verts))
+
+        # Volume of each tetrahedron, following vol_tetra
+        tri_volumes = np.abs(np.einsum("ij,ij->i", -disp2, np.cross(disp0 - disp2, disp1 - disp2))) / 6
+        volumes = np.bincount(tri_facets, weights=tri_volumes, minlength=len(n_verts))
+        face_dists = dists[keep] / 2
+        areas = 3 * volumes / face_dists
+
+        # Target masks over the sites of the structure, per set of targets
+        target_masks = {}
+        lattice = structure.lattice
+        offsets = np.searchsorted(centers, np.arange(n_sites + 1))
+        all_nn: list[list[dict] | None] = []
+        for n, (start, end) in enumerate(pairwise(offsets.tolist())):
+            if not is_exact[n]:
+                all_nn.append(None)
+                continue
+            site_targets = structure.elements if targets[n] is None else targets[n]
+            key = tuple(map(str, site_targets))
+            if key not in target_masks:
+                target_masks[key] = (
+                    np.array(
+                        [
+                            site.specie in site_targets
+                            if site.is_ordered
+                            else any(sp in site_targets for sp in site.species)
+                            for site in structure
+                        ]
+                    ),
+                    np.array([_is_in_targets(site, site_targets) for site in structure]),
+                )
+            has_target, in_targets = target_masks[key]
+
+            # Facets with any target, as in VoronoiNN._extract_cell_info
+            facets = np.arange(start, end)
+            facets = facets[has_target[site_indices[others[facets]]]]
+            max_angle = np.max(angles[facets])
+
+            # Neighbors of non-zero weight made only of targets, as in VoronoiNN._extract_nn_info
+            facets = facets[(angles[facets] > 0) & in_targets[site_indices[others[facets]]]]
+            nn = []
+            for facet in facets.tolist():
+                point = others[facet]
+                idx = int(site_indices[point])
+                image = tuple(images[point].tolist())
+                site = structure[idx]
+                neighbor = PeriodicNeighbor(
+                    species=site.species,
+                    coords=frac_coords[point],
+                    lattice=lattice,
+                    properties=site.properties,
+                    nn_distance=2 * face_dists[facet],
+                    index=idx,
+                    image=image,
+                    label=site.label,
+                )
+                nn.append(
+                    {
+                        "site": neighbor,
+                        "image": image,
+                        "weight": angles[facet] / max_angle,
+                        "site_index": idx,
+                        "poly_info": {"solid_angle": angles[facet], "area": areas[facet]},
+                    }
+                )
+            all_nn.append(nn)
+
+        return all_nn
+
+    def _get_nn_data_from_voronoi(self, structure: Structure, n: int, nn: list[dict], length=None) -> NNData:
+        """Compute the near neighbor data of site n from its VoronoiNN near neighbors.
+
+        Args:
+            structure: (Structure) enclosing structure object
+            n: (int) index of target site
+            nn: (list[dict]) VoronoiNN near neighbors of site n, with poly_info
+            length: (int) if set, will return a fixed range of CN numbers
+
+        Returns:
+            NNData: see `get_nn_data`
+        """
+        return self._get_nn_data_from_weights(self._get_weighted_nn(structure, n, nn), length)
+
+    def _get_weighted_nn(self, structure: Structure, n: int, nn: list[dict]) -> list[dict]:
+        """Weight the VoronoiNN near neighbors of site n.
+
+        Args:
+            structure: (Structure) enclosing structure object
+            n: (int) index of target site
+            nn: (list[dict]) VoronoiNN near neighbors of site n, with poly_info
+
+        Returns:
+            list[dict]: the near neighbors sorted from highest to lowest weight, before
+                rounding, or an empty list if all weights are zero
+        """
         # solid angle weights can be misleading in open / porous structures
         # adjust weights to correct for this behavior
         if self.porous_adjustment:
@@ -4009,7 +4875,7 @@ class CrystalNN(NearNeighbors):
         # sort nearest neighbors from highest to lowest weight
         nn = sorted(nn, key=lambda x: x["weight"], reverse=True)
         if nn[0]["weight"] == 0:
-            return self.transform_to_length(self.NNData([], {0: 1.0}, {0: []}), length)
+            return []
 
         # renormalize weights so the highest weight is 1.0
         highest_weight = nn[0]["weight"]
@@ -4047,6 +4913,21 @@ class CrystalNN(NearNeighbors):
         # sort nearest neighbors from highest to lowest weight
         nn = sorted(nn, key=lambda x: x["weight"], reverse=True)
         if nn[0]["weight"] == 0:
+            return []
+        return nn
+
+    def _get_nn_data_from_weights(self, nn: list[dict], length=None) -> NNData:
+        """Compute the near neighbor data from weighted near neighbors.
+
+        Args:
+            nn: (list[dict]) near neighbors from `_get_weighted_nn`
+            length: (int) if set, will return a fixed range of CN numbers
+
+        Returns:
+            NNData: see `get_nn_data`
+        """
+        length = length or self.fingerprint_length
+        if not nn:
             return self.transform_to_length(self.NNData([], {0: 1.0}, {0: []}), length)
 
         for entry in nn:
@@ -4177,6 +5058,18 @@ class CrystalNN(NearNeighbors):
         return nn_data
 
 
+def _has_ambiguous_weights(nn: list[dict], tol: float = 1e-6) -> bool:
+    """Whether the order or the rounding of the weights of near neighbors sorted by
+    CrystalNN may be changed by round-off, i.e. whether two weights that are not
+    rounded to zero differ by less than tol, or a weight is within tol of halfway
+    between two multiples of 0.001.
+    """
+    weights = np.array([entry["weight"] for entry in nn])
+    weights = weights[weights > 0.0005 - tol]
+    halfway = np.abs(weights * 1000 % 1 - 0.5) < tol * 1000
+    return bool(np.any(-np.diff(weights) < tol) or np.any(halfway))
+
+
 def _get_default_radius(site) -> float:
     """
     An internal function to get a "default" covalent/element radius.
@@ -4346,6 +5239,33 @@ class CutOffDictNN(NearNeighbors):
 
         return nn_info
 
+    def get_all_nn_info(self, structure: Structure) -> list[list[dict[str, Any]]]:
+        """Get a listing of all neighbors for all sites in a structure.
+
+        For periodic structures, the neighbors of all sites are found in a single
+        pass and the cut-offs are looked up per species pair rather than per
+        neighbor. The neighbors of each site are the same as from `get_nn_info`,
+        but may be listed in a different order.
+
+        Args:
+            structure (Structure): Input structure
+
+        Returns:
+            List of NN site information for each site in the structure. Each
+                entry has the same format as `get_nn_info`
+        """
+        if not isinstance(structure, Structure | IStructure):
+            return super().get_all_nn_info(structure)
+
+        nn_arrays = structure.get_all_neighbor_arrays(self._max_dist)
+        species, species_idx = np.unique([site.species_string for site in structure], return_inverse=True)
+        cut_offs = np.array(
+            [[self._lookup_dict.get(sp1, {}).get(sp2, 0.0) for sp2 in species] for sp1 in species]
+        ).reshape(len(species), len(species))
+        pair_cut_offs = cut_offs[species_idx[nn_arrays.center_indices], species_idx[nn_arrays.indices]]
+        selected = nn_arrays.distances < pair_cut_offs
+        return self._get_nn_info_from_arrays(structure, nn_arrays, selected, nn_arrays.distances)
+
 
 class Critic2NN(NearNeighbors):
     """
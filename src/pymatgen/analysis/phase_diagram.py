@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import itertools
 import logging
 import math
@@ -9,13 +11,15 @@ import os
 import re
 import warnings
 from collections import defaultdict
+from collections.abc import MutableMapping
 from functools import lru_cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import matplotlib.pyplot as plt
 import numpy as np
 import orjson
 import plotly.graph_objects as go
+from joblib import Parallel, delayed
 from matplotlib import cm
 from matplotlib.cm import ScalarMappable
 from matplotlib.colors import LinearSegmentedColormap, Normalize
@@ -32,6 +36,7 @@ from pymatgen.core.composition import Composition
 from pymatgen.entries import Entry
 from pymatgen.util.coord import Simplex, in_coord_list
 from pymatgen.util.due import Doi, due
+from pymatgen.util.joblib import tqdm_joblib
 from pymatgen.util.plotting import pretty_plot
 from pymatgen.util.string import htmlify, latexify
 
@@ -43,6 +48,8 @@ if TYPE_CHECKING:
     from numpy.typing import ArrayLike
     from typing_extensions import Self
 
+    from pymatgen.util.typing import PathLike
+
 logger = logging.getLogger(__name__)
 
 with open(
@@ -374,7 +381,7 @@ class PhaseDiagram(MSONable):
                 raise TypeError(f"computed_data should be dict, got {type(computed_data).__name__}")
 
             # Update keys to be Element objects in case they are strings in pre-computed data
-            computed_data["el_refs"] = [(Element(el_str), entry) for el_str, entry in computed_data["el_refs"]]
+            computed_data["el_refs"] = [(get_el_sp(el_str), entry) for el_str, entry in computed_data["el_refs"]]
         self.computed_data = computed_data
         self.facets = computed_data["facets"]
         self.simplexes = computed_data["simplexes"]
@@ -386,6 +393,15 @@ class PhaseDiagram(MSONable):
         self._qhull_spaces = tuple(frozenset(e.elements) for e in self.qhull_entries)
         self._stable_entries = tuple({self.qhull_entries[idx] for idx in set(itertools.chain(*self.facets))})
         self._stable_spaces = tuple(frozenset(e.elements) for e in self._stable_entries)
+        # Incremental Qhull hull and the qhull_data index of each of its points (-1 for replaced
+        # entries), kept by the diagrams returned by add_entries
+        self._incremental_hull: tuple[ConvexHull, np.ndarray] | None = None
+        self._facet_arrays: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_incremental_hull"] = None
+        return state
 
     def as_dict(self):
         """Get MSONable dict representation of PhaseDiagram."""
@@ -485,6 +501,134 @@ class PhaseDiagram(MSONable):
             "qhull_entries": qhull_entries,
         }
 
+    def add_entries(self, entries: Sequence[PDEntry]) -> PhaseDiagram:
+        """Get a new phase diagram with additional entries, updating the convex
+        hull incrementally rather than rebuilding it.
+
+        The new entries are added to the Qhull hull of this diagram in Qhull's
+        incremental mode. The hull is built once for a diagram that does not have
+        one yet and is then handed over to the new diagram, so that successive
+        calls only pay for the new points. Entries that are not below the hull
+        leave the facets unchanged. Only new entries are converted to hull
+        coordinates, and the simplexes of unchanged facets are reused.
+
+        The result has the same stable entries, facets (up to the triangulation
+        of coplanar points) and energies above the hull as PhaseDiagram built
+        from all entries. If a new entry changes an elemental reference, which
+        changes the formation energies of all entries, the diagram is rebuilt.
+
+        Args:
+            entries (list[PDEntry]): Entries to add. Their elements must be in
+                the phase diagram.
+
+        Returns:
+            PhaseDiagram: New phase diagram with all entries.
+        """
+        if type(self) is not PhaseDiagram:
+            raise NotImplementedError(f"add_entries() not implemented for {type(self).__name__}")
+
+        entries = list(entries)
+        all_entries = [*self.all_entries, *entries]
+        if extra := {el for entry in entries for el in entry.elements} - set(self.elements):
+            raise ValueError(f"Entries have elements not in the phase diagram: {sorted(map(str, extra))}")
+
+        if self.dim == 1 or any(
+            entry.composition.is_element
+            and entry.energy_per_atom < self.el_refs[entry.composition.elements[0]].energy_per_atom
+            for entry in entries
+        ):
+            return PhaseDiagram(all_entries, self.elements)
+
+        data = np.array(
+            [[e.composition.get_atomic_fraction(el) for el in self.elements] + [e.energy_per_atom] for e in entries]
+        ).reshape(-1, self.dim + 1)
+        vec = [self.el_refs[el].energy_per_atom for el in self.elements] + [-1]
+        form_e = -np.dot(data, vec)
+
+        # Lowest energy new entry at each composition with negative formation energy,
+        # unless an entry in the hull has the same or a lower energy
+        n_qhull = len(self.qhull_data) - 1
+        n_compounds = n_qhull - self.dim
+        qhull_idx = {tuple(row): idx for idx, row in enumerate(np.round(self.qhull_data[:n_compounds, :-1], 10))}
+        replaced: set[int] = set()
+        added: dict[tuple, int] = {}
+        for idx in np.where(form_e < -PhaseDiagram.formation_energy_tol)[0].tolist():
+            key = tuple(np.round(data[idx, 1:-1], 10))
+            if key in added:
+                if data[idx, -1] < data[added[key], -1]:
+                    added[key] = idx
+            elif key not in qhull_idx:
+                added[key] = idx
+            elif data[idx, -1] < self.qhull_data[qhull_idx[key], -1]:
+                replaced.add(qhull_idx[key])
+                added[key] = idx
+        new_idx = list(added.values())
+
+        # Kept compounds, new compounds, elemental references and the extra point, as in _compute
+        kept = [idx for idx in range(n_compounds) if idx not in replaced]
+        old_to_new = np.full(n_qhull + 1, -1)
+        old_to_new[kept] = np.arange(len(kept))
+        n_new_compounds = len(kept) + len(new_idx)
+        old_to_new[n_compounds:] = np.arange(n_new_compounds, n_new_compounds + self.dim + 1)
+
+        qhull_entries = [
+            *(self.qhull_entries[idx] for idx in kept),
+            *(entries[idx] for idx in new_idx),
+            *self.qhull_entries[n_compounds:],
+        ]
+        qhull_data = np.concatenate(
+            [self.qhull_data[kept], data[new_idx, 1:], self.qhull_data[n_compounds:n_qhull]], axis=0
+        )
+        extra_point = np.zeros(self.dim) + 1 / self.dim
+        extra_point[-1] = np.max(qhull_data) + 1
+        qhull_data = np.concatenate([qhull_data, [extra_point]], axis=0)
+
+        # The hull keeps the points of replaced entries, which are above the new ones and
+        # thus not in the lower hull. Its extra point keeps its height, which does not
+        # change the lower hull
+        if self._incremental_hull is None:
+            hull = ConvexHull(self.qhull_data, qhull_options="Qt i", incremental=True)
+            hull_idx = np.arange(n_qhull + 1)
+        else:
+            hull, hull_idx = self._incremental_hull
+            self._incremental_hull = None
+        if new_idx:
+            hull.add_points(data[new_idx, 1:])
+        hull_idx = np.concatenate([old_to_new[hull_idx], np.arange(len(kept), n_new_compounds)])
+
+        old_facets = {
+            tuple(sorted(facet)): (facet, simplex)
+            for facet, simplex in zip((old_to_new[facet] for facet in self.facets), self.simplexes, strict=True)
+        }
+        facets, simplexes = [], []
+        for facet in hull_idx[hull.simplices]:
+            # Skip facets that include the extra point, or the point of a replaced entry
+            if facet.max() == len(qhull_data) - 1 or facet.min() < 0:
+                continue
+            if (key := tuple(sorted(facet))) in old_facets:
+                facet, simplex = old_facets[key]
+            else:
+                mat = qhull_data[facet]
+                mat[:, -1] = 1
+                if abs(np.linalg.det(mat)) <= 1e-14:
+                    continue
+                simplex = Simplex(qhull_data[facet, :-1])
+            facets.append(facet)
+            simplexes.append(simplex)
+
+        computed_data = {
+            "facets": facets,
+            "simplexes": simplexes,
+            "all_entries": all_entries,
+            "qhull_data": qhull_data,
+            "dim": self.dim,
+            "el_refs": list(self.el_refs.items()),
+            "qhull_entries": qhull_entries,
+        }
+        phase_diagram = PhaseDiagram(all_entries, self.elements, computed_data=computed_data)
+        phase_diagram._incremental_hull = hull, hull_idx
+        return phase_diagram
+
     def pd_coords(self, comp: Composition) -> np.ndarray:
         """
         The phase diagram is generated in a reduced dimensional space
@@ -787,6 +931,205 @@ class PhaseDiagram(MSONable):
         """
         return self.get_decomp_and_e_above_hull(entry, **kwargs)[1]
 
+    def get_hull_energies_per_atom(self, comps: Sequence[Composition] | ArrayLike) -> np.ndarray:
+        """Batched version of get_hull_energy_per_atom, which finds the facets of
+        all compositions at once.
+
+        Args:
+            comps (list[Composition] | ArrayLike): Input compositions (or entries),
+                or an array of the amounts of the elements of the phase diagram (in
+                the order of self.elements) with one row per composition.
+
+        Raises:
+            ValueError: If a composition has elements that are not in the phase
+                diagram, or no facet is found for it.
+
+        Returns:
+            np.ndarray: Energies of the lowest energy equilibria per atom.
+        """
+        _, hull_energies = self._get_decomps_and_hull_energies(comps, with_decomps=False)
+        if np.isnan(hull_energies).any():
+            raise ValueError(f"No facet found for composition {np.where(np.isnan(hull_energies))[0][0]}")
+        return hull_energies
+
+    def get_decomps_and_hull_energies_per_atom(
+        self, comps: Sequence[Composition] | ArrayLike
+    ) -> tuple[list[dict[PDEntry, float]], np.ndarray]:
+        """Batched version of get_decomp_and_hull_energy_per_atom.
+
+        Args:
+            comps (list[Composition] | ArrayLike): Input compositions (or entries),
+                or an array of the amounts of the elements of the phase diagram (in
+                the order of self.elements) with one row per composition.
+
+        Raises:
+            ValueError: If a composition has elements that are not in the phase
+                diagram, or no facet is found for it.
+
+        Returns:
+            tuple[list[dict[PDEntry, float]], np.ndarray]: Decompositions as dicts of
+                {PDEntry: amount} and energies of the lowest energy equilibria per atom.
+        """
+        decomps, hull_energies = self._get_decomps_and_hull_energies(comps)
+        if np.isnan(hull_energies).any():
+            raise ValueError(f"No facet found for composition {np.where(np.isnan(hull_energies))[0][0]}")
+        return cast("list[dict[PDEntry, float]]", decomps), hull_energies
+
+    def get_decomps_and_e_above_hull(
+        self,
+        entries: Sequence[PDEntry],
+        allow_negative: bool = False,
+        check_stable: bool = True,
+        on_error: Literal["raise", "warn", "ignore"] = "raise",
+    ) -> tuple[list[dict[PDEntry, float] | None], np.ndarray]:
+        """Batched version of get_decomp_and_e_above_hull, which finds the facets
+        of all entries at once.
+
+        Args:
+            entries (list[PDEntry]): PDEntry like objects.
+            allow_negative (bool): Whether to allow negative e_above_hulls.
+                Defaults to False.
+            check_stable (bool): Whether to return a decomposition into the entry
+                itself for stable entries. Defaults to True.
+            on_error ('raise' | 'warn' | 'ignore'): What to do if no valid
+                decomposition was found for an entry, as in
+                get_decomp_and_e_above_hull. Defaults to 'raise'.
+
+        Raises:
+            ValueError: If on_error is 'raise' and no valid decomposition exists in this
+                phase diagram for an entry.
+
+        Returns:
+            tuple[list[dict[PDEntry, float] | None], np.ndarray]: Decompositions as dicts
+                of {PDEntry: amount}, and energies above the hull per atom. Entries
+                without a valid decomposition have a decomposition of None and an
+                energy of NaN.
+        """
+        entries = list(entries)
+        decomps, hull_energies = self._get_decomps_and_hull_energies([entry.composition for entry in entries])
+        e_above_hull = np.array([entry.energy_per_atom for entry in entries]).reshape(-1) - hull_energies
+
+        stable_entries = self.stable_entries if check_stable else set()
+        for idx, entry in enumerate(entries):
+            if entry in stable_entries:
+                decomps[idx], e_above_hull[idx] = {entry: 1.0}, 0.0
+            elif np.isnan(e_above_hull[idx]) or (
+                not allow_negative and e_above_hull[idx] < -PhaseDiagram.numerical_tol
+            ):
+                msg = (
+                    f"Unable to get decomposition for {entry}"
+                    if decomps[idx] is None
+                    else f"No valid decomposition found for {entry}! (e_h: {e_above_hull[idx]})"
+                )
+                if on_error == "raise":
+                    raise ValueError(msg)
+                if on_error == "warn":
+                    warnings.warn(msg, stacklevel=2)
+                decomps[idx], e_above_hull[idx] = None, np.nan
+        return decomps, e_above_hull
+
+    def get_e_above_hulls(self, entries: Sequence[PDEntry], **kwargs: Any) -> np.ndarray:
+        """Batched version of get_e_above_hull.
+
+        Args:
+            entries (list[PDEntry]): PDEntry like objects.
+            **kwargs: Passed to get_decomps_and_e_above_hull().
+
+        Returns:
+            np.ndarray: Energies above the convex hull per atom, NaN for entries
+                without a valid decomposition.
+        """
+        return self.get_decomps_and_e_above_hull(entries, **kwargs)[1]
+
+    def _get_decomps_and_hull_energies(
+        self, comps: Sequence[Composition] | ArrayLike, with_decomps: bool = True
+    ) -> tuple[list[dict[PDEntry, float] | None], np.ndarray]:
+        """Decompositions (if with_decomps) and hull energies per atom of
+        compositions, which are None and NaN for compositions that are not in the
+        phase diagram.
+        """
+        comps = comps if isinstance(comps, np.ndarray) else list(comps)  # type: ignore[arg-type]
+        if isinstance(comps, np.ndarray) or (len(comps) > 0 and not isinstance(comps[0], Composition | Entry)):
+            amounts = np.abs(np.asarray(comps, dtype=float)).reshape(-1, self.dim)
+            valid = amounts.sum(axis=1) > 0
+        else:
+            columns = {el: col for col, el in enumerate(self.elements)}
+            amounts = np.zeros((len(comps), self.dim))
+            valid = np.ones(len(amounts), dtype=bool)
+            for idx, comp in enumerate(comps):
+                for el, amt in getattr(comp, "composition", comp).items():
+                    if el not in columns:
+                        valid[idx] = False
+                        break
+                    amounts[idx, columns[el]] = abs(amt)
+            valid &= amounts.sum(axis=1) > 0
+
+        coords = amounts[valid, 1:] / amounts[valid].sum(axis=1, keepdims=True)
+        facet_idx, bary_coords = self._get_facets_and_bary_coords(coords)
+        found = np.where(valid)[0][facet_idx >= 0]
+        facet_idx, bary_coords = facet_idx[facet_idx >= 0], bary_coords[facet_idx >= 0]
+
+        _, _, vertices, vertex_energies = self._get_facet_arrays()
+        bary_coords[np.abs(bary_coords) <= PhaseDiagram.numerical_tol] = 0
+        hull_energies = np.full(len(amounts), np.nan)
+        hull_energies[found] = np.sum(bary_coords * vertex_energies[facet_idx], axis=1)
+
+        decomps: list[dict[PDEntry, float] | None] = [None] * len(amounts)
+        if with_decomps:
+            for idx, vertex_idx, amts in zip(
+                found.tolist(), vertices[facet_idx].tolist(), bary_coords.tolist(), strict=True
+            ):
+                decomps[idx] = {self.qhull_entries[v]: amt for v, amt in zip(vertex_idx, amts, strict=True) if amt != 0}
+        return decomps, hull_energies
+
+    def _get_facets_and_bary_coords(self, coords: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Find facets that contain points in the pd_coords space.
+
+        The hull energy at a point is the maximum of the planes of all facets,
+        so the facet with the highest plane at the point is tried first. Only
+        points where this facet does not contain the point, e.g. for coplanar
+        facets, are tested against all facets in turn as in _get_facet_and_simplex.
+
+        Args:
+            coords (np.ndarray): Points in the pd_coords space, with one row per point.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Indices of the facets, or -1 for points
+                outside all facets, and barycentric coordinates of the points.
+        """
+        aug_inv, planes, _, _ = self._get_facet_arrays()
+        tol = PhaseDiagram.numerical_tol / 10
+        points = np.concatenate([coords, np.ones((len(coords), 1))], axis=1)
+        facet_idx = np.zeros(len(points), dtype=int)
+        bary_coords = np.zeros((len(points), self.dim))
+
+        chunk_size = max(1, 2**22 // len(planes))
+        for start in range(0, len(points), chunk_size):
+            chunk = points[start : start + chunk_size]
+            best = np.argmax(chunk @ planes.T, axis=1)
+            bary = np.einsum("ni,nij->nj", chunk, aug_inv[best])
+            for idx in np.where((bary < -tol).any(axis=1))[0]:
+                all_bary = chunk[idx] @ aug_inv
+                inside = np.where((all_bary >= -tol).all(axis=1))[0]
+                best[idx] = inside[0] if len(inside) > 0 else -1
+                bary[idx] = all_bary[inside[0]] if len(inside) > 0 else np.nan
+            facet_idx[start : start + chunk_size] = best
+            bary_coords[start : start + chunk_size] = bary
+        return facet_idx, bary_coords
+
+    def _get_facet_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Arrays of the facets for batched lookups: the inverse augmented matrices
+        of the simplexes, the coefficients of the energy planes of the facets in
+        the augmented pd_coords space, the vertex indices and the vertex energies.
+        """
+        if self._facet_arrays is None:
+            vertices = np.array(self.facets, dtype=int).reshape(len(self.facets), self.dim)
+            aug_inv = np.array([simplex._aug_inv for simplex in self.simplexes]).reshape(-1, self.dim, self.dim)
+            vertex_energies = self.qhull_data[vertices, -1]
+            planes = np.einsum("fij,fj->fi", aug_inv, vertex_energies)
+            self._facet_arrays = aug_inv, planes, vertices, vertex_energies
+        return self._facet_arrays
+
     def get_equilibrium_reaction_energy(self, entry: PDEntry) -> float | None:
         """
         Provides the reaction energy of a stable entry from the neighboring
@@ -1594,7 +1937,8 @@ class PatchedPhaseDiagram(PhaseDiagram):
         subspaces ({str: {Element, }}): Dictionary of the sets of elements for each of the
             PhaseDiagrams within the PatchedPhaseDiagram.
         pds ({str: PhaseDiagram}): Dictionary of PhaseDiagrams within the
-            PatchedPhaseDiagram.
+            PatchedPhaseDiagram. If lazy, a mapping that builds each PhaseDiagram
+            the first time it is accessed.
         all_entries (list[PDEntry]): All entries provided for Phase Diagram construction.
             Note that this does not mean that all these entries are actually used in
             the phase diagram. For example, this includes the positive formation energy
@@ -1613,6 +1957,9 @@ class PatchedPhaseDiagram(PhaseDiagram):
         elements: Sequence[Element] | None = None,
         keep_all_spaces: bool = False,
         verbose: bool = False,
+        n_jobs: int = 1,
+        lazy: bool = False,
+        cache_dir: PathLike | None = None,
     ) -> None:
         """
         Args:
@@ -1626,6 +1973,17 @@ class PatchedPhaseDiagram(PhaseDiagram):
             keep_all_spaces (bool): Pass True to keep chemical spaces that are subspaces
                 of other spaces.
             verbose (bool): Whether to show progress bar during convex hull construction.
+            n_jobs (int): Number of parallel processes used to compute the convex hulls
+                of the chemical spaces, as in joblib.Parallel. -1 uses all CPUs.
+                Defaults to 1, i.e. serial.
+            lazy (bool): Whether to build the PhaseDiagram of each chemical space only
+                when it is first accessed, e.g. by get_pd_for_entry, rather than all
+                of them here. Methods that need all stable entries build all of them.
+                Defaults to False.
+            cache_dir (PathLike): Directory of an on-disk cache of the convex hulls
+                of the chemical spaces. Hulls are read from the cache if it has one
+                for the same entries, and otherwise are computed and written to it.
+                Defaults to None, i.e. no cache.
         """
         if elements is None:
             elements = sorted({els for entry in entries for els in entry.elements})
@@ -1685,16 +2043,35 @@ class PatchedPhaseDiagram(PhaseDiagram):
         self.spaces = sorted(spaces, key=len, reverse=True)  # Calculate pds for smaller dimension spaces last
         self.qhull_entries = qhull_entries
         self._qhull_spaces = qhull_spaces
-        self.pds = dict(self._get_pd_patch_for_space(s) for s in tqdm(self.spaces, disable=not verbose))
+        self.cache_dir = cache_dir
+        self.pds: MutableMapping[frozenset[Element], PhaseDiagram]
+        if lazy:
+            self.pds = _LazyPhaseDiagrams(self, self.spaces)
+        elif n_jobs == 1:
+            self.pds = dict(self._get_pd_patch_for_space(s) for s in tqdm(self.spaces, disable=not verbose))
+        else:
+            self.pds = self._get_pd_patches_parallel(n_jobs, verbose)
         self.all_entries = all_entries
         self.el_refs = el_refs
         self.elements = elements
+        self._patch_stable_entries: tuple[PDEntry, ...] | None = None
+
+    @property
+    def _stable_entries(self) -> tuple[PDEntry, ...]:  # type: ignore[override]
+        """Stable entries of all PhaseDiagrams, which are built if lazy."""
+        if getattr(self, "_patch_stable_entries", None) is None:
+            # Add terminal elements as we may not have PD patches including them
+            # NOTE add el_refs in case no multielement entries are present for el
+            _stable_entries = {se for pd in self.pds.values() for se in pd._stable_entries}
+            self._patch_stable_entries = tuple(_stable_entries | {*self.el_refs.values()})
+            self._patch_stable_spaces = tuple(frozenset(entry.elements) for entry in self._patch_stable_entries)
+        return cast("tuple[PDEntry, ...]", self._patch_stable_entries)
 
-        # Add terminal elements as we may not have PD patches including them
-        # NOTE add el_refs in case no multielement entries are present for el
-        _stable_entries = {se for pd in self.pds.values() for se in pd._stable_entries}
-        self._stable_entries = tuple(_stable_entries | {*self.el_refs.values()})
-        self._stable_spaces = tuple(frozenset(entry.elements) for entry in self._stable_entries)
+    @property
+    def _stable_spaces(self) -> tuple[frozenset[Element], ...]:  # type: ignore[override]
+        """Chemical spaces of the stable entries."""
+        _ = self._stable_entries
+        return self._patch_stable_spaces
 
     def __repr__(self):
         return f"{type(self).__name__} covering {len(self.spaces)} sub-spaces"
@@ -1810,9 +2187,10 @@ class PatchedPhaseDiagram(PhaseDiagram):
         try:
             return self.pds[entry_space]
         except KeyError:
-            for space, pd in self.pds.items():
+            # NOTE iterate over the spaces only, so that lazy PhaseDiagrams are not built
+            for space in self.pds:
                 if space.issuperset(entry_space):
-                    return pd
+                    return self.pds[space]
 
         raise ValueError(f"No suitable PhaseDiagrams found for {entry}.")
 
@@ -1868,6 +2246,47 @@ class PatchedPhaseDiagram(PhaseDiagram):
             on_error=on_error,
         )
 
+    def _get_decomps_and_hull_energies(
+        self, comps: Sequence[Composition] | ArrayLike, with_decomps: bool = True
+    ) -> tuple[list[dict[PDEntry, float] | None], np.ndarray]:
+        """See PhaseDiagram. Compositions are grouped by the PhaseDiagram they
+        are part of, and the decompositions of compositions that are not part
+        of any PhaseDiagram are found with SLSQP as in get_decomposition.
+        """
+        comps = comps if isinstance(comps, np.ndarray) else list(comps)  # type: ignore[arg-type]
+        if isinstance(comps, np.ndarray) or (len(comps) > 0 and not isinstance(comps[0], Composition | Entry)):
+            amounts = np.asarray(comps, dtype=float).reshape(-1, self.dim)
+            comps = [Composition(dict(zip(self.elements, row, strict=True))) for row in amounts.tolist()]
+        comps = [getattr(comp, "composition", comp) for comp in comps]
+
+        pds: dict[frozenset[Element], PhaseDiagram | None] = {}
+        groups: dict[int, list[int]] = defaultdict(list)
+        decomps: list[dict[PDEntry, float] | None] = [None] * len(comps)
+        hull_energies = np.full(len(comps), np.nan)
+        for idx, comp in enumerate(comps):
+            space = frozenset(comp.elements)
+            if space not in pds:
+                try:
+                    pds[space] = self.get_pd_for_entry(comp)
+                except ValueError:
+                    pds[space] = None
+            if (pd := pds[space]) is not None:
+                groups[id(pd)].append(idx)
+                continue
+            with contextlib.suppress(ValueError):
+                decomps[idx] = self.get_decomposition(comp)
+                hull_energies[idx] = sum(entry.energy_per_atom * amt for entry, amt in decomps[idx].items())
+
+        pd_by_id = {id(pd): pd for pd in pds.values() if pd is not None}
+        for pd_id, indices in groups.items():
+            pd_decomps, pd_energies = pd_by_id[pd_id]._get_decomps_and_hull_energies(
+                [comps[idx] for idx in indices], with_decomps=with_decomps
+            )
+            hull_energies[indices] = pd_energies
+            for idx, decomp in zip(indices, pd_decomps, strict=True):
+                decomps[idx] = decomp
+        return decomps, hull_energies
+
     def _get_pd_patch_for_space(self, space: frozenset[Element]) -> tuple[frozenset[Element], PhaseDiagram]:
         """
         Args:
@@ -1877,8 +2296,55 @@ class PatchedPhaseDiagram(PhaseDiagram):
             space, PhaseDiagram for the given chemical space
         """
         space_entries = [e for e, s in zip(self.qhull_entries, self._qhull_spaces, strict=True) if space.issuperset(s)]
+        if self.cache_dir is None:
+            return space, PhaseDiagram(space_entries)
+
+        cache_file = self._get_cache_file(space, space_entries)
+        if os.path.isfile(cache_file):
+            hull_data = _load_hull_data(cache_file)
+        else:
+            hull_data = _get_hull_data(space_entries)
+            _save_hull_data(cache_file, hull_data)
+        return space, _get_pd_from_hull_data(space_entries, hull_data)
+
+    def _get_pd_patches_parallel(self, n_jobs: int, verbose: bool) -> dict[frozenset[Element], PhaseDiagram]:
+        """Get the PhaseDiagrams of all spaces, computing the convex hulls that
+        are not in the cache in parallel. The workers only return the hull data,
+        so that the PhaseDiagrams share the entries of the PatchedPhaseDiagram.
+        """
+        pds: dict[frozenset[Element], PhaseDiagram] = {}
+        todo = []
+        for space in self.spaces:
+            space_entries = [
+                e for e, s in zip(self.qhull_entries, self._qhull_spaces, strict=True) if space.issuperset(s)
+            ]
+            cache_file = None if self.cache_dir is None else self._get_cache_file(space, space_entries)
+            if cache_file is not None and os.path.isfile(cache_file):
+                pds[space] = _get_pd_from_hull_data(space_entries, _load_hull_data(cache_file))
+            else:
+                todo.append((space, space_entries, cache_file))
 
-        return space, PhaseDiagram(space_entries)
+        with tqdm_joblib(tqdm(total=len(todo), disable=not verbose)):
+            all_hull_data = Parallel(n_jobs=n_jobs)(
+                delayed(_get_hull_data)(space_entries) for _, space_entries, _ in todo
+            )
+        for (space, space_entries, cache_file), hull_data in zip(todo, all_hull_data, strict=True):
+            if cache_file is not None:
+                _save_hull_data(cache_file, hull_data)
+            pds[space] = _get_pd_from_hull_data(space_entries, hull_data)
+        return {space: pds[space] for space in self.spaces}
+
+    def _get_cache_file(self, space: frozenset[Element], space_entries: Sequence[PDEntry]) -> str:
+        """Path of the cached hull data of a space, which depends on the compositions
+        and energies of its entries.
+        """
+        key = hashlib.sha256(
+            repr(
+                [(sorted((str(el), amt) for el, amt in e.composition.items()), e.energy) for e in space_entries]
+            ).encode()
+        ).hexdigest()
+        symbols = "-".join(sorted(map(str, space)))
+        return os.path.join(cast("PathLike", self.cache_dir), f"{symbols}_{key[:32]}.npz")
 
     # NOTE the following functions are not implemented for PatchedPhaseDiagram
 
@@ -2101,6 +2567,93 @@ def get_facets(qhull_data: ArrayLike, joggle: bool = False) -> ConvexHull:
     return ConvexHull(qhull_data, qhull_options="Qt i").simplices
 
 
+def _get_hull_data(entries: Sequence[PDEntry]) -> dict[str, np.ndarray]:
+    """Compute the PhaseDiagram of entries, as arrays that refer to the entries by
+    their indices. Used to compute PhaseDiagrams in other processes or to cache them.
+
+    Args:
+        entries (list[PDEntry]): Entries of the phase diagram.
+
+    Returns:
+        dict[str, np.ndarray]: The elements, the indices of all_entries, qhull_entries
+            and el_refs, the facets and the qhull_data of the PhaseDiagram.
+    """
+    pd = PhaseDiagram(entries)
+    index = {id(entry): idx for idx, entry in enumerate(entries)}
+    return {
+        "elements": np.array([str(el) for el in pd.elements]),
+        "all_entries": np.array([index[id(entry)] for entry in pd.all_entries], dtype=int),
+        "qhull_entries": np.array([index[id(entry)] for entry in pd.qhull_entries], dtype=int),
+        "el_refs": np.array([index[id(pd.el_refs[el])] for el in pd.elements], dtype=int),
+        "facets": np.array(pd.facets, dtype=int).reshape(len(pd.facets), pd.dim),
+        "qhull_data": pd.qhull_data,
+    }
+
+
+def _get_pd_from_hull_data(entries: Sequence[PDEntry], hull_data: dict[str, np.ndarray]) -> PhaseDiagram:
+    """Reconstitute a PhaseDiagram from the output of _get_hull_data."""
+    elements = [get_el_sp(el) for el in hull_data["elements"].tolist()]
+    qhull_data = hull_data["qhull_data"]
+    facets = list(hull_data["facets"])
+    computed_data = {
+        "facets": facets,
+        "simplexes": [Simplex(qhull_data[facet, :-1]) for facet in facets],
+        "all_entries": [entries[idx] for idx in hull_data["all_entries"].tolist()],
+        "qhull_data": qhull_data,
+        "dim": len(elements),
+        "el_refs": [(el, entries[idx]) for el, idx in zip(elements, hull_data["el_refs"].tolist(), strict=True)],
+        "qhull_entries": [entries[idx] for idx in hull_data["qhull_entries"].tolist()],
+    }
+    return PhaseDiagram(entries, elements, computed_data=computed_data)
+
+
+def _load_hull_data(filename: PathLike) -> dict[str, np.ndarray]:
+    """Read hull data written by _save_hull_data."""
+    with np.load(filename) as data:
+        return dict(data)
+
+
+def _save_hull_data(filename: PathLike, hull_data: dict[str, np.ndarray]) -> None:
+    """Write hull data to a .npz file, replacing rather than overwriting it so that
+    concurrent readers never see a partial file.
+    """
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    with open(f"{filename}.tmp{os.getpid()}", mode="wb") as file:
+        np.savez(file, **hull_data)
+    os.replace(f"{filename}.tmp{os.getpid()}", filename)
+
+
+class _LazyPhaseDiagrams(MutableMapping):
+    """PhaseDiagrams of the spaces of a PatchedPhaseDiagram, each built the
+    first time it is accessed.
+    """
+
+    def __init__(self, ppd: PatchedPhaseDiagram, spaces: Sequence[frozenset[Element]]) -> None:
+        self._ppd = ppd
+        self._pds: dict[frozenset[Element], PhaseDiagram | None] = dict.fromkeys(spaces)
+
+    def __getitem__(self, space: frozenset[Element]) -> PhaseDiagram:
+        if (pd := self._pds[space]) is None:
+            pd = self._pds[space] = self._ppd._get_pd_patch_for_space(space)[1]
+        return pd
+
+    def __setitem__(self, space: frozenset[Element], pd: PhaseDiagram) -> None:
+        self._pds[space] = pd
+
+    def __delitem__(self, space: frozenset[Element]) -> None:
+        del self._pds[space]
+
+    def __iter__(self) -> Iterator[frozenset[Element]]:
+        return iter(self._pds)
+
+    def __len__(self) -> int:
+        return len(self._pds)
+
+    def __repr__(self) -> str:
+        n_built = sum(pd is not None for pd in self._pds.values())
+        return f"{type(self).__name__}({n_built} of {len(self)} PhaseDiagrams built)"
+
+
 def _get_slsqp_decomp(
     comp,
     competing_entries,
@@ -0,0 +1,299 @@
+"""This module provides an index of structures for finding duplicates of new
+structures in a large set of reference structures with StructureMatcher.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+from monty.serialization import dumpfn, loadfn
+
+from pymatgen.analysis.structure_matcher import ElementComparator, StructureMatcher
+from pymatgen.core import Composition, IStructure, Lattice, Structure
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+    from numpy.typing import NDArray
+    from typing_extensions import Self
+
+    from pymatgen.util.typing import PathLike
+
+ARRAY_NAMES = ("lattices", "offsets", "frac_coords", "species", "key_ids", "fingerprints")
+
+
+class _IndexedStructure(NamedTuple):
+    """A structure prepared for the index."""
+
+    reduced: Structure
+    key: tuple[Hashable, int | None, int | None]
+    fingerprint: NDArray[np.float64]
+
+
+class StructureIndex:
+    """Index of structures for duplicate lookups with a StructureMatcher.
+
+    Each structure is stored as its reduced cell, i.e. after the species
+    processing and the primitive/Niggli reduction that StructureMatcher.fit
+    performs, together with a canonical fingerprint. Structures are bucketed by
+    keys that any two matching structures share: the comparator hash of the
+    composition, the number of sites of the reduced cell (unless the matcher
+    attempts supercells or allows subsets) and, if symprec is given, the space
+    group number. A lookup fetches the bucket of the new structure in constant
+    time and shortlists its structures by fingerprint before running the fit.
+    For cells with the same number of sites, the sorted Niggli lengths (the
+    successive minima of the lattice) of two matching structures can only
+    differ by a factor bounded by ltol and angle_tol, so structures outside a
+    loose bound are pruned without changing the result. The remaining
+    candidates are fitted in order of fingerprint distance, optionally capped
+    at max_candidates.
+
+    The index can be saved to a directory of NumPy arrays plus a JSON file.
+    Loaded indices memory-map the arrays and only build the candidate structures
+    of each lookup.
+    """
+
+    def __init__(
+        self,
+        structure_matcher: StructureMatcher | None = None,
+        symprec: float | None = None,
+        max_candidates: int | None = None,
+    ) -> None:
+        """
+        Args:
+            structure_matcher (StructureMatcher): Matcher used for the lookups.
+                Defaults to StructureMatcher(comparator=ElementComparator()).
+            symprec (float | None): If given, structures only match if they have
+                the same space group number at this symmetry precision.
+            max_candidates (int | None): If given, at most this many candidates
+                closest in fingerprint are fitted per lookup. This bounds the cost
+                of lookups in large buckets, but a match beyond the cap is missed.
+                Defaults to None, i.e. all candidates within the bound are fitted.
+        """
+        self.structure_matcher = structure_matcher or StructureMatcher(comparator=ElementComparator())
+        self.symprec = symprec
+        self.max_candidates = max_candidates
+        self._buckets: dict[tuple, list[int]] = defaultdict(list)
+        self._keys: list[tuple] = []
+        self._fingerprints: list[NDArray[np.float64]] = []
+        # Reduced structures added in memory, or None for those stored in _arrays
+        self._structures: list[Structure | None] = []
+        self._arrays: dict[str, np.ndarray] = {}
+        self._species: list[Composition] = []
+
+    def __len__(self) -> int:
+        return len(self._structures)
+
+    def __contains__(self, structure: object) -> bool:
+        return isinstance(structure, IStructure) and self.find_match(structure) is not None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} structures, {len(self._buckets)} buckets)"
+
+    def add(self, structure: Structure | IStructure, skip_duplicates: bool = False) -> int | None:
+        """Add a structure to the index.
+
+        Args:
+            structure (Structure): Structure to add.
+            skip_duplicates (bool): If True, the structure is not added if it
+                matches a structure in the index.
+
+        Returns:
+            int | None: Index of the new structure, or None if it was skipped.
+        """
+        indexed = self._prepare(structure)
+        if skip_duplicates and self._find_match(indexed) is not None:
+            return None
+
+        idx = len(self._structures)
+        self._structures.append(indexed.reduced)
+        self._keys.append(indexed.key)
+        self._fingerprints.append(indexed.fingerprint)
+        self._buckets[indexed.key].append(idx)
+        return idx
+
+    def add_structures(self, structures: Iterable[Structure | IStructure]) -> list[int]:
+        """Add structures to the index.
+
+        Args:
+            structures (list[Structure]): Structures to add.
+
+        Returns:
+            list[int]: Indices of the new structures.
+        """
+        return [self.add(structure) for structure in structures]  # type: ignore[misc]
+
+    def get_candidates(self, structure: Structure | IStructure) -> list[int]:
+        """Get the indices of the structures that may match a structure, i.e.
+        those in the same bucket within the fingerprint bound, sorted by
+        fingerprint distance.
+
+        Args:
+            structure (Structure): Input structure.
+
+        Returns:
+            list[int]: Indices of the candidate structures.
+        """
+        return self._get_candidates(self._prepare(structure))
+
+    def find_match(self, structure: Structure | IStructure) -> int | None:
+        """Find a structure in the index that matches a structure.
+
+        Args:
+            structure (Structure): Input structure.
+
+        Returns:
+            int | None: Index of a matching structure, or None if there is none.
+        """
+        return self._find_match(self._prepare(structure))
+
+    def get_structure(self, idx: int) -> Structure:
+        """Get the reduced structure stored at an index.
+
+        Args:
+            idx (int): Index of the structure.
+
+        Returns:
+            Structure: The structure after species processing and reduction.
+        """
+        if (structure := self._structures[idx]) is not None:
+            return structure
+        start, end = self._arrays["offsets"][idx : idx + 2]
+        return Structure(
+            Lattice(self._arrays["lattices"][idx]),
+            [self._species[sp_idx] for sp_idx in self._arrays["species"][start:end]],
+            self._arrays["frac_coords"][start:end],
+        )
+
+    def to_file(self, dirname: PathLike) -> None:
+        """Save the index to a directory as NumPy arrays plus a JSON file.
+
+        Args:
+            dirname (PathLike): Directory to write to. Created if needed.
+        """
+        os.makedirs(dirname, exist_ok=True)
+        species: dict[Composition, int] = {}
+        lattices = np.zeros((len(self), 3, 3))
+        offsets = np.zeros(len(self) + 1, dtype=np.int64)
+        frac_coords, species_idx = [], []
+        for idx in range(len(self)):
+            structure = self.get_structure(idx)
+            lattices[idx] = structure.lattice.matrix
+            offsets[idx + 1] = offsets[idx] + len(structure)
+            frac_coords.append(structure.frac_coords)
+            species_idx.append([species.setdefault(comp, len(species)) for comp in structure.species_and_occu])
+
+        keys: dict[tuple, int] = {}
+        arrays = {
+            "lattices": lattices,
+            "offsets": offsets,
+            "frac_coords": np.concatenate(frac_coords) if frac_coords else np.zeros((0, 3)),
+            "species": np.concatenate(species_idx).astype(np.int64) if species_idx else np.zeros(0, dtype=np.int64),
+            "key_ids": np.array([keys.setdefault(key, len(keys)) for key in self._keys], dtype=np.int64),
+            "fingerprints": np.array(self._fingerprints) if self._fingerprints else np.zeros((0, 6)),
+        }
+        # Replace rather than overwrite the files, which may be memory-mapped by this index
+        for name in ARRAY_NAMES:
+            filename = os.path.join(dirname, f"{name}.npy")
+            with open(f"{filename}.tmp", mode="wb") as file:
+                np.save(file, arrays[name])
+            os.replace(f"{filename}.tmp", filename)
+        dumpfn(
+            {
+                "structure_matcher": self.structure_matcher,
+                "symprec": self.symprec,
+                "max_candidates": self.max_candidates,
+                "species": list(species),
+                "keys": [list(key) for key in keys],
+            },
+            os.path.join(dirname, "index.json"),
+        )
+
+    @classmethod
+    def from_file(cls, dirname: PathLike, mmap: bool = True) -> Self:
+        """Load an index saved with to_file.
+
+        Args:
+            dirname (PathLike): Directory of the saved index.
+            mmap (bool): Whether to memory-map the arrays rather than reading
+                them into memory. Defaults to True.
+
+        Returns:
+            StructureIndex
+        """
+        data = loadfn(os.path.join(dirname, "index.json"))
+        index = cls(
+            structure_matcher=data["structure_matcher"],
+            symprec=data["symprec"],
+            max_candidates=data.get("max_candidates"),
+        )
+        index._arrays = {
+            name: np.load(os.path.join(dirname, f"{name}.npy"), mmap_mode="r" if mmap else None) for name in ARRAY_NAMES
+        }
+        index._species = [Composition(comp) for comp in data["species"]]
+
+        keys = [tuple(key) for key in data["keys"]]
+        index._keys = [keys[key_id] for key_id in index._arrays["key_ids"].tolist()]
+        for idx, key in enumerate(index._keys):
+            index._buckets[key].append(idx)
+        index._fingerprints = list(index._arrays["fingerprints"])
+        index._structures = [None] * len(index._keys)
+        return index
+
+    def _prepare(self, structure: Structure | IStructure) -> _IndexedStructure:
+        """Reduce a structure and get its key and fingerprint."""
+        matcher = self.structure_matcher
+        processed = matcher._process_species([structure])[0]
+        reduced = matcher._get_reduced_structure(processed, matcher._primitive_cell, niggli=True)
+
+        exact_sites = not (matcher._subset or matcher._supercell)
+        key = (
+            matcher._comparator.get_hash(processed.composition) if not matcher._subset else None,
+            len(reduced) if exact_sites else None,
+            SpacegroupAnalyzer(structure, symprec=self.symprec).get_space_group_number()  # type: ignore[arg-type]
+            if self.symprec is not None
+            else None,
+        )
+
+        # Scale-free parameters of the Niggli cell, only used to try likely matches first
+        lattice = reduced.lattice.get_niggli_reduced_lattice()
+        fingerprint = np.array([*lattice.abc, *lattice.angles]) / [*[lattice.volume ** (1 / 3)] * 3, 90, 90, 90]
+        if not matcher._scale:
+            fingerprint = np.append(fingerprint, (reduced.volume / len(reduced)) ** (1 / 3))
+        return _IndexedStructure(reduced, key, fingerprint)
+
+    def _get_candidates(self, indexed: _IndexedStructure) -> list[int]:
+        """Indices of the structures in the bucket of a prepared structure that
+        are within the fingerprint bound, sorted by fingerprint distance.
+        """
+        candidates = self._buckets.get(indexed.key, [])
+        if not candidates:
+            return []
+        fingerprints = np.array([self._fingerprints[idx] for idx in candidates])
+        order = np.argsort(np.linalg.norm(fingerprints - indexed.fingerprint, axis=1), kind="stable")
+
+        # Reduced cells with the same number of sites are related by a basis change whose
+        # distortion is bounded by ltol and angle_tol, so their successive minima differ by
+        # a bounded factor. The bound is kept loose, as the fit itself decides the match.
+        matcher = self.structure_matcher
+        distortion = matcher.ltol + np.radians(matcher.angle_tol)
+        if indexed.key[1] is not None and distortion < 1:
+            # Normalized lengths, plus the length scale of the cell if the matcher does not scale volumes
+            cols = [0, 1, 2] if matcher._scale else [0, 1, 2, 6]
+            log_ratios = np.abs(np.log(fingerprints[:, cols] / indexed.fingerprint[cols]))
+            keep = (log_ratios <= 2 * np.log((1 + distortion) / (1 - distortion))).all(axis=1)
+            order = order[keep[order]]
+        if self.max_candidates is not None:
+            order = order[: self.max_candidates]
+        return [candidates[idx] for idx in order]
+
+    def _find_match(self, indexed: _IndexedStructure) -> int | None:
+        """First candidate that matches a prepared structure."""
+        for idx in self._get_candidates(indexed):
+            if self.structure_matcher._fit_reduced(self.get_structure(idx), indexed.reduced):
+                return idx
+        return None
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import abc
+import contextlib
 import itertools
 import math
-from functools import lru_cache
-from typing import TYPE_CHECKING, cast
+import weakref
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, NamedTuple, cast
 
 import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
 from monty.json import MSONable
 
 from pymatgen.core import SETTINGS, Composition, IStructure, Lattice, Structure, get_el_sp
@@ -17,8 +21,8 @@ from pymatgen.util.coord import lattice_points_in_supercell
 from pymatgen.util.coord_cython import is_coord_subset_pbc, pbc_shortest_vectors
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
-    from typing import Literal
+    from collections.abc import Callable, Hashable, Mapping, Sequence
+    from typing import Any, Literal
 
     from typing_extensions import Self
 
@@ -308,6 +312,138 @@ class OccupancyComparator(AbstractComparator):
         return 1
 
 
+class CacheInfo(NamedTuple):
+    """Statistics of a StructureMatcherCache, as in functools.lru_cache."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class StructureMatcherCache:
+    """Size-bounded cache of the preprocessing done by StructureMatcher.
+
+    The cache stores the structures after species processing, the reduced
+    (primitive and Niggli) structures, the rescaled pairs of structures together
+    with their supercell sizes, and the masks of allowed site pairs. A cache can
+    be passed to one or more StructureMatchers, so that e.g. fitting one
+    reference structure against many others only processes and reduces the
+    reference once.
+
+    Entries are looked up by the identity of the input structures and only hold
+    weak references to them, so an entry is dropped as soon as one of its
+    structures is garbage collected. Temporary structures, e.g. copies made
+    during a fit, are therefore not kept alive by the cache. The lattice,
+    fractional coordinates, species and site properties of each structure are
+    stored with the entry and compared on lookup, so that a structure that was
+    modified in place is processed again. The least recently used entries are
+    dropped once there are more than maxsize entries.
+
+    The entries are not pickled, so that matchers sent to parallel workers start
+    with an empty cache.
+    """
+
+    def __init__(self, maxsize: int | None = LRU_CACHE_SIZE) -> None:
+        """
+        Args:
+            maxsize (int | None): Maximum number of entries. None for no limit.
+                Defaults to the STRUCTURE_MATCHER_CACHE_SIZE setting or 300.
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[tuple[weakref.ref, ...], tuple, Any]] = OrderedDict()
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        hits, misses, maxsize, currsize = self.cache_info()
+        return f"{type(self).__name__}({hits=}, {misses=}, {maxsize=}, {currsize=})"
+
+    def __getstate__(self) -> dict:
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["maxsize"])  # type: ignore[misc]
+
+    def cache_info(self, kind: str | None = None) -> CacheInfo:
+        """Get the hit and miss statistics of the cache.
+
+        Args:
+            kind (str | None): If given, only count lookups of this kind of
+                entry: "species" (processed structures), "reduced" (reduced
+                structures), "preprocess" (rescaled pairs and supercell sizes)
+                or "mask". Defaults to None, i.e. all lookups.
+
+        Returns:
+            CacheInfo: hits, misses, maxsize and current number of entries.
+        """
+        if kind is None:
+            return CacheInfo(self._hits.total(), self._misses.total(), self.maxsize, len(self._entries))
+        return CacheInfo(
+            self._hits[kind], self._misses[kind], self.maxsize, sum(key[0] == kind for key in self._entries)
+        )
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        self._entries.clear()
+        self._hits.clear()
+        self._misses.clear()
+
+    @staticmethod
+    def _get_state(struct: Structure | IStructure) -> tuple:
+        """State of a structure that the cached results depend on."""
+        return struct.lattice.matrix.copy(), struct.frac_coords, struct.species_and_occu, struct.site_properties
+
+    @staticmethod
+    def _states_equal(state: tuple, old_state: tuple) -> bool:
+        """Whether two states of a structure are the same."""
+        matrix, coords, species, props = state
+        old_matrix, old_coords, old_species, old_props = old_state
+        return (
+            np.array_equal(matrix, old_matrix)
+            and np.array_equal(coords, old_coords)
+            and species == old_species
+            and props.keys() == old_props.keys()
+            and all(np.array_equal(props[key], old_props[key]) for key in props)
+        )
+
+    def _get(
+        self, kind: str, structures: tuple[Structure | IStructure, ...], args: tuple, compute: Callable[[], Any]
+    ) -> Any:
+        """Get an entry, or compute and store it if it is missing or outdated."""
+        key = (kind, tuple(map(id, structures)), args)
+        states = tuple(map(self._get_state, structures))
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and all(ref() is struct for ref, struct in zip(entry[0], structures, strict=True))
+            and all(map(self._states_equal, states, entry[1]))
+        ):
+            self._entries.move_to_end(key)
+            self._hits[kind] += 1
+            return entry[2]
+
+        self._misses[kind] += 1
+        value = compute()
+        if self.maxsize is None or self.maxsize > 0:
+            # Drop the entry once any of its structures is collected, without keeping the cache alive
+            cache_ref = weakref.ref(self)
+
+            def drop(ref: weakref.ref) -> None:
+                if (cache := cache_ref()) is not None and (entry := cache._entries.get(key)) and ref in entry[0]:
+                    del cache._entries[key]
+
+            refs = tuple(weakref.ref(struct, drop) for struct in structures)
+            self._entries[key] = (refs, states, value)
+            self._entries.move_to_end(key)
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+
 class StructureMatcher(MSONable):
     """Match structures by similarity.
 
@@ -363,6 +499,8 @@ class StructureMatcher(MSONable):
         comparator: AbstractComparator | None = None,
         supercell_size: Literal["num_sites", "num_atoms", "volume"] = "num_sites",
         ignored_species: Sequence[SpeciesLike] = (),
+        batched_lattice_search: bool = False,
+        cache: StructureMatcherCache | None = None,
     ) -> None:
         """
         Args:
@@ -405,6 +543,20 @@ class StructureMatcher(MSONable):
                 except for certain ions, e.g. Li-ion intercalation frameworks.
                 This is more useful than allow_subset because it allows better
                 control over what species are ignored in the matching.
+            batched_lattice_search (bool): If True, the fractional coordinates of
+                struct2 are compared to those of struct1 on all candidate lattices
+                and translations at once in NumPy, rather than one at a time. This
+                also gives a lower bound on the distances of each lattice, so that
+                the site assignment is skipped for lattices that cannot improve on
+                the best match found so far. The results are the same as without
+                this option, but it is usually faster for low-symmetry cells and
+                supercells, which have many candidate lattices. Default to False.
+            cache (StructureMatcherCache): Cache of the processed and reduced
+                structures, supercell sizes and masks, which can be shared by
+                several matchers and inspected with cache_info(). Useful when the
+                same structures are fitted many times, e.g. one reference against
+                many structures. It is not included in as_dict. Default to None,
+                i.e. only the reduced structures are cached per process.
         """
         self.ltol = ltol
         self.stol = stol
@@ -416,6 +568,8 @@ class StructureMatcher(MSONable):
         self._supercell_size = supercell_size
         self._subset = allow_subset
         self._ignored_species = ignored_species
+        self._batched_lattice_search = batched_lattice_search
+        self._cache = cache
 
     def _get_supercell_size(self, s1, s2):
         """Get the supercell size, and whether the supercell should be applied to s1.
@@ -467,10 +621,33 @@ class StructureMatcher(MSONable):
             if math.isclose(abs(np.linalg.det(scale_m)), supercell_size, abs_tol=0.5, rel_tol=0):
                 yield latt, scale_m
 
-    def _get_supercells(self, struct1, struct2, fu, s1_supercell):
+    def _get_lattice_arrays(self, target_lattice, s, supercell_size=1):
+        """Vectorized version of _get_lattices.
+
+        Args:
+            target_lattice (Lattice): target lattice.
+            s (Structure): input structure.
+            supercell_size (int): Number of primitive cells in returned lattice
+
+        Returns:
+            tuple: (n, 3, 3) arrays of the lattice matrices and of the supercell
+                matrices of the lattices of _get_lattices, in the same order.
+        """
+        (c_a, c_b, c_c), (f_a, f_b, f_c), (alpha_b, beta_b, gamma_b) = s.lattice._get_mapping_candidates(
+            target_lattice, ltol=self.ltol, atol=self.angle_tol
+        )
+        inds_a, inds_b, inds_c = np.nonzero(gamma_b[:, :, None] & alpha_b[None, :, :] & beta_b[:, None, :])
+        scale_ms = np.stack((f_a[inds_a], f_b[inds_b], f_c[inds_c]), axis=1).astype(np.int64)
+        dets = np.abs(np.linalg.det(scale_ms))
+        keep = (dets >= 1e-8) & np.isclose(dets, supercell_size, atol=0.5, rtol=0)
+        matrices = np.stack((c_a[inds_a[keep]], c_b[inds_b[keep]], c_c[inds_c[keep]]), axis=1)
+        return matrices, scale_ms[keep]
+
+    def _get_supercells(self, struct1, struct2, fu, s1_supercell, lattices=None):
         """Compute all supercells of one structure close to the lattice of the other
         if s1_supercell is True, it makes the supercells of struct1, otherwise
-        it makes them of s2.
+        it makes them of s2. If lattices is given, only the supercells of these
+        (lattice, supercell_matrix) pairs from _get_lattices are computed.
 
         yields: s1, s2, supercell_matrix, average_lattice, supercell_matrix
         """
@@ -481,15 +658,16 @@ class StructureMatcher(MSONable):
 
         def sc_generator(s1, s2):
             s2_fc = np.array(s2.frac_coords)
+            candidates = self._get_lattices(s2.lattice, s1, fu) if lattices is None else lattices
             if fu == 1:
                 cc = np.array(s1.cart_coords)
-                for latt, sc_m in self._get_lattices(s2.lattice, s1, fu):
+                for latt, sc_m in candidates:
                     fc = latt.get_fractional_coords(cc)
                     fc -= np.floor(fc)
                     yield fc, s2_fc, av_lat(latt, s2.lattice), sc_m
             else:
                 fc_init = np.array(s1.frac_coords)
-                for latt, sc_m in self._get_lattices(s2.lattice, s1, fu):
+                for latt, sc_m in candidates:
                     fc = np.dot(fc_init, np.linalg.inv(sc_m))
                     lp = lattice_points_in_supercell(sc_m)
                     fc = (fc[:, None, :] + lp[None, :, :]).reshape((-1, 3))
@@ -504,6 +682,116 @@ class StructureMatcher(MSONable):
                 # reorder generator output so s1 is still first
                 yield x[1], x[0], x[2], x[3]
 
+    def _batch_search_supercells(self, struct1, struct2, fu, s1_supercell, mask, s1_t_inds, s2_t_ind, use_rms):
+        """Batched search of the lattices and translations of _strict_match.
+
+        The fractional coordinates of struct2 are compared to those of struct1 on
+        chunks of candidate lattices and all of their translations at once. For a
+        translation, the ratio of a site of struct2 is its smallest periodic
+        fractional distance to an allowed site of struct1, in units of the
+        fractional tolerance of _strict_match, so that the translation passes
+        _cmp_fstruct only if the ratios of all sites are at most 1. The sites are
+        compared in blocks of increasing size and translations are dropped as soon
+        as a ratio exceeds 1.
+
+        The ratios also bound the distances of _cart_dists. A fractional distance f
+        along lattice vector k is a Cartesian distance of at least 2 * pi * f / |b_k|,
+        with b_k the reciprocal lattice vector, i.e. at least 2 * stol times the ratio
+        after normalization. The difference between the displacements of a site and
+        of the site used for the translation does not depend on the translation, so
+        the largest normalized distance of any matching on a lattice is at least stol
+        times the smallest (over translations) largest ratio, and the RMS distance at
+        least 2 * stol * sqrt(sum(ratio**2)) / len(struct2).
+
+        Yields:
+            The (s1fc, s2fc, average_lattice, supercell_matrix) of _get_supercells for
+            the lattices with translations that may pass _cmp_fstruct, the struct1
+            translation indices of these and a lower bound of the distance of any
+            matching on the lattice.
+        """
+        s1, s2 = (struct1, struct2) if s1_supercell else (struct2, struct1)
+        all_matrices, all_sc_ms = self._get_lattice_arrays(s2.lattice, s1, fu)
+        allowed = np.invert(mask.astype(bool))
+        n_sites = len(mask)
+        # Sites with the fewest allowed sites in struct1 are compared first
+        site_order = np.argsort(allowed.sum(axis=1), kind="stable")
+        # Relative margin for the rounding errors of the batched coordinates
+        margin = 1e-6
+        max_chunk_size = max(1, 2**22 // (len(s1_t_inds) * mask.size * 3))
+        chunk_start, chunk_size = 0, 8
+        while chunk_start < len(all_matrices):
+            chunk = slice(chunk_start, chunk_start + min(chunk_size, max_chunk_size))
+            chunk_start, chunk_size = chunk.stop, 2 * chunk_size
+            matrices, sc_ms = all_matrices[chunk], all_sc_ms[chunk]
+
+            # Fractional coordinates of the supercells, up to rounding and translations
+            if fu == 1:
+                sc_fc = np.matmul(s1.cart_coords, np.linalg.inv(matrices))
+            else:
+                # Same lattice points as lattice_points_in_supercell, on a common grid
+                inv_sc_ms = np.linalg.inv(sc_ms)
+                corners = np.matmul(list(itertools.product((0, 1), repeat=3)), sc_ms)
+                grid = np.stack(
+                    np.meshgrid(*map(np.arange, corners.min(axis=(0, 1)), corners.max(axis=(0, 1)) + 1), indexing="ij"),
+                    axis=-1,
+                ).reshape((-1, 3))
+                lattice_points = np.matmul(grid, inv_sc_ms)
+                inside = np.all((lattice_points >= -1e-10) & (lattice_points < 1 - 1e-10), axis=-1)
+                lattice_points = lattice_points[inside].reshape((len(matrices), fu, 3))
+                sc_fc = np.matmul(s1.frac_coords, inv_sc_ms)
+                sc_fc = (sc_fc[:, :, None, :] + lattice_points[:, None, :, :]).reshape((len(matrices), -1, 3))
+            fixed_fc = np.broadcast_to(s2.frac_coords, (len(matrices), len(s2), 3))
+            s1fc, s2fc = (sc_fc, fixed_fc) if s1_supercell else (fixed_fc, sc_fc)
+
+            # Fractional tolerances on the average lattices, from their lattice parameters
+            lengths = np.linalg.norm(matrices, axis=-1)
+            dots = np.einsum("nij,nkj->nik", matrices, matrices)[:, [1, 0, 0], [2, 2, 1]]
+            cosines = np.clip(dots / (lengths[:, [1, 0, 0]] * lengths[:, [2, 2, 1]]), -1, 1)
+            angles = np.radians((np.degrees(np.arccos(cosines)) + s2.lattice.angles) / 2)
+            lengths = (lengths + s2.lattice.abc) / 2
+            cos_a, cos_b, cos_g = np.cos(angles).T
+            volumes = np.prod(lengths, axis=1) * np.sqrt(1 - cos_a**2 - cos_b**2 - cos_g**2 + 2 * cos_a * cos_b * cos_g)
+            inv_abc = 2 * np.pi * np.sin(angles) * lengths[:, [1, 0, 0]] * lengths[:, [2, 2, 1]] / volumes[:, None]
+            normalization = (s1fc.shape[1] / volumes) ** (1 / 3)
+            frac_tol = inv_abc * self.stol / (np.pi * normalization[:, None])
+
+            # Ratios of the translations that pass the sites compared so far
+            translations = s1fc[:, s1_t_inds] - s2fc[:, [s2_t_ind]]
+            max_ratio = np.zeros(translations.shape[:2])
+            sum_sq_ratio = np.zeros(translations.shape[:2])
+            latt_inds, t_inds = np.indices(translations.shape[:2]).reshape((2, -1))
+            start, block_size = 0, 1
+            while start < n_sites and len(latt_inds) > 0:
+                sites = site_order[start : start + block_size]
+                start, block_size = start + block_size, 2 * block_size
+                cols = np.flatnonzero(allowed[sites].any(axis=0))
+                diffs = (
+                    s2fc[latt_inds[:, None], sites, None]
+                    + translations[latt_inds, t_inds, None, None]
+                    - s1fc[latt_inds[:, None], cols][:, None]
+                )
+                diffs = np.abs(diffs - np.round(diffs)) / frac_tol[latt_inds, None, None]
+                ratios = np.maximum(np.maximum(diffs[..., 0], diffs[..., 1]), diffs[..., 2])
+                ratios = np.where(allowed[np.ix_(sites, cols)], ratios, np.inf).min(axis=-1)
+                max_ratio[latt_inds, t_inds] = np.maximum(max_ratio[latt_inds, t_inds], ratios.max(axis=1))
+                sum_sq_ratio[latt_inds, t_inds] += np.sum(ratios**2, axis=1)
+                passes = max_ratio[latt_inds, t_inds] <= 1 + margin
+                latt_inds, t_inds = latt_inds[passes], t_inds[passes]
+            passes = np.zeros(translations.shape[:2], dtype=bool)
+            passes[latt_inds, t_inds] = True
+
+            # The ratios of the dropped translations are lower bounds of their full ratios
+            if use_rms:
+                bounds = np.maximum(max_ratio / n_sites**0.5, 2 * np.sqrt(sum_sq_ratio) / n_sites)
+            else:
+                bounds = max_ratio
+            bounds = self.stol * (1 - margin) * bounds.min(axis=1)
+
+            for idx in np.flatnonzero(passes.any(axis=1)):
+                lattice = (Lattice(matrices[idx]), sc_ms[idx])
+                supercell = next(self._get_supercells(struct1, struct2, fu, s1_supercell, lattices=[lattice]))
+                yield supercell, s1_t_inds[passes[idx]], bounds[idx]
+
     @classmethod
     def _cmp_fstruct(cls, s1, s2, frac_tol, mask):
         """Get true if a matching exists between s2 and s2
@@ -662,16 +950,49 @@ class StructureMatcher(MSONable):
 
         return match[0], max(match[1])
 
+    def _cached(self, kind: str, structures: tuple, args: tuple, compute: Callable[[], Any]) -> Any:
+        """Look up a result in the cache of the matcher, if there is one. The
+        results may be shared, so they must not be modified.
+        """
+        if self._cache is None:
+            return compute()
+        settings = (
+            type(self._comparator),
+            self._primitive_cell,
+            self._scale,
+            self._supercell,
+            repr(self._supercell_size),
+            repr(self._ignored_species),
+        )
+        return self._cache._get(kind, structures, (*settings, *args), compute)
+
     def _process_species(self, structures):
-        copied_structures = []
-        for s in structures:
-            # We need the copies to be actual Structure to work properly, not
-            # subclasses. So do type(s) == Structure.
-            ss = Structure.from_sites(s)
-            if self._ignored_species:
-                ss.remove_species(self._ignored_species)
-            copied_structures.append(ss)
-        return copied_structures
+        return [self._cached("species", (s,), (), partial(self._process_structure, s)) for s in structures]
+
+    def _process_structure(self, struct):
+        # We need the copies to be actual Structure to work properly, not
+        # subclasses. So do type(s) == Structure.
+        processed = Structure.from_sites(struct)
+        if self._ignored_species:
+            processed.remove_species(self._ignored_species)
+        return processed
+
+    def _reduce_structure(self, struct, niggli=True):
+        """Get a copy of the reduced structure, from the cache of the matcher
+        if there is one.
+        """
+        if self._cache is None:
+            return self._get_reduced_structure(struct, self._primitive_cell, niggli)
+        reduced = self._cached(
+            "reduced",
+            (struct,),
+            (niggli,),
+            # the per-process lru_cache is bypassed, as its lookups compare all sites
+            lambda: self._get_reduced_istructure.__wrapped__(  # type: ignore[attr-defined]
+                SiteOrderedIStructure.from_sites(struct), self._primitive_cell, niggli
+            ),
+        )
+        return Structure.from_sites(reduced)
 
     def _preprocess(self, struct1, struct2, niggli=True, skip_structure_reduction: bool = False):
         """
@@ -681,13 +1002,22 @@ class StructureMatcher(MSONable):
         If skip_structure_reduction is True, skip to get reduced structures (by primitive transformation and
         niggli reduction). This option is useful for fitting a set of structures several times.
         """
+        return self._cached(
+            "preprocess",
+            (struct1, struct2),
+            (niggli, skip_structure_reduction),
+            partial(self._preprocess_uncached, struct1, struct2, niggli, skip_structure_reduction),
+        )
+
+    def _preprocess_uncached(self, struct1, struct2, niggli=True, skip_structure_reduction: bool = False):
+        """Uncached _preprocess."""
         if skip_structure_reduction:
             # Need to copy original structures to rescale lattices later
             struct1 = struct1.copy()
             struct2 = struct2.copy()
         else:
-            struct1 = self._get_reduced_structure(struct1, self._primitive_cell, niggli)
-            struct2 = self._get_reduced_structure(struct2, self._primitive_cell, niggli)
+            struct1 = self._reduce_structure(struct1, niggli)
+            struct2 = self._reduce_structure(struct2, niggli)
 
         if self._supercell:
             fu, s1_supercell = self._get_supercell_size(struct1, struct2)
@@ -762,7 +1092,9 @@ class StructureMatcher(MSONable):
         if fu < 1:
             raise ValueError("fu cannot be less than 1")
 
-        mask, s1_t_inds, s2_t_ind = self._get_mask(struct1, struct2, fu, s1_supercell)
+        mask, s1_t_inds, s2_t_ind = self._cached(
+            "mask", (struct1, struct2), (fu, s1_supercell), partial(self._get_mask, struct1, struct2, fu, s1_supercell)
+        )
 
         if mask.shape[0] > mask.shape[1]:
             raise ValueError("after supercell creation, struct1 must have more sites than struct2")
@@ -774,15 +1106,26 @@ class StructureMatcher(MSONable):
         if LinearAssignment(mask).min_cost > 0:
             return None
 
+        if self._batched_lattice_search:
+            candidates = self._batch_search_supercells(
+                struct1, struct2, fu, s1_supercell, mask, s1_t_inds, s2_t_ind, use_rms
+            )
+        else:
+            supercells = self._get_supercells(struct1, struct2, fu, s1_supercell)
+            candidates = ((supercell, s1_t_inds, 0.0) for supercell in supercells)
+
         best_match = None
         # loop over all lattices
-        for s1fc, s2fc, avg_l, sc_m in self._get_supercells(struct1, struct2, fu, s1_supercell):
+        for (s1fc, s2fc, avg_l, sc_m), t_inds, lower_bound in candidates:
+            # skip lattices that cannot give a match or improve on the best match
+            if lower_bound >= (self.stol if best_match is None else min(self.stol, best_match[0])):
+                continue
             # compute fractional tolerance
             normalization = (len(s1fc) / avg_l.volume) ** (1 / 3)
             inv_abc = np.array(avg_l.reciprocal_lattice.abc)
             frac_tol = inv_abc * self.stol / (np.pi * normalization)
             # loop over all translations
-            for s1i in s1_t_inds:
+            for s1i in t_inds:
                 t = s1fc[s1i] - s2fc[s2_t_ind]
                 t_s2fc = s2fc + t
                 if self._cmp_fstruct(s1fc, t_s2fc, frac_tol, mask):
@@ -803,14 +1146,24 @@ class StructureMatcher(MSONable):
 
         return None
 
-    def group_structures(self, s_list, anonymous=False):
+    def group_structures(self, s_list, anonymous=False, n_jobs: int = 1):
         """
         Given a list of structures, use fit to group
         them by structural equality.
 
+        Structures are first bucketed by invariants that any two matching
+        structures share (the composition hash and, unless attempt_supercell
+        is used, the number of sites of the reduced structures), so that fit
+        is only called within a bucket. The structure reduction and the fits
+        of each reference structure against the rest of its bucket can be
+        run in parallel, which gives the same groups as a serial run.
+
         Args:
             s_list ([Structure]): List of structures to be grouped
             anonymous (bool): Whether to use anonymous mode.
+            n_jobs (int): Number of parallel processes used for the structure
+                reduction and the fits, as in joblib.Parallel. -1 uses all
+                CPUs. Defaults to 1, i.e. serial.
 
         Returns:
             A list of lists of matched structures
@@ -822,47 +1175,70 @@ class StructureMatcher(MSONable):
 
         original_s_list = list(s_list)
         s_list = self._process_species(s_list)
-        # Prepare reduced structures beforehand
-        s_list = [self._get_reduced_structure(s, self._primitive_cell, niggli=True) for s in s_list]
 
-        # Use structure hash to pre-group structures
-        if anonymous:
+        with Parallel(n_jobs=n_jobs) if n_jobs != 1 else contextlib.nullcontext() as parallel:
+            # Prepare reduced structures beforehand
+            if parallel is None:
+                s_list = [self._reduce_structure(s, niggli=True) for s in s_list]
+            else:
+                s_list = parallel(
+                    delayed(self._get_reduced_structure)(s, self._primitive_cell, niggli=True) for s in s_list
+                )
 
-            def c_hash(c):
-                return c.anonymized_formula
+            # Use structure hash to pre-group structures
+            if anonymous:
 
-        else:
-            c_hash = self._comparator.get_hash
-
-        def s_hash(s):
-            return c_hash(s[1].composition)
-
-        sorted_s_list = sorted(enumerate(s_list), key=s_hash)
-        all_groups = []
-
-        # For each pre-grouped list of structures, perform actual matching.
-        for _, g in itertools.groupby(sorted_s_list, key=s_hash):
-            unmatched = list(g)
-            while len(unmatched) > 0:
-                i, refs = unmatched.pop(0)
-                matches = [i]
-                if anonymous:
-                    inds = filter(
-                        lambda i: self.fit_anonymous(refs, unmatched[i][1], skip_structure_reduction=True),
-                        list(range(len(unmatched))),
-                    )
-                else:
-                    inds = filter(
-                        lambda i: self.fit(refs, unmatched[i][1], skip_structure_reduction=True),
-                        list(range(len(unmatched))),
-                    )
-                inds = list(inds)
-                matches.extend([unmatched[i][0] for i in inds])
-                unmatched = [unmatched[i] for i in range(len(unmatched)) if i not in inds]
-                all_groups.append([original_s_list[i] for i in matches])
+                def c_hash(c):
+                    return c.anonymized_formula
+
+            else:
+                c_hash = self._comparator.get_hash
+
+            def s_hash(s):
+                return c_hash(s[1].composition)
+
+            sorted_s_list = sorted(enumerate(s_list), key=s_hash)
+            all_groups = []
+
+            # For each pre-grouped list of structures, perform actual matching.
+            for _, g in itertools.groupby(sorted_s_list, key=s_hash):
+                # Without supercells, structures only match if they have the same number of sites
+                buckets: dict[int, list[tuple[int, Structure]]] = defaultdict(list)
+                for idx, struct in g:
+                    buckets[0 if self._supercell else len(struct)].append((idx, struct))
+
+                groups = []
+                for unmatched in buckets.values():
+                    while len(unmatched) > 0:
+                        i, refs = unmatched.pop(0)
+                        # Small batches of fits are not worth dispatching to the workers
+                        if parallel is None or len(unmatched) < 4 * effective_n_jobs(n_jobs):
+                            is_match = [self._fit_reduced(refs, struct, anonymous) for _, struct in unmatched]
+                        else:
+                            is_match = parallel(
+                                delayed(self._fit_reduced)(refs, struct, anonymous) for _, struct in unmatched
+                            )
+                        groups.append([i] + [idx for (idx, _), match in zip(unmatched, is_match, strict=True) if match])
+                        unmatched = [item for item, match in zip(unmatched, is_match, strict=True) if not match]
+
+                # Order the groups as if the buckets were matched as a whole
+                groups.sort(key=lambda group: group[0])
+                all_groups.extend([original_s_list[i] for i in group] for group in groups)
 
         return all_groups
 
+    def _fit_reduced(self, struct1: Structure, struct2: Structure, anonymous: bool = False) -> bool:
+        """Same as fit (or fit_anonymous) with skip_structure_reduction=True, for
+        structures that are already processed and reduced by group_structures.
+        """
+        struct1, struct2, fu, s1_supercell = self._preprocess(struct1, struct2, skip_structure_reduction=True)
+        if anonymous:
+            return bool(
+                self._anonymous_match(struct1, struct2, fu, s1_supercell, break_on_match=True, single_match=True)
+            )
+        match = self._match(struct1, struct2, fu, s1_supercell, break_on_match=True)
+        return match is not None and match[0] <= self.stol
+
     def as_dict(self):
         """MSONable dict."""
         return {
@@ -879,6 +1255,7 @@ class StructureMatcher(MSONable):
             "allow_subset": self._subset,
             "supercell_size": self._supercell_size,
             "ignored_species": self._ignored_species,
+            "batched_lattice_search": self._batched_lattice_search,
         }
 
     @classmethod
@@ -901,6 +1278,7 @@ class StructureMatcher(MSONable):
             comparator=AbstractComparator.from_dict(dct["comparator"]),
             supercell_size=dct["supercell_size"],
             ignored_species=dct["ignored_species"],
+            batched_lattice_search=dct.get("batched_lattice_search", False),
         )
 
     def _anonymous_match(
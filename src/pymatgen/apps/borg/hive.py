@@ -16,7 +16,7 @@ from monty.json import MSONable
 from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEntry
 from pymatgen.io.gaussian import GaussianOutput
 from pymatgen.io.vasp.inputs import Incar, Poscar, Potcar
-from pymatgen.io.vasp.outputs import Dynmat, Oszicar, Vasprun
+from pymatgen.io.vasp.outputs import Dynmat, Oszicar, Vasprun, VasprunSummary
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -83,6 +83,10 @@ class VaspToComputedEntryDrone(AbstractDrone):
     2. Directories designated "relax1", "relax2" are considered to be 2 parts
        of an aflow style run, and only "relax2" is parsed.
     3. The drone parses only the vasprun.xml file.
+
+    Unless parameters or data that are not in the summary of a run (e.g. DOS
+    and band data, see VasprunSummary.skipped_attrs) are requested, the
+    vasprun.xml is parsed with the faster VasprunSummary.
     """
 
     def __init__(
@@ -141,7 +145,10 @@ class VaspToComputedEntryDrone(AbstractDrone):
                 warnings.warn(f"{len(vasprun_files)} vasprun.xml.* found. {filepath} is being parsed.", stacklevel=2)
 
         try:
-            vasp_run = Vasprun(filepath)
+            if VasprunSummary.skipped_attrs.isdisjoint([*self._parameters, *self._data]):
+                vasp_run = VasprunSummary(filepath)
+            else:
+                vasp_run = Vasprun(filepath)
         except Exception as exc:
             logger.debug(f"error in {filepath}: {exc}")
             return None
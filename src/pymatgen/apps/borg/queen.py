@@ -5,9 +5,12 @@ data using Python's multiprocessing.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import lzma
 import os
+import zlib
 from multiprocessing import Manager, Pool
 from typing import TYPE_CHECKING
 
@@ -15,6 +18,8 @@ from monty.io import zopen
 from monty.json import MontyDecoder, MontyEncoder
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from pymatgen.apps.borg.hive import AbstractDrone
     from pymatgen.util.typing import PathLike
 
@@ -32,6 +37,7 @@ class BorgQueen:
         drone: AbstractDrone,
         rootpath: PathLike | None = None,
         number_of_drones: int = 1,
+        manifest: PathLike | None = None,
     ) -> None:
         """
         Args:
@@ -46,13 +52,17 @@ class BorgQueen:
                 will definitely see a significant speedup of at least 50% or so.
                 If you are running this over a server with far more processors,
                 the speedup will be even greater.
+            manifest (PathLike): If given, rootpath is assimilated incrementally
+                with this manifest file, see incremental_assimilate.
         """
         self._drone = drone
         self._num_drones = number_of_drones
         self._data: list = []
 
         if rootpath:
-            if number_of_drones > 1:
+            if manifest is not None:
+                self.incremental_assimilate(rootpath, manifest)
+            elif number_of_drones > 1:
                 self.parallel_assimilate(rootpath)
             else:
                 self.serial_assimilate(rootpath)
@@ -60,9 +70,7 @@ class BorgQueen:
     def parallel_assimilate(self, rootpath: PathLike) -> None:
         """Assimilate the entire subdirectory structure in rootpath."""
         logger.info("Scanning for valid paths...")
-        valid_paths = []
-        for parent, subdirs, files in os.walk(rootpath):
-            valid_paths.extend(self._drone.get_valid_paths((parent, subdirs, files)))
+        valid_paths = self._get_valid_paths(rootpath)
         manager = Manager()
         data = manager.list()
         status = manager.dict()
@@ -79,9 +87,7 @@ class BorgQueen:
 
     def serial_assimilate(self, root: PathLike) -> None:
         """Assimilate the entire subdirectory structure in rootpath serially."""
-        valid_paths = []
-        for parent, subdirs, files in os.walk(root):
-            valid_paths.extend(self._drone.get_valid_paths((parent, subdirs, files)))
+        valid_paths = self._get_valid_paths(root)
         data: list[str] = []
         total = len(valid_paths)
         for idx, path in enumerate(valid_paths, start=1):
@@ -91,6 +97,83 @@ class BorgQueen:
         for json_str in data:
             self._data.append(json.loads(json_str, cls=MontyDecoder))
 
+    def incremental_assimilate(self, rootpath: PathLike, manifest: PathLike, chunk_size: int = 100) -> None:
+        """Assimilate the entire subdirectory structure in rootpath, reusing the
+        results of a previous run for the paths that did not change.
+
+        The manifest is a JSON lines file with one record per valid path,
+        holding the path relative to rootpath, a signature of the names, sizes
+        and modification times of its files, and the assimilated data. Only
+        new paths and paths whose signature changed are assimilated, using
+        number_of_drones processes. Their records are appended to the manifest
+        in chunks as they complete, so that an interrupted run can be resumed.
+        At the end, the manifest is rewritten with the records of the current
+        valid paths only.
+
+        Args:
+            rootpath (PathLike): The root directory to start assimilation.
+            manifest (PathLike): Manifest file, created if it does not exist.
+                Note that if the filename ends with gz or bz2, the relevant
+                compression will be applied.
+            chunk_size (int): Number of records written to the manifest at once.
+                Defaults to 100.
+        """
+        logger.info("Scanning for valid paths...")
+        valid_paths = self._get_valid_paths(rootpath)
+        records, n_lines, complete = _load_manifest(manifest)
+        if not complete:
+            # Appending after a truncated line or compressed stream would corrupt the new records
+            logger.info("Rewriting the manifest of an interrupted run...")
+            _write_manifest(manifest, records.values())
+            n_lines = len(records)
+
+        path_set = set(valid_paths)
+        signatures = {}
+        todo = []
+        for path in valid_paths:
+            rel_path = os.path.relpath(path, rootpath)
+            signatures[rel_path] = signature = _get_signature(path, path_set)
+            if rel_path not in records or records[rel_path]["signature"] != signature:
+                todo.append((self._drone, path, rel_path, signature))
+        logger.info(f"{len(valid_paths)} valid paths found, {len(todo)} new or changed.")
+
+        if todo:
+            with zopen(manifest, mode="at", encoding="utf-8") as file:
+                lines: list[str] = []
+                for idx, line in enumerate(self._map_assimilation(todo), start=1):
+                    record = json.loads(line)
+                    records[record["path"]] = record
+                    lines.append(line)
+                    if len(lines) == chunk_size or idx == len(todo):
+                        file.write("".join(lines))  # type:ignore[arg-type]
+                        file.flush()
+                        lines = []
+                    logger.info(f"{idx}/{len(todo)} ({idx / len(todo):.1%}) done")
+
+        # Drop the records of removed paths and superseded records
+        if todo or n_lines != len(signatures) or records.keys() != signatures.keys() or not os.path.isfile(manifest):
+            _write_manifest(manifest, (records[rel_path] for rel_path in signatures))
+
+        decoder = MontyDecoder()
+        for rel_path in signatures:
+            if (data := records[rel_path]["data"]) is not None:
+                self._data.append(decoder.process_decoded(data))
+
+    def _map_assimilation(self, todo: list[tuple]) -> Iterator[str]:
+        """Manifest lines of assimilated paths, in the order they complete."""
+        if self._num_drones > 1 and len(todo) > 1:
+            with Pool(self._num_drones) as pool:
+                yield from pool.imap_unordered(_assimilate_record, todo)
+        else:
+            yield from map(_assimilate_record, todo)
+
+    def _get_valid_paths(self, rootpath: PathLike) -> list[str]:
+        """Valid paths of the drone in the subdirectory structure of rootpath."""
+        valid_paths = []
+        for parent, subdirs, files in os.walk(rootpath):
+            valid_paths.extend(self._drone.get_valid_paths((parent, subdirs, files)))
+        return valid_paths
+
     def get_data(self) -> list:
         """Get an list of assimilated objects."""
         return self._data
@@ -121,3 +204,64 @@ def order_assimilation(args: tuple) -> None:
     count = status["count"]
     total = status["total"]
     logger.info(f"{count}/{total} ({count / total:.2%}) done")
+
+
+def _assimilate_record(args: tuple) -> str:
+    """Internal helper method for BorgQueen to assimilate a path into a manifest line."""
+    drone, path, rel_path, signature = args
+    record = {"path": rel_path, "signature": signature, "data": drone.assimilate(path)}
+    return json.dumps(record, cls=MontyEncoder) + "\n"
+
+
+def _get_signature(path: str, valid_paths: set[str]) -> str:
+    """Hash of the names, sizes and modification times of the files in a path.
+    Subdirectories that are valid paths themselves are not included.
+    """
+    if os.path.isfile(path):
+        stats = [(os.path.basename(path), os.stat(path))]
+    else:
+        stats = []
+        for parent, subdirs, files in os.walk(path):
+            subdirs[:] = [subdir for subdir in subdirs if os.path.join(parent, subdir) not in valid_paths]
+            for name in files:
+                filename = os.path.join(parent, name)
+                stats.append((os.path.relpath(filename, path), os.stat(filename)))
+    digest = hashlib.md5(usedforsecurity=False)
+    for name, stat in sorted(stats, key=lambda item: item[0]):
+        digest.update(f"{name}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode())
+    return digest.hexdigest()
+
+
+def _load_manifest(manifest: PathLike) -> tuple[dict[str, dict], int, bool]:
+    """Records of a manifest by path, where later records replace earlier ones,
+    the number of lines and whether the file is complete. Truncated lines and
+    compressed streams of an interrupted run are skipped, keeping the records
+    read before them.
+    """
+    records: dict[str, dict] = {}
+    n_lines = 0
+    if not os.path.isfile(manifest):
+        return records, n_lines, True
+    complete = True
+    with zopen(manifest, mode="rt", encoding="utf-8") as file:
+        try:
+            for line in file:
+                n_lines += 1
+                complete = line.endswith("\n")
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                records[record["path"]] = record
+        except (EOFError, OSError, UnicodeDecodeError, lzma.LZMAError, zlib.error):
+            complete = False
+    return records, n_lines, complete
+
+
+def _write_manifest(manifest: PathLike, records: Iterable[dict]) -> None:
+    """Replace a manifest with the given records."""
+    tmp_manifest = os.path.join(os.path.dirname(manifest), f".tmp.{os.path.basename(manifest)}")
+    with zopen(tmp_manifest, mode="wt", encoding="utf-8") as file:
+        for record in records:
+            file.write(json.dumps(record) + "\n")  # type:ignore[arg-type]
+    os.replace(tmp_manifest, manifest)
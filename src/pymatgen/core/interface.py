@@ -2705,9 +2705,10 @@ class Interface(Structure):
 
         new_latt_matrix = [*self.lattice.matrix[:2].tolist(), [0, 0, new_c]]
         new_lattice = Lattice(new_latt_matrix)
+        cart_coords = self.cart_coords
         self._lattice = new_lattice
 
-        for site, c_coords in zip(self, self.cart_coords, strict=True):
+        for site, c_coords in zip(self, cart_coords, strict=True):
             site._lattice = new_lattice  # Update the lattice
             site.coords = c_coords  # Put back into original Cartesian space
 
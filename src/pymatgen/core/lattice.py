@@ -952,6 +952,42 @@ class Lattice(MSONable):
 
             None is returned if no matches are found.
         """
+        (c_a, c_b, c_c), (f_a, f_b, f_c), (alpha_b, beta_b, gamma_b) = self._get_mapping_candidates(
+            other_lattice, ltol=ltol, atol=atol
+        )
+
+        for idx, all_j in enumerate(gamma_b):
+            inds = np.logical_and(all_j[:, None], np.logical_and(alpha_b, beta_b[idx][None, :]))
+            for j, k in np.argwhere(inds):
+                scale_m = np.array((f_a[idx], f_b[j], f_c[k]), dtype=np.int64)  # type: ignore[index]
+                if abs(np.linalg.det(scale_m)) < 1e-8:
+                    continue
+
+                aligned_m = np.array((c_a[idx], c_b[j], c_c[k]))
+
+                rotation_m = None if skip_rotation_matrix else np.linalg.solve(aligned_m, other_lattice.matrix)
+
+                yield type(self)(aligned_m), rotation_m, scale_m
+
+    def _get_mapping_candidates(
+        self,
+        other_lattice: Self,
+        ltol: float = 1e-5,
+        atol: float = 1,
+    ) -> tuple[tuple[NDArray, NDArray, NDArray], tuple[NDArray, NDArray, NDArray], tuple[NDArray, NDArray, NDArray]]:
+        """Get the candidate lattice vectors of find_all_mappings.
+
+        Args:
+            other_lattice (Lattice): Another lattice that is equivalent to this one.
+            ltol (float): Tolerance for matching lengths. Defaults to 1e-5.
+            atol (float): Tolerance for matching angles. Defaults to 1.
+
+        Returns:
+            tuple: The Cartesian and the fractional coordinates of the lattice
+                points with the length of each lattice vector of other_lattice,
+                and the boolean arrays of the pairs of these with the alpha, beta
+                and gamma angles of other_lattice.
+        """
 
         def get_angles(v1, v2, l1, l2):
             x = np.inner(v1, v2) / l1[:, None] / l2
@@ -976,18 +1012,7 @@ class Lattice(MSONable):
         beta_b = np.isclose(get_angles(c_a, c_c, l_a, l_c), beta, atol=atol, rtol=0)
         gamma_b = np.isclose(get_angles(c_a, c_b, l_a, l_b), gamma, atol=atol, rtol=0)
 
-        for idx, all_j in enumerate(gamma_b):
-            inds = np.logical_and(all_j[:, None], np.logical_and(alpha_b, beta_b[idx][None, :]))
-            for j, k in np.argwhere(inds):
-                scale_m = np.array((f_a[idx], f_b[j], f_c[k]), dtype=np.int64)  # type: ignore[index]
-                if abs(np.linalg.det(scale_m)) < 1e-8:
-                    continue
-
-                aligned_m = np.array((c_a[idx], c_b[j], c_c[k]))
-
-                rotation_m = None if skip_rotation_matrix else np.linalg.solve(aligned_m, other_lattice.matrix)
-
-                yield type(self)(aligned_m), rotation_m, scale_m
+        return (c_a, c_b, c_c), (f_a, f_b, f_c), (alpha_b, beta_b, gamma_b)  # type: ignore[return-value]
 
     def find_mapping(
         self,
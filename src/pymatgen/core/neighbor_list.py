@@ -0,0 +1,230 @@
+"""This module provides a reusable neighbor list for analyzing sequences of
+closely related structures, such as the frames of a molecular dynamics
+trajectory or the ionic steps of a relaxation.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pymatgen.core.lattice import Lattice
+from pymatgen.optimization.neighbors import find_points_in_spheres
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+    from typing_extensions import Self
+
+    from pymatgen.core.structure import IStructure
+
+
+class NeighborList:
+    """Verlet neighbor list with a skin radius.
+
+    The candidate pairs within r + skin are searched with find_points_in_spheres
+    and kept between updates. The search is only repeated when the atoms (or the
+    lattice) have moved far enough that a pair outside of the candidates may have
+    come within r, i.e. when twice the largest atomic displacement plus the
+    strain-induced change of the candidate distances exceeds the skin. Otherwise,
+    an update only recomputes the distances of the candidate pairs.
+
+    The neighbors are the same as those from IStructure.get_neighbor_list with
+    sites=None, in the same (center-major) layout:
+
+        nl = NeighborList.from_structure(trajectory[0], r=3.0, skin=0.5)
+        for structure in trajectory:
+            center_indices, points_indices, images, distances = nl.update(
+                structure.frac_coords, structure.lattice
+            )
+
+    Attributes:
+        r (float): Cutoff radius of the neighbors.
+        skin (float): Extra search radius on top of r.
+        pbc (tuple[bool, bool, bool]): Periodic boundary conditions.
+        numerical_tol (float): Numerical tolerance for distances.
+        exclude_self (bool): Whether to exclude each atom neighboring itself.
+        n_builds (int): Number of times the candidate pairs have been searched.
+    """
+
+    def __init__(
+        self,
+        r: float,
+        skin: float = 0.5,
+        pbc: tuple[bool, bool, bool] = (True, True, True),
+        numerical_tol: float = 1e-8,
+        exclude_self: bool = True,
+    ) -> None:
+        """
+        Args:
+            r (float): Cutoff radius of the neighbors.
+            skin (float): Extra search radius on top of r. A larger skin makes
+                the updates slower but the candidate searches rarer. Defaults to 0.5.
+            pbc (tuple[bool, bool, bool]): Periodic boundary conditions along the
+                three lattice vectors. Defaults to (True, True, True).
+            numerical_tol (float): Numerical tolerance for distances, as in
+                IStructure.get_neighbor_list. Defaults to 1e-8.
+            exclude_self (bool): Whether to exclude atoms neighboring with
+                themselves within numerical_tol. Defaults to True.
+        """
+        if r < 0:
+            raise ValueError(f"r must be non-negative, got {r=}")
+        if skin < 0:
+            raise ValueError(f"skin must be non-negative, got {skin=}")
+        self.r = r
+        self.skin = skin
+        self.pbc = tuple(bool(periodic) for periodic in pbc)
+        self.numerical_tol = numerical_tol
+        self.exclude_self = exclude_self
+        self.n_builds = 0
+
+        # Positions at the last candidate search and at the last update
+        self._ref_frac_coords: NDArray[np.float64] | None = None
+        self._ref_matrix: NDArray[np.float64] | None = None
+        self._frac_coords: NDArray[np.float64] | None = None
+        self._matrix: NDArray[np.float64] | None = None
+        # Candidate pairs, with their images at the last candidate search and
+        # their images and distances at the last update
+        self._center_indices: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._points_indices: NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._ref_images: NDArray[np.float64] = np.empty((0, 3))
+        self._images: NDArray[np.float64] = np.empty((0, 3))
+        self._image_vectors: NDArray[np.float64] = np.empty((0, 3))
+        self._shifts: NDArray[np.float64] = np.empty((0, 3))
+        self._distances: NDArray[np.float64] = np.empty(0)
+        self._neighbors: tuple[NDArray, NDArray, NDArray, NDArray] | None = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(r={self.r}, skin={self.skin}, pbc={self.pbc}, n_builds={self.n_builds})"
+
+    @classmethod
+    def from_structure(cls, structure: IStructure, r: float, skin: float = 0.5, **kwargs) -> Self:
+        """Create a neighbor list and build it for a structure.
+
+        Args:
+            structure (Structure): Input structure.
+            r (float): Cutoff radius of the neighbors.
+            skin (float): Extra search radius on top of r. Defaults to 0.5.
+            **kwargs: Passed to NeighborList.
+
+        Returns:
+            NeighborList
+        """
+        neighbor_list = cls(r, skin=skin, pbc=structure.pbc, **kwargs)
+        neighbor_list.update(structure.frac_coords, structure.lattice)
+        return neighbor_list
+
+    def update(
+        self,
+        frac_coords: ArrayLike,
+        lattice: Lattice | ArrayLike,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64], NDArray[np.float64]]:
+        """Update the neighbor list for new atomic positions and lattice.
+
+        The atoms must be the same and in the same order as in the previous
+        updates, although their fractional coordinates may be wrapped differently.
+        The candidate pairs are searched again if needed, see NeighborList.
+
+        Args:
+            frac_coords (ArrayLike): (n_atoms, 3) fractional coordinates.
+            lattice (Lattice | ArrayLike): Lattice or 3x3 lattice matrix.
+
+        Returns:
+            tuple: (center_indices, points_indices, offset_vectors, distances), as
+                returned by IStructure.get_neighbor_list.
+        """
+        frac_coords = np.array(frac_coords, dtype=float).reshape(-1, 3)
+        matrix = np.array(lattice.matrix if isinstance(lattice, Lattice) else lattice, dtype=float).reshape(3, 3)
+
+        if self._ref_frac_coords is None or len(frac_coords) != len(self._ref_frac_coords):
+            self._build(frac_coords, matrix)
+            return self.get_neighbor_list()
+
+        # Integer lattice translations of the atoms (e.g. from wrapping into the
+        # unit cell) are absorbed into the images of the candidate pairs
+        displacements = frac_coords - self._ref_frac_coords
+        shifts = np.where(self.pbc, np.round(displacements), 0)
+        max_displacement = np.linalg.norm((displacements - shifts) @ matrix, axis=1).max(initial=0)
+        strain = 0.0
+        if not np.array_equal(matrix, self._ref_matrix):
+            strain = np.linalg.norm(np.linalg.solve(self._ref_matrix, matrix) - np.eye(3), ord=2)
+        if 2 * max_displacement + (self.r + self.skin) * strain > self.skin:
+            self._build(frac_coords, matrix)
+            return self.get_neighbor_list()
+
+        # Images only change for the atoms that were translated by a lattice
+        # vector since the last update, which is rare
+        if (rewrapped := (shifts != self._shifts).any(axis=1)).any():
+            pairs = np.flatnonzero(rewrapped[self._center_indices] | rewrapped[self._points_indices])
+            self._images[pairs] = (
+                self._ref_images[pairs] - shifts[self._points_indices[pairs]] + shifts[self._center_indices[pairs]]
+            )
+            self._image_vectors[pairs] = self._images[pairs] @ matrix
+            self._shifts = shifts
+        if not np.array_equal(matrix, self._matrix):
+            self._image_vectors = self._images @ matrix
+
+        # Only the pairs involving atoms that moved since the last update are recomputed
+        moved = (frac_coords != self._frac_coords).any(axis=1)
+        if moved.all() or not np.array_equal(matrix, self._matrix):
+            pairs = slice(None)
+        else:
+            pairs = np.flatnonzero(moved[self._center_indices] | moved[self._points_indices])
+        center_indices, points_indices = self._center_indices[pairs], self._points_indices[pairs]
+        if len(center_indices) > 0:
+            cart_coords = frac_coords @ matrix
+            vectors = cart_coords[points_indices] - cart_coords[center_indices] + self._image_vectors[pairs]
+            self._distances[pairs] = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
+            self._neighbors = None
+        self._frac_coords = frac_coords
+        self._matrix = matrix
+        return self.get_neighbor_list()
+
+    def get_neighbor_list(
+        self,
+    ) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.float64], NDArray[np.float64]]:
+        """Get the neighbors from the last update.
+
+        Returns:
+            tuple: (center_indices, points_indices, offset_vectors, distances), as
+                returned by IStructure.get_neighbor_list.
+        """
+        if self._ref_frac_coords is None:
+            raise RuntimeError("NeighborList has not been built, call update first.")
+        if self._neighbors is None:
+            cond = self._distances**2 < self.r**2 + self.numerical_tol
+            self._neighbors = (
+                self._center_indices[cond],
+                self._points_indices[cond],
+                self._images[cond],
+                self._distances[cond],
+            )
+        return self._neighbors
+
+    def _build(self, frac_coords: NDArray[np.float64], matrix: NDArray[np.float64]) -> None:
+        """Search the candidate pairs within r + skin."""
+        cart_coords = np.ascontiguousarray(frac_coords @ matrix, dtype=float)
+        center_indices, points_indices, images, distances = find_points_in_spheres(
+            cart_coords,
+            cart_coords,
+            r=self.r + self.skin,
+            pbc=np.ascontiguousarray(self.pbc, dtype=np.int64),
+            lattice=np.ascontiguousarray(matrix, dtype=float),
+            tol=self.numerical_tol,
+        )
+        if self.exclude_self:
+            cond = ~((center_indices == points_indices) & (distances <= self.numerical_tol))
+            center_indices, points_indices = center_indices[cond], points_indices[cond]
+            images, distances = images[cond], distances[cond]
+
+        self._ref_frac_coords = self._frac_coords = frac_coords
+        self._ref_matrix = self._matrix = matrix
+        self._center_indices = center_indices
+        self._points_indices = points_indices
+        self._ref_images = images
+        self._images = images.copy()
+        self._image_vectors = images @ matrix
+        self._shifts = np.zeros_like(frac_coords)
+        self._distances = distances
+        self._neighbors = None
+        self.n_builds += 1
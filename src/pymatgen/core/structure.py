@@ -20,7 +20,7 @@ import warnings
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from fnmatch import fnmatch
-from typing import TYPE_CHECKING, Literal, cast, get_args, overload
+from typing import TYPE_CHECKING, Literal, NamedTuple, cast, get_args, overload
 
 import numpy as np
 import orjson
@@ -45,6 +45,7 @@ from pymatgen.electronic_structure.core import Magmom
 from pymatgen.symmetry.maggroups import MagneticSpaceGroup
 from pymatgen.util.coord import all_distances, get_angle, lattice_points_in_supercell
 from pymatgen.util.due import Doi, due
+from pymatgen.util.misc import is_np_dict_equal
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable, Iterator, Sequence
@@ -210,6 +211,457 @@ class PeriodicNeighbor(PeriodicSite):
         return super(Site, cls).from_dict(dct)
 
 
+class NeighborArrays(NamedTuple):
+    """Neighbors of a set of center sites stored as arrays in compressed sparse
+    row (CSR) layout, i.e. without any PeriodicNeighbor objects. The neighbors of
+    center i are the entries offsets[i]:offsets[i + 1] of indices, images and
+    distances, in the same order as returned by IStructure.get_all_neighbors.
+
+    Attributes:
+        offsets (NDArray): (n_centers + 1,) start of the neighbors of each center.
+        indices (NDArray): (n_neighbors,) site index of each neighbor in the structure.
+        images (NDArray): (n_neighbors, 3) lattice image of each neighbor.
+        distances (NDArray): (n_neighbors,) distance from the center to each neighbor.
+    """
+
+    offsets: NDArray[np.intp]
+    indices: NDArray[np.intp]
+    images: NDArray[np.float64]
+    distances: NDArray[np.float64]
+
+    @property
+    def center_indices(self) -> NDArray[np.intp]:
+        """Index of the center of each neighbor, as in IStructure.get_neighbor_list."""
+        return np.repeat(np.arange(len(self.offsets) - 1), np.diff(self.offsets))
+
+    def neighbors_of(self, idx: int) -> tuple[NDArray[np.intp], NDArray[np.float64], NDArray[np.float64]]:
+        """Neighbor indices, images and distances of the center at idx."""
+        start, end = self.offsets[idx], self.offsets[idx + 1]
+        return self.indices[start:end], self.images[start:end], self.distances[start:end]
+
+
+def _to_composition(species: SpeciesLike | CompositionLike) -> Composition:
+    """Convert a species-like input to a validated Composition, following the
+    same rules as Site.species.
+    """
+    if not isinstance(species, Composition):
+        try:
+            species = Composition({get_el_sp(species): 1})  # type: ignore[arg-type]
+        except TypeError:
+            species = Composition(species)
+    if species.num_atoms > 1 + Composition.amount_tolerance:
+        raise ValueError("Species occupancies sum to more than 1!")
+    return species
+
+
+def _species_string(comp: Composition) -> str:
+    """Same as Site.species_string for a bare Composition."""
+    if comp.num_atoms == len(comp) == 1:
+        return str(next(iter(comp)))
+    return ", ".join(f"{sp}:{comp[sp]:.3}" for sp in sorted(comp))
+
+
+class _SiteArrays:
+    """Columnar storage for the sites of an IStructure.
+
+    Sites are stored as one contiguous (N, 3) array of fractional coordinates,
+    an integer index per site into a table of unique species Compositions,
+    one list per site property and an optional list of labels. PeriodicSite
+    objects are only built from these columns when a structure is indexed or
+    iterated over (see IStructure.sites). Properties set on single sites are
+    sparse: sites without them hold None and do not list them.
+    """
+
+    __slots__ = ("frac_coords", "labels", "properties", "sparse", "species_idx", "species_table")
+
+    def __init__(
+        self,
+        frac_coords: NDArray[np.float64],
+        species_idx: NDArray[np.intp],
+        species_table: list[Composition],
+        properties: dict[str, list] | None = None,
+        labels: list[str | None] | None = None,
+        sparse: set[str] | None = None,
+    ) -> None:
+        """
+        Args:
+            frac_coords (NDArray): (N, 3) fractional coordinates.
+            species_idx (NDArray): (N,) indices into species_table.
+            species_table (list[Composition]): Species of the sites.
+            properties (dict[str, list]): Site properties as lists of length N.
+            labels (list[str | None]): Site labels, None for default labels.
+            sparse (set[str]): Properties that sites holding None do not have.
+        """
+        self.frac_coords = frac_coords
+        self.species_idx = species_idx
+        self.species_table = species_table
+        self.properties = properties or {}
+        self.labels = labels
+        self.sparse = sparse or set()
+
+    def __len__(self) -> int:
+        return len(self.species_idx)
+
+    @classmethod
+    def from_species(
+        cls,
+        species: Sequence[CompositionLike],
+        frac_coords: NDArray[np.float64],
+        site_properties: dict | None = None,
+        labels: Sequence[str | None] | None = None,
+    ) -> Self:
+        """Build columns from the inputs accepted by IStructure.__init__.
+        Species inputs are converted to Compositions once per distinct value.
+        """
+        n_sites = len(species)
+        species_idx = np.empty(n_sites, dtype=np.intp)
+        species_table: list[Composition] = []
+        seen: dict[Any, int] = {}
+        for idx, specie in enumerate(species):
+            try:
+                if isinstance(specie, Composition | dict):
+                    key: Any = (type(specie), tuple(specie.items()))
+                else:
+                    key = (type(specie), specie)
+                species_idx[idx] = seen[key]
+                continue
+            except KeyError:
+                seen[key] = species_idx[idx] = len(species_table)
+            except TypeError:
+                species_idx[idx] = len(species_table)
+            species_table.append(_to_composition(specie))
+
+        properties = {
+            key: [val[idx] for idx in range(n_sites)] for key, val in (site_properties or {}).items() if val is not None
+        }
+        return cls(
+            frac_coords,
+            species_idx,
+            species_table,
+            properties,
+            [labels[idx] for idx in range(n_sites)] if labels else None,
+        )
+
+    @classmethod
+    def from_sites(cls, sites: Sequence[PeriodicSite]) -> Self:
+        """Gather the columns of a sequence of PeriodicSites."""
+        props: dict[str, list] = {}
+        for idx, site in enumerate(sites):
+            for key, val in site.properties.items():
+                props.setdefault(key, [None] * len(sites))[idx] = val
+        return cls.from_species(
+            [site.species for site in sites],
+            np.array([site.frac_coords for site in sites], dtype=np.float64).reshape(-1, 3),
+            site_properties=props,
+            labels=[site.label for site in sites],
+        )
+
+    def copy(self) -> Self:
+        """Copy of the columns. Species Compositions are shared."""
+        return type(self)(
+            self.frac_coords.copy(),
+            self.species_idx.copy(),
+            list(self.species_table),
+            {key: list(val) for key, val in self.properties.items()},
+            None if self.labels is None else list(self.labels),
+            set(self.sparse),
+        )
+
+    def take(self, indices: Sequence[int] | NDArray[np.intp]) -> Self:
+        """New columns with the sites at indices, in that order."""
+        indices = np.asarray(indices, dtype=np.intp).reshape(-1)
+        idx_list = indices.tolist()
+        return type(self)(
+            self.frac_coords[indices],
+            self.species_idx[indices],
+            list(self.species_table),
+            {key: [val[idx] for idx in idx_list] for key, val in self.properties.items()},
+            None if self.labels is None else [self.labels[idx] for idx in idx_list],
+            set(self.sparse),
+        )
+
+    def species_counts(self) -> list[tuple[Composition, int]]:
+        """Each species Composition in use with the number of sites it occupies."""
+        counts = np.bincount(self.species_idx, minlength=len(self.species_table))
+        return [(comp, int(cnt)) for comp, cnt in zip(self.species_table, counts, strict=True) if cnt]
+
+    def compositions(self) -> list[Composition]:
+        """Species Composition of each site."""
+        table = self.species_table
+        return [table[idx] for idx in self.species_idx.tolist()]
+
+    def resolved_labels(self) -> list[str]:
+        """Site labels with defaults filled in, as given by Site.label."""
+        strings = [_species_string(comp) for comp in self.species_table]
+        if self.labels is None:
+            return [strings[idx] for idx in self.species_idx.tolist()]
+        return [
+            strings[idx] if label is None else label
+            for idx, label in zip(self.species_idx.tolist(), self.labels, strict=True)
+        ]
+
+    def set_species(self, idx: int, species: Composition) -> None:
+        """Set the species of the site at idx, adding it to species_table if new."""
+        items = tuple(species.items())
+        table = self.species_table
+        sp_idx = next(
+            (sp_idx for sp_idx, comp in enumerate(table) if comp is species or tuple(comp.items()) == items), None
+        )
+        if sp_idx is None:
+            sp_idx = len(table)
+            table.append(species)
+        self.species_idx[idx] = sp_idx
+
+    def site_properties(self, idx: int) -> dict[str, Any]:
+        """Properties of the site at idx."""
+        sparse = self.sparse
+        return {key: vals[idx] for key, vals in self.properties.items() if vals[idx] is not None or key not in sparse}
+
+    def set_property(self, idx: int, key: str, val: Any) -> None:
+        """Set a property of the site at idx. A new property only set on this
+        site is sparse.
+        """
+        if key not in self.properties:
+            self.properties[key] = [None] * len(self)
+            self.sparse.add(key)
+        self.properties[key][idx] = val
+
+    def unset_property(self, idx: int, key: str) -> None:
+        """Remove a property of the site at idx. The column is dropped once no
+        site has the property any more.
+        """
+        vals = self.properties[key]
+        vals[idx] = None
+        if all(val is None for val in vals):
+            del self.properties[key]
+            self.sparse.discard(key)
+        else:
+            self.sparse.add(key)
+
+    def set_label(self, idx: int, label: str | None) -> None:
+        """Set the label of the site at idx."""
+        if self.labels is None:
+            if label is None:
+                return
+            self.labels = [None] * len(self)
+        self.labels[idx] = label
+
+    def to_sites(self, lattice: Lattice) -> list[PeriodicSite]:
+        """PeriodicSites reading from and writing to the rows of the columns."""
+        return [_ColumnSite(self, idx, lattice) for idx in range(len(self))]
+
+
+class _SiteProperties(dict):
+    """Properties of a _ColumnSite. Changes are written through to the property
+    columns. Copies and pickles are plain dicts.
+    """
+
+    def __init__(self, columns: _SiteArrays, idx: int) -> None:
+        super().__init__(columns.site_properties(idx))
+        self._columns = columns
+        self._idx = idx
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def __setitem__(self, key: str, val: Any) -> None:
+        super().__setitem__(key, val)
+        self._columns.set_property(self._idx, key, val)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._columns.unset_property(self._idx, key)
+
+    def __ior__(self, other):  # type: ignore[override]
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        for key in list(self):
+            del self[key]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self:
+            return super().pop(key, *default)
+        val = self[key]
+        del self[key]
+        return val
+
+    def popitem(self) -> tuple[str, Any]:
+        key, val = super().popitem()
+        self._columns.unset_property(self._idx, key)
+        return key, val
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:  # type: ignore[override]
+        for key, val in dict(*args, **kwargs).items():
+            self[key] = val
+
+
+class _ColumnSite(PeriodicSite):
+    """PeriodicSite backed by a row of _SiteArrays. Species, coordinates,
+    properties and label are read from and written to the columns, so these
+    remain the storage of the structure while its sites are in use. Copies,
+    pickles and dicts of the site are plain PeriodicSites.
+    """
+
+    def __init__(self, columns: _SiteArrays, idx: int, lattice: Lattice) -> None:
+        """
+        Args:
+            columns (_SiteArrays): Columns holding the site.
+            idx (int): Row of the site in the columns.
+            lattice (Lattice): Lattice of the structure.
+        """
+        self._site_columns = columns
+        self._site_idx = idx
+        self._lattice = lattice
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("_site_"):
+            raise AttributeError(attr)
+        props = self.properties
+        if attr in props:
+            return props[attr]
+        raise AttributeError(f"{attr=} not found on PeriodicSite")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PeriodicSite):
+            return NotImplemented
+        return (
+            self.species == other.species
+            and self.lattice == other.lattice
+            and np.allclose(self.coords, other.coords, atol=Site.position_atol)
+            and is_np_dict_equal(self.properties, other.properties)
+        )
+
+    __hash__ = PeriodicSite.__hash__
+
+    def __reduce__(self):
+        site = self.to_periodic_site()
+        return PeriodicSite, (site.species, site.frac_coords, site.lattice, False, False, site.properties, site._label)
+
+    def __repr__(self) -> str:
+        return repr(self.to_periodic_site())
+
+    def to_periodic_site(self) -> PeriodicSite:
+        """Plain PeriodicSite with the current values of the site."""
+        return PeriodicSite(
+            self.species,
+            self.frac_coords.copy(),
+            self._lattice,
+            properties=dict(self.properties),
+            label=self._label,
+            skip_checks=True,
+        )
+
+    def bind(self, columns: _SiteArrays, idx: int) -> None:
+        """Move the site to row idx of columns."""
+        self._site_columns = columns
+        self._site_idx = idx
+
+    @property  # type: ignore[override]
+    def _species(self) -> Composition:
+        columns = self._site_columns
+        return columns.species_table[columns.species_idx[self._site_idx]]
+
+    @_species.setter
+    def _species(self, species: Composition) -> None:
+        self._site_columns.set_species(self._site_idx, species)
+
+    @property  # type: ignore[override]
+    def _frac_coords(self) -> NDArray[np.float64]:
+        return self._site_columns.frac_coords[self._site_idx]
+
+    @_frac_coords.setter
+    def _frac_coords(self, frac_coords: ArrayLike) -> None:
+        self._site_columns.frac_coords[self._site_idx] = frac_coords
+
+    @property  # type: ignore[override]
+    def _coords(self) -> NDArray[np.float64]:
+        return self.coords
+
+    @_coords.setter
+    def _coords(self, coords: NDArray[np.float64] | None) -> None:
+        """Cartesian coordinates are not cached as the columns can change."""
+
+    @property  # type: ignore[override]
+    def _label(self) -> str | None:
+        labels = self._site_columns.labels
+        return None if labels is None else labels[self._site_idx]
+
+    @_label.setter
+    def _label(self, label: str | None) -> None:
+        self._site_columns.set_label(self._site_idx, label)
+
+    @property  # type: ignore[override]
+    def properties(self) -> dict:
+        """Site properties, writing changes through to the columns."""
+        return _SiteProperties(self._site_columns, self._site_idx)
+
+    @properties.setter
+    def properties(self, properties: dict | None) -> None:
+        columns = self._site_columns
+        for key in list(columns.properties):
+            columns.unset_property(self._site_idx, key)
+        for key, val in (properties or {}).items():
+            columns.set_property(self._site_idx, key, val)
+
+    @property
+    def coords(self) -> NDArray[np.float64]:
+        """Cartesian coordinates."""
+        return self._lattice.get_cartesian_coords(self._frac_coords)
+
+    @coords.setter
+    def coords(self, coords: ArrayLike) -> None:
+        self._frac_coords = self._lattice.get_fractional_coords(coords)
+
+    def _set_cart_coord(self, axis: int, val: float) -> None:
+        coords = self.coords
+        coords[axis] = val
+        self.coords = coords
+
+    @property
+    def x(self) -> float:
+        """Cartesian x coordinate."""
+        return self.coords[0]
+
+    @x.setter
+    def x(self, x: float) -> None:
+        self._set_cart_coord(0, x)
+
+    @property
+    def y(self) -> float:
+        """Cartesian y coordinate."""
+        return self.coords[1]
+
+    @y.setter
+    def y(self, y: float) -> None:
+        self._set_cart_coord(1, y)
+
+    @property
+    def z(self) -> float:
+        """Cartesian z coordinate."""
+        return self.coords[2]
+
+    @z.setter
+    def z(self, z: float) -> None:
+        self._set_cart_coord(2, z)
+
+    def to_unit_cell(self, in_place: bool = False) -> Self | None:
+        """Move frac coords to within the unit cell."""
+        if in_place:
+            return super().to_unit_cell(in_place=True)
+        return self.to_periodic_site().to_unit_cell()  # type: ignore[return-value]
+
+    def as_dict(self, verbosity: Literal[0, 1] = 0) -> dict:
+        """JSON-serializable dict representation of the site as a PeriodicSite."""
+        return self.to_periodic_site().as_dict(verbosity=verbosity)
+
+
 class SiteCollection(collections.abc.Sequence, ABC):
     """Basic SiteCollection. Essentially a sequence of Sites or PeriodicSites.
     This serves as a base class for Molecule (a collection of Site, i.e., no
@@ -1073,30 +1525,92 @@ class IStructure(SiteCollection, MSONable):
 
         self._lattice = lattice if isinstance(lattice, Lattice) else Lattice(lattice)
 
-        sites = []
-        for idx, specie in enumerate(species):
-            prop = None
-            if site_properties:
-                prop = {key: val[idx] for key, val in site_properties.items() if val is not None}
-
-            label = labels[idx] if labels else None
+        frac_coords = np.array(coords, dtype=np.float64).reshape(len(species), 3)
+        if coords_are_cartesian:
+            frac_coords = self._lattice.get_fractional_coords(frac_coords)
+        if to_unit_cell:
+            pbc = np.array(self._lattice.pbc, dtype=bool)
+            frac_coords[:, pbc] = np.mod(frac_coords[:, pbc], 1)
 
-            site = PeriodicSite(
-                specie,
-                np.array(coords[idx]),
-                self._lattice,
-                to_unit_cell,
-                coords_are_cartesian=coords_are_cartesian,
-                properties=prop,
-                label=label,
-            )
-            sites.append(site)
-        self._sites: tuple[PeriodicSite, ...] = tuple(sites)
+        # Sites are kept as columns and only turned into PeriodicSites on demand
+        self._columns: _SiteArrays | None = _SiteArrays.from_species(
+            species, frac_coords, site_properties=site_properties, labels=labels
+        )
+        self._site_list: list[PeriodicSite] | tuple[PeriodicSite, ...] | None = None
         if validate_proximity and not self.is_valid():
             raise StructureError(f"sites are less than {self.DISTANCE_TOLERANCE} Angstrom apart!")
         self._charge = charge
         self._properties = properties or {}
 
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # Sites backed by the columns are rebuilt on demand
+        if self._columns is not None:
+            state["_site_list"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        # Structures pickled before the columnar storage hold a plain site sequence
+        if "_sites" in state:
+            state["_site_list"] = state.pop("_sites")
+            state["_columns"] = None
+        self.__dict__.update(state)
+
+    def __len__(self) -> int:
+        if self._columns is not None:
+            return len(self._columns)
+        return len(self._sites)
+
+    @property
+    def sites(self) -> list[PeriodicSite] | tuple[PeriodicSite, ...]:
+        """The sites in the Structure. PeriodicSites are built from the
+        columnar storage on first access and kept alongside it. They read from
+        and write to the columns, which remain the storage of the structure.
+        """
+        if self._site_list is None:
+            sites = cast("_SiteArrays", self._columns).to_sites(self._lattice)
+            is_mutable = isinstance(self, collections.abc.MutableSequence)
+            self._site_list = sites if is_mutable else tuple(sites)
+        return self._site_list
+
+    @sites.setter
+    def sites(self, sites: Sequence[PeriodicSite]) -> None:
+        """Set the sites in the Structure. These replace the columnar storage."""
+        is_mutable = isinstance(self, collections.abc.MutableSequence)
+        self._site_list = list(sites) if is_mutable else tuple(sites)
+        self._columns = None
+
+    # Internal alias of sites, kept for code that manipulates the site list directly
+    _sites = sites
+
+    @classmethod
+    def _from_columns(
+        cls,
+        lattice: Lattice,
+        columns: _SiteArrays,
+        charge: float | None = None,
+        properties: dict | None = None,
+    ) -> Self:
+        """Create a structure directly from columnar site storage, skipping
+        input parsing. Only meant for IStructure and Structure themselves as
+        subclass constructors are bypassed.
+        """
+        struct = cls.__new__(cls)
+        struct._lattice = lattice
+        struct._columns = columns
+        struct._site_list = None
+        struct._charge = charge
+        struct._properties = properties or {}
+        return struct
+
+    def _get_columns(self) -> _SiteArrays:
+        """Columnar view of the sites. Gathers it from the PeriodicSites if these
+        have been built.
+        """
+        if self._columns is not None:
+            return self._columns
+        return _SiteArrays.from_sites(self._sites)
+
     def __eq__(self, other: object) -> bool:
         """Define equality by comparing all three attributes: lattice, sites, properties."""
         needed_attrs = ("lattice", "sites", "properties")
@@ -1153,25 +1667,29 @@ class IStructure(SiteCollection, MSONable):
         new_lattice = Lattice(np.dot(scale_matrix, self.lattice.matrix))
 
         frac_lattice = lattice_points_in_supercell(scale_matrix)
-        cart_lattice = new_lattice.get_cartesian_coords(frac_lattice)
-
-        new_sites = []
-        for site in self:
-            for vec in cart_lattice:
-                periodic_site = PeriodicSite(
-                    site.species,
-                    site.coords + vec,
-                    new_lattice,
-                    properties=site.properties,
-                    coords_are_cartesian=True,
-                    to_unit_cell=False,
-                    skip_checks=True,
-                    label=site.label,
-                )
-                new_sites.append(periodic_site)
+        cart_lattice = new_lattice.get_cartesian_coords(frac_lattice).reshape(-1, 3)
+
+        # Each site is repeated once per lattice point, in site-major order
+        columns = self._get_columns()
+        n_images = len(cart_lattice)
+        new_cart = (self._lattice.get_cartesian_coords(columns.frac_coords)[:, None, :] + cart_lattice).reshape(-1, 3)
+        new_frac = new_lattice.get_fractional_coords(new_cart)
+        pbc = np.array(new_lattice.pbc, dtype=bool)
+        new_frac[:, pbc] = np.mod(new_frac[:, pbc], 1)
+
+        for key, vals in columns.properties.items():
+            if any(val is None for val in vals):
+                warnings.warn(f"Not all sites have property {key}. Missing values are set to None.", stacklevel=2)
 
+        new_columns = _SiteArrays(
+            new_frac,
+            np.repeat(columns.species_idx, n_images),
+            list(columns.species_table),
+            {key: [val for val in vals for _ in range(n_images)] for key, vals in columns.properties.items()},
+            [label for label in columns.resolved_labels() for _ in range(n_images)],
+        )
         new_charge = self._charge * np.linalg.det(scale_matrix) if self._charge else None
-        return Structure.from_sites(new_sites, charge=new_charge, to_unit_cell=True)
+        return Structure._from_columns(new_lattice, new_columns, charge=new_charge)
 
     def __rmul__(self, scaling_matrix):
         """Similar to __mul__ to preserve commutativeness."""
@@ -1514,9 +2032,9 @@ class IStructure(SiteCollection, MSONable):
     @property
     def charge(self) -> float:
         """Overall charge of the structure."""
-        formal_charge = super().charge
+        formal_charge = self._formal_charge
         if self._charge is None:
-            return super().charge
+            return formal_charge
         if abs(formal_charge - self._charge) > 1e-8:
             warnings.warn(
                 f"Structure charge ({self._charge}) is set to be not equal to the sum of oxidation states"
@@ -1525,6 +2043,17 @@ class IStructure(SiteCollection, MSONable):
             )
         return self._charge
 
+    @property
+    def _formal_charge(self) -> float:
+        """Sum of the oxidation states of all sites."""
+        if self._columns is None:
+            return super().charge
+        charge = 0.0
+        for comp, count in self._columns.species_counts():
+            for specie, amt in comp.items():
+                charge += (getattr(specie, "oxi_state", 0) or 0) * amt * count
+        return charge
+
     @property
     def distance_matrix(self) -> NDArray[np.float64]:
         """The distance matrix between all sites in the structure. For
@@ -1612,8 +2141,172 @@ class IStructure(SiteCollection, MSONable):
     @property
     def frac_coords(self):
         """Fractional coordinates as a Nx3 numpy array."""
+        if self._columns is not None:
+            return self._columns.frac_coords.copy()
         return np.array([site.frac_coords for site in self])
 
+    @property
+    def cart_coords(self) -> NDArray[np.float64]:
+        """An np.array of the Cartesian coordinates of sites in the structure."""
+        if self._columns is not None:
+            return self._lattice.get_cartesian_coords(self._columns.frac_coords).reshape(-1, 3)
+        return super().cart_coords
+
+    @property
+    def species(self) -> list[Element | Species]:
+        """Only works for ordered structures.
+
+        Raises:
+            AttributeError: If structure is disordered.
+
+        Returns:
+            list[Species]: species at each site of the structure.
+        """
+        if self._columns is None:
+            return super().species
+        if not self.is_ordered:
+            raise AttributeError("species property only supports ordered structures!")
+        table = [next(iter(comp)) for comp in self._columns.species_table]
+        return [table[idx] for idx in self._columns.species_idx.tolist()]
+
+    @property
+    def species_and_occu(self) -> list[Composition]:
+        """List of species and occupancies at each site of the structure."""
+        if self._columns is not None:
+            return self._columns.compositions()
+        return super().species_and_occu
+
+    @property
+    def types_of_species(self) -> tuple[Element | Species | DummySpecies, ...]:
+        """Tuple of types of species."""
+        if self._columns is None:
+            return super().types_of_species
+        types = {sp for comp, _ in self._columns.species_counts() for sp, amt in comp.items() if amt != 0}
+        return cast("tuple[Element | Species | DummySpecies, ...]", tuple(sorted(types)))
+
+    @property
+    def atomic_numbers(self) -> tuple[int, ...]:
+        """Tuple of atomic numbers."""
+        if self._columns is None:
+            return super().atomic_numbers
+        try:
+            return tuple(specie.Z for specie in self.species)
+        except AttributeError:
+            raise AttributeError("atomic_numbers available only for ordered Structures")
+
+    @property
+    def site_properties(self) -> dict[str, Sequence]:
+        """The site properties as a dict of sequences.
+        E.g. {"magmom": (5, -5), "charge": (-4, 4)}.
+        """
+        if self._columns is not None:
+            return {key: list(val) for key, val in self._columns.properties.items()}
+        return super().site_properties
+
+    @property
+    def labels(self) -> list[str | None]:
+        """Site labels as a list."""
+        if self._columns is not None:
+            return cast("list[str | None]", self._columns.resolved_labels())
+        return super().labels
+
+    @property
+    def composition(self) -> Composition:
+        """The structure's corresponding Composition object."""
+        if self._columns is None:
+            return super().composition
+        elem_map: dict[SpeciesLike, float] = defaultdict(float)
+        for comp, count in self._columns.species_counts():
+            for species, occu in comp.items():
+                elem_map[species] += occu * count
+        return Composition(elem_map)
+
+    @property
+    def is_ordered(self) -> bool:
+        """Check if structure is ordered, meaning no partial occupancies in any
+        of the sites.
+        """
+        if self._columns is None:
+            return super().is_ordered
+        return all(comp.num_atoms == len(comp) == 1 for comp, _ in self._columns.species_counts())
+
+    def add_site_property(self, property_name: str, values: Sequence | NDArray) -> Self:
+        """Add a property to a site. Note: This is the preferred method
+        for adding magnetic moments, selective dynamics, and related
+        site-specific properties to a structure object.
+
+        Args:
+            property_name (str): The name of the property to add.
+            values (list): A sequence of values. Must be same length as
+                number of sites.
+
+        Raises:
+            ValueError: if len(values) != number of sites.
+
+        Returns:
+            IStructure: self with site property added.
+        """
+        if self._columns is None:
+            return super().add_site_property(property_name, values)
+        if len(values) != len(self):
+            raise ValueError(f"{len(values)=} must equal sites in structure={len(self)}")
+        self._columns.properties[property_name] = list(values)
+        self._columns.sparse.discard(property_name)
+        return self
+
+    def remove_site_property(self, property_name: str) -> Self:
+        """Removes a property to a site.
+
+        Args:
+            property_name (str): The name of the property to remove.
+
+        Returns:
+            IStructure: self with property removed.
+        """
+        if self._columns is None:
+            return super().remove_site_property(property_name)
+        del self._columns.properties[property_name]
+        self._columns.sparse.discard(property_name)
+        return self
+
+    def add_oxidation_state_by_element(self, oxidation_states: dict[str, float]) -> Self:
+        """Add oxidation states.
+
+        Args:
+            oxidation_states (dict): Dict of oxidation states.
+                e.g. {"Li":1, "Fe":2, "P":5, "O":-2}
+
+        Raises:
+            ValueError if oxidation states are not specified for all elements.
+
+        Returns:
+            IStructure: self with oxidation states.
+        """
+        if self._columns is None:
+            return super().add_oxidation_state_by_element(oxidation_states)
+        if missing := {el.symbol for el in self.composition} - {*oxidation_states}:
+            raise ValueError(f"Oxidation states not specified for all elements, {missing=}")
+        self._columns.species_table = [
+            _to_composition(
+                Composition({Species(el.symbol, oxidation_states[el.symbol]): occu for el, occu in comp.items()})
+            )
+            for comp in self._columns.species_table
+        ]
+        return self
+
+    def remove_oxidation_states(self) -> Self:
+        """Removes oxidation states from a structure."""
+        if self._columns is None:
+            return super().remove_oxidation_states()
+        new_table = []
+        for comp in self._columns.species_table:
+            new_sp: dict[Element, float] = defaultdict(float)
+            for el, occu in comp.items():
+                new_sp[Element(el.symbol)] += occu
+            new_table.append(_to_composition(Composition(new_sp)))
+        self._columns.species_table = new_table
+        return self
+
     @property
     def volume(self) -> float:
         """The volume of the structure in Angstrom^3."""
@@ -1822,10 +2515,11 @@ class IStructure(SiteCollection, MSONable):
             return self._get_neighbor_list_py(r, list(sites), exclude_self=exclude_self)
 
         else:
-            if sites is None:
-                sites = self.sites
-            site_coords = np.ascontiguousarray([site.coords for site in sites], dtype=float)
             cart_coords = np.ascontiguousarray(self.cart_coords, dtype=float)
+            if sites is None:
+                site_coords = cart_coords
+            else:
+                site_coords = np.ascontiguousarray([site.coords for site in sites], dtype=float)
             lattice_matrix = np.ascontiguousarray(self.lattice.matrix, dtype=float)
             pbc = np.ascontiguousarray(self.pbc, dtype=np.int64)
             center_indices, points_indices, images, distances = find_points_in_spheres(
@@ -2062,47 +2756,90 @@ class IStructure(SiteCollection, MSONable):
             [[pymatgen.core.structure.PeriodicNeighbor], ...]: a list of
                 list of neighbors for each site in structure.
         """
-        if sites is None:
-            sites = self.sites
+        nn_arrays = self.get_all_neighbor_arrays(r, sites=sites, numerical_tol=numerical_tol)
+        n_centers = len(nn_arrays.offsets) - 1
+        if len(nn_arrays.indices) < 1:
+            return [[]] * n_centers
+        f_coords = self.frac_coords[nn_arrays.indices] + nn_arrays.images
+        lattice = self.lattice
+        all_sites = self.sites
+        neighbors = [
+            PeriodicNeighbor(
+                species=all_sites[pindex].species,
+                coords=f_coord,
+                lattice=lattice,
+                properties=all_sites[pindex].properties,
+                nn_distance=d,
+                index=pindex,
+                image=tuple(image),
+                label=all_sites[pindex].label,
+            )
+            for pindex, image, f_coord, d in zip(
+                nn_arrays.indices, nn_arrays.images, f_coords, nn_arrays.distances, strict=True
+            )
+        ]
+        offsets = nn_arrays.offsets.tolist()
+        return [neighbors[offsets[idx] : offsets[idx + 1]] for idx in range(n_centers)]
+
+    def get_all_neighbor_arrays(
+        self,
+        r: float,
+        sites: Sequence[PeriodicSite] | None = None,
+        numerical_tol: float = 1e-8,
+    ) -> NeighborArrays:
+        """Get the neighbors of each site out to a distance r as arrays, without
+        constructing PeriodicNeighbor objects. The neighbors and their order are
+        the same as in get_all_neighbors, including the exclusion of each site
+        itself (and of identical sites at the same position).
+
+        Args:
+            r (float): Radius of sphere.
+            sites (list of Sites or None): sites for getting all neighbors,
+                default is None, which means neighbors will be obtained for all
+                sites.
+            numerical_tol (float): This is a numerical tolerance for distances.
+                Sites which are < numerical_tol are determined to be coincident
+                with the site. Sites which are r + numerical_tol away is deemed
+                to be within r from the site. The default of 1e-8 should be
+                ok in most instances.
+
+        Returns:
+            NeighborArrays: neighbor indices, images and distances of each site in
+                compressed sparse row layout.
+        """
         center_indices, points_indices, images, distances = self.get_neighbor_list(
             r=r, sites=sites, numerical_tol=numerical_tol
         )
-        if len(points_indices) < 1:
-            return [[]] * len(sites)
-        f_coords = self.frac_coords[points_indices] + images
-        neighbor_dict: dict[int, list] = defaultdict(list)
-        lattice = self.lattice
-        atol = Site.position_atol
-        all_sites = self.sites
-        for cindex, pindex, image, f_coord, d in zip(
-            center_indices, points_indices, images, f_coords, distances, strict=True
-        ):
-            psite = all_sites[pindex]
-            csite = sites[cindex]
-            if (
-                d > numerical_tol
-                or
-                # This simply compares the psite and csite. The reason why manual comparison is done is
-                # for speed. This does not check the lattice since they are always equal. Also, the or construct
-                # returns True immediately once one of the conditions are satisfied.
-                psite.species != csite.species
-                or (not np.allclose(psite.coords, csite.coords, atol=atol))
-                or (psite.properties != csite.properties)
-            ):
-                neighbor_dict[cindex].append(
-                    PeriodicNeighbor(
-                        species=psite.species,
-                        coords=f_coord,
-                        lattice=lattice,
-                        properties=psite.properties,
-                        nn_distance=d,
-                        index=pindex,
-                        image=tuple(image),
-                        label=psite.label,
-                    )
+        n_centers = len(self) if sites is None else len(sites)
+
+        # Pairs closer than numerical_tol are dropped if both sites are identical. Such
+        # coincident pairs are rare, so only those are compared one by one.
+        keep = np.ones(len(center_indices), dtype=bool)
+        if coincident := np.flatnonzero(distances <= numerical_tol).tolist():
+            all_sites = self.sites
+            center_sites = all_sites if sites is None else sites
+            atol = Site.position_atol
+            for pair_idx in coincident:
+                psite = all_sites[points_indices[pair_idx]]
+                csite = center_sites[center_indices[pair_idx]]
+                # This does not check the lattice since they are always equal
+                keep[pair_idx] = (
+                    psite.species != csite.species
+                    or not np.allclose(psite.coords, csite.coords, atol=atol)
+                    or psite.properties != csite.properties
                 )
 
-        return [neighbor_dict[i] for i in range(len(sites))]
+        # Stable sort by center keeps the neighbor order of each center
+        order = np.argsort(center_indices[keep], kind="stable")
+        center_indices = center_indices[keep][order]
+        offsets = np.zeros(n_centers + 1, dtype=np.intp)
+        np.cumsum(np.bincount(center_indices, minlength=n_centers), out=offsets[1:])
+        return NeighborArrays(
+            offsets,
+            points_indices[keep][order],
+            images[keep][order],
+            distances[keep][order],
+        )
 
     def get_all_neighbors_py(
         self,
@@ -2846,6 +3583,10 @@ class IStructure(SiteCollection, MSONable):
             "lattice": latt_dict,
             "properties": self.properties,
         }
+        if self._columns is not None and verbosity in {0, 1}:
+            dct["sites"] = self._columns_as_dicts(verbosity)
+            return dct
+
         for site in self:
             site_dict = site.as_dict(verbosity=verbosity)
             del site_dict["lattice"]
@@ -2858,6 +3599,38 @@ class IStructure(SiteCollection, MSONable):
         dct["sites"] = sites
         return dct
 
+    def _columns_as_dicts(self, verbosity: Literal[0, 1]) -> list[dict[str, Any]]:
+        """Site dicts as in as_dict, written straight from the columnar storage."""
+        columns = cast("_SiteArrays", self._columns)
+        species_dicts = []
+        for comp in columns.species_table:
+            species = []
+            for spec, occu in comp.items():
+                spec_dct = spec.as_dict()
+                del spec_dct["@module"]
+                del spec_dct["@class"]
+                spec_dct["occu"] = occu
+                species.append(spec_dct)
+            species_dicts.append(species)
+
+        all_abc = columns.frac_coords.tolist()
+        all_xyz = self._lattice.get_cartesian_coords(columns.frac_coords).reshape(-1, 3).tolist()
+        labels = columns.resolved_labels()
+        sites = []
+        for idx, sp_idx in enumerate(columns.species_idx.tolist()):
+            site_dict: dict[str, Any] = {
+                "species": [dict(spec_dct) for spec_dct in species_dicts[sp_idx]],
+                "abc": all_abc[idx],
+                "properties": columns.site_properties(idx),
+            }
+            if verbosity == 0:
+                sites.append(site_dict)
+                continue
+            site_dict["label"] = labels[idx]
+            site_dict["xyz"] = all_xyz[idx]
+            sites.append(site_dict)
+        return sites
+
     def as_dataframe(self) -> pd.DataFrame:
         """Create a Pandas DataFrame of the sites.
         Structure-level attributes are stored in DataFrame.attrs.
@@ -4221,8 +4994,6 @@ class Structure(IStructure, collections.abc.MutableSequence):
             properties=properties,
         )
 
-        self._sites: list[PeriodicSite] = list(self._sites)  # type: ignore[assignment]
-
     def __setitem__(
         self,
         idx: int | slice | Sequence[int] | SpeciesLike,
@@ -4279,7 +5050,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
                     raise ValueError("PeriodicSite added must have same lattice as Structure!")
                 if len(indices) != 1:
                     raise ValueError("Site assignments makes sense only for single int indices!")
-                self._sites[ii] = site
+                self._mutable_sites()[ii] = site
 
             elif isinstance(site, str) or (not isinstance(site, collections.abc.Sequence)):
                 self._sites[ii].species = site  # type: ignore[assignment]
@@ -4293,7 +5064,33 @@ class Structure(IStructure, collections.abc.MutableSequence):
 
     def __delitem__(self, idx: SupportsIndex | slice) -> None:
         """Delete a site from the Structure."""
-        self._sites.__delitem__(idx)
+        if self._columns is None:
+            self._sites.__delitem__(idx)
+            return
+        keep = list(range(len(self)))
+        del keep[idx]
+        self._take_sites(keep)
+
+    def _mutable_sites(self) -> list[PeriodicSite]:
+        """The site list, for changing the list itself in place. The
+        PeriodicSites become the storage of the structure in place of the
+        columns, which would otherwise go out of sync.
+        """
+        if self._columns is not None:
+            self.sites = self.sites
+        return cast("list[PeriodicSite]", self._site_list)
+
+    def _take_sites(self, indices: list[int]) -> None:
+        """Keep the sites at indices, in that order, in the columnar storage.
+        Sites already built move along to their new rows.
+        """
+        columns = cast("_SiteArrays", self._columns).take(indices)
+        if self._site_list is not None:
+            sites = [cast("_ColumnSite", self._site_list[idx]) for idx in indices]
+            for new_idx, site in enumerate(sites):
+                site.bind(columns, new_idx)
+            self._site_list = cast("list[PeriodicSite]", sites)
+        self._columns = columns
 
     @property
     def lattice(self) -> Lattice:
@@ -4305,7 +5102,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
         if not isinstance(lattice, Lattice):
             lattice = Lattice(lattice)
         self._lattice = lattice
-        for site in self:
+        for site in self._site_list or ():
             site.lattice = lattice
 
     def append(  # type:ignore[override]
@@ -4373,7 +5170,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
                 if site.distance(new_site) < self.DISTANCE_TOLERANCE:
                     raise ValueError("New site is too close to an existing site!")
 
-        cast("list[PeriodicSite]", self.sites).insert(idx, new_site)
+        self._mutable_sites().insert(idx, new_site)
 
         return self
 
@@ -4410,7 +5207,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
             frac_coords = coords
 
         new_site = PeriodicSite(species, frac_coords, self._lattice, properties=properties, label=label)
-        cast("list[PeriodicSite]", self.sites)[idx] = new_site
+        self._mutable_sites()[idx] = new_site
 
         return self
 
@@ -4523,7 +5320,7 @@ class Structure(IStructure, collections.abc.MutableSequence):
                 coords_are_cartesian=True,
                 label=site.label,
             )
-            self._sites.append(s_new)
+            self._mutable_sites().append(s_new)
 
         return self
 
@@ -4564,8 +5361,12 @@ class Structure(IStructure, collections.abc.MutableSequence):
         Returns:
             Structure: self with sites removed.
         """
-        self.sites = [site for idx, site in enumerate(self) if idx not in indices]
+        if self._columns is None:
+            self.sites = [site for idx, site in enumerate(self) if idx not in indices]
+            return self
 
+        to_remove = set(indices)
+        self._take_sites([idx for idx in range(len(self)) if idx not in to_remove])
         return self
 
     def apply_operation(self, symm_op: SymmOp, fractional: bool = False) -> Self:
@@ -4582,37 +5383,22 @@ class Structure(IStructure, collections.abc.MutableSequence):
         Returns:
             Structure: post-operation structure
         """
+        # All sites are replaced, so operate on a copy of the columns
+        columns = self._get_columns().copy()
+        old_lattice = self._lattice
         if fractional:
-            new_latt = np.dot(symm_op.rotation_matrix, self._lattice.matrix)
+            new_latt = np.dot(symm_op.rotation_matrix, old_lattice.matrix)
             self._lattice = Lattice(new_latt)
-
-            def operate_site(site):
-                return PeriodicSite(
-                    site.species,
-                    site.lattice.get_cartesian_coords(symm_op.operate(site.frac_coords)),
-                    self._lattice,
-                    coords_are_cartesian=True,
-                    properties=site.properties,
-                    skip_checks=True,
-                    label=site.label,
-                )
+            new_cart = old_lattice.get_cartesian_coords(symm_op.operate_multi(columns.frac_coords))
 
         else:
-            self._lattice = Lattice([symm_op.apply_rotation_only(row) for row in self._lattice.matrix])
-
-            def operate_site(site):
-                new_cart = symm_op.operate(site.coords)
-                new_frac = self._lattice.get_fractional_coords(new_cart)
-                return PeriodicSite(
-                    site.species,
-                    new_frac,
-                    self._lattice,
-                    properties=site.properties,
-                    skip_checks=True,
-                    label=site.label,
-                )
+            self._lattice = Lattice([symm_op.apply_rotation_only(row) for row in old_lattice.matrix])
+            new_cart = symm_op.operate_multi(old_lattice.get_cartesian_coords(columns.frac_coords))
 
-        self.sites = [operate_site(site) for site in self]
+        columns.frac_coords = self._lattice.get_fractional_coords(new_cart).reshape(-1, 3)
+        columns.labels = columns.resolved_labels()
+        self._columns = columns
+        self._site_list = None
 
         return self
 
@@ -4654,7 +5440,13 @@ class Structure(IStructure, collections.abc.MutableSequence):
         Returns:
             Structure: self sorted.
         """
-        self._sites.sort(key=key, reverse=reverse)
+        if self._columns is None:
+            self._sites.sort(key=key, reverse=reverse)
+            return self
+        sites = self.sites
+        self._take_sites(
+            sorted(range(len(sites)), key=lambda idx: sites[idx] if key is None else key(sites[idx]), reverse=reverse)
+        )
         return self
 
     def translate_sites(
@@ -4682,6 +5474,14 @@ class Structure(IStructure, collections.abc.MutableSequence):
         if not isinstance(indices, collections.abc.Iterable):
             indices = [indices]
 
+        if self._columns is not None:
+            indices = np.asarray(indices, dtype=np.intp).reshape(-1)
+            if np.any((indices >= len(self)) | (indices < -len(self))):
+                raise IndexError("list index out of range")
+            if len(np.unique(indices % max(len(self), 1))) == len(indices):
+                self._translate_columns(indices, np.asarray(vector, dtype=np.float64), frac_coords, to_unit_cell)
+                return self
+
         for idx in indices:
             site = self[idx]
             if frac_coords:
@@ -4770,11 +5570,42 @@ class Structure(IStructure, collections.abc.MutableSequence):
             dist = distance if min_distance is None else rng.uniform(min_distance, distance)
             return vector / vnorm * dist if vnorm != 0 else get_rand_vec()
 
+        if self._columns is not None:
+            vectors = np.array([get_rand_vec() for _ in range(len(self))]).reshape(-1, 3)
+            self._translate_columns(np.arange(len(self)), vectors, frac_coords=False, to_unit_cell=True)
+            return self
+
         for idx in range(len(self._sites)):
             self.translate_sites([idx], get_rand_vec(), frac_coords=False)
 
         return self
 
+    def _translate_columns(
+        self,
+        indices: NDArray[np.intp],
+        vectors: NDArray[np.float64],
+        frac_coords: bool,
+        to_unit_cell: bool,
+    ) -> None:
+        """Translate the sites at (unique) indices in the columnar storage, like translate_sites.
+
+        Args:
+            indices (NDArray): Unique site indices.
+            vectors (NDArray): A translation vector shared by all sites or one per site.
+            frac_coords (bool): Whether the vectors are fractional or Cartesian.
+            to_unit_cell (bool): Whether to map translated sites into the unit cell.
+        """
+        columns = cast("_SiteArrays", self._columns)
+        if frac_coords:
+            new_frac = columns.frac_coords[indices] + vectors
+        else:
+            new_cart = self._lattice.get_cartesian_coords(columns.frac_coords[indices]) + vectors
+            new_frac = self._lattice.get_fractional_coords(new_cart).reshape(-1, 3)
+        if to_unit_cell:
+            pbc = np.array(self._lattice.pbc, dtype=bool)
+            new_frac[:, pbc] = np.mod(new_frac[:, pbc], 1)
+        columns.frac_coords[indices] = new_frac
+
     def make_supercell(
         self,
         scaling_matrix: ArrayLike,
@@ -4808,10 +5639,12 @@ class Structure(IStructure, collections.abc.MutableSequence):
         # TODO (janosh) maybe default in_place to False after a depreciation period
         struct: Structure = self if in_place else self.copy()
         supercell: Structure = struct * scaling_matrix
+        columns = supercell._get_columns()
         if to_unit_cell:
-            for site in supercell:
-                site.to_unit_cell(in_place=True)
-        struct.sites = supercell.sites
+            pbc = np.array(supercell.lattice.pbc, dtype=bool)
+            columns.frac_coords[:, pbc] = np.mod(columns.frac_coords[:, pbc], 1)
+        struct._columns = columns
+        struct._site_list = None
         struct.lattice = supercell.lattice
 
         return struct
@@ -573,9 +573,11 @@ class Trajectory(MSONable):
         if fnmatch(filename, "*XDATCAR*"):
             from pymatgen.io.vasp.outputs import Xdatcar
 
-            structures = Xdatcar(filename).structures
+            trajectory = Xdatcar(filename, lazy=True).get_trajectory(constant_lattice=constant_lattice, **kwargs)
+            # Subclasses get their own type back
+            return trajectory if cls is Trajectory else cls.from_dict(trajectory.as_dict())  # type:ignore[return-value]
 
-        elif fnmatch(filename, "vasprun*.xml*"):
+        if fnmatch(filename, "vasprun*.xml*"):
             from pymatgen.io.vasp.outputs import Vasprun
 
             structures = Vasprun(filename).structures
@@ -23,6 +23,9 @@ from pymatgen.core.units import ang_to_bohr, bohr_to_angstrom
 from pymatgen.electronic_structure.core import Spin
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Literal
+
     from numpy.typing import NDArray
     from typing_extensions import Any, Self
 
@@ -83,8 +86,10 @@ class VolumetricData(MSONable):
         self.structure = structure
         self.is_spin_polarized = len(data) >= 2
         self.is_soc = len(data) >= 4
-        # convert data to numpy arrays in case they were jsanitized as lists
-        self.data = {k: np.array(v) for k, v in data.items()}
+        # convert data to numpy arrays in case they were jsanitized as lists,
+        # but keep copy-on-write memory maps on disk. Other memory maps are
+        # copied, so that changes to the data are never written to their files.
+        self.data = {k: v if isinstance(v, np.memmap) and v.mode == "c" else np.array(v) for k, v in data.items()}
         self.dim = self.data["total"].shape
         self.data_aug = data_aug or {}
         self.ngridpts = self.dim[0] * self.dim[1] * self.dim[2]
@@ -228,7 +233,8 @@ class VolumetricData(MSONable):
         x_pts = np.linspace(p1[0], p2[0], num=n)
         y_pts = np.linspace(p1[1], p2[1], num=n)
         z_pts = np.linspace(p1[2], p2[2], num=n)
-        return [self.value_at(x_pts[i], y_pts[i], z_pts[i]) for i in range(n)]
+        # Interpolate all points in one call, which only reads the grid points around them
+        return list(self.interpolator(np.column_stack((x_pts, y_pts, z_pts))))
 
     def get_integrated_diff(self, ind, radius, nbins=1):
         """Get integrated difference of atom index ind up to radius. This can be
@@ -339,20 +345,31 @@ class VolumetricData(MSONable):
             file.attrs["structure_json"] = orjson.dumps(self.structure.as_dict()).decode()
 
     @classmethod
-    def from_hdf5(cls, filename: str, **kwargs) -> VolumetricData:
+    def from_hdf5(cls, filename: str, mmap: bool = False, **kwargs) -> VolumetricData:
         """
         Reads VolumetricData from HDF5 file.
 
         Args:
             filename: Filename
+            mmap (bool): Whether to memory-map the data rather than reading it
+                into memory, so that only the parts of the grids that are used
+                are read. Only possible for contiguous, uncompressed datasets as
+                written by to_hdf5, others are read into memory. Changes to
+                memory-mapped data are not written to the file. Defaults to False.
 
         Returns:
             VolumetricData
         """
         import h5py
 
+        def read_dataset(dataset) -> np.ndarray:
+            offset = dataset.id.get_offset() if mmap and dataset.chunks is None and dataset.size else None
+            if offset is None:
+                return np.array(dataset)
+            return np.memmap(filename, mode="c", dtype=dataset.dtype, offset=offset, shape=dataset.shape)
+
         with h5py.File(filename, mode="r") as file:
-            data = {k: np.array(v) for k, v in file["vdata"].items()}
+            data = {k: read_dataset(v) for k, v in file["vdata"].items()}
             data_aug = None
             if "vdata_aug" in file:
                 data_aug = {k: np.array(v) for k, v in file["vdata_aug"].items()}
@@ -391,6 +408,62 @@ class VolumetricData(MSONable):
                 if idx % 6 == 0:
                     file.write("\n")  # type:ignore[arg-type]
 
+    @staticmethod
+    def _read_grid(
+        text: str,
+        pos: int,
+        dim: Sequence[int],
+        order: Literal["C", "F"] = "C",
+    ) -> tuple[NDArray[np.float64], int]:
+        """Read the values of a volumetric grid written over consecutive lines of a text.
+
+        All values are converted in a single call. Files written by Fortran codes
+        have the same number of values on every full line of a grid, so the end
+        of the grid is computed from its first line, and only scanned for line by
+        line if that fails.
+
+        Args:
+            text (str): Text of the file.
+            pos (int): Position of the first line of the grid in the text.
+            dim (tuple[int, int, int]): Dimensions of the grid.
+            order ("C" | "F"): "F" if the first index runs fastest in the file,
+                as in VASP files, and "C" if the last one does, as in cube files.
+
+        Returns:
+            tuple[NDArray, int]: The grid and the position after its last line.
+        """
+        n_values = int(np.prod(dim))
+
+        def line_end(start: int) -> int:
+            end = text.find("\n", start)
+            return len(text) if end == -1 else end + 1
+
+        first_end = line_end(pos)
+        n_per_line = len(text[pos:first_end].split())
+        if n_per_line:
+            n_lines = -(-n_values // n_per_line)
+            last_start = pos + (n_lines - 1) * (first_end - pos)
+            end = line_end(last_start)
+            if last_start == pos or text[last_start - 1 : last_start] == "\n":
+                try:
+                    values = np.fromstring(text[pos:end], sep=" ")
+                except ValueError:  # the computed end is past the grid
+                    values = np.zeros(0)
+                # Values after the end of the grid on its last line are ignored
+                if n_values <= len(values) < n_values + n_per_line:
+                    return values[:n_values].reshape(dim, order=order), end
+
+        # Lines of varying lengths, find the end of the grid line by line
+        end, count = pos, 0
+        while count < n_values and end < len(text):
+            start, end = end, line_end(end)
+            count += len(text[start:end].split())
+        if count < n_values:
+            raise ValueError(f"Expected {n_values} values for a grid of dimensions {tuple(dim)}, found {count}.")
+        # Values after the end of the grid on its last line are ignored
+        values = np.fromstring(text[pos:end], sep=" ")[:n_values]
+        return values.reshape(dim, order=order), end
+
     @classmethod
     def from_cube(cls, filename: str | Path) -> Self:
         """
@@ -401,10 +474,16 @@ class VolumetricData(MSONable):
         """
         # Limit the number of I/O operations by reading the entire file at once
         with zopen(filename, mode="rt", encoding="utf-8") as f:
-            lines = f.readlines()
+            text: str = f.read()  # type:ignore[assignment]
 
         # Parse the number of atoms from line 3 (first two lines are headers)
-        n_atoms = int(lines[2].split()[0])
+        n_atoms = int(text.split("\n", 2)[2].split(maxsplit=1)[0])
+
+        # The header has 6 + n_atoms lines, followed by the volumetric data
+        data_start = 0
+        for _ in range(6 + n_atoms):
+            data_start = text.index("\n", data_start) + 1
+        lines = text[:data_start].splitlines()
 
         # Pre-parse voxel data into arrays
         def parse_voxel(line):
@@ -433,15 +512,8 @@ class VolumetricData(MSONable):
             coords_are_cartesian=True,
         )
 
-        # Extract volumetric data (starts after atomic site data)
-        volumetric_data_start = atom_data_end
-        volumetric_data_lines = lines[volumetric_data_start:]
-
-        # Convert the text-based volumetric data into a NumPy array (much faster)
-        volumetric_data = np.fromstring(" ".join(volumetric_data_lines), sep=" ", dtype=float)  # type:ignore[arg-type, type-var]
-
-        # Reshape 1D data array into a 3D grid matching the voxel dimensions
-        data = volumetric_data.reshape((num_x_voxels, num_y_voxels, num_z_voxels))
+        # Extract volumetric data (starts after atomic site data), with z running fastest
+        data, _ = cls._read_grid(text, data_start, (num_x_voxels, num_y_voxels, num_z_voxels), order="C")
 
         return cls(structure=structure, data={"total": data})
 
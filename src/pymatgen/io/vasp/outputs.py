@@ -2,28 +2,34 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import itertools
 import math
 import os
 import re
+import tempfile
 import warnings
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import wraps
 from glob import glob
-from io import BytesIO
+from io import BufferedReader, BytesIO, StringIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 from xml.etree import ElementTree as ET
 
 import numpy as np
 import orjson
+from joblib import Parallel, delayed, effective_n_jobs
 from monty.dev import requires
 from monty.io import reverse_readfile, zopen
 from monty.json import MSONable, jsanitize
 from monty.os.path import zpath
 from monty.re import regrep
+from scipy import sparse
 from tqdm import tqdm
 
 from pymatgen.core import Composition, Element, Lattice, Structure
@@ -50,8 +56,8 @@ except ImportError:
     h5py = None
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator, Sequence
-    from typing import Literal, TypeAlias
+    from collections.abc import Callable, Iterator
+    from typing import IO, ClassVar, Literal, TypeAlias
 
     # Avoid name conflict with pymatgen.core.Element
     from xml.etree.ElementTree import Element as XML_Element
@@ -138,11 +144,156 @@ def _parse_vasp_array(elem) -> list[list[bool]] | NDArray[np.float64]:
     if elem.get("type") == "logical":
         return [[i == "T" for i in v.text.split()] for v in elem]
 
+    # numerical data, parse all rows in one call for efficiency if they have the same length
+    rows = [(e.text or "").split() for e in elem]
+    if rows and rows[0] and all(len(row) == len(rows[0]) for row in rows):
+        return _floats_to_array([val for row in rows for val in row]).reshape(len(rows), -1)
+    # unexpectedly couldn't re-shape to grid
+    return np.array([list(map(_vasprun_float, row)) for row in rows])
+
+
+def _parse_vasp_floats(elems: Iterable[XML_Element]) -> NDArray[np.float64]:
+    """Parse the text of a sequence of <v> or <r> elements into a flat array in one call."""
+    return _floats_to_array(" ".join(elem.text or "" for elem in elems).split())
+
+
+def _floats_to_array(values: list[str]) -> NDArray[np.float64]:
+    """Convert the numbers of a vasprun.xml to a flat array in one call."""
     try:
-        # numerical data, try parse with numpy loadtxt for efficiency:
-        return np.loadtxt([e.text for e in elem], ndmin=2, dtype=np.float64)
-    except ValueError:  # unexpectedly couldn't re-shape to grid
-        return np.array([list(map(_vasprun_float, e.text.split())) for e in elem])
+        return np.array(values, dtype=np.float64)
+    except ValueError:  # e.g. overflows written as ********
+        return np.array([_vasprun_float(val) for val in values])
+
+
+# Attributes of Vasprun(lazy=True) set on access, by the tag of the block they are parsed from
+_LAZY_VASPRUN_ATTRS: dict[str, tuple[str, ...]] = {
+    "dos": ("tdos", "idos", "pdos", "efermi", "dos_has_errors"),
+    "eigenvalues": ("eigenvalues",),
+    "projected": ("projected_eigenvalues", "projected_magnetisation"),
+}
+
+# Start and end tags of the blocks of a vasprun.xml that Vasprun(lazy=True) parses on access
+_VASPRUN_LAZY_TAG = re.compile(
+    rb"<(/?)(calculation|dos|eigenvalues|projected|eigenvalues_kpoints_opt|projected_kpoints_opt)\b([^<>]*)>"
+)
+
+
+def _index_vasprun_blocks(
+    filename: PathLike,
+    chunk_size: int = 2**24,
+) -> tuple[list[tuple[int, int]], dict[str, tuple[int, int]]]:
+    """Get the byte offsets of the blocks of a vasprun.xml that can be parsed on access.
+
+    Args:
+        filename (PathLike): Path to the vasprun.xml file.
+        chunk_size (int): Number of bytes read at a time.
+
+    Returns:
+        tuple[list[tuple[int, int]], dict[str, tuple[int, int]]]: The (start, end)
+            offsets of every complete calculation block, and those of the last
+            "dos", "eigenvalues" and "projected" blocks outside of KPOINTS_OPT data.
+            As in Vasprun, the last eigenvalues block may be the one nested in
+            the projected block.
+    """
+    calculations: list[tuple[int, int]] = []
+    blocks: dict[str, tuple[int, int]] = {}
+    # Open blocks as (tag, start offset, whether the block is indexed)
+    open_tags: list[tuple[str, int, bool]] = []
+    offset = 0
+    rest = b""
+    with zopen(filename, mode="rb") as file:
+        while True:
+            data = file.read(chunk_size)
+            chunk = rest + data
+            # A tag may be cut at the end of the chunk, so only search up to the last "<"
+            end = max(chunk.rfind(b"<"), 0) if data else len(chunk)
+            for match in _VASPRUN_LAZY_TAG.finditer(chunk, 0, end):
+                closing, tag, attrs = match[1], match[2].decode(), match[3]
+                if attrs.endswith(b"/"):
+                    continue
+                if not closing:
+                    # Blocks of KPOINTS_OPT data are not indexed
+                    in_kpoints_opt = b"kpoints_opt" in attrs or any(
+                        name in {"eigenvalues_kpoints_opt", "projected_kpoints_opt"} for name, _, _ in open_tags
+                    )
+                    open_tags.append((tag, offset + match.start(), not in_kpoints_opt))
+                elif open_tags and open_tags[-1][0] == tag:
+                    _, start, indexed = open_tags.pop()
+                    if tag == "calculation":
+                        calculations.append((start, offset + match.end()))
+                    elif indexed and tag in {"dos", "eigenvalues", "projected"}:
+                        blocks[tag] = (start, offset + match.end())
+            if not data:
+                break
+            offset += end
+            rest = chunk[end:]
+    return calculations, blocks
+
+
+def _iter_xml_blocks(filename: PathLike, offsets: Iterable[tuple[int, int]]) -> Iterator[XML_Element]:
+    """Parse the XML blocks of a file at (start, end) byte offsets one at a time."""
+    with zopen(filename, mode="rb") as file:
+        for start, end in offsets:
+            file.seek(start)
+            yield ET.fromstring(file.read(end - start))
+
+
+# Start and end tags of the blocks of a vasprun.xml that VasprunSummary keeps or skips
+_VASPRUN_SUMMARY_TAG = re.compile(rb"<(/?)(calculation|dos|eigenvalues|projected|structure)\b([^<>]*)>")
+
+
+def _read_vasprun_summary(filename: PathLike, chunk_size: int = 2**24) -> tuple[bytes, int, int]:
+    """Read the parts of a vasprun.xml that are parsed by VasprunSummary in one pass.
+
+    Args:
+        filename (PathLike): Path to the vasprun.xml file.
+        chunk_size (int): Number of bytes read at a time.
+
+    Returns:
+        tuple[bytes, int, int]: The XML document without the calculation blocks
+            before the last one and without any DOS, eigenvalues or projected
+            eigenvalues block, the number of calculation blocks and the number
+            of unnamed structure blocks, i.e. of MD steps in ML runs.
+    """
+    header: list[bytes] = []
+    last_calculation: list[bytes] = []
+    kept = header
+    n_calculations = n_structures = 0
+    # Tag and depth of the block being skipped
+    skipped: tuple[str, int] | None = None
+    rest = b""
+    with zopen(filename, mode="rb") as file:
+        while True:
+            data = file.read(chunk_size)
+            chunk = rest + data
+            # A tag may be cut at the end of the chunk, so only search up to the last "<"
+            end = max(chunk.rfind(b"<"), 0) if data else len(chunk)
+            pos = 0
+            for match in _VASPRUN_SUMMARY_TAG.finditer(chunk, 0, end):
+                closing, tag, attrs = match[1], match[2].decode(), match[3]
+                if attrs.endswith(b"/"):
+                    continue
+                if skipped is not None:
+                    if tag == skipped[0]:
+                        depth = skipped[1] + (-1 if closing else 1)
+                        skipped = (tag, depth) if depth > 0 else None
+                        pos = match.end()
+                elif tag == "structure":
+                    n_structures += not closing and not attrs.strip()
+                elif not closing:
+                    kept.append(chunk[pos : match.start()])
+                    pos = match.start()
+                    if tag == "calculation":
+                        n_calculations += 1
+                        last_calculation = kept = []
+                    else:
+                        skipped = (tag, 1)
+            if skipped is None:
+                kept.append(chunk[pos:end])
+            if not data:
+                break
+            rest = chunk[end:]
+    return b"".join(header) + b"".join(last_calculation), n_calculations, n_structures
 
 
 def _parse_from_incar(filename: PathLike, key: str) -> Any:
@@ -191,6 +342,38 @@ class KpointOptProps:
     dos_has_errors: bool | None = None
 
 
+class _LazyIonicSteps(Sequence):
+    """Ionic steps of a Vasprun(lazy=True), parsed from their calculation blocks on access.
+
+    Only the last accessed step is kept in memory, so that iterating over the
+    steps of a long run does not hold all of them at once.
+    """
+
+    def __init__(self, vasprun: Vasprun, offsets: list[tuple[int, int]]) -> None:
+        self._vasprun = vasprun
+        self._offsets = offsets
+        self._last: tuple[int, dict[str, Any]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        idx = range(len(self))[idx]
+        if self._last is None or self._last[0] != idx:
+            (elem,) = _iter_xml_blocks(self._vasprun.filename, self._offsets[idx : idx + 1])
+            self._last = idx, self._vasprun._parse_ionic_step(elem)
+        return self._last[1]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for elem in _iter_xml_blocks(self._vasprun.filename, self._offsets):
+            yield self._vasprun._parse_ionic_step(elem)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} ionic steps)"
+
+
 @dataclass
 class BandgapProps(MSONable):
     vbm: float | None = None
@@ -276,6 +459,7 @@ class Vasprun(MSONable):
         occu_tol: float = 1e-8,
         separate_spins: bool = False,
         exception_on_bad_xml: bool = True,
+        lazy: bool = False,
     ) -> None:
         """
         Args:
@@ -324,6 +508,14 @@ class Vasprun(MSONable):
                 proper vasprun.xml are parsed. You can set to False if you want
                 partial results (e.g., if you are monitoring a calculation during a
                 run), but use the results with care. A warning is issued.
+            lazy (bool): Whether to parse the ionic steps, DOS, eigenvalues and
+                projected eigenvalues only when they are accessed. A first fast pass
+                records the byte offsets of these blocks, and the DOS, eigenvalues
+                and projected eigenvalues are parsed on first access. ionic_steps is
+                then a sequence that parses each step from the file when accessed,
+                so that iterating over it does not hold every step in memory. The
+                md_data of ML MD runs is parsed in the first pass. The file must
+                stay in place while in use. Defaults to False.
         """
         self.filename = filename
         self.ionic_step_skip = ionic_step_skip
@@ -332,41 +524,48 @@ class Vasprun(MSONable):
         self.separate_spins = separate_spins
         self.exception_on_bad_xml = exception_on_bad_xml
 
-        with zopen(filename, mode="rt", encoding="utf-8") as file:
-            if ionic_step_skip or ionic_step_offset:
-                # Remove parts of the xml file and parse the string
-                content: str = file.read()  # type:ignore[assignment]
-                steps: list[str] = content.split("<calculation>")
-
-                # The text before the first <calculation> is the preamble!
-                preamble: str = steps.pop(0)
-                self.nionic_steps: int = len(steps)
-                new_steps = steps[ionic_step_offset :: int(ionic_step_skip or 1)]
-
-                # Add the tailing information in the last step from the run
-                to_parse: str = "<calculation>".join(new_steps)
-                if steps[-1] != new_steps[-1]:
-                    to_parse = f"{preamble}<calculation>{to_parse}{steps[-1].split('</calculation>')[-1]}"
+        if lazy:
+            self._parse_lazy(
+                parse_dos=parse_dos,
+                parse_eigen=parse_eigen,
+                parse_projected_eigen=parse_projected_eigen,
+            )
+        else:
+            with zopen(filename, mode="rt", encoding="utf-8") as file:
+                if ionic_step_skip or ionic_step_offset:
+                    # Remove parts of the xml file and parse the string
+                    content: str = file.read()  # type:ignore[assignment]
+                    steps: list[str] = content.split("<calculation>")
+
+                    # The text before the first <calculation> is the preamble!
+                    preamble: str = steps.pop(0)
+                    self.nionic_steps: int = len(steps)
+                    new_steps = steps[ionic_step_offset :: int(ionic_step_skip or 1)]
+
+                    # Add the tailing information in the last step from the run
+                    to_parse: str = "<calculation>".join(new_steps)
+                    if steps[-1] != new_steps[-1]:
+                        to_parse = f"{preamble}<calculation>{to_parse}{steps[-1].split('</calculation>')[-1]}"
+                    else:
+                        to_parse = f"{preamble}<calculation>{to_parse}"
+                    self._parse(
+                        BytesIO(to_parse.encode("utf-8")),
+                        parse_dos=parse_dos,
+                        parse_eigen=parse_eigen,
+                        parse_projected_eigen=parse_projected_eigen,
+                    )
                 else:
-                    to_parse = f"{preamble}<calculation>{to_parse}"
-                self._parse(
-                    BytesIO(to_parse.encode("utf-8")),
-                    parse_dos=parse_dos,
-                    parse_eigen=parse_eigen,
-                    parse_projected_eigen=parse_projected_eigen,
-                )
-            else:
-                self._parse(
-                    file,
-                    parse_dos=parse_dos,
-                    parse_eigen=parse_eigen,
-                    parse_projected_eigen=parse_projected_eigen,
-                )
-                self.nionic_steps = len(self.ionic_steps)
+                    self._parse(
+                        file,
+                        parse_dos=parse_dos,
+                        parse_eigen=parse_eigen,
+                        parse_projected_eigen=parse_projected_eigen,
+                    )
+                    self.nionic_steps = len(self.ionic_steps)
 
-            if parse_potcar_file:
-                self.update_potcar_spec(parse_potcar_file)
-                self.update_charge_from_potcar(parse_potcar_file)
+        if parse_potcar_file:
+            self.update_potcar_spec(parse_potcar_file)
+            self.update_charge_from_potcar(parse_potcar_file)
 
         if self.incar.get("ALGO") not in {"Chi", "Bse"} and not self.converged and self.parameters.get("IBRION") != 0:
             msg = f"{filename} is an unconverged VASP run.\n"
@@ -384,6 +583,7 @@ class Vasprun(MSONable):
         parse_dos: bool,
         parse_eigen: bool,
         parse_projected_eigen: bool,
+        parse_ionic_steps: bool = True,
     ) -> None:
         self.efermi: float | None = None
         self.eigenvalues: dict[Any, NDArray] | None = None
@@ -447,7 +647,9 @@ class Vasprun(MSONable):
 
                     if tag == "calculation":
                         parsed_header = True
-                        if not self.parameters.get("LCHIMAG", False):
+                        if not parse_ionic_steps:
+                            elem.clear()
+                        elif not self.parameters.get("LCHIMAG", False):
                             ionic_steps.append(self._parse_ionic_step(elem))
                         else:
                             ionic_steps.extend(self._parse_chemical_shielding(elem))
@@ -546,17 +748,7 @@ class Vasprun(MSONable):
                         self.normalmode_eigenvecs = np.array([np.array(ev).reshape(n_atoms, 3) for ev in eigenvectors])
 
                     elif ml_run:
-                        if tag == "structure" and elem.attrib.get("name") is None:
-                            md_data.append({})
-                            md_data[-1]["structure"] = self._parse_structure(elem)
-                        elif tag == "varray" and elem.attrib.get("name") == "forces":
-                            md_data[-1]["forces"] = _parse_vasp_array(elem)
-                        elif tag == "varray" and elem.attrib.get("name") == "stress":
-                            md_data[-1]["stress"] = _parse_vasp_array(elem)
-                        elif tag == "energy":
-                            d = {i.attrib["name"]: float(i.text) for i in elem.findall("i")}
-                            if "kinetic" in d:
-                                md_data[-1]["energy"] = {i.attrib["name"]: float(i.text) for i in elem.findall("i")}
+                        self._parse_md_step(elem, md_data)
 
         except ET.ParseError:
             if self.exception_on_bad_xml:
@@ -570,6 +762,93 @@ class Vasprun(MSONable):
         self.md_data = md_data
         self.vasp_version = self.generator["version"]
 
+    def _parse_lazy(
+        self,
+        parse_dos: bool,
+        parse_eigen: bool,
+        parse_projected_eigen: bool,
+    ) -> None:
+        """Parse all but the ionic steps, DOS, eigenvalues and projected
+        eigenvalues, which are indexed by their byte offsets and parsed on access.
+        """
+        calculations, blocks = _index_vasprun_blocks(self.filename)
+
+        # Skip the indexed blocks, but keep the last calculation for the data
+        # VASP writes at the end of the run, e.g. dielectric functions. The MD
+        # steps of ML runs are spread over the calculation blocks and the
+        # structures between them, so these keep every calculation to collect
+        # md_data in the same pass.
+        content: list[bytes] = []
+        pos = 0
+        with zopen(self.filename, mode="rb") as file:
+            header = file.read(calculations[0][0] if calculations else -1)
+            ml_run = False
+            if (incar_start := header.find(b"<incar>")) >= 0 and (incar_end := header.find(b"</incar>")) >= 0:
+                ml_run = bool(self._parse_params(ET.fromstring(header[incar_start : incar_end + 8])).get("ML_LMLFF"))
+            skipped = [*blocks.values()] if ml_run else [*calculations[:-1], *blocks.values()]
+            for start, end in sorted(skipped):
+                if start < pos:  # eigenvalues nested in the skipped projected block
+                    continue
+                file.seek(pos)
+                content.append(file.read(start - pos))
+                pos = end
+            file.seek(pos)
+            content.append(file.read())
+        self._parse(
+            BytesIO(b"".join(content)),
+            parse_dos=parse_dos,
+            parse_eigen=parse_eigen,
+            parse_projected_eigen=parse_projected_eigen,
+            parse_ionic_steps=not ml_run,
+        )
+
+        self._lazy_calculations = calculations[self.ionic_step_offset :: int(self.ionic_step_skip or 1)]
+        self._lazy_blocks = blocks
+        # Attributes set on access by _parse_lazy_block, with the tag of their block
+        self._lazy_attrs: dict[str, str] = {}
+        for tag, parse in (("dos", parse_dos), ("eigenvalues", parse_eigen), ("projected", parse_projected_eigen)):
+            if parse and tag in blocks:
+                for attr in _LAZY_VASPRUN_ATTRS[tag]:
+                    self.__dict__.pop(attr, None)
+                    self._lazy_attrs[attr] = tag
+
+        if self.parameters.get("LCHIMAG", False):
+            self.ionic_steps = [
+                step
+                for elem in _iter_xml_blocks(self.filename, self._lazy_calculations)
+                for step in self._parse_chemical_shielding(elem)
+            ]
+        else:
+            self.ionic_steps = _LazyIonicSteps(self, self._lazy_calculations)  # type: ignore[assignment]
+        self.nionic_steps = (
+            len(calculations) if self.ionic_step_skip or self.ionic_step_offset else len(self.ionic_steps)
+        )
+
+    def _parse_lazy_block(self, tag: str) -> None:
+        """Parse an indexed block of a Vasprun(lazy=True) and set its attributes."""
+        self._lazy_attrs = {attr: attr_tag for attr, attr_tag in self._lazy_attrs.items() if attr_tag != tag}
+        (elem,) = _iter_xml_blocks(self.filename, [self._lazy_blocks[tag]])
+        if tag == "dos":
+            self.efermi = None
+            try:
+                self.tdos, self.idos, self.pdos = self._parse_dos(elem)
+                self.efermi = self.tdos.efermi
+                self.dos_has_errors = False
+            except Exception:
+                self.dos_has_errors = True
+        elif tag == "eigenvalues":
+            self.eigenvalues = self._parse_eigen(elem)
+        else:
+            self.projected_eigenvalues, self.projected_magnetisation = self._parse_projected_eigen(elem)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for missing attributes, i.e. blocks not yet parsed by a Vasprun(lazy=True)
+        tag = self.__dict__.get("_lazy_attrs", {}).get(name)
+        if tag is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        self._parse_lazy_block(tag)
+        return getattr(self, name)
+
     @property
     def structures(self) -> list[Structure]:
         """List of Structures for each ionic step."""
@@ -1382,7 +1661,7 @@ class Vasprun(MSONable):
 
         try:
             vout = {
-                "ionic_steps": self.ionic_steps,
+                "ionic_steps": list(self.ionic_steps),
                 "final_energy": self.final_energy,
                 "final_energy_per_atom": self.final_energy / n_sites,
                 "crystal": self.final_structure.as_dict(),
@@ -1390,7 +1669,7 @@ class Vasprun(MSONable):
             }
         except (ArithmeticError, TypeError):
             vout = {
-                "ionic_steps": self.ionic_steps,
+                "ionic_steps": list(self.ionic_steps),
                 "final_energy": self.final_energy,
                 "final_energy_per_atom": None,
                 "crystal": self.final_structure.as_dict(),
@@ -1647,18 +1926,37 @@ class Vasprun(MSONable):
         elem.clear()
         return ion_step
 
+    def _parse_md_step(self, elem: XML_Element, md_data: list[dict]) -> None:
+        """Parse an element of an ML MD run into md_data."""
+        tag = elem.tag
+        if tag == "structure" and elem.attrib.get("name") is None:
+            md_data.append({})
+            md_data[-1]["structure"] = self._parse_structure(elem)
+        elif tag == "varray" and elem.attrib.get("name") == "forces":
+            md_data[-1]["forces"] = _parse_vasp_array(elem)
+        elif tag == "varray" and elem.attrib.get("name") == "stress":
+            md_data[-1]["stress"] = _parse_vasp_array(elem)
+        elif tag == "energy":
+            d = {i.attrib["name"]: float(i.text) for i in elem.findall("i")}
+            if "kinetic" in d:
+                md_data[-1]["energy"] = d
+
     @staticmethod
     def _parse_dos(elem: XML_Element) -> tuple[Dos, Dos, list[dict]]:
         """Parse density of states (DOS)."""
         efermi = float(elem.find("i").text)  # type: ignore[union-attr, arg-type]
-        energies: NDArray | None = None
         tdensities = {}
         idensities = {}
 
-        soc_run = len(elem.find("total").find("array").find("set").findall("set")) > 2  # type: ignore[union-attr]
-        for s in elem.find("total").find("array").find("set").findall("set"):  # type: ignore[union-attr]
-            data = _parse_vasp_array(s)
-            energies = data[:, 0]
+        # Parse the sets of all spins at once into an array of shape (nspin, nedos, 3)
+        spin_sets = elem.find("total").find("array").find("set").findall("set")  # type: ignore[union-attr]
+        soc_run = len(spin_sets) > 2
+        if not spin_sets:
+            raise ValueError("energies is None")
+        total = _parse_vasp_floats(elem.find("total").iter("r"))  # type: ignore[union-attr]
+        total = total.reshape(len(spin_sets), len(spin_sets[0]), -1)
+        energies = total[-1, :, 0]
+        for s, data in zip(spin_sets, total, strict=True):
             spin = Spin.up if s.attrib["comment"] == "spin 1" else Spin.down
             if spin != Spin.up and soc_run:  # other 'spins' are x,y,z SOC projections
                 continue
@@ -1671,23 +1969,26 @@ class Vasprun(MSONable):
             orbs = [ss.text for ss in partial.find("array").findall("field")]  # type: ignore[union-attr]
             orbs.pop(0)
             lm = any("x" in s for s in orbs if s is not None)
-            for s in partial.find("array").find("set").findall("set"):  # type: ignore[union-attr]
-                pdos: dict[Orbital | OrbitalType, dict[Spin, NDArray]] = defaultdict(dict)
-
-                for ss in s.findall("set"):
-                    spin = Spin.up if ss.attrib["comment"] == "spin 1" else Spin.down
-                    if spin != Spin.up and soc_run:  # other 'spins' are x,y,z SOC projections
-                        continue
-                    data = _parse_vasp_array(ss)
-                    _n_row, n_col = data.shape
-                    for col_idx in range(1, n_col):
-                        orb = Orbital(col_idx - 1) if lm else OrbitalType(col_idx - 1)
-                        pdos[orb][spin] = data[:, col_idx]  # type: ignore[index]
-                pdoss.append(pdos)
+            ion_sets = partial.find("array").find("set").findall("set")  # type: ignore[union-attr]
+            if ion_sets:
+                # Parse the sets of all ions at once into an array of shape (nion, nspin, nedos, norb + 1)
+                spin_sets = ion_sets[0].findall("set")
+                partial_data = _parse_vasp_floats(partial.iter("r")).reshape(
+                    len(ion_sets), len(spin_sets), len(spin_sets[0]), -1
+                )
+                for ion_data in partial_data:
+                    pdos: dict[Orbital | OrbitalType, dict[Spin, NDArray]] = defaultdict(dict)
+
+                    for ss, data in zip(spin_sets, ion_data, strict=True):
+                        spin = Spin.up if ss.attrib["comment"] == "spin 1" else Spin.down
+                        if spin != Spin.up and soc_run:  # other 'spins' are x,y,z SOC projections
+                            continue
+                        for col_idx in range(1, data.shape[1]):
+                            orb = Orbital(col_idx - 1) if lm else OrbitalType(col_idx - 1)
+                            pdos[orb][spin] = data[:, col_idx]  # type: ignore[index]
+                    pdoss.append(pdos)
         elem.clear()
 
-        if energies is None:
-            raise ValueError("energies is None")
         return (
             Dos(efermi, energies, tdensities),
             Dos(efermi, energies, idensities),
@@ -1697,12 +1998,17 @@ class Vasprun(MSONable):
     @staticmethod
     def _parse_eigen(elem: XML_Element) -> dict[Spin, NDArray]:
         """Parse eigenvalues."""
-        eigenvalues: dict[Spin, NDArray] = defaultdict(list)  # type:ignore[arg-type]
-        for s in elem.find("array").find("set").findall("set"):  # type: ignore[union-attr]
-            spin = Spin.up if s.attrib["comment"] == "spin 1" else Spin.down
-            for ss in s.findall("set"):
-                eigenvalues[spin].append(_parse_vasp_array(ss))
-        eigenvalues = {spin: np.array(v) for spin, v in eigenvalues.items()}
+        spin_sets = elem.find("array").find("set").findall("set")  # type: ignore[union-attr]
+        eigenvalues: dict[Spin, NDArray] = {}
+        kpt_sets = spin_sets[0].findall("set") if spin_sets else []
+        if kpt_sets:
+            # Parse all eigenvalues and occupations at once into an array of shape (nspin, nkpt, nband, 2)
+            data = _parse_vasp_floats(elem.find("array").iter("r")).reshape(  # type: ignore[union-attr]
+                len(spin_sets), len(kpt_sets), len(kpt_sets[0]), -1
+            )
+            for s, spin_data in zip(spin_sets, data, strict=True):
+                spin = Spin.up if s.attrib["comment"] == "spin 1" else Spin.down
+                eigenvalues[spin] = spin_data
         elem.clear()
         return eigenvalues
 
@@ -1712,27 +2018,32 @@ class Vasprun(MSONable):
     ) -> tuple[dict[Spin, NDArray], NDArray | None]:
         """Parse projected eigenvalues."""
         root = elem.find("array").find("set")  # type: ignore[union-attr]
-        _proj_eigen: dict[int, NDArray] = defaultdict(list)  # type:ignore[arg-type]
-        for s in root.findall("set"):  # type: ignore[union-attr]
-            spin: int = int(re.match(r"spin(\d+)", s.attrib["comment"])[1])  # type: ignore[index]
+        spin_sets = root.findall("set")  # type: ignore[union-attr]
+        kpt_sets = spin_sets[0].findall("set") if spin_sets else []
+        if not kpt_sets:
+            elem.clear()
+            return {}, None
+
+        # Parse all projections at once into an array of shape (nspin, nkpt, nband, nion, norb)
+        band_sets = kpt_sets[0].findall("set")
+        data = _parse_vasp_floats(root.iter("r")).reshape(  # type: ignore[union-attr]
+            len(spin_sets), len(kpt_sets), len(band_sets), len(band_sets[0]), -1
+        )
+        spins = [int(re.match(r"spin(\d+)", s.attrib["comment"])[1]) for s in spin_sets]  # type: ignore[index]
 
-            # Force spin to be +1 or -1
-            for ss in s.findall("set"):
-                dk = []
-                for sss in ss.findall("set"):
-                    db = _parse_vasp_array(sss)
-                    dk.append(db)
-                _proj_eigen[spin].append(dk)
-        _proj_eigen = {spin: np.array(v) for spin, v in _proj_eigen.items()}
-
-        if len(_proj_eigen) > 2:
+        if len(spins) > 2:
             # non-collinear magentism (also spin-orbit coupling) enabled, last three
             # "spin channels" are the projected magnetization of the orbitals in the
-            # x, y, and z Cartesian coordinates
-            proj_mag = np.stack([_proj_eigen.pop(i) for i in range(2, 5)], axis=-1)  # type: ignore[call-overload]
-            proj_eigen: dict[Spin, NDArray] = {Spin.up: _proj_eigen[1]}
+            # x, y, and z Cartesian coordinates, as views of the parsed array
+            if spins != [1, 2, 3, 4]:
+                raise ValueError(f"Unexpected spin channels {spins} in projected eigenvalues")
+            proj_mag = np.moveaxis(data[1:], 0, -1)
+            proj_eigen: dict[Spin, NDArray] = {Spin.up: data[0]}
         else:
-            proj_eigen = {Spin.up if k == 1 else Spin.down: v for k, v in _proj_eigen.items()}
+            # Force spin to be +1 or -1
+            proj_eigen = {
+                Spin.up if spin == 1 else Spin.down: spin_data for spin, spin_data in zip(spins, data, strict=True)
+            }
             proj_mag = None
 
         elem.clear()
@@ -1954,6 +2265,128 @@ class BSVasprun(Vasprun):
         return jsanitize(dct, strict=True)
 
 
+class VasprunSummary(Vasprun):
+    """
+    A fast version of Vasprun that only parses the summary of a run, e.g. to
+    get a ComputedEntry. The header (generator, incar, kpoints, parameters,
+    initial structure and atominfo), the last ionic step and the data written
+    after it, like the final structure, are parsed. The file is read in one
+    pass that only looks for the tags of the calculation, DOS, eigenvalues and
+    projected eigenvalues blocks, so that all but the last calculation and the
+    DOS and eigenvalues are skipped without being parsed as XML.
+
+    The attributes in skipped_attrs are set as follows. ionic_steps and
+    structures only hold the last ionic step and md_data only the MD steps of
+    the parsed parts, while nionic_steps and md_n_steps count the steps of the
+    whole run. As with Vasprun(parse_dos=False, parse_eigen=False,
+    parse_projected_eigen=False), efermi, eigenvalues, projected_eigenvalues
+    and projected_magnetisation are None, kpoints_opt_props is None or holds no
+    DOS or eigenvalues, tdos, idos, pdos, dos_has_errors, complete_dos and
+    complete_dos_normalized raise an AttributeError and
+    eigenvalue_band_properties raises a ValueError.
+    """
+
+    skipped_attrs: ClassVar[frozenset[str]] = frozenset(
+        {
+            "tdos",
+            "idos",
+            "pdos",
+            "efermi",
+            "dos_has_errors",
+            "complete_dos",
+            "complete_dos_normalized",
+            "eigenvalues",
+            "eigenvalue_band_properties",
+            "projected_eigenvalues",
+            "projected_magnetisation",
+            "kpoints_opt_props",
+            "ionic_steps",
+            "structures",
+            "md_data",
+        }
+    )
+
+    def __init__(
+        self,
+        filename: PathLike,
+        parse_potcar_file: PathLike | bool = True,
+        occu_tol: float = 1e-8,
+        separate_spins: bool = False,
+        exception_on_bad_xml: bool = True,
+    ) -> None:
+        """
+        Args:
+            filename (str): Filename to parse
+            parse_potcar_file (bool | PathLike): Whether to parse the potcar file to read
+                the potcar hashes for the potcar_spec attribute. See Vasprun.
+            occu_tol (float): Sets the minimum tol for the determination of the
+                vbm and cbm. See Vasprun.
+            separate_spins (bool): Whether the band gap, CBM, and VBM should be
+                reported for each individual spin channel. See Vasprun.
+            exception_on_bad_xml (bool): Whether to throw a ParseException if a
+                malformed XML is detected. See Vasprun.
+        """
+        self.filename = filename
+        self.ionic_step_skip = None
+        self.ionic_step_offset = 0
+        self.occu_tol = occu_tol
+        self.separate_spins = separate_spins
+        self.exception_on_bad_xml = exception_on_bad_xml
+
+        content, self.nionic_steps, self._n_md_structures = _read_vasprun_summary(filename)
+        self._parse(BytesIO(content), parse_dos=False, parse_eigen=False, parse_projected_eigen=False)
+        if self.parameters.get("LCHIMAG", False):
+            # The steps of a chemical shielding run are all parsed from its calculation block
+            self.nionic_steps = len(self.ionic_steps)
+
+        if parse_potcar_file:
+            self.update_potcar_spec(parse_potcar_file)
+            self.update_charge_from_potcar(parse_potcar_file)
+
+        if self.incar.get("ALGO") not in {"Chi", "Bse"} and not self.converged and self.parameters.get("IBRION") != 0:
+            msg = f"{filename} is an unconverged VASP run.\n"
+            msg += f"Electronic convergence reached: {self.converged_electronic}.\n"
+            msg += f"Ionic convergence reached: {self.converged_ionic}."
+            warnings.warn(
+                msg,
+                UnconvergedVASPWarning,
+                stacklevel=2,
+            )
+
+    @property
+    def md_n_steps(self) -> int:
+        """Number of steps for MD runs, counting all the actual MD steps if ML enabled."""
+        return self._n_md_structures if self.incar.get("ML_LMLFF") else self.nionic_steps
+
+    @property
+    def converged_ionic(self) -> bool:
+        """Whether ionic step convergence has been reached, see Vasprun.converged_ionic.
+        Only the last ionic step is parsed, so the steps of the run are counted
+        with nionic_steps.
+        """
+        nsw = self.parameters.get("NSW", 0)
+        ibrion = self.parameters.get("IBRION", -1 if nsw in (-1, 0) else 0)
+        if ibrion == 0:
+            return nsw <= 1 or self.md_n_steps == nsw
+        if ibrion in {1, 2} and self.parameters.get("EDIFFG", 1) == 0:
+            return nsw <= 1 or nsw == self.nionic_steps
+        return nsw <= 1 or self.nionic_steps < nsw
+
+
+def _outcar_section(method: Callable) -> Callable:
+    """Decorator for the Outcar read_* methods, which only parse the section of
+    the file named after the method, e.g. "lepsilon" for read_lepsilon.
+    """
+    section = method.__name__.removeprefix("read_")
+
+    @wraps(method)
+    def wrapper(self: Outcar, *args, **kwargs):
+        with self._read_section(section):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class Outcar:
     """Parser for data in OUTCAR that is not available in vasprun.xml.
 
@@ -1989,6 +2422,11 @@ class Outcar:
         - read_pseudo_zval
         - read_table_pattern
 
+    Each reader only parses the section of the file it needs, which is located by
+    a quick search for the first line the reader uses. Several readers can be run
+    at once with read_sections, or when creating the instance with the sections
+    argument, which reads the file only once.
+
     Attributes:
         magnetization (tuple[dict[str, float]]): Magnetization on each ion, e.g.
             ({"d": 0.0, "p": 0.003, "s": 0.002, "tot": 0.005}, ... ).
@@ -2034,13 +2472,61 @@ class Outcar:
     Authors: Rickard Armiento, Shyue Ping Ong
     """
 
-    def __init__(self, filename: PathLike) -> None:
+    # Literal markers of the sections parsed by the read_* methods, keyed by the
+    # method names without "read_". All lines used by a reader contain or follow
+    # one of its markers, so it only parses the text from a few lines before the
+    # first marker in the file. Readers without markers parse the whole file.
+    _SECTION_MARKERS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "avg_core_poten": ("the norm of the test charge is",),
+        "chemical_shielding": ("CSA tensor (J. Mason",),
+        "core_state_eigen": ("NIONS =", "the core state eigen"),
+        "corrections": (),
+        "cs_core_contribution": ("Core NMR properties",),
+        "cs_g0_contribution": ("G=0 CONTRIBUTION TO CHEMICAL SHIFT",),
+        "cs_raw_symmetrized_tensors": ("Absolute Chemical Shift tensors",),
+        "elastic_tensor": ("TOTAL ELASTIC MODULI (kBar)",),
+        "electrostatic_potential": (),
+        "fermi_contact_shift": (
+            "Fermi contact (isotropic) hyperfine coupling parameter (MHz)",
+            "Dipolar hyperfine coupling parameters (MHz)",
+            "Total hyperfine coupling parameters after diagonalization (MHz)",
+        ),
+        "freq_dielectric": (
+            "plasma frequency squared",
+            "IMAGINARY DIELECTRIC FUNCTION (independent particle, no local field effects)",
+        ),
+        "igpar": ("e<r>_ev=(", "p[elc]=(", "p[ion]=("),
+        "internal_strain_tensor": ("INTERNAL STRAIN TENSOR FOR ION",),
+        "lcalcpol": ("p[elc]=(", "p[sp1]=(", "p[sp2]=(", "Ionic dipole moment: "),
+        "lepsilon": (
+            "MACROSCOPIC STATIC DIELECTRIC TENSOR (",
+            "PIEZOELECTRIC TENSOR  for field in x, y, z",
+            "BORN EFFECTIVE CHARGES ",
+        ),
+        "lepsilon_ionic": (
+            "MACROSCOPIC STATIC DIELECTRIC TENSOR IONIC",
+            "PIEZOELECTRIC TENSOR IONIC CONTR  for field in x, y, z",
+        ),
+        "neb": (),
+        "nmr_efg": ("NMR quadrupolar parameters",),
+        "nmr_efg_tensor": ("Electric field gradients (V/A^2)",),
+        "onsite_density_matrices": ("spin component  1", "spin component  2"),
+        "piezo_tensor": ("PIEZOELECTRIC TENSOR  for field in x, y, z",),
+        "pseudo_zval": ("VRHFIN =", "ZVAL"),
+    }
+
+    def __init__(self, filename: PathLike, sections: Iterable[str] = ()) -> None:
         """
         Args:
             filename (PathLike): OUTCAR file to parse.
+            sections (Iterable[str]): Additional sections to read, see read_sections.
         """
         self.filename: str = str(filename)
         self.is_stopped: bool = False
+        # Text of the file while it is being parsed, see _read_section
+        self._text: str | None = None
+        self._section: str | None = None
+        self._section_offsets: dict[str, int | None] = {}
 
         # Assume a compilation with parallelization enabled.
         # Will be checked later.
@@ -2175,10 +2661,14 @@ class Outcar:
         else:
             mag = mag_x  # type:ignore[assignment]
 
+        # Keep the text in memory while parsing, so that the file is only read once
+        with zopen(filename, mode="rt", encoding="utf-8") as file:
+            self._text = file.read()  # type:ignore[assignment]
+
         # Data from beginning of OUTCAR
         run_stats["cores"] = None
-        with zopen(filename, mode="rt", encoding="utf-8") as file:
-            for line in file:  # type:ignore[assignment]
+        with StringIO(self._text) as file:
+            for line in file:
                 if "serial" in line:
                     # Activate serial parallelization
                     run_stats["cores"] = 1
@@ -2241,19 +2731,50 @@ class Outcar:
             except ValueError:
                 pass
 
-        # Read the drift
+        # Energy contributions to the final total energy
+        energy_contrib_keys = (
+            "PSCENC",
+            "TEWEN",
+            "DENC",
+            "EXHF",
+            "XCENC",
+            "PAW double counting",
+            "EENTRO",
+            "EBANDS",
+            "EATOM",
+            "Ediel_sol",
+        )
+
+        # Read all patterns that are searched in the whole file in one pass
         self.read_pattern(
-            {"drift": r"total drift:\s+([\.\-\d]+)\s+([\.\-\d]+)\s+([\.\-\d]+)"},
-            postprocess=float,
+            {
+                "drift": r"total drift:\s+([\.\-\d]+)\s+([\.\-\d]+)\s+([\.\-\d]+)",
+                "spin": r"ISPIN\s*=\s*2",
+                "noncollinear": r"LNONCOLLINEAR\s*=\s*T",
+                "epsilon": r"LEPSILON\s*=\s*T",
+                "calcpol": r"LCALCPOL\s*=\s*T",
+                "electrostatic": r"average \(electrostatic\) potential at core",
+                "nmr_cs": r"LCHIMAG\s*=\s*(T)",
+                "nmr_efg": r"NMR quadrupolar parameters",
+                **{
+                    key: (
+                        rf"{key}\s+=\s+([\.\-\d]+)\s+([\.\-\d]+)"
+                        if key == "PAW double counting"
+                        else rf"{key}\s+=\s+([\d\-\.]+)"
+                    )
+                    for key in energy_contrib_keys
+                },
+            }
         )
-        self.drift = self.data.get("drift", [])
+
+        # Read the drift
+        self.data["drift"] = [[float(val) for val in drift] for drift in self.data["drift"]]
+        self.drift = self.data["drift"]
 
         # Check if calculation is spin polarized
-        self.read_pattern({"spin": r"ISPIN\s*=\s*2"})
         self.spin = bool(self.data.get("spin", False))
 
         # Check if calculation is non-collinear
-        self.read_pattern({"noncollinear": r"LNONCOLLINEAR\s*=\s*T"})
         self.noncollinear = bool(self.data.get("noncollinear", False))
 
         # Check if the calculation type is DFPT
@@ -2269,7 +2790,6 @@ class Outcar:
             self.dfpt = False
 
         # Check if LEPSILON is True and read piezo data if so
-        self.read_pattern({"epsilon": r"LEPSILON\s*=\s*T"})
         if self.data.get("epsilon", False):
             self.lepsilon = True
             self.read_lepsilon()
@@ -2280,7 +2800,6 @@ class Outcar:
             self.lepsilon = False
 
         # Check if LCALCPOL is True and read polarization data if so
-        self.read_pattern({"calcpol": r"LCALCPOL\s*=\s*T"})
         if self.data.get("calcpol", False):
             self.lcalcpol = True
             self.read_lcalcpol()
@@ -2292,11 +2811,9 @@ class Outcar:
         self.electrostatic_potential: list[float] | None = None
         self.ngf: list[int] | None = None
         self.sampling_radii: list[float] | None = None
-        self.read_pattern({"electrostatic": r"average \(electrostatic\) potential at core"})
         if self.data.get("electrostatic", False):
             self.read_electrostatic_potential()
 
-        self.read_pattern({"nmr_cs": r"LCHIMAG\s*=\s*(T)"})
         if self.data.get("nmr_cs"):
             self.nmr_cs: bool = True
             self.read_chemical_shielding()
@@ -2306,7 +2823,6 @@ class Outcar:
         else:
             self.nmr_cs = False
 
-        self.read_pattern({"nmr_efg": r"NMR quadrupolar parameters"})
         if self.data.get("nmr_efg"):
             self.nmr_efg: bool = True
             self.read_nmr_efg()
@@ -2326,27 +2842,15 @@ class Outcar:
 
         # Store the individual contributions to the final total energy
         final_energy_contribs = {}
-        for key in (
-            "PSCENC",
-            "TEWEN",
-            "DENC",
-            "EXHF",
-            "XCENC",
-            "PAW double counting",
-            "EENTRO",
-            "EBANDS",
-            "EATOM",
-            "Ediel_sol",
-        ):
-            if key == "PAW double counting":
-                self.read_pattern({key: rf"{key}\s+=\s+([\.\-\d]+)\s+([\.\-\d]+)"})
-            else:
-                self.read_pattern({key: rf"{key}\s+=\s+([\d\-\.]+)"})
+        for key in energy_contrib_keys:
             if not self.data[key]:
                 continue
             final_energy_contribs[key] = sum(map(float, self.data[key][-1]))
         self.final_energy_contribs = final_energy_contribs
 
+        self.read_sections(sections)
+        self._text = None
+
     @staticmethod
     def _parse_sci_notation(line: str) -> list[float]:
         """
@@ -2431,6 +2935,66 @@ class Outcar:
 
         return dct
 
+    def read_sections(self, sections: Iterable[str]) -> None:
+        """Run several read_* methods, while reading the file only once.
+
+        Args:
+            sections (Iterable[str]): Names of the read_* methods without the
+                "read_" prefix, e.g. ["lepsilon", "elastic_tensor"].
+        """
+        sections = list(sections)
+        if unknown := set(sections).difference(self._SECTION_MARKERS):
+            raise ValueError(f"Unknown sections {sorted(unknown)}, supported are {list(self._SECTION_MARKERS)}.")
+
+        with self._read_section():
+            for section in sections:
+                getattr(self, f"read_{section}")()
+
+    @contextmanager
+    def _read_section(self, section: str | None = None) -> Iterator[None]:
+        """Restrict read_pattern, read_table_pattern and the read_* methods to a
+        section of the file, keeping the text of the file in memory for the
+        readers called in the meantime.
+
+        Args:
+            section (str | None): Name of the section, or None for the whole file.
+        """
+        owner = self._text is None
+        if owner:
+            with zopen(self.filename, mode="rt", encoding="utf-8") as file:
+                self._text = file.read()  # type:ignore[assignment]
+            self._section_offsets = {}
+        previous, self._section = self._section, section
+        try:
+            yield
+        finally:
+            self._section = previous
+            if owner:
+                self._text = None
+
+    def _get_text(self) -> str:
+        """Text of the current section of the file."""
+        if self._text is None:
+            with zopen(self.filename, mode="rt", encoding="utf-8") as file:
+                return file.read()  # type:ignore[return-value]
+        if self._section is None or not (markers := self._SECTION_MARKERS.get(self._section)):
+            return self._text
+
+        if self._section not in self._section_offsets:
+            offsets = [offset for marker in markers if (offset := self._text.find(marker)) != -1]
+            start = min(offsets, default=None)
+            if start is not None:
+                # Go back to the start of the third line before the marker, as
+                # the headers matched by the readers may start before it
+                for _ in range(4):
+                    start = self._text.rfind("\n", 0, start)
+                    if start == -1:
+                        break
+                start += 1
+            self._section_offsets[self._section] = start
+        start = self._section_offsets[self._section]
+        return "" if start is None else self._text[start:]
+
     def read_pattern(
         self,
         patterns: dict[str, str],
@@ -2460,15 +3024,31 @@ class Outcar:
             results from regex and postprocess. Note that the values
             are list[list], because you can grep multiple items on one line.
         """
-        matches = regrep(
-            filename=self.filename,
-            patterns=patterns,
-            reverse=reverse,
-            terminate_on_match=terminate_on_match,
-            postprocess=postprocess,
-        )
-        for key in patterns:
-            self.data[key] = [i[0] for i in matches.get(key, [])]
+        if reverse:
+            matches = regrep(
+                filename=self.filename,
+                patterns=patterns,
+                reverse=reverse,
+                terminate_on_match=terminate_on_match,
+                postprocess=postprocess,
+            )
+            for key in patterns:
+                self.data[key] = [i[0] for i in matches.get(key, [])]
+            return
+
+        # Same as regrep, but on the text of the current section
+        compiled = {key: re.compile(pattern) for key, pattern in patterns.items()}
+        found: dict[str, list] = {key: [] for key in patterns}
+        pending = set(compiled)
+        with StringIO(self._get_text()) as file:
+            for line in file:
+                for key, regex in compiled.items():
+                    if match := regex.search(line):
+                        found[key].append([postprocess(group) for group in match.groups()])
+                        pending.discard(key)
+                if terminate_on_match and not pending:
+                    break
+        self.data |= found
 
     def read_table_pattern(
         self,
@@ -2519,8 +3099,7 @@ class Outcar:
         if last_one_only and first_one_only:
             raise ValueError("last_one_only and first_one_only options are incompatible")
 
-        with zopen(self.filename, mode="rt", encoding="utf-8") as file:
-            text: str = file.read()  # type:ignore[assignment]
+        text = self._get_text()
         table_pattern_text = header_pattern + r"\s*^(?P<table_body>(?:\s+" + row_pattern + r")+)\s+" + footer_pattern
         table_pattern = re.compile(table_pattern_text, re.MULTILINE | re.DOTALL)
         rp = re.compile(row_pattern)
@@ -2549,6 +3128,7 @@ class Outcar:
             self.data[attribute_name] = retained_data
         return retained_data
 
+    @_outcar_section
     def read_electrostatic_potential(self) -> None:
         """Parse the eletrostatic potential for the last ionic step.
 
@@ -2575,6 +3155,7 @@ class Outcar:
 
         self.electrostatic_potential = [*map(float, pots)]
 
+    @_outcar_section
     def read_freq_dielectric(self) -> None:
         """
         Parse the frequency dependent dielectric function (obtained with LOPTICS).
@@ -2599,9 +3180,9 @@ class Outcar:
         data: dict[str, Any] = {"REAL": [], "IMAGINARY": []}
         count = 0
         component = "IMAGINARY"
-        with zopen(self.filename, mode="rt", encoding="utf-8") as file:
+        with StringIO(self._get_text()) as file:
             line: str
-            for line in file:  # type:ignore[assignment]
+            for line in file:
                 line = line.strip()
                 if re.match(plasma_pattern, line):
                     read_plasma = "intraband" if "intraband" in line else "interband"
@@ -2643,6 +3224,7 @@ class Outcar:
             data["IMAGINARY"]
         )
 
+    @_outcar_section
     def read_chemical_shielding(self) -> None:
         """Parse the NMR chemical shieldings data. Only the second part "absolute, valence and core"
         will be parsed. And only the three right most field (ISO_SHIELDING, SPAN, SKEW) will be retrieved.
@@ -2678,6 +3260,7 @@ class Outcar:
         }
         self.data["chemical_shielding"] = chemical_shielding
 
+    @_outcar_section
     def read_cs_g0_contribution(self) -> None:
         """Parse the G0 contribution of NMR chemical shielding.
 
@@ -2701,6 +3284,7 @@ class Outcar:
             attribute_name="cs_g0_contribution",
         )
 
+    @_outcar_section
     def read_cs_core_contribution(self) -> None:
         """Parse the core contribution of NMR chemical shielding.
 
@@ -2721,6 +3305,7 @@ class Outcar:
         core_contrib: dict[str, float] = {d["element"]: float(d["shift"]) for d in self.data["cs_core_contribution"]}
         self.data["cs_core_contribution"] = core_contrib
 
+    @_outcar_section
     def read_cs_raw_symmetrized_tensors(self) -> None:
         """Parse the matrix form of NMR tensor before corrected to table.
 
@@ -2732,8 +3317,7 @@ class Outcar:
         row_pattern = r"\s+".join([r"([-]?\d+\.\d+)"] * 3)
         unsym_footer_pattern = r"^\s+SYMMETRIZED TENSORS\s+$"
 
-        with zopen(self.filename, mode="rt", encoding="utf-8") as file:
-            text: str = file.read()  # type:ignore[assignment]
+        text = self._get_text()
         unsym_table_pattern_text = header_pattern + first_part_pattern + r"(?P<table_body>.+)" + unsym_footer_pattern
         table_pattern = re.compile(unsym_table_pattern_text, re.MULTILINE | re.DOTALL)
         row_pat = re.compile(row_pattern)
@@ -2758,6 +3342,7 @@ class Outcar:
         else:
             raise ValueError("NMR UNSYMMETRIZED TENSORS is not found")
 
+    @_outcar_section
     def read_nmr_efg_tensor(self) -> list[NDArray[np.float64]]:
         """Parses the NMR Electric Field Gradient Raw Tensors.
 
@@ -2780,6 +3365,7 @@ class Outcar:
         self.data["unsym_efg_tensor"] = tensors
         return tensors
 
+    @_outcar_section
     def read_nmr_efg(self) -> None:
         """Parse the NMR Electric Field Gradient interpreted values.
 
@@ -2810,6 +3396,7 @@ class Outcar:
             attribute_name="efg",
         )
 
+    @_outcar_section
     def read_elastic_tensor(self) -> None:
         """
         Parse the elastic tensor data.
@@ -2825,6 +3412,7 @@ class Outcar:
         )
         self.data["elastic_tensor"] = et_table
 
+    @_outcar_section
     def read_piezo_tensor(self) -> None:
         """Parse the piezo tensor data.
 
@@ -2839,6 +3427,7 @@ class Outcar:
         )
         self.data["piezo_tensor"] = piezo_tensor
 
+    @_outcar_section
     def read_onsite_density_matrices(self) -> None:
         """Parse the onsite density matrices.
 
@@ -2881,6 +3470,7 @@ class Outcar:
         ]
         self.data["onsite_density_matrices"] = onsite_density_matrices
 
+    @_outcar_section
     def read_corrections(
         self,
         reverse: bool = True,
@@ -2905,6 +3495,7 @@ class Outcar:
         dipol_quadrupol_correction: float = self.data["dipol_quadrupol_correction"][0][0]
         self.data["dipol_quadrupol_correction"] = dipol_quadrupol_correction
 
+    @_outcar_section
     def read_neb(
         self,
         reverse: bool = True,
@@ -2942,6 +3533,7 @@ class Outcar:
         if self.data.get("tangent_force"):
             self.data["tangent_force"] = float(self.data["tangent_force"][0][1])
 
+    @_outcar_section
     def read_igpar(self) -> None:
         """Read IGPAR.
 
@@ -3042,7 +3634,7 @@ class Outcar:
             self.er_ev = {Spin.up: None, Spin.down: None}  # type:ignore[dict-item]
             self.er_bp = {Spin.up: None, Spin.down: None}  # type:ignore[dict-item]
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            micro_pyawk(StringIO(self._get_text()), search, self)
 
             if self.er_ev[Spin.up] is not None and self.er_ev[Spin.down] is not None:
                 self.er_ev_tot = self.er_ev[Spin.up] + self.er_ev[Spin.down]  # type: ignore[operator,assignment]
@@ -3053,6 +3645,7 @@ class Outcar:
         except Exception as exc:
             raise RuntimeError("IGPAR OUTCAR could not be parsed.") from exc
 
+    @_outcar_section
     def read_internal_strain_tensor(self) -> None:
         """Read the internal strain tensor.
 
@@ -3098,8 +3691,9 @@ class Outcar:
 
         self.internal_strain_ion = None
         self.internal_strain_tensor: list[NDArray[np.float64]] = []
-        micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+        micro_pyawk(StringIO(self._get_text()), search, self)
 
+    @_outcar_section
     def read_lepsilon(self) -> None:
         """Read a LEPSILON run.
 
@@ -3248,7 +3842,7 @@ class Outcar:
             self.born_ion = None
             self.born: list | NDArray = []
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            micro_pyawk(StringIO(self._get_text()), search, self)
 
             self.born = np.array(self.born)
 
@@ -3258,6 +3852,7 @@ class Outcar:
         except Exception as exc:
             raise RuntimeError("LEPSILON OUTCAR could not be parsed.") from exc
 
+    @_outcar_section
     def read_lepsilon_ionic(self) -> None:
         """Read the ionic component of a LEPSILON run.
 
@@ -3378,7 +3973,7 @@ class Outcar:
             self.piezo_ionic_index = None
             self.piezo_ionic_tensor = np.zeros((3, 6))
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            micro_pyawk(StringIO(self._get_text()), search, self)
 
             self.dielectric_ionic_tensor = self.dielectric_ionic_tensor.tolist()  # type:ignore[assignment]
             self.piezo_ionic_tensor = self.piezo_ionic_tensor.tolist()  # type:ignore[assignment]
@@ -3386,6 +3981,7 @@ class Outcar:
         except Exception as exc:
             raise RuntimeError("ionic part of LEPSILON OUTCAR could not be parsed.") from exc
 
+    @_outcar_section
     def read_lcalcpol(self) -> None:
         """Read the LCALCPOL.
 
@@ -3478,12 +4074,12 @@ class Outcar:
                 ]
             )
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            micro_pyawk(StringIO(self._get_text()), search, self)
 
             # Fix polarization units in new versions of VASP
             regex = r"^.*Ionic dipole moment: .*"
             search = [[regex, None, lambda x, y: x.append(y.group(0))]]
-            results = micro_pyawk(self.filename, search, [])  # type:ignore[arg-type]
+            results = micro_pyawk(StringIO(self._get_text()), search, [])
 
             if "|e|" in results[0]:
                 self.p_elec *= -1  # type: ignore[operator]
@@ -3495,6 +4091,7 @@ class Outcar:
         except Exception as exc:
             raise RuntimeError("LCALCPOL OUTCAR could not be parsed.") from exc
 
+    @_outcar_section
     def read_pseudo_zval(self) -> None:
         """Create a pseudopotential valence electron number (ZVAL) dictionary.
 
@@ -3521,7 +4118,7 @@ class Outcar:
                 )
             )
 
-            micro_pyawk(self.filename, search, self)  # type:ignore[arg-type]
+            micro_pyawk(StringIO(self._get_text()), search, self)
 
             self.zval_dict: dict[str, float] = dict(zip(self.atom_symbols, self.zvals, strict=True))  # type: ignore[attr-defined]
 
@@ -3532,6 +4129,7 @@ class Outcar:
         except Exception as exc:
             raise RuntimeError("ZVAL dict could not be parsed.") from exc
 
+    @_outcar_section
     def read_core_state_eigen(self) -> list[dict[str, list[float]]]:
         """Read the core state eigenenergies at each ionic step.
 
@@ -3543,12 +4141,12 @@ class Outcar:
             The core state eigenenergie of the 2s AO of the 6th atom of the
             structure at the last ionic step is [5]["2s"][-1].
         """
-        with zopen(self.filename, mode="rt", encoding="utf-8") as foutcar:
-            line: str = foutcar.readline()  # type:ignore[assignment]
+        with StringIO(self._get_text()) as foutcar:
+            line: str = foutcar.readline()
             core_state_eigs: list[dict[str, list[float]]] = []
 
             while line != "":
-                line = foutcar.readline()  # type:ignore[assignment]
+                line = foutcar.readline()
 
                 if "NIONS =" in line:
                     natom = int(line.split("NIONS =")[1])
@@ -3557,7 +4155,7 @@ class Outcar:
                 if "the core state eigen" in line:
                     iat = -1
                     while line != "":
-                        line = foutcar.readline()  # type:ignore[assignment]
+                        line = foutcar.readline()
                         # don't know number of lines to parse without knowing
                         # specific species, so stop parsing when we reach
                         # "E-fermi" instead
@@ -3574,6 +4172,7 @@ class Outcar:
                             core_state_eigs[iat][data[i]].append(float(data[i + 1]))
         return core_state_eigs
 
+    @_outcar_section
     def read_avg_core_poten(self) -> list[list[float]]:
         """Read the core potential at each ionic step.
 
@@ -3585,7 +4184,7 @@ class Outcar:
             The average core potential of the 2nd atom of the structure at the
             last ionic step is: [-1][1].
         """
-        with zopen(self.filename, mode="rt", encoding="utf-8") as foutcar:
+        with StringIO(self._get_text()) as foutcar:
             line = foutcar.readline()
             avg_core_pots: list[list[float]] = []
             while line != "":
@@ -3612,6 +4211,7 @@ class Outcar:
 
         return avg_core_pots
 
+    @_outcar_section
     def read_fermi_contact_shift(self) -> None:
         """Read Fermi contact (isotropic) hyperfine coupling parameter.
 
@@ -3698,115 +4298,195 @@ class VolumetricData(BaseVolumetricData):
     """
 
     @staticmethod
-    def parse_file(filename: PathLike) -> tuple[Poscar, dict, dict]:
+    def parse_file(
+        filename: PathLike, parse_aug: bool = True, cache: bool | PathLike = False
+    ) -> tuple[Poscar, dict, dict]:
         """
         Parse a generic volumetric data file in the VASP like format.
         Used by subclasses for parsing files.
 
         Args:
             filename (PathLike): Path of file to parse.
+            parse_aug (bool): Whether to keep the lines after each dataset,
+                typically augmentation charges. Defaults to True.
+            cache (bool | PathLike): Whether to use a binary cache of the data,
+                i.e. a .npy file plus a JSON file with the header. If True, the
+                cache is "{filename}.pmg_cache.npy" next to the file. If a
+                directory is given, the cache is stored there instead. The cache
+                is written when the file is first parsed and later calls
+                memory-map the data from it copy-on-write, so that only the parts
+                of the grids that are used are read from disk and changes to the
+                data are not written back. The cache is rewritten if the size or
+                modification time of the file changes. Defaults to False, i.e.
+                no files are written.
 
         Returns:
             tuple[Poscar, dict, dict]: Poscar object, data dict, data_aug dict
         """
-        poscar_read = False
+        if cache and (cached := VolumetricData._read_cache(filename, cache, parse_aug)) is not None:
+            return cached
+
+        with zopen(filename, mode="rt", encoding="utf-8") as file:
+            text: str = file.read()  # type:ignore[assignment]
+
+        # The Poscar ends at the first blank line, followed by the grid dimensions
         poscar_string: list[str] = []
-        dataset: NDArray = np.zeros((1, 1, 1))
+        pos = 0
+        while True:
+            end = text.find("\n", pos)
+            if end == -1:
+                raise ValueError(f"No volumetric data found in {filename}.")
+            line = text[pos:end].strip()
+            pos = end + 1
+            if line == "" and poscar_string:
+                break
+            poscar_string.append(line)
+        poscar_str = "\n".join(poscar_string)
+        poscar = Poscar.from_str(poscar_str)
+
+        end = text.find("\n", pos)
+        dimline = text[pos : len(text) if end == -1 else end].strip()
+        dim = [int(i) for i in dimline.split()]
+        pos = end + 1
+        # Each dataset starts after a repeat of the dimensions line
+        dimline_pattern = re.compile(rf"^[ \t]*{re.escape(dimline)}[ \t]*$", re.MULTILINE)
+
         all_dataset: list[NDArray] = []
         # for holding any strings in input that are not Poscar
         # or VolumetricData (typically augmentation charges)
         all_dataset_aug: dict[int, list[str]] = {}
-        dim: list[int] = []
-        dimline = ""
-        read_dataset = False
-        ngrid_pts = 0
-        data_count = 0
-        poscar = None
-        with zopen(filename, mode="rt", encoding="utf-8") as file:
-            for line in file:
-                original_line = line
-                line = line.strip()
-                if read_dataset:
-                    for tok in line.split():
-                        if data_count < ngrid_pts:
-                            # This complicated procedure is necessary because
-                            # VASP outputs x as the fastest index, followed by y
-                            # then z.
-                            no_x = data_count // dim[0]
-                            dataset[data_count % dim[0], no_x % dim[1], no_x // dim[1]] = float(tok)
-                            data_count += 1
-                    if data_count >= ngrid_pts:
-                        read_dataset = False
-                        data_count = 0
-                        all_dataset.append(dataset)
-
-                elif not poscar_read:
-                    if line != "" or len(poscar_string) == 0:
-                        poscar_string.append(line)  # type:ignore[arg-type]
-                    elif line == "":
-                        poscar = Poscar.from_str("\n".join(poscar_string))
-                        poscar_read = True
-
-                elif not dim:
-                    dim = [int(i) for i in line.split()]
-                    ngrid_pts = dim[0] * dim[1] * dim[2]
-                    dimline = line  # type:ignore[assignment]
-                    read_dataset = True
-                    dataset = np.zeros(dim)
-
-                elif line == dimline:
-                    # when line == dimline, expect volumetric data to follow
-                    # so set read_dataset to True
-                    read_dataset = True
-                    dataset = np.zeros(dim)
+        while True:
+            # VASP outputs x as the fastest index, followed by y then z
+            dataset, pos = VolumetricData._read_grid(text, pos, dim, order="F")
+            all_dataset.append(dataset)
+
+            match = dimline_pattern.search(text, pos)
+            next_pos = len(text) if match is None else match.start()
+            if parse_aug and next_pos > pos:
+                # store any extra lines that were not part of the
+                # volumetric data so we know which set of data the extra
+                # lines are associated with
+                all_dataset_aug[len(all_dataset) - 1] = text[pos:next_pos].splitlines(keepends=True)
+            if match is None:
+                break
+            pos = match.end() + 1
+
+        if len(all_dataset) == 4:
+            data = {
+                "total": all_dataset[0],
+                "diff_x": all_dataset[1],
+                "diff_y": all_dataset[2],
+                "diff_z": all_dataset[3],
+            }
+            data_aug = {
+                "total": all_dataset_aug.get(0),
+                "diff_x": all_dataset_aug.get(1),
+                "diff_y": all_dataset_aug.get(2),
+                "diff_z": all_dataset_aug.get(3),
+            }
 
-                else:
-                    # store any extra lines that were not part of the
-                    # volumetric data so we know which set of data the extra
-                    # lines are associated with
-                    key = len(all_dataset) - 1
-                    if key not in all_dataset_aug:
-                        all_dataset_aug[key] = []
-                    all_dataset_aug[key].append(original_line)  # type:ignore[arg-type]
-
-            if len(all_dataset) == 4:
-                data = {
-                    "total": all_dataset[0],
-                    "diff_x": all_dataset[1],
-                    "diff_y": all_dataset[2],
-                    "diff_z": all_dataset[3],
-                }
-                data_aug = {
-                    "total": all_dataset_aug.get(0),
-                    "diff_x": all_dataset_aug.get(1),
-                    "diff_y": all_dataset_aug.get(2),
-                    "diff_z": all_dataset_aug.get(3),
-                }
+            # Construct a "diff" dict for scalar-like magnetization density,
+            # referenced to an arbitrary direction (using same method as
+            # pymatgen.electronic_structure.core.Magmom, see
+            # Magmom documentation for justification for this)
+            # TODO: re-examine this, and also similar behavior in
+            # Magmom - @mkhorton
+            # TODO: does CHGCAR change with different SAXIS?
+            diff_xyz = np.array([data["diff_x"], data["diff_y"], data["diff_z"]])
+            diff_xyz = diff_xyz.reshape((3, dim[0] * dim[1] * dim[2]))
+            ref_direction = np.array([1.01, 1.02, 1.03])
+            ref_sign = np.sign(np.dot(ref_direction, diff_xyz))
+            diff = np.multiply(np.linalg.norm(diff_xyz, axis=0), ref_sign)
+            data["diff"] = diff.reshape((dim[0], dim[1], dim[2]))
+
+        elif len(all_dataset) == 2:
+            data = {"total": all_dataset[0], "diff": all_dataset[1]}
+            data_aug = {
+                "total": all_dataset_aug.get(0),
+                "diff": all_dataset_aug.get(1),
+            }
+        else:
+            data = {"total": all_dataset[0]}
+            data_aug = {"total": all_dataset_aug.get(0)}
 
-                # Construct a "diff" dict for scalar-like magnetization density,
-                # referenced to an arbitrary direction (using same method as
-                # pymatgen.electronic_structure.core.Magmom, see
-                # Magmom documentation for justification for this)
-                # TODO: re-examine this, and also similar behavior in
-                # Magmom - @mkhorton
-                # TODO: does CHGCAR change with different SAXIS?
-                diff_xyz = np.array([data["diff_x"], data["diff_y"], data["diff_z"]])
-                diff_xyz = diff_xyz.reshape((3, dim[0] * dim[1] * dim[2]))
-                ref_direction = np.array([1.01, 1.02, 1.03])
-                ref_sign = np.sign(np.dot(ref_direction, diff_xyz))
-                diff = np.multiply(np.linalg.norm(diff_xyz, axis=0), ref_sign)
-                data["diff"] = diff.reshape((dim[0], dim[1], dim[2]))
-
-            elif len(all_dataset) == 2:
-                data = {"total": all_dataset[0], "diff": all_dataset[1]}
-                data_aug = {
-                    "total": all_dataset_aug.get(0),
-                    "diff": all_dataset_aug.get(1),
-                }
-            else:
-                data = {"total": all_dataset[0]}
-                data_aug = {"total": all_dataset_aug.get(0)}
-            return poscar, data, data_aug  # type: ignore[return-value]
+        if cache:
+            VolumetricData._write_cache(filename, cache, poscar_str, data, data_aug, parse_aug)
+        return poscar, data, data_aug  # type: ignore[return-value]
+
+    @staticmethod
+    def _get_cache_source(filename: PathLike) -> list[int]:
+        """Size and modification time of a file, which the cache of a file must match."""
+        stat = os.stat(filename)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @staticmethod
+    def _get_cache_prefix(filename: PathLike, cache: bool | PathLike) -> str:
+        """Path of the cache files of a file without their extensions."""
+        if cache is True:
+            return f"{filename}.pmg_cache"
+        # Files of the same name in different directories get different caches
+        path_hash = hashlib.sha256(os.path.abspath(filename).encode()).hexdigest()[:16]
+        return os.path.join(cache, f"{os.path.basename(filename)}.{path_hash}.pmg_cache")
+
+    @staticmethod
+    def _read_cache(filename: PathLike, cache: bool | PathLike, parse_aug: bool) -> tuple[Poscar, dict, dict] | None:
+        """Load the data of a file from its cache, or None if there is no valid cache."""
+        prefix = VolumetricData._get_cache_prefix(filename, cache)
+        try:
+            with open(f"{prefix}.json", mode="rb") as file:
+                header = orjson.loads(file.read())
+            if header["source"] != VolumetricData._get_cache_source(filename) or (
+                parse_aug and not header["parse_aug"]
+            ):
+                return None
+            arrays = np.load(f"{prefix}.npy", mmap_mode="c")
+        except (OSError, ValueError, KeyError):
+            return None
+        if list(arrays.shape) != header["shape"]:
+            return None
+
+        # Each dataset is a Fortran-ordered slab of the file, as parsed
+        data = {key: arrays[..., idx] for idx, key in enumerate(header["keys"])}
+        data_aug = header["data_aug"] if parse_aug else dict.fromkeys(header["data_aug"])
+        return Poscar.from_str(header["poscar"]), data, data_aug
+
+    @staticmethod
+    def _write_cache(
+        filename: PathLike, cache: bool | PathLike, poscar_str: str, data: dict, data_aug: dict, parse_aug: bool
+    ) -> None:
+        """Write the cache of a file. Failing to write it only raises a warning."""
+        keys = list(data)
+        shape = [*data["total"].shape, len(keys)]
+        header = {
+            "source": VolumetricData._get_cache_source(filename),
+            "poscar": poscar_str,
+            "keys": keys,
+            "shape": shape,
+            "data_aug": data_aug,
+            "parse_aug": parse_aug,
+        }
+        # Replace rather than overwrite the files, which may be memory-mapped
+        prefix = VolumetricData._get_cache_prefix(filename, cache)
+        tmp_filenames = [f"{prefix}.npy.tmp", f"{prefix}.json.tmp"]
+        try:
+            if cache is not True:
+                os.makedirs(cache, exist_ok=True)
+            arrays = np.lib.format.open_memmap(
+                tmp_filenames[0], mode="w+", dtype=np.float64, shape=tuple(shape), fortran_order=True
+            )
+            for idx, key in enumerate(keys):
+                arrays[..., idx] = data[key]
+            arrays.flush()
+            del arrays
+            with open(tmp_filenames[1], mode="wb") as file:
+                file.write(orjson.dumps(header))
+            os.replace(tmp_filenames[0], f"{prefix}.npy")
+            os.replace(tmp_filenames[1], f"{prefix}.json")
+        except (OSError, TypeError, ValueError) as exc:
+            for tmp_filename in tmp_filenames:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_filename)
+            warnings.warn(f"Failed to write volumetric data cache for {filename}: {exc}", stacklevel=3)
 
     def write_file(
         self,
@@ -3900,16 +4580,20 @@ class Locpot(VolumetricData):
         self.name = poscar.comment
 
     @classmethod
-    def from_file(cls, filename: PathLike, **kwargs) -> Self:
+    def from_file(cls, filename: PathLike, cache: bool | PathLike = False, **kwargs) -> Self:
         """Read a LOCPOT file.
 
         Args:
             filename (PathLike): Path to LOCPOT file.
+            cache (bool | PathLike): Whether to memory-map the data from a binary
+                cache next to the file, or in the given directory, which is
+                written on the first read. See VolumetricData.parse_file.
+                Defaults to False.
 
         Returns:
             Locpot
         """
-        poscar, data, _data_aug = VolumetricData.parse_file(filename)
+        poscar, data, _data_aug = VolumetricData.parse_file(filename, parse_aug=False, cache=cache)
         return cls(poscar, data, **kwargs)
 
 
@@ -3944,16 +4628,22 @@ class Chgcar(VolumetricData):
         self._distance_matrix: dict = {}
 
     @classmethod
-    def from_file(cls, filename: str) -> Self:
+    def from_file(cls, filename: str, parse_aug: bool = True, cache: bool | PathLike = False) -> Self:
         """Read a CHGCAR file.
 
         Args:
             filename (str): Path to CHGCAR file.
+            parse_aug (bool): Whether to read the augmentation occupancies, which
+                are needed to write the file back. Defaults to True.
+            cache (bool | PathLike): Whether to memory-map the data from a binary
+                cache next to the file, or in the given directory, which is
+                written on the first read. See VolumetricData.parse_file.
+                Defaults to False.
 
         Returns:
             Chgcar
         """
-        poscar, data, data_aug = VolumetricData.parse_file(filename)
+        poscar, data, data_aug = VolumetricData.parse_file(filename, parse_aug=parse_aug, cache=cache)
         return cls(poscar, data, data_aug=data_aug)  # type:ignore[arg-type]
 
     @property
@@ -3998,17 +4688,20 @@ class Elfcar(VolumetricData):
         self.data = data
 
     @classmethod
-    def from_file(cls, filename: str) -> Self:
+    def from_file(cls, filename: str, cache: bool | PathLike = False) -> Self:
         """
         Read a ELFCAR file.
 
         Args:
             filename: Filename
+            cache (bool | PathLike): Whether to memory-map the data from a binary
+                cache next to the file, or in the given directory. See
+                VolumetricData.parse_file. Defaults to False.
 
         Returns:
             Elfcar
         """
-        poscar, data, _data_aug = VolumetricData.parse_file(filename)
+        poscar, data, _data_aug = VolumetricData.parse_file(filename, parse_aug=False, cache=cache)
         return cls(poscar, data)
 
     def get_alpha(self) -> VolumetricData:
@@ -4030,6 +4723,8 @@ class Procar(MSONable):
         data (dict): The PROCAR data of the form below. It should VASP uses 1-based indexing,
             but all indices are converted to 0-based here.
             {spin: np.array accessed with (k-point index, band index, ion index, orbital index)}
+            With storage="sparse", the arrays are scipy sparse arrays whose rows are the flattened
+            (k-point index, band index, ion index), and with storage="summed", data is None.
         weights (NDArray): The weights associated with each k-point as an array of length nkpoints.
         phase_factors (dict): Phase factors, where present (e.g. LORBIT = 12). A dict of the form:
             {spin: complex np.array accessed with (k-point index, band index, ion index, orbital index)}
@@ -4046,13 +4741,33 @@ class Procar(MSONable):
         xyz_data (dict): The PROCAR projections data along the x,y and z magnetisation projection
             directions, with is_soc = True (see VASP wiki for more info).
             {'x'/'y'/'z': np.array accessed with (k-point index, band index, ion index, orbital index)}
+        storage (str): How the projections are stored, see __init__.
+        ion_projections (dict): With storage="summed", the projections summed over orbitals as
+            {spin: np.array accessed with (k-point index, band index, ion index)}, otherwise None.
+        orbital_projections (dict): With storage="summed", the projections summed over bands as
+            {spin: np.array accessed with (k-point index, ion index, orbital index)}, otherwise None.
     """
 
-    def __init__(self, filename: PathLike | list[PathLike]):
+    def __init__(
+        self,
+        filename: PathLike | list[PathLike],
+        storage: Literal["dense", "float32", "sparse", "summed"] = "dense",
+    ):
         """
         Args:
             filename: The path to PROCAR(.gz) file to read, or list of paths.
+            storage ("dense" | "float32" | "sparse" | "summed"): How to store the projections.
+                "dense" stores data, xyz_data and phase_factors as float64/complex128 arrays and
+                "float32" as float32/complex64 arrays. "sparse" stores them as scipy sparse arrays
+                of shape (nkpoints * nbands * nions, norbitals) holding only the nonzero values.
+                "summed" only keeps ion_projections and orbital_projections, which are summed
+                while reading, so data is None and xyz_data and phase_factors are not stored.
+                get_projection_on_elements and get_occupation work with all of them.
+                Defaults to "dense".
         """
+        if storage not in {"dense", "float32", "sparse", "summed"}:
+            raise ValueError(f"Unknown {storage=}, supported are 'dense', 'float32', 'sparse' and 'summed'")
+        self.storage = storage
         # get PROCAR filenames list to parse:
         filenames = filename if isinstance(filename, list) else [filename]
         self.nions: int | None = None  # used to check for consistency in files later
@@ -4071,7 +4786,7 @@ class Procar(MSONable):
         parsed_kpoints = None
         occupancies_list, kpoints_list, weights_list = [], [], []
         eigenvalues_list, data_list, xyz_data_list = [], [], []
-        phase_factors_list = []
+        phase_factors_list, orbital_projections_list = [], []
         for filename in tqdm(filenames, desc="Reading PROCARs", unit="file", disable=len(filenames) == 1):
             (
                 kpoints,
@@ -4081,6 +4796,7 @@ class Procar(MSONable):
                 data,
                 phase_factors,
                 xyz_data,
+                orbital_projections,
             ) = self._read(filename, parsed_kpoints=parsed_kpoints)
 
             # Append to respective lists
@@ -4091,77 +4807,65 @@ class Procar(MSONable):
             data_list.append(data)
             xyz_data_list.append(xyz_data)
             phase_factors_list.append(phase_factors)
+            orbital_projections_list.append(orbital_projections)
 
         # Combine arrays along the kpoints axis:
-        # nbands (axis = 2) could differ between arrays, so set missing values to zero:
+        # nbands (axis = 1) could differ between arrays, so set missing values to zero:
         max_nbands = max(eig_dict[Spin.up].shape[1] for eig_dict in eigenvalues_list)
-        for dict_array in itertools.chain(
+        for weights, *dict_arrays in zip(
+            weights_list,
             occupancies_list,
             eigenvalues_list,
             data_list,
             xyz_data_list,
             phase_factors_list,
+            strict=True,
         ):
-            if dict_array:
-                for key, array in dict_array.items():
-                    if array.shape[1] < max_nbands:
-                        if len(array.shape) == 2:  # occupancies, eigenvalues
-                            dict_array[key] = np.pad(
-                                array,
-                                ((0, 0), (0, max_nbands - array.shape[2])),
-                                mode="constant",
-                            )
-                        elif len(array.shape) == 4:  # data, phase_factors
-                            dict_array[key] = np.pad(
-                                array,
-                                (
-                                    (0, 0),
-                                    (0, max_nbands - array.shape[2]),
-                                    (0, 0),
-                                    (0, 0),
-                                ),
-                                mode="constant",
-                            )
-                        elif len(array.shape) == 5:  # xyz_data
-                            dict_array[key] = np.pad(
-                                array,
-                                (
-                                    (0, 0),
-                                    (0, max_nbands - array.shape[2]),
-                                    (0, 0),
-                                    (0, 0),
-                                    (0, 0),
-                                ),
-                                mode="constant",
+            for dict_array in dict_arrays:
+                for key, array in (dict_array or {}).items():
+                    if isinstance(array, sparse.sparray):
+                        # Rows of sparse projections are flattened (k-point, band, ion) indices
+                        n_rows = len(weights) * max_nbands * self.nions  # type: ignore[operator]
+                        if array.shape[0] < n_rows:
+                            coo = array.tocoo()
+                            kpoint, band_ion = np.divmod(coo.row, array.shape[0] // len(weights))
+                            rows = kpoint * (n_rows // len(weights)) + band_ion
+                            dict_array[key] = sparse.csr_array(
+                                (coo.data, (rows, coo.col)), shape=(n_rows, array.shape[1])
                             )
-                        else:
-                            raise ValueError("Unexpected array shape encountered!")
+                    elif array.shape[1] < max_nbands:
+                        pad_width = [(0, 0)] * array.ndim
+                        pad_width[1] = (0, max_nbands - array.shape[1])
+                        dict_array[key] = np.pad(array, pad_width, mode="constant")
+
+        def concatenate(dicts: list[dict]) -> dict:
+            return {
+                key: sparse.csr_array(sparse.vstack([dct[key] for dct in dicts]))
+                if isinstance(dicts[0][key], sparse.sparray)
+                else np.concatenate([dct[key] for dct in dicts], axis=0)
+                for key in dicts[0]
+            }
 
         # set nbands, nkpoints, and other attributes:
         self.nbands = max_nbands
         self.kpoints = np.concatenate(kpoints_list, axis=0)
         self.nkpoints = len(self.kpoints)
-        self.occupancies = {
-            spin: np.concatenate([occupancies[spin] for occupancies in occupancies_list], axis=0)
-            for spin in occupancies_list[0]
-        }
-        self.eigenvalues = {
-            spin: np.concatenate([eigenvalues[spin] for eigenvalues in eigenvalues_list], axis=0)
-            for spin in eigenvalues_list[0]
-        }
+        self.occupancies = concatenate(occupancies_list)
+        self.eigenvalues = concatenate(eigenvalues_list)
         self.weights = np.concatenate(weights_list, axis=0)
-        self.data = {spin: np.concatenate([data[spin] for data in data_list], axis=0) for spin in data_list[0]}
-        self.phase_factors = {
-            spin: np.concatenate([phase_factors[spin] for phase_factors in phase_factors_list], axis=0)
-            for spin in phase_factors_list[0]
-        }
-        if self.is_soc:
-            self.xyz_data: dict | None = {
-                key: np.concatenate([xyz_data[key] for xyz_data in xyz_data_list], axis=0) for key in xyz_data_list[0]
-            }
+        self.data: dict[Spin, Any] | None = concatenate(data_list)
+        self.phase_factors = concatenate(phase_factors_list)
+        if self.is_soc and self.storage != "summed":
+            self.xyz_data: dict | None = concatenate(xyz_data_list)  # type: ignore[arg-type]
         else:
             self.xyz_data = None
 
+        self.ion_projections: dict[Spin, NDArray] | None = None
+        self.orbital_projections: dict[Spin, NDArray] | None = None
+        if self.storage == "summed":
+            self.ion_projections, self.data = self.data, None
+            self.orbital_projections = concatenate(orbital_projections_list)
+
     def _parse_kpoint_line(self, line: str) -> tuple[float, float, float]:
         """
         Parse k-point vector from a PROCAR line.
@@ -4181,6 +4885,9 @@ class Procar(MSONable):
     def _read(self, filename: PathLike, parsed_kpoints: set[tuple[Kpoint]] | None = None):
         """Main function for reading in the PROCAR projections data.
 
+        The lines of the ions of each band are collected and parsed in bulk, into
+        arrays stored according to self.storage.
+
         Args:
             filename (PathLike): Path to PROCAR file to read.
             parsed_kpoints (set[tuple[Kpoint]]): Set of tuples of already-parsed kpoints (e.g. from multiple
@@ -4193,9 +4900,7 @@ class Procar(MSONable):
             preamble_expr = re.compile(r"# of k-points:\s*(\d+)\s+# of bands:\s*(\d+)\s+# of ions:\s*(\d+)")
             kpoint_expr = re.compile(r"^k-point\s+(\d+).*weight = ([0-9\.]+)")
             band_expr = re.compile(r"^band\s+(\d+)")
-            ion_expr = re.compile(r"^ion.*")
             total_expr = re.compile(r"^tot.*")
-            expr = re.compile(r"^([0-9]+)\s+")
             current_kpoint = 0
             current_band = 0
             spin = Spin.down  # switched to Spin.up for first block
@@ -4206,11 +4911,18 @@ class Procar(MSONable):
             n_ions = None
             weights: NDArray[np.float64] | None = None
             headers = None
-            data: dict[Spin, NDArray] = {}
             eigenvalues: dict[Spin, NDArray] | None = None
             occupancies: dict[Spin, NDArray] | None = None
-            phase_factors: dict[Spin, NDArray] | None = None
-            xyz_data: dict[str, NDArray] | None = None  # 'x'/'y'/'z' as keys for SOC projections dict
+            dtype = np.float32 if self.storage == "float32" else np.float64
+            complex_dtype = np.complex64 if self.storage == "float32" else np.complex128
+            # Dense arrays accessed with (k-point index, band index, ion index, orbital index), or for
+            # sparse storage the (row, column, value) triplets of the nonzero values of each band
+            data: dict[Spin, Any] = {}
+            phase_factors: dict[Spin, Any] = {}
+            xyz_data: dict[str, Any] = {}  # 'x'/'y'/'z' as keys for SOC projections dict
+            # summed storage, with (k-point index, band index, ion index) and (k-point index, ion index,
+            # orbital index) arrays
+            orbital_projections: dict[Spin, NDArray] = {}
             # keep track of parsed kpoints, to avoid redundant/duplicate parsing with multiple PROCARs:
             this_procar_parsed_kpoints = (
                 set()
@@ -4242,18 +4954,84 @@ class Procar(MSONable):
                 raise ValueError("Mismatch in SOC setting (LSORBIT) in supplied PROCARs!")
             self.is_soc = is_soc
 
+            def store(target: dict, key: Spin | str, ions: NDArray, values: NDArray) -> None:
+                """Store the values of the ions of the current band."""
+                shape = (n_kpoints, n_bands, n_ions, len(headers))  # type: ignore[arg-type]
+                if self.storage == "sparse":
+                    rows, cols = np.nonzero(values)
+                    rows_offset = (current_kpoint * n_bands + current_band) * n_ions  # type: ignore[operator]
+                    target.setdefault(key, []).append((rows_offset + ions[rows], cols, values[rows, cols]))
+                    return
+                if key not in target:
+                    if np.iscomplexobj(values):
+                        target[key] = np.full(shape, np.nan, dtype=complex_dtype)
+                    else:
+                        target[key] = np.zeros(shape, dtype=dtype)
+                target[key][current_kpoint, current_band, ions] = values
+
+            def store_band(groups: list[list[str]]) -> None:
+                """Parse the groups of consecutive ion lines of the current band in bulk.
+
+                These are the projections, followed by the x, y and z projections with SOC,
+                and the phase factors where present.
+                """
+                if not groups:
+                    return
+                if headers is None:
+                    raise ValueError("headers is None")
+                n_orbs = len(headers)
+                arrays = [np.array(" ".join(group).split(), dtype=float).reshape(len(group), -1) for group in groups]
+                ions = arrays[0][:, 0].astype(int) - 1
+                projections = arrays[0][:, 1 : n_orbs + 1]
+
+                if self.storage == "summed":
+                    if spin not in data:
+                        data[spin] = np.zeros((n_kpoints, n_bands, n_ions))  # type: ignore[arg-type]
+                        orbital_projections[spin] = np.zeros((n_kpoints, n_ions, n_orbs))  # type: ignore[arg-type]
+                    data[spin][current_kpoint, current_band, ions] = projections.sum(axis=1)
+                    orbital_projections[spin][current_kpoint, ions] += projections
+                    return
+
+                store(data, spin, ions, projections)
+                n_proj = 4 if self.is_soc else 1
+                if self.is_soc:
+                    for direction, array in zip("xyz", arrays[1:n_proj], strict=False):
+                        store(xyz_data, direction, array[:, 0].astype(int) - 1, array[:, 1 : n_orbs + 1])
+
+                if len(arrays) > n_proj:  # note no xyz projected phase factors with SOC
+                    array = np.concatenate(arrays[n_proj:])
+                    if array.shape[1] - 1 > n_orbs:
+                        # New format of PROCAR (VASP 5.4.4)
+                        values = array[:, 1 : 2 * n_orbs + 1 : 2] + 1j * array[:, 2 : 2 * n_orbs + 2 : 2]
+                        store(phase_factors, spin, array[:, 0].astype(int) - 1, values)
+                    else:
+                        # Old format of PROCAR (VASP 5.4.1 and before), with real and imaginary lines
+                        values = array[::2, 1 : n_orbs + 1] + 1j * array[1::2, 1 : n_orbs + 1]
+                        store(phase_factors, spin, array[::2, 0].astype(int) - 1, values)
+
             skipping_kpoint = False  # true when skipping projections for a previously-parsed kpoint
-            ion_line_count = 0  # printed twice when phase factors present
-            proj_data_parsed_for_band = 0  # 0 for non-SOC, 1-4 for SOC/phase factors
+            groups: list[list[str]] = []  # groups of consecutive ion lines of the current band
+            in_group = False
             for line in file:  # type:ignore[assignment]
                 line = line.strip()  # type:ignore[assignment]
-                if ion_expr.match(line):
-                    ion_line_count += 1
+                if line[:1].isdigit():
+                    if skipping_kpoint:
+                        continue
+                    if in_group:
+                        groups[-1].append(line)
+                    else:
+                        groups.append([line])
+                        in_group = True
+                    continue
+                in_group = False
 
-                if kpoint_expr.match(line):
+                if line.startswith(("band", "k-point", "#")):
+                    store_band(groups)
+                    groups = []
+
+                if line.startswith("k-point") and (match := kpoint_expr.match(line)):
                     kvec = self._parse_kpoint_line(line)
-                    match = kpoint_expr.match(line)
-                    current_kpoint = int(match[1]) - 1  # type: ignore[index]
+                    current_kpoint = int(match[1]) - 1
                     if current_kpoint == 0:
                         spin = Spin.up if spin == Spin.down else Spin.down
 
@@ -4271,75 +5049,22 @@ class Procar(MSONable):
 
                     if spin == Spin.up:  # record k-weight only once
                         weights[current_kpoint] = float(match[2])  # type: ignore[index]
-                    proj_data_parsed_for_band = 0
 
                 elif skipping_kpoint:
                     continue
 
-                elif band_expr.match(line):
-                    ion_line_count = 0  # printed a second time when phase factors present
-                    match = band_expr.match(line)
-                    current_band = int(match[1]) - 1  # type: ignore[index]
+                elif line.startswith("band") and (match := band_expr.match(line)):
+                    current_band = int(match[1]) - 1
                     tokens = line.split()
                     eigenvalues[spin][current_kpoint, current_band] = float(tokens[4])  # type: ignore[index]
                     occupancies[spin][current_kpoint, current_band] = float(tokens[-1])  # type: ignore[index]
-                    # keep track of parsed projections for each band (1x w/non-SOC, 4x w/SOC):
-                    proj_data_parsed_for_band = 0
 
-                elif headers is None and ion_expr.match(line):
+                elif headers is None and line.startswith("ion"):
                     headers = line.split()
                     headers.pop(0)
                     headers.pop(-1)
 
-                    data = defaultdict(lambda: np.zeros((n_kpoints, n_bands, n_ions, len(headers))))  # type:ignore[arg-type, type-var]
-                    phase_factors = defaultdict(
-                        lambda: np.full(  # type:ignore[type-var]
-                            (n_kpoints, n_bands, n_ions, len(headers)),  # type:ignore[arg-type]
-                            np.nan,
-                            dtype=np.complex128,
-                        )
-                    )
-                    if self.is_soc:  # dict keys are now "x", "y", "z" rather than Spin.up/down
-                        xyz_data = defaultdict(lambda: np.zeros((n_kpoints, n_bands, n_ions, len(headers))))  # type:ignore[arg-type, type-var]
-
-                elif expr.match(line):
-                    tokens = line.split()
-                    index = int(tokens.pop(0)) - 1
-                    if headers is None:
-                        raise ValueError("headers is None")
-                    num_data = np.array([float(t) for t in tokens[: len(headers)]])
-                    if phase_factors is None:
-                        raise ValueError("phase_factors is None")
-
-                    if proj_data_parsed_for_band == 0:
-                        data[spin][current_kpoint, current_band, index, :] = num_data
-
-                    elif self.is_soc and proj_data_parsed_for_band < 4:
-                        proj_direction = {1: "x", 2: "y", 3: "z"}[proj_data_parsed_for_band]
-                        if xyz_data is None:
-                            raise ValueError(f"{xyz_data=}")
-                        xyz_data[proj_direction][current_kpoint, current_band, index, :] = num_data
-
-                    elif len(tokens) > len(headers):  # note no xyz projected phase factors with SOC
-                        # New format of PROCAR (VASP 5.4.4)
-                        num_data = np.array([float(t) for t in tokens[: 2 * len(headers)]])
-                        for orb in range(len(headers)):
-                            phase_factors[spin][current_kpoint, current_band, index, orb] = complex(
-                                num_data[2 * orb], num_data[2 * orb + 1]
-                            )
-                    elif np.isnan(phase_factors[spin][current_kpoint, current_band, index, 0]):
-                        # Old format of PROCAR (VASP 5.4.1 and before)
-                        phase_factors[spin][current_kpoint, current_band, index, :] = num_data
-                    else:
-                        phase_factors[spin][current_kpoint, current_band, index, :] += 1j * num_data
-
-                elif total_expr.match(line):
-                    proj_data_parsed_for_band += 1
-
-                elif preamble_expr.match(line):
-                    match = preamble_expr.match(line)
-                    if match is None:
-                        raise RuntimeError(f"Failed to find preamable pattern, {match=}")
+                elif line.startswith("#") and (match := preamble_expr.match(line)):
                     n_kpoints = int(match[1])
                     n_bands = int(match[2])
                     if eigenvalues is None:  # first spin
@@ -4351,6 +5076,8 @@ class Procar(MSONable):
                     if self.nions is not None and self.nions != n_ions:  # parsing multiple PROCARs but nions mismatch!
                         raise ValueError(f"Mismatch in number of ions in supplied PROCARs: ({n_ions} vs {self.nions})!")
 
+            store_band(groups)
+
             self.nions = n_ions  # attributes that should be consistent between multiple files are set here
             if self.orbitals is not None and self.orbitals != headers:  # multiple PROCARs but orbitals mismatch!
                 raise ValueError(f"Mismatch in orbital headers in supplied PROCARs: {headers} vs {self.orbitals}!")
@@ -4362,12 +5089,19 @@ class Procar(MSONable):
             # chop off empty kpoints in arrays and redetermine nkpoints as we may have skipped previously-parsed kpoints
             nkpoints = current_kpoint + 1
             weights = np.array(weights[:nkpoints])  # type: ignore[index]
-            data = {spin: data[spin][:nkpoints] for spin in data}  # type: ignore[index]
             eigenvalues = {spin: eigenvalues[spin][:nkpoints] for spin in eigenvalues}  # type: ignore[union-attr,index]
             occupancies = {spin: occupancies[spin][:nkpoints] for spin in occupancies}  # type: ignore[union-attr,index]
-            phase_factors = {spin: phase_factors[spin][:nkpoints] for spin in phase_factors}  # type: ignore[union-attr,index]
-            if self.is_soc:
-                xyz_data = {spin: xyz_data[spin][:nkpoints] for spin in xyz_data}  # type: ignore[union-attr,index]
+            if self.storage == "sparse":
+                shape = (nkpoints * n_bands * n_ions, len(headers))  # type: ignore[operator,arg-type]
+                for dct in (data, phase_factors, xyz_data):
+                    for key, triplets in dct.items():
+                        rows, cols, values = (np.concatenate(arrays) for arrays in zip(*triplets, strict=True))
+                        dct[key] = sparse.csr_array((values, (rows, cols)), shape=shape)
+            else:
+                data = {spin: data[spin][:nkpoints] for spin in data}
+                phase_factors = {spin: phase_factors[spin][:nkpoints] for spin in phase_factors}
+                xyz_data = {spin: xyz_data[spin][:nkpoints] for spin in xyz_data}  # type: ignore[misc]
+                orbital_projections = {spin: orbital_projections[spin][:nkpoints] for spin in orbital_projections}
 
             # Update the parsed kpoints
             parsed_kpoints.update({kvec_spin_tuple[0] for kvec_spin_tuple in this_procar_parsed_kpoints})
@@ -4379,7 +5113,8 @@ class Procar(MSONable):
                 occupancies,
                 data,
                 phase_factors,
-                xyz_data,
+                xyz_data if self.is_soc else None,
+                orbital_projections,
             )
 
     def get_projection_on_elements(self, structure: Structure) -> dict[Spin, list[list[dict[str, float]]]]:
@@ -4391,8 +5126,6 @@ class Procar(MSONable):
         Returns:
             A dict as {Spin: [band index][kpoint index][{Element: values}]].
         """
-        if self.data is None:
-            raise ValueError("data cannot be None.")
         if self.nkpoints is None:
             raise ValueError("nkpoints cannot be None.")
         if self.nbands is None:
@@ -4401,14 +5134,18 @@ class Procar(MSONable):
             raise ValueError("nions cannot be None.")
 
         elem_proj: dict[Spin, list] = {}
-        for spin in self.data:
-            elem_proj[spin] = [[defaultdict(float) for _ in range(self.nkpoints)] for _ in range(self.nbands)]
-
-        for iat in range(self.nions):
-            name = structure.species[iat].symbol
-            for spin, data in self.data.items():
-                for kpoint, band in itertools.product(range(self.nkpoints), range(self.nbands)):
-                    elem_proj[spin][band][kpoint][name] += np.sum(data[kpoint, band, iat, :])
+        for spin, ion_projections in self._get_ion_projections().items():
+            elem_sums: dict[str, NDArray] = {}
+            for iat in range(self.nions):
+                name = structure.species[iat].symbol
+                elem_sums[name] = elem_sums.get(name, 0.0) + ion_projections[:, :, iat]
+            elem_proj[spin] = [
+                [
+                    defaultdict(float, {name: sums[kpoint, band] for name, sums in elem_sums.items()})
+                    for kpoint in range(self.nkpoints)
+                ]
+                for band in range(self.nbands)
+            ]
 
         return elem_proj
 
@@ -4433,12 +5170,34 @@ class Procar(MSONable):
             raise ValueError("orbitals is None")
         orbital_index = self.orbitals.index(orbital)
 
+        if self.orbital_projections is not None:
+            return {
+                spin: np.sum(orbital_projections[:, atom_index, orbital_index] * self.weights)
+                for spin, orbital_projections in self.orbital_projections.items()
+            }
         if self.data is None:
             raise ValueError("data is None")
-        return {
-            spin: np.sum(data[:, :, atom_index, orbital_index] * self.weights[:, None])  # type: ignore[call-overload]
-            for spin, data in self.data.items()
-        }
+        occupations = {}
+        for spin, data in self.data.items():
+            if isinstance(data, sparse.sparray):
+                # Only densify the (k-point, band) values of this atom and orbital
+                projections = data[atom_index :: self.nions, [orbital_index]].toarray()
+                projections = projections.reshape(-1, self.nbands)
+            else:
+                projections = data[:, :, atom_index, orbital_index]
+            occupations[spin] = np.sum(projections * self.weights[:, None])
+        return occupations
+
+    def _get_ion_projections(self) -> dict[Spin, NDArray]:
+        """Projections summed over the orbitals, as {spin: np.array accessed with
+        (k-point index, band index, ion index)}.
+        """
+        if self.ion_projections is not None:
+            return self.ion_projections
+        if self.data is None:
+            raise ValueError("data cannot be None.")
+        shape = (-1, self.nbands, self.nions)
+        return {spin: np.reshape(data.sum(axis=data.ndim - 1), shape) for spin, data in self.data.items()}
 
 
 class Oszicar:
@@ -4589,11 +5348,100 @@ def get_band_structure_from_vasp_multiple_branches(
     raise FileNotFoundError(f"failed to find any vasprun.xml in selected {dir_name=}")
 
 
+class _LazyXdatcarFrames(Sequence):
+    """Frames of an Xdatcar, parsed from their byte offsets in the file on access.
+
+    Only the last accessed frame is kept in memory, so that iterating over the
+    frames of a long run does not hold all of them at once. Seeking backwards in
+    a compressed file decompresses it again from the start, so the frames of a
+    compressed file are read from a decompressed temporary copy instead.
+    """
+
+    def __init__(
+        self,
+        filename: PathLike,
+        preambles: list[list[str]],
+        offsets: np.ndarray,
+        preamble_ids: np.ndarray,
+        decompressed: IO[bytes] | None = None,
+    ) -> None:
+        self.filename = filename
+        self.preambles = preambles
+        self.offsets = offsets
+        self.preamble_ids = preamble_ids
+        # Decompressed copy of a compressed file
+        self._decompressed = decompressed
+        self._last: tuple[int, Structure] | None = None
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        idx = range(len(self))[idx]
+        if self._last is None or self._last[0] != idx:
+            ((preamble_id, coords),) = self.iter_coords([idx])
+            self._last = idx, self._parse_frame(preamble_id, coords)
+        return self._last[1]
+
+    def __iter__(self) -> Iterator[Structure]:
+        for preamble_id, coords in self.iter_coords():
+            yield self._parse_frame(preamble_id, coords)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} frames)"
+
+    def iter_coords(self, indices: Iterable[int] | None = None) -> Iterator[tuple[int, list[str]]]:
+        """Read the coordinate lines of frames one at a time.
+
+        Args:
+            indices (list[int]): Indices of the frames. Defaults to all frames.
+
+        Yields:
+            tuple[int, list[str]]: Preamble index and coordinate lines of each frame.
+        """
+        with self._open() as file:
+            for idx in range(len(self)) if indices is None else indices:
+                start, end = self.offsets[idx]
+                file.seek(start)
+                lines = file.read(end - start).decode("utf-8").splitlines()
+                yield int(self.preamble_ids[idx]), [line.strip() for line in lines]
+
+    @contextmanager
+    def _open(self) -> Iterator[IO[bytes]]:
+        """Open the file, or its decompressed copy, for reading frames."""
+        if self._decompressed is not None:
+            yield self._decompressed
+            return
+        with zopen(self.filename, mode="rb") as file:
+            yield file
+
+    def get_lattices(self) -> np.ndarray:
+        """Lattice matrices of all frames as a (nframes, 3, 3) array."""
+        lattices = np.zeros((len(self.preambles), 3, 3))
+        for idx, preamble in enumerate(self.preambles):
+            # Same scaling as Poscar.from_str, where a negative scale is the volume
+            scale = float(preamble[1])
+            lattice = np.array([[float(val) for val in line.split()] for line in preamble[2:5]])
+            lattices[idx] = lattice * ((-scale / abs(np.linalg.det(lattice))) ** (1 / 3) if scale < 0 else scale)
+        return lattices[self.preamble_ids]
+
+    def _parse_frame(self, preamble_id: int, coords: list[str]) -> Structure:
+        """Parse the Structure of a frame from its preamble and coordinate lines."""
+        return Poscar.from_str("\n".join([*self.preambles[preamble_id], "Direct", *coords])).structure
+
+
 class Xdatcar:
     """XDATCAR parser. Only tested with VASP 5.x files.
 
+    The file is first indexed by the byte offsets of its frames, so that with
+    lazy=True a frame is only parsed when it is accessed and the coordinates
+    of all frames can be read into one array without creating any Structure.
+
     Attributes:
-        structures (list[Structure]): Structures parsed from XDATCAR.
+        structures (list[Structure]): Structures parsed from XDATCAR. For
+            Xdatcar(lazy=True), a sequence that parses each frame on access.
         comment (str): Optional comment.
 
     Authors: Ram Balachandran
@@ -4605,6 +5453,7 @@ class Xdatcar:
         ionicstep_start: int = 1,
         ionicstep_end: int | None = None,
         comment: str | None = None,
+        lazy: bool = False,
     ) -> None:
         """
         Init a Xdatcar.
@@ -4614,72 +5463,101 @@ class Xdatcar:
             ionicstep_start (int): Starting index of ionic step.
             ionicstep_end (int): Ending index of ionic step.
             comment (str): Optional comment attached to this set of structures.
+            lazy (bool): Whether to only index the frames and parse each of
+                them when it is accessed. Random access to a frame then seeks
+                straight to it, and iterating over the frames streams through
+                the file. Defaults to False.
+
+        A last frame with fewer sites than the first one, e.g. of a run that
+        was cut off while writing it, is skipped with a warning.
         """
-        preamble = None
-        coords_str: list = []
-        structures: list = []
-        preamble_done: bool = False
-        parse_poscar: bool = False
-        num_sites: int | None = None
-        restart_preamble: bool = False
         if ionicstep_start < 1:
             raise ValueError("Start ionic step cannot be less than 1")
         if ionicstep_end is not None and ionicstep_end < 1:
             raise ValueError("End ionic step cannot be less than 1")
 
-        file_len = sum(1 for _ in zopen(filename, mode="rt", encoding="utf-8"))
-        ionicstep_cnt = 1
-        ionicstep_start = ionicstep_start or 0
-        with zopen(filename, mode="rt", encoding="utf-8") as file:
-            title = None
-            for iline, line in enumerate(file):
-                line = line.strip()
+        frames = self._index_frames(filename, ionicstep_start, ionicstep_end, keep_decompressed=lazy)
+        self.structures: Sequence[Structure] = frames if lazy else list(frames)
+        self.comment = comment or self.structures[0].formula
+
+    @staticmethod
+    def _index_frames(
+        filename: PathLike, ionicstep_start: int, ionicstep_end: int | None, keep_decompressed: bool = False
+    ) -> _LazyXdatcarFrames:
+        """Find the byte offsets of the coordinate lines of each frame in a single
+        pass over the file, without parsing any coordinates. If keep_decompressed,
+        a compressed file is also copied to a decompressed temporary file in this
+        pass, so that its frames can be read in any order.
+        """
+        preambles: list[list[str]] = []
+        preamble: list[str] | None = None
+        title = None
+        preamble_done = in_frame = False
+        offsets: list[list[int]] = []
+        preamble_ids: list[int] = []
+        n_coords: list[int] = []
+        offset = 0
+        decompressed: IO[bytes] | None = None
+        with zopen(filename, mode="rb") as file:
+            if keep_decompressed and not isinstance(file, BufferedReader):
+                decompressed = tempfile.TemporaryFile()  # noqa: SIM115
+            for raw_line in file:
+                if decompressed is not None:
+                    decompressed.write(raw_line)
+                start, offset = offset, offset + len(raw_line)
+                line = raw_line.strip()
                 if preamble is None:
-                    preamble = [line]
                     title = line
+                    preamble = [line.decode("utf-8")]
 
-                elif title == line and len(coords_str) > 0:
-                    # sometimes the title is the same as the only chemical species in the structure
-                    # only enter this block if the coords have been read
-                    parse_poscar = True
-                    restart_preamble = True
-                    preamble_done = False
+                elif preamble_done and line == title:
+                    # The title starts a new preamble when the lattice changes. It is
+                    # sometimes the same as the only chemical species in the structure,
+                    # so it is only looked for after the end of the previous preamble.
+                    preamble = [line.decode("utf-8")]
+                    preamble_done = in_frame = False
 
                 elif not preamble_done:
-                    if line == "" or "Direct configuration=" in line:
+                    if line == b"" or b"Direct configuration=" in line:
                         preamble_done = True
+                        preambles.append(preamble)
                     else:
-                        preamble.append(line)
-
-                elif line == "" or ("Direct configuration=" in line and len(coords_str) > 0):
-                    parse_poscar = True
-                    restart_preamble = False
-                else:
-                    coords_str.append(line)
-
-                if (parse_poscar and (num_sites is None or len(coords_str) == num_sites)) or iline == file_len - 1:
-                    if num_sites is None:
-                        num_sites = len(coords_str)
-
-                    poscar = Poscar.from_str("\n".join([*preamble, "Direct", *coords_str]))
-                    if (ionicstep_end is None and ionicstep_cnt >= ionicstep_start) or (
-                        ionicstep_end is not None and ionicstep_start <= ionicstep_cnt < ionicstep_end
-                    ):
-                        structures.append(poscar.structure)
-                    elif (ionicstep_end is not None) and ionicstep_cnt >= ionicstep_end:
-                        break
+                        preamble.append(line.decode("utf-8"))
 
-                    ionicstep_cnt += 1
-                    coords_str = []
-                    parse_poscar = False
-                    if restart_preamble:
-                        preamble = [line]
+                elif line == b"" or b"Direct configuration=" in line:
+                    in_frame = False
 
-            if preamble is None:
-                raise ValueError("preamble is None")
+                else:
+                    if not in_frame:
+                        if ionicstep_end is not None and len(offsets) + 1 >= ionicstep_end:
+                            break
+                        in_frame = True
+                        offsets.append([start, offset])
+                        preamble_ids.append(len(preambles) - 1)
+                        n_coords.append(0)
+                    offsets[-1][1] = offset
+                    n_coords[-1] += 1
+
+        if preamble is None:
+            raise ValueError("preamble is None")
+
+        # Skip the last frame of a run that was cut off while writing it
+        if len(offsets) > 1 and n_coords[-1] < n_coords[0]:
+            warnings.warn(
+                f"The last frame of {filename} is incomplete and is skipped, "
+                f"as it has {n_coords[-1]} of {n_coords[0]} sites.",
+                stacklevel=3,
+            )
+            offsets.pop()
+            preamble_ids.pop()
 
-        self.structures = structures
-        self.comment = comment or self.structures[0].formula
+        return _LazyXdatcarFrames(
+            filename,
+            preambles,
+            np.array(offsets, dtype=np.int64).reshape(-1, 2)[ionicstep_start - 1 :],
+            np.array(preamble_ids, dtype=np.int64)[ionicstep_start - 1 :],
+            decompressed,
+        )
 
     def __str__(self) -> str:
         return self.get_str()
@@ -4689,8 +5567,7 @@ class Xdatcar:
 
     def __iter__(self) -> Iterator[Structure]:
         """Iterator of Xdatcar, yielding a pymatgen Structure."""
-        for idx in range(len(self)):
-            yield self.structures[idx]
+        yield from self.structures
 
     def __getitem__(self, frames: int | slice | list[int] | np.ndarray) -> Structure | list[Structure]:
         """Get a subset of the Xdatcar.
@@ -4721,6 +5598,58 @@ class Xdatcar:
         syms = [site.specie.symbol for site in self.structures[0]]
         return [len(tuple(a[1])) for a in itertools.groupby(syms)]
 
+    def get_frac_coords(self) -> np.ndarray:
+        """Fractional coordinates of all frames as a single array. For
+        Xdatcar(lazy=True), these are read without parsing any Structure.
+
+        Returns:
+            np.ndarray: Coordinates with shape (nframes, natoms, 3).
+        """
+        if not isinstance(self.structures, _LazyXdatcarFrames):
+            return np.array([structure.frac_coords for structure in self.structures]).reshape(len(self), -1, 3)
+        frac_coords = np.zeros((len(self), len(self.structures[0]), 3))
+        for idx, (preamble_id, coords) in enumerate(self.structures.iter_coords()):
+            try:
+                frac_coords[idx] = [line.split()[:3] for line in coords]
+            except ValueError:
+                # Leave badly formatted lines to the fixes of Poscar.from_str
+                frac_coords[idx] = self.structures._parse_frame(preamble_id, coords).frac_coords
+        return frac_coords
+
+    def get_lattices(self) -> np.ndarray:
+        """Lattice matrices of all frames as a single array.
+
+        Returns:
+            np.ndarray: Lattices with shape (nframes, 3, 3).
+        """
+        if not isinstance(self.structures, _LazyXdatcarFrames):
+            return np.array([structure.lattice.matrix for structure in self.structures]).reshape(len(self), 3, 3)
+        return self.structures.get_lattices()
+
+    def get_trajectory(self, constant_lattice: bool = True, **kwargs) -> Trajectory:
+        """Get a Trajectory of the frames, built from the arrays of get_frac_coords
+        and get_lattices rather than from a Structure per frame.
+
+        Args:
+            constant_lattice (bool): Whether the lattice is the same in all frames.
+                If True, the lattice of the first frame is used. Defaults to True.
+            **kwargs: Passed to the Trajectory constructor.
+
+        Returns:
+            Trajectory
+        """
+        frac_coords = self.get_frac_coords()
+        lattices = self.get_lattices()
+        # Each frame has its own (empty) site properties, as in Trajectory.from_structures
+        kwargs.setdefault("site_properties", [{} for _ in range(len(frac_coords))])
+        return Trajectory(
+            species=self.structures[0].species,
+            coords=frac_coords,
+            lattice=lattices[0] if constant_lattice else lattices,
+            constant_lattice=constant_lattice,
+            **kwargs,
+        )
+
     def concatenate(
         self,
         filename: PathLike,
@@ -4739,7 +5668,7 @@ class Xdatcar:
         """
         preamble = None
         coords_str: list[str] = []
-        structures = self.structures
+        structures = list(self.structures)
         preamble_done = False
         if ionicstep_start < 1:
             raise ValueError("Start ionic step cannot be less than 1")
@@ -5027,6 +5956,7 @@ class Wavecar:
         verbose: bool = False,
         precision: Literal["normal", "accurate"] = "normal",
         vasp_type: Literal["std", "gam", "ncl"] | None = None,
+        mmap: bool = False,
     ) -> None:
         """Extract information from the given WAVECAR.
 
@@ -5037,6 +5967,11 @@ class Wavecar:
                 accurate), only the first letter matters.
             vasp_type (str): determines the VASP type that is used, allowed
                 values are {'std', 'gam', 'ncl'} (only first letter is required).
+            mmap (bool): If True, the coefficients are read-only views of the
+                memory-mapped file in the precision they were written with,
+                so that only the records that are used are read from disk.
+                Coefficients of gamma-only WAVECARs are still copied to
+                reconstruct the missing half. Defaults to False.
         """
         self.filename = filename
         valid_types = {"std", "gam", "ncl"}
@@ -5050,164 +5985,161 @@ class Wavecar:
         # c = 0.26246582250210965422
         # 2m/hbar^2 in agreement with VASP
         self._C = 0.262465831
-        with open(self.filename, "rb") as file:
-            # Read the header information
-            recl, spin, rtag = np.fromfile(file, dtype=np.float64, count=3).astype(int)
-            if verbose:
-                print(f"{recl=}, {spin=}, {rtag=}")
-            recl8 = int(recl / 8)
-            self.spin = spin
-
-            # Make sure we have correct precision
-            valid_rtags = {45200, 45210, 53300, 53310}
-            if rtag not in valid_rtags:
-                # note that rtag=45200 and 45210 may not work if file was actually
-                # generated by old version of VASP, since that would write eigenvalues
-                # and occupations in way that does not span FORTRAN records, but
-                # reader below appears to assume that record boundaries can be ignored
-                # (see OUTWAV vs. OUTWAV_4 in VASP fileio.F)
-                raise ValueError(f"Invalid {rtag=}, must be one of {valid_rtags}")
-
-            # Pad to end of fortran REC=1
-            np.fromfile(file, dtype=np.float64, count=recl8 - 3)
-
-            # Extract kpoint, bands, energy, and lattice information
-            self.nk, self.nb = np.fromfile(file, dtype=np.float64, count=2).astype(int)
-            self.encut = np.fromfile(file, dtype=np.float64, count=1)[0]
-            self.a = np.fromfile(file, dtype=np.float64, count=9).reshape((3, 3))
-            self.efermi = np.fromfile(file, dtype=np.float64, count=1)[0]
-            if verbose:
-                print(
-                    f"kpoints = {self.nk}, bands = {self.nb}, energy cutoff = {self.encut}, fermi "
-                    f"energy= {self.efermi:.04f}\n"
-                )
-                print(f"primitive lattice vectors = \n{self.a}")
-
-            self.vol = np.dot(self.a[0, :], np.cross(self.a[1, :], self.a[2, :]))
-            if verbose:
-                print(f"volume = {self.vol}\n")
 
-            # Calculate reciprocal lattice
-            b = np.array(
-                [
-                    np.cross(self.a[1, :], self.a[2, :]),
-                    np.cross(self.a[2, :], self.a[0, :]),
-                    np.cross(self.a[0, :], self.a[1, :]),
-                ]
+        # The file is viewed as 8-byte words, Fortran records are recl bytes long
+        raw = np.memmap(self.filename, dtype=np.uint8, mode="r")
+        words = raw[: raw.size // 8 * 8].view(np.float64)
+
+        # Read the header information
+        recl, spin, rtag = words[:3].astype(int)
+        if verbose:
+            print(f"{recl=}, {spin=}, {rtag=}")
+        recl8 = int(recl / 8)
+        self.spin = spin
+
+        # Make sure we have correct precision
+        valid_rtags = {45200, 45210, 53300, 53310}
+        if rtag not in valid_rtags:
+            # note that rtag=45200 and 45210 may not work if file was actually
+            # generated by old version of VASP, since that would write eigenvalues
+            # and occupations in way that does not span FORTRAN records, but
+            # reader below appears to assume that record boundaries can be ignored
+            # (see OUTWAV vs. OUTWAV_4 in VASP fileio.F)
+            raise ValueError(f"Invalid {rtag=}, must be one of {valid_rtags}")
+        coeff_dtype = np.complex64 if rtag in (45200, 53300) else np.complex128
+        coeff_words = np.dtype(coeff_dtype).itemsize // 8
+
+        # Extract kpoint, bands, energy, and lattice information from REC=2
+        header = np.array(words[recl8 : recl8 + 13])
+        self.nk, self.nb = header[:2].astype(int)
+        self.encut = header[2]
+        self.a = header[3:12].reshape((3, 3))
+        self.efermi = header[12]
+        if verbose:
+            print(
+                f"kpoints = {self.nk}, bands = {self.nb}, energy cutoff = {self.encut}, fermi "
+                f"energy= {self.efermi:.04f}\n"
             )
-            b = 2 * np.pi * b / self.vol
-            self.b = b
-            if verbose:
-                print(f"reciprocal lattice vectors = \n{b}")
-                print(f"reciprocal lattice vector magnitudes = \n{np.linalg.norm(b, axis=1)}\n")
-
-            # Calculate maximum number of b vectors in each direction
-            self._generate_nbmax()
-            if verbose:
-                print(f"max number of G values = {self._nbmax}\n\n")
-            self.ng = self._nbmax * 3 if precision.lower()[0] == "n" else self._nbmax * 4
+            print(f"primitive lattice vectors = \n{self.a}")
 
-            # Pad to end of fortran REC=2
-            np.fromfile(file, dtype=np.float64, count=recl8 - 13)
+        self.vol = np.dot(self.a[0, :], np.cross(self.a[1, :], self.a[2, :]))
+        if verbose:
+            print(f"volume = {self.vol}\n")
 
-            # Read records
-            self.Gpoints = [None for _ in range(self.nk)]
-            self.kpoints = []
-            if spin == 2:
-                self.coeffs: list[list[list[None]]] | list[list[None]] = [
-                    [[None for _ in range(self.nb)] for _ in range(self.nk)] for _ in range(spin)
-                ]
-                self.band_energy: list = [[] for _ in range(spin)]
-            else:
-                self.coeffs = [[None for _ in range(self.nb)] for _ in range(self.nk)]
-                self.band_energy = []
-
-            for i_spin in range(spin):
-                if verbose:
-                    print(f"Reading spin {i_spin}")
+        # Calculate reciprocal lattice
+        b = np.array(
+            [
+                np.cross(self.a[1, :], self.a[2, :]),
+                np.cross(self.a[2, :], self.a[0, :]),
+                np.cross(self.a[0, :], self.a[1, :]),
+            ]
+        )
+        b = 2 * np.pi * b / self.vol
+        self.b = b
+        if verbose:
+            print(f"reciprocal lattice vectors = \n{b}")
+            print(f"reciprocal lattice vector magnitudes = \n{np.linalg.norm(b, axis=1)}\n")
+
+        # Calculate maximum number of b vectors in each direction
+        self._generate_nbmax()
+        if verbose:
+            print(f"max number of G values = {self._nbmax}\n\n")
+        self.ng = self._nbmax * 3 if precision.lower()[0] == "n" else self._nbmax * 4
+
+        # Read records
+        pos = 2 * recl8
+        self.Gpoints = [None for _ in range(self.nk)]
+        self.kpoints = []
+        if spin == 2:
+            self.coeffs: list[list[list[None]]] | list[list[None]] = [
+                [[None for _ in range(self.nb)] for _ in range(self.nk)] for _ in range(spin)
+            ]
+            self.band_energy: list = [[] for _ in range(spin)]
+        else:
+            self.coeffs = [[None for _ in range(self.nb)] for _ in range(self.nk)]
+            self.band_energy = []
 
-                for i_nk in range(self.nk):
-                    # Information for this kpoint
-                    nplane = int(np.fromfile(file, dtype=np.float64, count=1)[0])
-                    kpoint = np.fromfile(file, dtype=np.float64, count=3)
+        for i_spin in range(spin):
+            if verbose:
+                print(f"Reading spin {i_spin}")
 
-                    if i_spin == 0:
-                        self.kpoints.append(kpoint)
-                    elif not np.allclose(self.kpoints[i_nk], kpoint, rtol=1e-7, atol=0):
-                        raise ValueError(f"kpoints of {i_nk=} mismatch")
+            for i_nk in range(self.nk):
+                # Information for this kpoint
+                nplane = int(words[pos])
+                kpoint = np.array(words[pos + 1 : pos + 4])
 
-                    if verbose:
-                        print(f"kpoint {i_nk: 4} with {nplane: 5} plane waves at {kpoint}")
+                if i_spin == 0:
+                    self.kpoints.append(kpoint)
+                elif not np.allclose(self.kpoints[i_nk], kpoint, rtol=1e-7, atol=0):
+                    raise ValueError(f"kpoints of {i_nk=} mismatch")
 
-                    # Energy and occupation information
-                    enocc = np.fromfile(file, dtype=np.float64, count=3 * self.nb).reshape((self.nb, 3))
-                    if spin == 2:
-                        self.band_energy[i_spin].append(enocc)
-                    else:
-                        self.band_energy.append(enocc)
+                if verbose:
+                    print(f"kpoint {i_nk: 4} with {nplane: 5} plane waves at {kpoint}")
 
-                    if verbose:
-                        print("enocc =\n", enocc[:, [0, 2]])
+                # Energy and occupation information
+                enocc = np.array(words[pos + 4 : pos + 4 + 3 * self.nb]).reshape((self.nb, 3))
+                if spin == 2:
+                    self.band_energy[i_spin].append(enocc)
+                else:
+                    self.band_energy.append(enocc)
 
-                    # Pad the end of record that contains nplane, kpoints, evals and occs
-                    np.fromfile(file, dtype=np.float64, count=(recl8 - 4 - 3 * self.nb) % recl8)
+                if verbose:
+                    print("enocc =\n", enocc[:, [0, 2]])
 
-                    if self.vasp_type is None:
-                        self.Gpoints[i_nk], extra_gpoints, extra_coeff_inds = self._generate_G_points(  # type: ignore[call-overload]
-                            kpoint, gamma=True
-                        )
-                        if len(self.Gpoints[i_nk]) == nplane:  # type: ignore[arg-type]
-                            self.vasp_type = "gam"
-                        else:
-                            self.Gpoints[i_nk], extra_gpoints, extra_coeff_inds = self._generate_G_points(  # type: ignore[call-overload]
-                                kpoint, gamma=False
-                            )
-                            self.vasp_type = "std" if len(self.Gpoints[i_nk]) == nplane else "ncl"  # type: ignore[arg-type]
+                # Skip to the end of the record that contains nplane, kpoints, evals and occs
+                pos += 4 + 3 * self.nb + (recl8 - 4 - 3 * self.nb) % recl8
 
-                        if verbose:
-                            print(f"\ndetermined {self.vasp_type = }\n")
+                if self.vasp_type is None:
+                    self.Gpoints[i_nk], extra_gpoints, extra_coeff_inds = self._generate_G_points(  # type: ignore[call-overload]
+                        kpoint, gamma=True
+                    )
+                    if len(self.Gpoints[i_nk]) == nplane:  # type: ignore[arg-type]
+                        self.vasp_type = "gam"
                     else:
                         self.Gpoints[i_nk], extra_gpoints, extra_coeff_inds = self._generate_G_points(  # type: ignore[call-overload]
-                            kpoint, gamma=self.vasp_type.lower()[0] == "g"
+                            kpoint, gamma=False
                         )
+                        self.vasp_type = "std" if len(self.Gpoints[i_nk]) == nplane else "ncl"  # type: ignore[arg-type]
 
-                    if len(self.Gpoints[i_nk]) != nplane and 2 * len(self.Gpoints[i_nk]) != nplane:  # type: ignore[arg-type]
-                        raise ValueError(
-                            f"Incorrect {vasp_type=}. Please open an issue if you are certain this WAVECAR"
-                            " was generated with the given vasp_type."
-                        )
+                    if verbose:
+                        print(f"\ndetermined {self.vasp_type = }\n")
+                else:
+                    self.Gpoints[i_nk], extra_gpoints, extra_coeff_inds = self._generate_G_points(  # type: ignore[call-overload]
+                        kpoint, gamma=self.vasp_type.lower()[0] == "g"
+                    )
 
-                    self.Gpoints[i_nk] = np.array(self.Gpoints[i_nk] + extra_gpoints, dtype=np.float64)  # type: ignore[arg-type, operator]
-
-                    # Extract coefficients
-                    for inb in range(self.nb):
-                        if rtag in (45200, 53300):
-                            data = np.fromfile(file, dtype=np.complex64, count=nplane)
-                            np.fromfile(file, dtype=np.float64, count=recl8 - nplane)
-                        elif rtag in (45210, 53310):
-                            # TODO: This should handle double precision coefficients,
-                            # but I don't have a WAVECAR to test it with
-                            data = np.fromfile(file, dtype=np.complex128, count=nplane)
-                            np.fromfile(file, dtype=np.float64, count=recl8 - 2 * nplane)
-                        else:
-                            raise RuntimeError("Invalid rtag value.")
-
-                        extra_coeffs = []
-                        if len(extra_coeff_inds) > 0:
-                            # Reconstruct extra coefficients missing from gamma-only executable WAVECAR
-                            for G_ind in extra_coeff_inds:
-                                # No idea where this factor of sqrt(2) comes from,
-                                # but empirically it appears to be necessary
-                                data[G_ind] /= np.sqrt(2)
-                                extra_coeffs.append(np.conj(data[G_ind]))
-
-                        if spin == 2:
-                            self.coeffs[i_spin][i_nk][inb] = np.array(list(data) + extra_coeffs, dtype=np.complex64)  # type: ignore[index]
-                        else:
-                            self.coeffs[i_nk][inb] = np.array(list(data) + extra_coeffs, dtype=np.complex128)
+                if len(self.Gpoints[i_nk]) != nplane and 2 * len(self.Gpoints[i_nk]) != nplane:  # type: ignore[arg-type]
+                    raise ValueError(
+                        f"Incorrect {vasp_type=}. Please open an issue if you are certain this WAVECAR"
+                        " was generated with the given vasp_type."
+                    )
 
-                        if self.vasp_type is not None and self.vasp_type.lower()[0] == "n":
-                            self.coeffs[i_nk][inb].shape = (2, nplane // 2)  # type: ignore[union-attr]
+                self.Gpoints[i_nk] = np.array(self.Gpoints[i_nk] + extra_gpoints, dtype=np.float64)  # type: ignore[arg-type, operator]
+
+                # Extract coefficients of all bands, one record per band
+                if coeff_words * nplane > recl8:
+                    raise ValueError(f"Record of {recl} bytes is too short for {nplane} coefficients with rtag={rtag}")
+                records = words[pos : pos + self.nb * recl8].reshape((self.nb, recl8))
+                pos += self.nb * recl8
+                data = records[:, : coeff_words * nplane].view(coeff_dtype)
+
+                if len(extra_coeff_inds) > 0:
+                    # Reconstruct extra coefficients missing from gamma-only executable WAVECAR.
+                    # No idea where this factor of sqrt(2) comes from, but empirically it
+                    # appears to be necessary
+                    data = np.array(data)
+                    data[:, extra_coeff_inds] /= np.sqrt(2)
+                    data = np.concatenate([data, np.conj(data[:, extra_coeff_inds])], axis=1)
+
+                if not mmap:
+                    data = data.astype(np.complex64 if spin == 2 else np.complex128)
+
+                if self.vasp_type.lower()[0] == "n":
+                    self.coeffs[i_nk] = [band_coeffs.reshape((2, nplane // 2)) for band_coeffs in data]
+                elif spin == 2:
+                    self.coeffs[i_spin][i_nk] = list(data)
+                else:
+                    self.coeffs[i_nk] = list(data)
 
     def _generate_nbmax(self) -> None:
         """Helper function to determine maximum number of b vectors for
@@ -5252,10 +6184,10 @@ class Wavecar:
     ) -> tuple[list, list, list]:
         """Helper method to generate G-points based on nbmax.
 
-        This function iterates over possible G-point values and determines
-        if the energy is less than G_{cut}. Valid values are appended to
-        the output array. This function should not be called outside of
-        initialization.
+        This function evaluates all possible G-point values and determines
+        if the energy is less than G_{cut}. Valid values are returned in the
+        order of the WAVECAR coefficients. This function should not be called
+        outside of initialization.
 
         Args:
             kpoint (NDArray): The current k-point value.
@@ -5267,28 +6199,24 @@ class Wavecar:
         """
         kmax = self._nbmax[0] + 1 if gamma else 2 * self._nbmax[0] + 1
 
-        gpoints = []
+        # Integer multipliers in the order 0, 1, ..., nbmax, -nbmax, ..., -1, with
+        # the first component running fastest
+        freqs = [np.r_[0 : nbmax + 1, -nbmax:0] for nbmax in self._nbmax]
+        i3, j2, k1 = (arr.ravel() for arr in np.meshgrid(freqs[2], freqs[1], freqs[0][:kmax], indexing="ij"))
+        G = np.column_stack([k1, j2, i3])
+        if gamma:
+            G = G[~((k1 == 0) & ((j2 < 0) | ((j2 == 0) & (i3 < 0))))]
+
+        E = np.linalg.norm(np.dot(kpoint + G, self.b), axis=1) ** 2 / self._C
+        G = G[self.encut > E]
+
+        gpoints = list(G)
         extra_gpoints = []
         extra_coeff_inds = []
-        G_ind = 0
-        for i in range(2 * self._nbmax[2] + 1):
-            i3 = i - 2 * self._nbmax[2] - 1 if i > self._nbmax[2] else i
-            for j in range(2 * self._nbmax[1] + 1):
-                j2 = j - 2 * self._nbmax[1] - 1 if j > self._nbmax[1] else j
-                for k in range(kmax):
-                    k1 = k - 2 * self._nbmax[0] - 1 if k > self._nbmax[0] else k
-                    if gamma and ((k1 == 0 and j2 < 0) or (k1 == 0 and j2 == 0 and i3 < 0)):
-                        continue
-                    G = np.array([k1, j2, i3])
-                    v = kpoint + G
-                    g = np.linalg.norm(np.dot(v, self.b))
-                    E = g**2 / self._C
-                    if self.encut > E:
-                        gpoints.append(G)
-                        if gamma and (k1, j2, i3) != (0, 0, 0):
-                            extra_gpoints.append(-G)
-                            extra_coeff_inds.append(G_ind)
-                        G_ind += 1
+        if gamma:
+            nonzero = np.any(G != 0, axis=1)
+            extra_gpoints = list(-G[nonzero])
+            extra_coeff_inds = np.flatnonzero(nonzero).tolist()
         return gpoints, extra_gpoints, extra_coeff_inds
 
     def evaluate_wavefunc(
@@ -5343,7 +6271,7 @@ class Wavecar:
     def fft_mesh(
         self,
         kpoint: int,
-        band: int,
+        band: int | Sequence[int],
         spin: int = 0,
         spinor: int = 0,
         shift: bool = True,
@@ -5358,9 +6286,16 @@ class Wavecar:
             mesh = Wavecar('WAVECAR').fft_mesh(kpoint, band)
             evals = np.fft.ifftn(mesh)
 
+        Several bands can be placed on a stack of meshes at once, which can
+        be transformed together:
+
+            meshes = Wavecar('WAVECAR').fft_mesh(kpoint, [0, 1, 2])
+            evals = np.fft.ifftn(meshes, axes=(1, 2, 3))
+
         Args:
             kpoint (int): the index of the kpoint where the wavefunction will be evaluated
-            band (int): the index of the band where the wavefunction will be evaluated
+            band (int | Sequence[int]): the index of the band where the wavefunction
+                will be evaluated, or a sequence of band indices
             spin (int): the spin of the wavefunction for the desired
                 wavefunction (only for ISPIN = 2, default = 0)
             spinor (int): component of the spinor that is evaluated (only used
@@ -5369,34 +6304,42 @@ class Wavecar:
                 placed at index (0, 0, 0) or centered
 
         Returns:
-            a numpy ndarray representing the 3D mesh of coefficients
+            a numpy ndarray representing the 3D mesh of coefficients, or of
+            shape (len(band), *ng) with one mesh per band if band is a sequence
         """
         if self.vasp_type is None:
             raise RuntimeError("vasp_type cannot be None.")
 
+        bands = [band] if np.ndim(band) == 0 else list(band)  # type: ignore[list-item, arg-type]
         if self.vasp_type.lower()[0] == "n":
-            tcoeffs = self.coeffs[kpoint][band][spinor, :]  # type: ignore[call-overload, index]
+            tcoeffs = np.array([self.coeffs[kpoint][b][spinor, :] for b in bands])  # type: ignore[call-overload, index]
         elif self.spin == 2:
-            tcoeffs = self.coeffs[spin][kpoint][band]  # type: ignore[index]
+            tcoeffs = np.array([self.coeffs[spin][kpoint][b] for b in bands])  # type: ignore[index]
         else:
-            tcoeffs = self.coeffs[kpoint][band]
+            tcoeffs = np.array([self.coeffs[kpoint][b] for b in bands])
+
+        gpoints = self.Gpoints[kpoint]
+        n_coeffs = min(len(gpoints), tcoeffs.shape[-1])  # type: ignore[arg-type]
+        inds = np.asarray(gpoints[:n_coeffs]).astype(int) + (self.ng / 2).astype(int)  # type: ignore[index]
 
-        mesh = np.zeros(tuple(self.ng), dtype=np.complex128)
-        for gp, coeff in zip(self.Gpoints[kpoint], tcoeffs, strict=False):  # type: ignore[call-overload]
-            t = tuple(gp.astype(int) + (self.ng / 2).astype(int))
-            mesh[t] = coeff
+        mesh = np.zeros((len(bands), *self.ng), dtype=np.complex128)
+        mesh[:, inds[:, 0], inds[:, 1], inds[:, 2]] = tcoeffs[:, :n_coeffs]
+        if shift:
+            mesh = np.fft.ifftshift(mesh, axes=(-3, -2, -1))
 
-        return np.fft.ifftshift(mesh) if shift else mesh
+        return mesh[0] if np.ndim(band) == 0 else mesh
 
     def get_parchg(
         self,
         poscar: Poscar,
-        kpoint: int,
-        band: int,
+        kpoint: int | Sequence[int],
+        band: int | Sequence[int],
         spin: int | None = None,
         spinor: int | None = None,
         phase: bool = False,
         scale: int = 2,
+        batch_size: int = 16,
+        n_jobs: int = 1,
     ) -> Chgcar:
         """Generate a Chgcar object, which is the charge density of the specified
         wavefunction.
@@ -5409,6 +6352,11 @@ class Wavecar:
         sign of the wavefunction at that point in space. A warning is generated
         if the phase tag is on and the chosen kpoint is not Gamma.
 
+        If several kpoints or bands are given, the charge densities of all
+        their wavefunctions are summed (without kpoint weights). The bands of
+        a kpoint are transformed in batches with one multi-dimensional FFT,
+        and the kpoints can be distributed over several threads.
+
         Note: Augmentation from the PAWs is NOT included in this function. The
         maximal charge density will differ from the PARCHG from VASP, but the
         qualitative shape of the charge density will match.
@@ -5416,8 +6364,10 @@ class Wavecar:
         Args:
             poscar (pymatgen.io.vasp.inputs.Poscar): Poscar object that has the
                 structure associated with the WAVECAR file
-            kpoint (int): the index of the kpoint for the wavefunction
-            band (int): the index of the band for the wavefunction
+            kpoint (int | Sequence[int]): the index of the kpoint for the
+                wavefunction, or a sequence of kpoint indices
+            band (int | Sequence[int]): the index of the band for the
+                wavefunction, or a sequence of band indices
             spin (int): optional argument to specify the spin. If the Wavecar
                 has ISPIN = 2, spin is None generates a Chgcar with total spin
                 and magnetization, and spin == {0, 1} specifies just the spin
@@ -5430,55 +6380,89 @@ class Wavecar:
                 wavefunctions.
             scale (int): scaling for the FFT grid. The default value of 2 is at
                 least as fine as the VASP default.
+            batch_size (int): number of bands that are transformed at once.
+                Larger batches need more memory. Defaults to 16.
+            n_jobs (int): number of threads the kpoints are distributed over.
+                Defaults to 1.
 
         Returns:
             A Chgcar object.
         """
-        if phase and not np.allclose(self.kpoints[kpoint], 0.0):
+        if self.vasp_type is None:
+            raise RuntimeError("vasp_type cannot be None.")
+
+        kpoints = [kpoint] if np.ndim(kpoint) == 0 else list(kpoint)  # type: ignore[list-item, arg-type]
+        bands = [band] if np.ndim(band) == 0 else list(band)  # type: ignore[list-item, arg-type]
+        if phase and not all(np.allclose(self.kpoints[k], 0.0) for k in kpoints):
             warnings.warn(
                 "phase is True should only be used for the Gamma kpoint! I hope you know what you're doing!",
                 stacklevel=2,
             )
 
+        def get_density(spin: int, spinors: list[int], phase: bool) -> NDArray:
+            """Density of all bands and kpoints, where each thread sums a chunk of kpoints."""
+            chunks = [chunk for chunk in np.array_split(kpoints, effective_n_jobs(n_jobs)) if len(chunk) > 0]
+            densities = Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(sum)(self._get_band_density(k, bands, spin, spinors, phase, batch_size) for k in chunk)
+                for chunk in chunks
+            )
+            return sum(densities)  # type: ignore[return-value, arg-type]
+
         # Scaling of ng for the fft grid, need to restore value at the end
         temp_ng = self.ng
         self.ng = self.ng * scale
-        N = np.prod(self.ng)
-
-        data = {}
-        if self.spin == 2:
-            if spin is not None:
-                wfr = np.fft.ifftn(self.fft_mesh(kpoint, band, spin=spin)) * N
-                den = np.abs(np.conj(wfr) * wfr)
-                if phase:
-                    den = np.sign(np.real(wfr)) * den
-                data["total"] = den
-            else:
-                wfr = np.fft.ifftn(self.fft_mesh(kpoint, band, spin=0)) * N
-                denup = np.abs(np.conj(wfr) * wfr)
-                wfr = np.fft.ifftn(self.fft_mesh(kpoint, band, spin=1)) * N
-                dendn = np.abs(np.conj(wfr) * wfr)
-                data["total"] = denup + dendn
-                data["diff"] = denup - dendn
-        else:
-            if spinor is not None:
-                wfr = np.fft.ifftn(self.fft_mesh(kpoint, band, spinor=spinor)) * N
-                den = np.abs(np.conj(wfr) * wfr)
+        try:
+            data = {}
+            if self.spin == 2:
+                if spin is not None:
+                    data["total"] = get_density(spin, [0], phase)
+                else:
+                    denup = get_density(0, [0], phase=False)
+                    dendn = get_density(1, [0], phase=False)
+                    data["total"] = denup + dendn
+                    data["diff"] = denup - dendn
             else:
-                wfr = np.fft.ifftn(self.fft_mesh(kpoint, band, spinor=0)) * N
-                wfr_t = np.fft.ifftn(self.fft_mesh(kpoint, band, spinor=1)) * N
-                den = np.abs(np.conj(wfr) * wfr)
-                den += np.abs(np.conj(wfr_t) * wfr_t)
-
-            if self.vasp_type is None:
-                raise RuntimeError("vasp_type cannot be None.")
+                spinors = [spinor] if spinor is not None else [0, 1]
+                data["total"] = get_density(
+                    0, spinors, phase=phase and (self.vasp_type.lower()[0] != "n" or spinor is not None)
+                )
+        finally:
+            self.ng = temp_ng
+        return Chgcar(poscar, data)
 
-            if phase and (self.vasp_type.lower()[0] != "n" or spinor is not None):
-                den = np.sign(np.real(wfr)) * den
-            data["total"] = den
+    def _get_band_density(
+        self,
+        kpoint: int,
+        bands: list[int],
+        spin: int,
+        spinors: list[int],
+        phase: bool,
+        batch_size: int,
+    ) -> NDArray:
+        """Summed charge density of bands at a kpoint on the current fft mesh.
 
-        self.ng = temp_ng
-        return Chgcar(poscar, data)
+        The densities of the spinor components are added, and with phase the
+        density is multiplied by the sign of the first component.
+        """
+        N = np.prod(self.ng)
+        ncl = self.vasp_type is not None and self.vasp_type.lower()[0] == "n"
+        density = np.zeros(tuple(self.ng))
+        for start in range(0, len(bands), batch_size):
+            batch = bands[start : start + batch_size]
+            # Without spinors, fft_mesh ignores the spinor and the density is the same for both
+            for idx, spinor in enumerate(spinors if ncl else spinors[:1]):
+                wfr = np.fft.ifftn(self.fft_mesh(kpoint, batch, spin=spin, spinor=spinor), axes=(1, 2, 3)) * N
+                if idx == 0:
+                    den = np.abs(np.conj(wfr) * wfr)
+                    sign = np.sign(np.real(wfr)) if phase else None
+                else:
+                    den += np.abs(np.conj(wfr) * wfr)
+            if not ncl and len(spinors) == 2:
+                den += den
+            if sign is not None:
+                den = sign * den
+            density += den.sum(axis=0)
+        return density
 
     def write_unks(self, directory: PathLike) -> None:
         """Write the UNK files to the given directory.
@@ -5505,19 +6489,17 @@ class Wavecar:
             raise RuntimeError("vasp_type cannot be None.")
 
         N = np.prod(self.ng)
+        bands = range(self.nb)
         for ik in range(self.nk):
             fname = f"UNK{ik + 1:05d}."
             if self.vasp_type.lower()[0] == "n":
                 data = np.empty((self.nb, 2, *self.ng), dtype=np.complex128)
-                for ib in range(self.nb):
-                    data[ib, 0, :, :, :] = np.fft.ifftn(self.fft_mesh(ik, ib, spinor=0)) * N
-                    data[ib, 1, :, :, :] = np.fft.ifftn(self.fft_mesh(ik, ib, spinor=1)) * N
+                data[:, 0] = np.fft.ifftn(self.fft_mesh(ik, bands, spinor=0), axes=(1, 2, 3)) * N
+                data[:, 1] = np.fft.ifftn(self.fft_mesh(ik, bands, spinor=1), axes=(1, 2, 3)) * N
                 Unk(ik + 1, data).write_file(str(out_dir / f"{fname}NC"))
             else:
-                data = np.empty((self.nb, *self.ng), dtype=np.complex128)
                 for ispin in range(self.spin):
-                    for ib in range(self.nb):
-                        data[ib, :, :, :] = np.fft.ifftn(self.fft_mesh(ik, ib, spin=ispin)) * N
+                    data = np.fft.ifftn(self.fft_mesh(ik, bands, spin=ispin), axes=(1, 2, 3)) * N
                     Unk(ik + 1, data).write_file(str(out_dir / f"{fname}{ispin + 1}"))
 
 
@@ -50,7 +50,8 @@ if TYPE_CHECKING:
     import networkx as nx
 
 
-def _hash_label(label, digest_size):
+def hash_label(label: str, digest_size: int) -> str:
+    """Hash a node label, or the histogram of node labels of a graph, with blake2b."""
     return blake2b(label.encode("ascii"), digest_size=digest_size).hexdigest()
 
 
@@ -62,7 +63,7 @@ def _init_node_labels(graph: nx.Graph, edge_attr, node_attr):
     return {u: str(deg) for u, deg in graph.degree()}
 
 
-def _neighborhood_aggregate(graph: nx.Graph, node, node_labels, edge_attr=None):
+def neighborhood_aggregate(graph: nx.Graph, node, node_labels, edge_attr=None) -> str:
     """Compute new labels for given node by aggregating
     the labels of each node's neighbors.
     """
@@ -130,8 +131,8 @@ def weisfeiler_lehman_graph_hash(graph: nx.Graph, edge_attr=None, node_attr=None
         """
         new_labels = {}
         for node in G.nodes():
-            label = _neighborhood_aggregate(G, node, labels, edge_attr=edge_attr)
-            new_labels[node] = _hash_label(label, digest_size)
+            label = neighborhood_aggregate(G, node, labels, edge_attr=edge_attr)
+            new_labels[node] = hash_label(label, digest_size)
         return new_labels
 
     # set initial node labels
@@ -145,7 +146,7 @@ def weisfeiler_lehman_graph_hash(graph: nx.Graph, edge_attr=None, node_attr=None
         subgraph_hash_counts.extend(sorted(counter.items(), key=lambda x: x[0]))
 
     # hash the final counter
-    return _hash_label(str(tuple(subgraph_hash_counts)), digest_size)
+    return hash_label(str(tuple(subgraph_hash_counts)), digest_size)
 
 
 def weisfeiler_lehman_subgraph_hashes(graph, edge_attr=None, node_attr=None, iterations=3, digest_size=16):
@@ -235,8 +236,8 @@ def weisfeiler_lehman_subgraph_hashes(graph, edge_attr=None, node_attr=None, ite
         """
         new_labels = {}
         for node in G.nodes():
-            label = _neighborhood_aggregate(G, node, labels, edge_attr=edge_attr)
-            hashed_label = _hash_label(label, digest_size)
+            label = neighborhood_aggregate(G, node, labels, edge_attr=edge_attr)
+            hashed_label = hash_label(label, digest_size)
             new_labels[node] = hashed_label
             node_subgraph_hashes[node].append(hashed_label)
         return new_labels
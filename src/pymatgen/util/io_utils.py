@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import re
 import warnings
+from contextlib import nullcontext
+from io import TextIOBase
 from typing import TYPE_CHECKING
 
 from monty.io import zopen
@@ -51,7 +53,7 @@ def clean_lines(
 
 
 def micro_pyawk(
-    filename: str | Path,
+    filename: str | Path | TextIOBase,
     search: list[tuple[re.Pattern | str, Callable, Callable]],
     results: Any | None = None,
     debug: Callable | None = None,
@@ -65,7 +67,8 @@ def micro_pyawk(
     Pattern.match.
 
     Args:
-        filename (PathLike): The file to search through.
+        filename (PathLike | TextIOBase): The file to search through, or an open
+            text stream such as a StringIO.
         search (list[tuple[Pattern | str, Callable, Callable]]): The "search program" of
             3 elements, i.e. [(regex, test, run), ...].
             Here `regex` is either a Pattern object, or a string that we compile
@@ -95,7 +98,9 @@ def micro_pyawk(
         (re.compile(regex), test, run) for regex, test, run in search
     ]
 
-    with zopen(filename, mode="rt", encoding="utf-8") as file:
+    with (
+        nullcontext(filename) if isinstance(filename, TextIOBase) else zopen(filename, mode="rt", encoding="utf-8")
+    ) as file:
         for line in file:
             for regex, test, run in searches:
                 match = re.search(regex, line)
@@ -11,6 +11,7 @@ from pymatgen.alchemy.filters import (
     SpecieProximityFilter,
 )
 from pymatgen.alchemy.transmuters import StandardTransmuter
+from pymatgen.analysis.structure_index import StructureIndex
 from pymatgen.analysis.structure_matcher import StructureMatcher
 from pymatgen.core import Lattice, Species, Structure
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
@@ -105,3 +106,10 @@ class TestRemoveExistingFilter:
             self._struct_list[-1],
             transmuter.transformed_structures[-1].final_structure,
         )
+
+    def test_filter_with_index(self, tmp_path):
+        index = StructureIndex()
+        index.add_structures(self._existing_structures)
+        index.to_file(f"{tmp_path}/index")
+        fil = RemoveExistingFilter(StructureIndex.from_file(f"{tmp_path}/index"))
+        assert [fil.test(struct) for struct in self._struct_list] == [False] * 15 + [True]
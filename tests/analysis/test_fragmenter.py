@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import copy
 import platform
 
+import networkx as nx
 import pytest
+from monty.serialization import dumpfn, loadfn
 
-from pymatgen.analysis.fragmenter import Fragmenter
+from pymatgen.analysis.fragmenter import Fragmenter, FragmentRegistry
 from pymatgen.analysis.graphs import MoleculeGraph
 from pymatgen.analysis.local_env import OpenBabelNN
 from pymatgen.core.structure import Molecule
+from pymatgen.util.graph_hashing import weisfeiler_lehman_graph_hash
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
 
 __author__ = "Samuel Blau"
@@ -156,6 +160,53 @@ class TestFragmentMolecule(MatSciTest):
         )
         assert frag2.new_unique_fragments == 295 - 12
 
+    def test_registry(self):
+        registry = FragmentRegistry()
+        frag1 = Fragmenter(molecule=self.pc_frag1, edges=self.pc_frag1_edges, depth=0, registry=registry)
+        assert len(registry) == frag1.total_unique_fragments == 12
+
+        dumpfn(registry, f"{self.tmp_path}/registry.json")
+        registry = loadfn(f"{self.tmp_path}/registry.json")
+        assert isinstance(registry, FragmentRegistry)
+        assert len(registry) == 12
+
+        frag2 = Fragmenter(molecule=self.pc, edges=self.pc_edges, depth=0, registry=registry)
+        assert frag2.new_unique_fragments == 295 - 12
+        assert frag2.total_unique_fragments == len(registry) == 295
+
+        # Fragments already in the registry are not fragmented again
+        frag3 = Fragmenter(molecule=self.pc, edges=self.pc_edges, depth=10, registry=registry)
+        assert frag3.new_unique_fragments == 0
+        assert len(registry) == 295
+
+    def test_registry_incremental_hashes(self):
+        fragmenter = Fragmenter(molecule=self.tfsi, edges=self.tfsi_edges, depth=10)
+        assert len(fragmenter.registry) == fragmenter.total_unique_fragments == 156
+        for fragment in fragmenter.registry:
+            fragment.set_node_attributes()
+            frag_hash = weisfeiler_lehman_graph_hash(fragment.graph.to_undirected(), node_attr="specie")
+            assert fragmenter.registry.get_hash(fragment) == frag_hash
+            assert fragmenter.registry.find(fragment) is fragment
+
+    def test_registry_charged_species(self):
+        # Fragments that only differ in the oxidation states of their species are distinct
+        coords = [[0, 0, 0], [1.9, 0, 0], [3.8, 0, 0]]
+        edges = {(0, 1): None, (1, 2): None}
+        fe2 = MoleculeGraph.from_edges(Molecule(["O2-", "Fe2+", "O2-"], coords), edges)
+        fe3 = MoleculeGraph.from_edges(Molecule(["O2-", "Fe3+", "O2-"], coords), edges)
+        registry = FragmentRegistry()
+        assert registry.add(fe2)
+        assert registry.find(fe3) is None
+        assert registry.add(fe3)
+        assert not registry.add(copy.deepcopy(fe3))
+        assert len(registry) == 2
+        assert registry.find(fe2) is fe2
+        assert registry.find(fe3) is fe3
+
+        graph = nx.Graph(fe3.graph.to_undirected())
+        nx.set_node_attributes(graph, {idx: str(site.specie) for idx, site in enumerate(fe3.molecule)}, "specie")
+        assert registry.get_hash(fe3) == weisfeiler_lehman_graph_hash(graph, node_attr="specie")
+
     @pytest.mark.skipif(platform.system() == "Windows", reason="Tests for openbabel failing on Win")
     def test_pc_then_ec_depth_10(self):
         pytest.importorskip("openbabel")
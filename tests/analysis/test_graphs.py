@@ -4,6 +4,7 @@ import copy
 import re
 import warnings
 from glob import glob
+from itertools import combinations
 from shutil import which
 
 import networkx as nx
@@ -12,7 +13,13 @@ import pytest
 from monty.serialization import loadfn
 from pytest import approx
 
-from pymatgen.analysis.graphs import MoleculeGraph, MolGraphSplitError, PeriodicSite, StructureGraph
+from pymatgen.analysis.graphs import (
+    MoleculeGraph,
+    MolGraphSplitError,
+    PeriodicSite,
+    StructureGraph,
+    _connected_induced_subgraphs,
+)
 from pymatgen.analysis.local_env import (
     CovalentBondNN,
     CutOffDictNN,
@@ -841,6 +848,22 @@ class TestMoleculeGraph:
             # Test that each fragment is connected
             assert nx.is_connected(unique_fragments[ii].graph.to_undirected())
 
+    def test_connected_induced_subgraphs(self):
+        edges = {(edge[0], edge[1]): None for edge in self.pc_edges}
+        graph = MoleculeGraph.from_edges(self.pc, edges).graph.to_undirected()
+        expected = {
+            combination
+            for size in range(1, len(graph) + 1)
+            for combination in combinations(range(len(graph)), size)
+            if nx.is_connected(graph.subgraph(combination))
+        }
+        subgraphs = list(_connected_induced_subgraphs(graph))
+        assert len(subgraphs) == len(set(subgraphs))
+        assert set(subgraphs) == expected
+
+        subgraphs = list(_connected_induced_subgraphs(graph, max_size=3))
+        assert set(subgraphs) == {combination for combination in expected if len(combination) <= 3}
+
     def test_find_rings(self):
         rings = self.cyclohexene.find_rings(including=[0])
         assert sorted(rings[0]) == [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 0)]
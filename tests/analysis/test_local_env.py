@@ -30,16 +30,18 @@ from pymatgen.analysis.local_env import (
     OpenBabelNN,
     ValenceIonicRadiusEvaluator,
     VoronoiNN,
+    _has_ambiguous_weights,
     cn_opt_params,
     default_op_params,
     get_neighbors_of_site_with_index,
+    iter_all_nn_info,
     metal_edge_extender,
     on_disorder_options,
     oxygen_edge_extender,
     site_is_of_motif_type,
     solid_angle,
 )
-from pymatgen.core import Element, Lattice, Molecule, Structure
+from pymatgen.core import Element, Lattice, Molecule, PeriodicNeighbor, Structure
 from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
 
 TEST_DIR = f"{TEST_FILES_DIR}/analysis/local_env/fragmenter_files"
@@ -476,6 +478,18 @@ class TestMiniDistNN(MatSciTest):
         assert crystal_nn.get_cn(self.cscl, 0) == 8
         assert crystal_nn.get_cn(self.lifepo4, 0) == 6
 
+    def test_get_all_nn_info(self):
+        def nn_keys(nn_info):
+            return sorted((nn["site_index"], nn["image"], round(nn["weight"], 6)) for nn in nn_info)
+
+        for nn in (MinimumDistanceNN(), MinimumDistanceNN(cutoff=5, get_all_sites=True)):
+            for struct in (self.cscl, self.mos2, self.lifepo4):
+                all_nn_info = nn.get_all_nn_info(struct)
+                assert len(all_nn_info) == len(struct)
+                for idx, nn_info in enumerate(all_nn_info):
+                    assert nn_keys(nn_info) == nn_keys(nn.get_nn_info(struct, idx))
+                    assert all(isinstance(info["site"], PeriodicNeighbor) for info in nn_info)
+
     def test_get_local_order_params(self):
         min_dist_nn = MinimumDistanceNN()
         ops = min_dist_nn.get_local_order_parameters(self.diamond, 0)
@@ -616,6 +630,34 @@ class TestNearNeighbor(MatSciTest):
             "error",
         )
 
+    def test_iter_all_nn_info(self):
+        structures = [self.get_structure(name) for name in ("Li2O", "Si", "SrTiO3")]
+        disordered = Structure(Lattice.cubic(3), [{"Fe": 0.5, "Mn": 0.5}, "O"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+        strategy = MinimumDistanceNN()
+
+        def summarize(all_nn_info):
+            return [
+                sorted((nn["site_index"], tuple(nn["image"]), nn["weight"]) for nn in nn_info)
+                for nn_info in all_nn_info
+            ]
+
+        expected = [summarize(strategy.get_all_nn_info(struct)) for struct in structures]
+        for n_jobs in (1, 2):
+            results = iter_all_nn_info(iter(structures), strategy, n_jobs=n_jobs, chunk_size=2)
+            assert [summarize(all_nn_info) for all_nn_info in results] == expected
+
+        # errors are captured per structure
+        with pytest.raises(AttributeError, match="attr='specie' not found"):
+            list(iter_all_nn_info([disordered], CrystalNN()))
+        with pytest.warns(UserWarning, match="Failed to get the near neighbors of structure 1"):
+            results = list(iter_all_nn_info([structures[0], disordered], CrystalNN(), on_error="warn"))
+        assert results[1] is None
+        assert len(results[0]) == len(structures[0])
+
+        # warnings raised in the workers are emitted again
+        with pytest.warns(UserWarning, match="No oxidation states specified on sites"):
+            list(iter_all_nn_info(structures[1:2], CrystalNN(), n_jobs=2))
+
 
 class TestLocalStructOrderParams(MatSciTest):
     def setup_method(self):
@@ -1181,6 +1223,41 @@ class TestLocalStructOrderParams(MatSciTest):
         with pytest.raises(ValueError, match="Neighbor site index beyond maximum!"):
             ops_101.get_order_parameters(self.bcc, 0, indices_neighs=[2])
 
+    def test_get_order_parameters_from_vectors(self):
+        op_types = list(DEFAULT_OP_PARAMS)
+        motifs = [
+            (self.cuboctahedron, list(range(1, 13))),
+            (self.see_saw_rect, list(range(1, 5))),
+            (self.hexagonal_planar, [1, 2, 3, 4, 5, 6]),
+            (self.sq_face_capped_trig_pris, list(range(1, 8))),
+            (self.bcc, [1]),
+            (self.bcc, []),
+        ]
+        vectors = [struct[idx].coords - struct[0].coords for struct, indices in motifs for idx in indices]
+        offsets = np.cumsum([0, *(len(indices) for _, indices in motifs)])
+
+        # the last OP type matters, see get_order_parameters
+        for types in (op_types, [*op_types, "tri_bipyr"]):
+            ops = LocalStructOrderParams(types, cutoff=1.01)
+            op_vals = ops.get_order_parameters_from_vectors(vectors, offsets)
+            assert op_vals.shape == (len(motifs), len(types))
+            for site_op_vals, (struct, indices) in zip(op_vals, motifs, strict=True):
+                expected = ops.get_order_parameters(struct, 0, indices_neighs=indices)
+                assert_allclose(site_op_vals, np.array(expected, dtype=float), atol=1e-10)
+
+    def test_get_all_order_parameters(self):
+        op_types = [typ for typ in DEFAULT_OP_PARAMS if typ != "bcc"]
+        struct = self.get_structure("LiFePO4")
+        struct.perturb(0.1, seed=0)
+        for cutoff in (3.0, -10.0):
+            ops = LocalStructOrderParams(op_types, cutoff=cutoff)
+            op_vals = ops.get_all_order_parameters(struct)
+            expected = [ops.get_order_parameters(struct, idx) for idx in range(len(struct))]
+            assert_allclose(op_vals, np.array(expected, dtype=float), atol=1e-10)
+
+        ops = LocalStructOrderParams(["cn", "q6"], cutoff=-10.0)
+        assert_allclose(ops.get_all_order_parameters(self.bcc), [[14, 0.51069], [14, 0.51069]], atol=1e-5)
+
 
 class TestCrystalNN(MatSciTest):
     def setup_method(self):
@@ -1253,6 +1330,61 @@ class TestCrystalNN(MatSciTest):
         assert len(nn_data.cn_weights) == 30
         assert len(nn_data.cn_nninfo) == 30
 
+    def test_get_all_nn_data(self):
+        def summarize(nn_data):
+            cn_nninfo = {
+                cn: [(entry["site_index"], tuple(entry["image"]), entry["weight"]) for entry in entries]
+                for cn, entries in nn_data.cn_nninfo.items()
+            }
+            return cn_nninfo, nn_data.cn_weights
+
+        def assert_same_as_per_site(cnn, struct):
+            all_nn_data = cnn.get_all_nn_data(struct)
+            assert len(all_nn_data) == len(struct)
+            for idx, nn_data in enumerate(all_nn_data):
+                cn_nninfo, cn_weights = summarize(nn_data)
+                expected_cn_nninfo, expected_cn_weights = summarize(cnn.get_nn_data(struct, idx))
+                assert cn_nninfo == expected_cn_nninfo
+                assert cn_weights == approx(expected_cn_weights)
+
+        for cnn in (CrystalNN(), CrystalNN(weighted_cn=True, cation_anion=True), CrystalNN(fingerprint_length=30)):
+            assert_same_as_per_site(cnn, self.lifepo4)
+
+        # small cells, whose neighbors within search_cutoff are many periodic images
+        cu_fcc = Structure.from_spacegroup("Fm-3m", Lattice.cubic(3.61), ["Cu"], [[0, 0, 0]])
+        fe_bcc = Structure.from_spacegroup("Im-3m", Lattice.cubic(2.87), ["Fe"], [[0, 0, 0]])
+        for struct in (cu_fcc, fe_bcc, self.he_bcc):
+            assert_same_as_per_site(CrystalNN(), struct)
+            assert_same_as_per_site(CrystalNN(weighted_cn=True, porous_adjustment=False), struct)
+
+        # oxidation state decorated structures with cation_anion
+        nacl = Structure.from_spacegroup("Fm-3m", Lattice.cubic(5.69), ["Na+", "Cl-"], [[0, 0, 0], [0.5, 0.5, 0.5]])
+        assert_same_as_per_site(CrystalNN(cation_anion=True), nacl)
+        assert_same_as_per_site(CrystalNN(weighted_cn=True, cation_anion=True, search_cutoff=4), self.lifepo4)
+
+        # search_cutoff too small for the cells of some or all sites to be closed
+        for search_cutoff in (2, 3):
+            assert_same_as_per_site(CrystalNN(search_cutoff=search_cutoff), self.lifepo4)
+            assert_same_as_per_site(CrystalNN(search_cutoff=search_cutoff), cu_fcc)
+        cnn = CrystalNN(search_cutoff=2)
+        cn_array = [len(cnn._get_nn_info_from_data(nn_data)) for nn_data in cnn.get_all_nn_data(self.lifepo4)]
+        assert cn_array == 8 * [6] + 20 * [4]
+
+        # sites whose neighbor order or weight rounding depends on round-off are evaluated one by one
+        assert not _has_ambiguous_weights([{"weight": 1.0}, {"weight": 0.5}, {"weight": 1e-5}, {"weight": 0.0}])
+        assert _has_ambiguous_weights([{"weight": 1.0}, {"weight": 0.5}, {"weight": 0.5 - 1e-9}])
+        assert _has_ambiguous_weights([{"weight": 1.0}, {"weight": 0.1235}])
+
+    def test_get_all_nn_info(self):
+        cnn = CrystalNN(weighted_cn=True)
+        all_nn_info = cnn.get_all_nn_info(self.lifepo4)
+        for idx, nn_info in enumerate(all_nn_info):
+            expected = cnn.get_nn_info(self.lifepo4, idx)
+            assert sorted((entry["site_index"], tuple(entry["image"])) for entry in nn_info) == sorted(
+                (entry["site_index"], tuple(entry["image"])) for entry in expected
+            )
+            assert sum(entry["weight"] for entry in nn_info) == approx(sum(entry["weight"] for entry in expected))
+
     def test_cation_anion(self):
         cnn = CrystalNN(weighted_cn=True, cation_anion=True)
         assert cnn.get_cn(self.lifepo4, 0, use_weights=True) == approx(5.8630, abs=1e-2)
@@ -1345,6 +1477,17 @@ class TestCutOffDictNN(MatSciTest):
         nn_null = CutOffDictNN()
         assert nn_null.get_cn(self.diamond, 0) == 0
 
+    def test_get_all_nn_info(self):
+        nn = CutOffDictNN({("C", "C"): 2})
+        all_nn_info = nn.get_all_nn_info(self.diamond)
+        for idx, nn_info in enumerate(all_nn_info):
+            assert len(nn_info) == 4
+            assert sorted((info["site_index"], info["image"]) for info in nn_info) == sorted(
+                (info["site_index"], info["image"]) for info in nn.get_nn_info(self.diamond, idx)
+            )
+
+        assert CutOffDictNN().get_all_nn_info(self.diamond) == [[], []]
+
     def test_from_preset(self):
         nn = CutOffDictNN.from_preset("vesta_2019")
         assert nn.get_cn(self.diamond, 0) == 4
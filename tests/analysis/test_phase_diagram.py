@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections
+import os
 from itertools import combinations
 from numbers import Number
 from unittest.mock import patch
@@ -299,6 +300,37 @@ class TestPhaseDiagram(MatSciTest):
             " LiFeO2, Li, Li2O, LiO, Li5FeO4, Li2FeO3, O"
         )
 
+    def test_add_entries(self):
+        compounds = [entry for entry in self.entries if not entry.is_element]
+        base = [entry for entry in self.entries if entry.is_element] + compounds[::2]
+        new = compounds[1::2]
+        pd = PhaseDiagram(base)
+        for new_entries in (new[:5], new[5:6], new[6:]):
+            pd = pd.add_entries(new_entries)
+            base += new_entries
+            expected = PhaseDiagram(base)
+            assert pd.stable_entries == expected.stable_entries
+            assert len(pd.facets) == len(expected.facets)
+            assert len(pd.qhull_entries) == len(expected.qhull_entries)
+            for entry in base:
+                assert pd.get_e_above_hull(entry) == approx(expected.get_e_above_hull(entry), abs=1e-10)
+        assert len(pd.all_entries) == len(self.entries)
+
+        # lower energy entries replace those at the same composition
+        li2o = next(entry for entry in pd.stable_entries if entry.reduced_formula == "Li2O")
+        lower = PDEntry(li2o.composition, li2o.energy - 1)
+        new_pd = pd.add_entries([lower])
+        assert lower in new_pd.stable_entries
+        assert li2o not in new_pd.qhull_entries
+        assert new_pd.get_e_above_hull(li2o) == approx(PhaseDiagram([*self.entries, lower]).get_e_above_hull(li2o))
+
+        # a new elemental reference changes all formation energies, so the diagram is rebuilt
+        lower_li = PDEntry(Composition("Li"), self.pd.el_refs[Element("Li")].energy - 1)
+        assert pd.add_entries([lower_li]).el_refs[Element("Li")] == lower_li
+
+        with pytest.raises(ValueError, match=r"Entries have elements not in the phase diagram: \['Mn'\]"):
+            pd.add_entries([PDEntry(Composition("MnO"), -10)])
+
     def test_get_e_above_hull(self):
         for entry in self.pd.all_entries:
             for entry in self.pd.stable_entries:
@@ -509,6 +541,37 @@ class TestPhaseDiagram(MatSciTest):
             h_e = self.pd.get_hull_energy_per_atom(entry.composition)
             assert h_e == approx(entry.energy_per_atom)
 
+    def test_batched_hull_energies(self):
+        entries = list(self.entries)
+        decomps, e_above_hull = self.pd.get_decomps_and_e_above_hull(entries)
+        for entry, decomp, e_hull in zip(entries, decomps, e_above_hull, strict=True):
+            expected_decomp, expected_e_hull = self.pd.get_decomp_and_e_above_hull(entry)
+            assert e_hull == approx(expected_e_hull, abs=1e-10)
+            assert decomp == approx(expected_decomp)
+        assert_allclose(self.pd.get_e_above_hulls(entries, check_stable=False), e_above_hull, atol=1e-10)
+
+        comps = [Composition(dict(zip(self.pd.elements, amounts, strict=True))) for amounts in np.ndindex(3, 3, 3)][1:]
+        expected = [self.pd.get_hull_energy_per_atom(comp) for comp in comps]
+        assert_allclose(self.pd.get_hull_energies_per_atom(comps), expected)
+        assert_allclose(self.pd.get_hull_energies_per_atom(list(np.ndindex(3, 3, 3))[1:]), expected)
+        decomps, hull_energies = self.pd.get_decomps_and_hull_energies_per_atom(comps)
+        assert_allclose(hull_energies, expected)
+        assert decomps[4] == approx(self.pd.get_decomposition(comps[4]))
+
+        # entries below the hull or outside the phase diagram
+        below_hull = PDEntry("Li2O", -100)
+        with pytest.raises(ValueError, match="No valid decomposition found for"):
+            self.pd.get_decomps_and_e_above_hull([below_hull])
+        decomps, e_above_hull = self.pd.get_decomps_and_e_above_hull(
+            [below_hull, PDEntry("MnO", -10), entries[0]], on_error="ignore"
+        )
+        assert decomps[:2] == [None, None]
+        assert np.isnan(e_above_hull[:2]).all()
+        assert e_above_hull[2] == approx(self.pd.get_e_above_hull(entries[0]))
+        assert self.pd.get_e_above_hulls([below_hull], allow_negative=True)[0] < 0
+        with pytest.raises(ValueError, match="No facet found for composition 1"):
+            self.pd.get_hull_energies_per_atom([Composition("Li2O"), Composition("MnO")])
+
     def test_1d_pd(self):
         entry = PDEntry("H", 0)
         pd = PhaseDiagram([entry])
@@ -773,6 +836,50 @@ class TestPatchedPhaseDiagram:
             decomp_ppd = self.ppd.get_decomposition(comp)
             assert decomp_pd == approx(decomp_ppd)
 
+    def test_batched_hull_energies(self):
+        entries = [*self.pd.all_entries, *self.novel_entries]
+        decomps, e_above_hull = self.ppd.get_decomps_and_e_above_hull(entries)
+        expected_decomps, expected = self.pd.get_decomps_and_e_above_hull(entries)
+        assert_allclose(e_above_hull, expected, atol=1e-6)
+        for decomp, expected_decomp in zip(decomps, expected_decomps, strict=True):
+            assert decomp == approx(expected_decomp, abs=1e-6)
+
+    def test_lazy_parallel_and_cache(self, tmp_path):
+        lazy_ppd = PatchedPhaseDiagram(entries=self.entries, lazy=True)
+        assert sum(pd is not None for pd in lazy_ppd.pds._pds.values()) == 0
+        entry = next(entry for entry in self.pd.all_entries if len(entry.elements) == 4)
+        assert lazy_ppd.get_e_above_hull(entry) == approx(self.ppd.get_e_above_hull(entry))
+        assert sum(pd is not None for pd in lazy_ppd.pds._pds.values()) == 1
+        assert lazy_ppd.stable_entries == self.ppd.stable_entries
+        assert sum(pd is not None for pd in lazy_ppd.pds._pds.values()) == len(self.ppd)
+
+        parallel_ppd = PatchedPhaseDiagram(entries=self.entries, n_jobs=2)
+        assert list(parallel_ppd.pds) == list(self.ppd.pds)
+        assert parallel_ppd.stable_entries == self.ppd.stable_entries
+        # sub-diagrams share the entries of the PatchedPhaseDiagram
+        all_entry_ids = set(map(id, parallel_ppd.all_entries))
+        assert all(id(entry) in all_entry_ids for pd in parallel_ppd for entry in pd.all_entries)
+
+        cache_dir = f"{tmp_path}/hulls"
+        cached_ppd = PatchedPhaseDiagram(entries=self.entries, cache_dir=cache_dir)
+        cache_files = sorted(os.listdir(cache_dir))
+        assert len(cache_files) == len(self.ppd)
+        with patch("pymatgen.analysis.phase_diagram._get_hull_data") as get_hull_data:
+            for ppd in (
+                PatchedPhaseDiagram(entries=self.entries, cache_dir=cache_dir),
+                PatchedPhaseDiagram(entries=self.entries, cache_dir=cache_dir, n_jobs=2),
+                PatchedPhaseDiagram(entries=self.entries, cache_dir=cache_dir, lazy=True),
+            ):
+                assert ppd.stable_entries == self.ppd.stable_entries
+                for entry in self.pd.all_entries:
+                    assert ppd.get_e_above_hull(entry) == approx(cached_ppd.get_e_above_hull(entry))
+        assert get_hull_data.call_count == 0
+
+        # different entries are cached separately
+        entries = [*self.entries, PDEntry("V2O5", -60)]
+        PatchedPhaseDiagram(entries=entries, cache_dir=cache_dir)
+        assert len(os.listdir(cache_dir)) > len(cache_files)
+
     def test_get_phase_separation_energy(self):
         for entry in self.novel_entries:
             e_phase_sep_pd = self.pd.get_phase_separation_energy(entry)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+
+from monty.json import MontyDecoder
+from numpy.testing import assert_allclose
+
+from pymatgen.analysis.structure_index import StructureIndex
+from pymatgen.analysis.structure_matcher import ElementComparator, StructureMatcher
+from pymatgen.core import Lattice
+from pymatgen.util.testing import TEST_FILES_DIR, MatSciTest
+
+
+class TestStructureIndex(MatSciTest):
+    def setup_method(self):
+        with open(f"{TEST_FILES_DIR}/entries/TiO2_entries.json", encoding="utf-8") as file:
+            entries = json.load(file, cls=MontyDecoder)
+        self.struct_list = [entry.structure for entry in entries]
+        self.matcher = StructureMatcher(comparator=ElementComparator())
+
+    def test_add_and_find_match(self):
+        index = StructureIndex(self.matcher)
+        added = [index.add(struct, skip_duplicates=True) for struct in self.struct_list]
+        assert len(index) == 11
+        assert added[:4] == [0, None, None, 1]
+
+        # same result as fitting against every stored structure
+        for struct in self.struct_list:
+            match = index.find_match(struct)
+            assert match is not None
+            assert self.matcher.fit(index.get_structure(match), struct)
+            assert match in index.get_candidates(struct)
+            assert struct in index
+            for idx in set(range(len(index))) - set(index.get_candidates(struct)):
+                assert not self.matcher.fit(index.get_structure(idx), struct)
+
+        assert self.get_structure("LiFePO4") not in index
+        assert index.get_candidates(self.get_structure("LiFePO4")) == []
+
+    def test_symprec(self):
+        index = StructureIndex(self.matcher, symprec=0.1)
+        index.add_structures(self.struct_list)
+        for struct in self.struct_list:
+            assert all(
+                index._keys[idx][2] == index._keys[index.get_candidates(struct)[0]][2]
+                for idx in index.get_candidates(struct)
+            )
+
+    def test_to_from_file(self):
+        index = StructureIndex(self.matcher, symprec=0.1)
+        index.add_structures(self.struct_list[:8])
+        index.to_file(f"{self.tmp_path}/index")
+
+        loaded = StructureIndex.from_file(f"{self.tmp_path}/index")
+        assert len(loaded) == 8
+        assert loaded.symprec == 0.1
+        assert loaded.structure_matcher.ltol == self.matcher.ltol
+        for idx in range(len(index)):
+            assert_allclose(loaded.get_structure(idx).frac_coords, index.get_structure(idx).frac_coords)
+            assert loaded.get_structure(idx).composition == index.get_structure(idx).composition
+        for struct in self.struct_list:
+            assert loaded.find_match(struct) == index.find_match(struct)
+
+        # loaded indices can be extended and saved again
+        assert loaded.add(self.struct_list[-1]) == 8
+        loaded.to_file(f"{self.tmp_path}/index")
+        assert len(StructureIndex.from_file(f"{self.tmp_path}/index", mmap=False)) == 9
+
+    def test_candidate_pruning(self):
+        index = StructureIndex(self.matcher)
+        index.add_structures(self.struct_list)
+        struct = self.struct_list[0]
+        assert index.get_candidates(struct)
+
+        # same bucket, but a lattice too different to match any stored structure
+        stretched = struct.copy()
+        stretched.lattice = Lattice(struct.lattice.matrix * [[1], [1], [30]])
+        assert index._prepare(stretched).key == index._prepare(struct).key
+        assert index.get_candidates(stretched) == []
+        assert index.find_match(stretched) is None
+        for idx in range(len(index)):
+            assert not self.matcher.fit(index.get_structure(idx), stretched)
+
+        capped = StructureIndex(self.matcher, max_candidates=1)
+        capped.add_structures(self.struct_list)
+        assert len(capped.get_candidates(struct)) == 1
+        assert capped.get_candidates(struct) == index.get_candidates(struct)[:1]
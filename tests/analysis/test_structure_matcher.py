@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import pickle
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -14,6 +16,7 @@ from pymatgen.analysis.structure_matcher import (
     OccupancyComparator,
     OrderDisorderElementComparator,
     StructureMatcher,
+    StructureMatcherCache,
 )
 from pymatgen.core import Element, Lattice, Structure, SymmOp
 from pymatgen.util.coord import find_in_coord_list_pbc
@@ -317,6 +320,73 @@ class TestStructureMatcher(MatSciTest):
         out = sm.group_structures(self.struct_list, anonymous=True)
         assert list(map(len, out)) == [4, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1]
 
+    def test_group_structures_parallel(self):
+        sm = StructureMatcher()
+        structs = [struct.copy() for struct in self.struct_list]
+        structs[1].make_supercell([[2, 0, 0], [0, 3, 0], [0, 0, 1]])
+        indices = {id(struct): idx for idx, struct in enumerate(structs)}
+        serial = [[indices[id(s)] for s in group] for group in sm.group_structures(structs)]
+        parallel = [[indices[id(s)] for s in group] for group in sm.group_structures(structs, n_jobs=2)]
+        assert serial == parallel
+        assert list(map(len, serial)) == [4, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1]
+
+        # structures with different numbers of sites are bucketed apart without calling fit
+        sm = StructureMatcher(primitive_cell=False)
+        li2o = self.oxi_structs[0]
+        with patch.object(StructureMatcher, "_fit_reduced", autospec=True, return_value=True) as fit:
+            groups = sm.group_structures([li2o, li2o * (1, 1, 2), li2o.copy()])
+        assert list(map(len, groups)) == [2, 1]
+        assert fit.call_count == 1
+
+    def test_cache(self):
+        cache = StructureMatcherCache(maxsize=100)
+        sm = StructureMatcher(cache=cache)
+        ref = self.struct_list[0]
+        expected = [StructureMatcher().fit(ref, struct) for struct in self.struct_list]
+        assert [sm.fit(ref, struct) for struct in self.struct_list] == expected
+        assert [sm.fit(ref, struct) for struct in self.struct_list] == expected
+        rms_dist = StructureMatcher().get_rms_dist(ref, self.struct_list[1])
+        assert sm.get_rms_dist(ref, self.struct_list[1]) == approx(rms_dist)
+
+        # the reference is only processed and reduced once, and the second pass only hits
+        n_structs = len(self.struct_list)
+        assert cache.cache_info("species").misses == n_structs
+        assert cache.cache_info("reduced") == (n_structs, n_structs, 100, n_structs)
+        assert cache.cache_info("preprocess").misses == n_structs
+        assert cache.cache_info("preprocess").hits == n_structs + 1
+        assert cache.cache_info("mask").hits > 0
+        assert len(cache) == cache.cache_info().currsize <= 100
+        assert "hits=" in repr(cache)
+
+        # structures modified in place are processed again
+        struct = self.struct_list[1].copy()
+        assert sm.fit(ref, struct)
+        misses = cache.cache_info("species").misses
+        struct.replace_species({"Ti": "Zr"})
+        assert not sm.fit(ref, struct)
+        assert cache.cache_info("species").misses == misses + 1
+        struct.add_site_property("magmom", [1] * len(struct))
+        sm.fit(ref, struct)
+        assert cache.cache_info("species").misses == misses + 2
+
+        # entries of collected structures are dropped
+        currsize = len(cache)
+        sm.fit(ref, self.struct_list[2].copy())
+        assert len(cache) == currsize
+
+        # the cache is bounded and can be cleared
+        small_cache = StructureMatcherCache(maxsize=3)
+        sm = StructureMatcher(cache=small_cache)
+        assert [sm.fit(ref, struct) for struct in self.struct_list] == expected
+        assert len(small_cache) <= 3
+        small_cache.clear()
+        assert small_cache.cache_info() == (0, 0, 3, 0)
+
+        # the entries are not pickled for parallel workers
+        assert len(pickle.loads(pickle.dumps(cache))) == 0  # noqa: S301
+        groups = StructureMatcher().group_structures(self.struct_list)
+        assert StructureMatcher(cache=cache).group_structures(self.struct_list, n_jobs=2) == groups
+
     def test_mix(self):
         structures = list(map(self.get_structure, ["Li2O", "Li2O2", "LiFePO4"]))
         structures += [Structure.from_file(f"{VASP_IN_DIR}/{fname}") for fname in ["POSCAR_Li2O", "POSCAR_LiFePO4"]]
@@ -386,6 +456,43 @@ class TestStructureMatcher(MatSciTest):
         lattices = list(sm._get_lattices(s=s1, target_lattice=s3.lattice))
         assert len(lattices) == 0
 
+    def test_get_lattice_arrays(self):
+        sm = StructureMatcher(ltol=0.3, angle_tol=10)
+        struct = Structure.from_file(f"{TEST_DIR}/Li3GaPCO7.json")
+        for supercell_size, target_lattice in [(1, struct.lattice), (4, (struct * (2, 1, 2)).lattice)]:
+            lattices = list(sm._get_lattices(target_lattice, struct, supercell_size))
+            matrices, sc_ms = sm._get_lattice_arrays(target_lattice, struct, supercell_size)
+            assert len(lattices) == len(matrices) > 0
+            assert_allclose([latt.matrix for latt, _ in lattices], matrices, atol=0, rtol=0)
+            assert_allclose([sc_m for _, sc_m in lattices], sc_ms, atol=0, rtol=0)
+
+    def test_batched_lattice_search(self):
+        struct = Structure.from_file(f"{TEST_DIR}/Li3GaPCO7.json")
+        s1 = struct.copy()
+        s1.perturb(0.1, seed=0)
+        s2 = struct * (1, 2, 1)
+        s2.perturb(0.1, seed=1)
+        s3 = struct.copy()
+        s3.perturb(0.6, seed=2)
+        kwargs = {"ltol": 0.3, "angle_tol": 8, "primitive_cell": False, "attempt_supercell": True}
+        sm = StructureMatcher(**kwargs)
+        sm_batched = StructureMatcher(**kwargs, batched_lattice_search=True)
+        assert StructureMatcher.from_dict(sm_batched.as_dict())._batched_lattice_search
+
+        for struct1, struct2 in [(s1, s2), (s2, s1), (s1, s3), (s2, s3)]:
+            assert sm_batched.fit(struct1, struct2) == sm.fit(struct1, struct2)
+            assert sm_batched.get_rms_dist(struct1, struct2) == sm.get_rms_dist(struct1, struct2)
+        transformation = sm_batched.get_transformation(s2, s1)
+        for actual, desired in zip(transformation, sm.get_transformation(s2, s1), strict=True):
+            assert_allclose(actual, desired, atol=0, rtol=0)
+
+        s1 = Structure.from_file(f"{TEST_DIR}/Al3F9.json")
+        s2 = Structure.from_file(f"{TEST_DIR}/Al3F9_distorted.json")
+        sm_batched = StructureMatcher(attempt_supercell=True, batched_lattice_search=True)
+        assert sm_batched.fit(s1, s2)
+        assert sm_batched.fit(s2, s1)
+        assert not StructureMatcher(batched_lattice_search=True).fit(s1, s2)
+
     def test_find_match1(self):
         sm = StructureMatcher(
             ltol=0.2,
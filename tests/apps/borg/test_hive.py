@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from unittest.mock import patch
 
 import pytest
 from pytest import approx
@@ -45,6 +46,16 @@ class TestVaspToComputedEntryDrone:
         assert isinstance(entry, ComputedStructureEntry)
         assert entry.structure is not None
 
+    def test_assimilate_summary(self):
+        drone = VaspToComputedEntryDrone(parameters=["incar"], data=["final_energy"])
+        with patch("pymatgen.apps.borg.hive.Vasprun") as vasprun:
+            entry = drone.assimilate(f"{TEST_DIR}")
+            vasprun.assert_not_called()
+        assert entry.energy == approx(0.5559329)
+        assert entry.data["final_energy"] == approx(0.5559329)
+        assert entry.parameters["incar"]["ISPIN"] == 2
+        assert entry.entry_id == self.drone.assimilate(f"{TEST_DIR}").entry_id
+
     def test_as_from_dict(self):
         dct = self.structure_drone.as_dict()
         drone = VaspToComputedEntryDrone.from_dict(dct)
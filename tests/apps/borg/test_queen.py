@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import json
+import os
+import shutil
+from unittest.mock import patch
+
+from monty.io import zopen
 from pytest import approx
 
 from pymatgen.apps.borg.hive import VaspToComputedEntryDrone
@@ -27,3 +33,60 @@ class TestBorgQueen:
         queen = BorgQueen(drone)
         queen.load_data(f"{TEST_DIR}/assimilated.json")
         assert len(queen.get_data()) == 1
+
+    def test_incremental_assimilate(self, tmp_path):
+        for name in ("calc1", "calc2"):
+            os.makedirs(f"{tmp_path}/root/{name}")
+            shutil.copy(f"{TEST_DIR}/vasprun.xml.xe.gz", f"{tmp_path}/root/{name}")
+        manifest = f"{tmp_path}/manifest.jsonl.gz"
+
+        drone = VaspToComputedEntryDrone()
+        with patch.object(drone, "assimilate", wraps=drone.assimilate) as assimilate:
+            queen = BorgQueen(drone, f"{tmp_path}/root", manifest=manifest)
+            assert assimilate.call_count == 2
+            assert len(queen.get_data()) == 2
+            assert queen.get_data()[0].energy == approx(0.5559329, 1e-6)
+
+            # Nothing changed, all entries are read from the manifest, which is left untouched
+            stat = os.stat(manifest)
+            queen = BorgQueen(drone, f"{tmp_path}/root", manifest=manifest)
+            assert assimilate.call_count == 2
+            assert [entry.energy for entry in queen.get_data()] == approx([0.5559329] * 2, 1e-6)
+            assert os.stat(manifest).st_size == stat.st_size
+            assert os.stat(manifest).st_mtime_ns == stat.st_mtime_ns
+
+            # Only the changed directory is assimilated again
+            vasprun = f"{tmp_path}/root/calc2/vasprun.xml.xe.gz"
+            os.utime(vasprun, ns=(os.stat(vasprun).st_atime_ns, os.stat(vasprun).st_mtime_ns + 10**9))
+            shutil.rmtree(f"{tmp_path}/root/calc1")
+            queen = BorgQueen(drone)
+            queen.incremental_assimilate(f"{tmp_path}/root", manifest, chunk_size=1)
+            assert assimilate.call_count == 3
+            assert len(queen.get_data()) == 1
+
+        with zopen(manifest, mode="rt", encoding="utf-8") as file:
+            records = [json.loads(line) for line in file]
+        assert [record["path"] for record in records] == ["calc2"]
+
+    def test_incremental_assimilate_resume(self, tmp_path):
+        for name in ("calc1", "calc2", "calc3"):
+            os.makedirs(f"{tmp_path}/root/{name}")
+            shutil.copy(f"{TEST_DIR}/vasprun.xml.xe.gz", f"{tmp_path}/root/{name}")
+
+        drone = VaspToComputedEntryDrone()
+        for manifest in (f"{tmp_path}/manifest.jsonl.gz", f"{tmp_path}/manifest.jsonl"):
+            BorgQueen(drone, f"{tmp_path}/root", manifest=manifest)
+            # Simulate a run interrupted while appending the last record
+            with open(manifest, mode="rb") as file:
+                content = file.read()
+            with open(manifest, mode="wb") as file:
+                file.write(content[: len(content) - 20])
+
+            with patch.object(drone, "assimilate", wraps=drone.assimilate) as assimilate:
+                queen = BorgQueen(drone, f"{tmp_path}/root", manifest=manifest)
+                assert 1 <= assimilate.call_count < 3
+            assert len(queen.get_data()) == 3
+
+            with zopen(manifest, mode="rt", encoding="utf-8") as file:
+                records = [json.loads(line) for line in file]
+            assert sorted(record["path"] for record in records) == ["calc1", "calc2", "calc3"]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from pymatgen.core.lattice import Lattice
+from pymatgen.core.neighbor_list import NeighborList
+from pymatgen.core.structure import Structure
+from pymatgen.core.trajectory import Trajectory
+from pymatgen.util.testing import VASP_OUT_DIR, MatSciTest
+
+
+def _sorted_neighbors(neighbors):
+    center_indices, points_indices, images, distances = neighbors
+    order = np.lexsort((*images.T, points_indices, center_indices))
+    return center_indices[order], points_indices[order], images[order], distances[order]
+
+
+class TestNeighborList(MatSciTest):
+    def setup_method(self):
+        self.struct = Structure(Lattice.cubic(4.2), ["Cs", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]]) * 3
+        self.struct.perturb(0.05, seed=42)
+
+    def assert_same_neighbors(self, neighbors, expected):
+        for actual, desired in zip(_sorted_neighbors(neighbors), _sorted_neighbors(expected), strict=True):
+            assert_allclose(actual, desired)
+
+    def test_update(self):
+        rng = np.random.default_rng(0)
+        neighbor_list = NeighborList.from_structure(self.struct, r=4.5, skin=0.6)
+        assert neighbor_list.n_builds == 1
+        self.assert_same_neighbors(neighbor_list.get_neighbor_list(), self.struct.get_neighbor_list(4.5))
+
+        struct = self.struct.copy()
+        for _ in range(20):
+            struct.translate_sites(range(len(struct)), rng.normal(0, 0.02, (len(struct), 3)), frac_coords=False)
+            neighbors = neighbor_list.update(struct.frac_coords, struct.lattice)
+            self.assert_same_neighbors(neighbors, struct.get_neighbor_list(4.5))
+        assert 1 < neighbor_list.n_builds < 20
+
+    def test_update_partial_and_wrapped(self):
+        neighbor_list = NeighborList.from_structure(self.struct, r=4.5, skin=0.6)
+        struct = self.struct.copy()
+        # move a single atom across the cell boundary, unwrapped then wrapped
+        struct.translate_sites([0], [-0.02, 0, 0], to_unit_cell=False)
+        frac_coords = struct.frac_coords
+        neighbors = neighbor_list.update(frac_coords, struct.lattice.matrix)
+        self.assert_same_neighbors(neighbors, struct.get_neighbor_list(4.5))
+
+        neighbors = neighbor_list.update(frac_coords % 1, struct.lattice.matrix)
+        struct.translate_sites([0], [0, 0, 0], to_unit_cell=True)
+        self.assert_same_neighbors(neighbors, struct.get_neighbor_list(4.5))
+        assert neighbor_list.n_builds == 1
+
+    def test_update_lattice(self):
+        neighbor_list = NeighborList.from_structure(self.struct, r=4.5, skin=0.6)
+        struct = self.struct.copy()
+        struct.apply_strain(0.01)
+        neighbors = neighbor_list.update(struct.frac_coords, struct.lattice)
+        self.assert_same_neighbors(neighbors, struct.get_neighbor_list(4.5))
+        assert neighbor_list.n_builds == 1
+
+        # a large strain needs a new search of the candidate pairs
+        struct.apply_strain(-0.2)
+        neighbors = neighbor_list.update(struct.frac_coords, struct.lattice)
+        self.assert_same_neighbors(neighbors, struct.get_neighbor_list(4.5))
+        assert neighbor_list.n_builds == 2
+
+    def test_trajectory(self):
+        traj = Trajectory.from_file(f"{VASP_OUT_DIR}/XDATCAR_traj")
+        neighbor_list = NeighborList.from_structure(traj[0], r=3, skin=0.5)
+        for struct in traj:
+            neighbors = neighbor_list.update(struct.frac_coords, struct.lattice)
+            self.assert_same_neighbors(neighbors, struct.get_neighbor_list(3))
+
+    def test_errors(self):
+        with pytest.raises(ValueError, match="skin must be non-negative"):
+            NeighborList(3, skin=-1)
+        with pytest.raises(RuntimeError, match="NeighborList has not been built"):
+            NeighborList(3).get_neighbor_list()
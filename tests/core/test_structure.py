@@ -4,6 +4,7 @@ import itertools
 import json
 import math
 import os
+import pickle
 from fractions import Fraction
 from pathlib import Path
 from shutil import which
@@ -19,6 +20,7 @@ from pytest import approx
 
 from pymatgen.core import SETTINGS, Composition, Element, Lattice, Species
 from pymatgen.core.operations import SymmOp
+from pymatgen.core.sites import PeriodicSite
 from pymatgen.core.structure import (
     IMolecule,
     IStructure,
@@ -714,6 +716,24 @@ Direct
             assert_allclose(cy_indices2, py_indices2)
             assert len(cy_offsets) == len(py_offsets)
 
+    def test_get_all_neighbor_arrays(self):
+        struct = self.struct * 2
+        nn_arrays = struct.get_all_neighbor_arrays(3)
+        all_nn = struct.get_all_neighbors(3)
+        assert len(nn_arrays.offsets) == len(struct) + 1
+        assert nn_arrays.offsets[-1] == len(nn_arrays.indices) == sum(map(len, all_nn))
+        for idx, nns in enumerate(all_nn):
+            indices, images, distances = nn_arrays.neighbors_of(idx)
+            assert indices.tolist() == [nn.index for nn in nns]
+            assert_allclose(images, [nn.image for nn in nns])
+            assert_allclose(distances, [nn.nn_distance for nn in nns])
+        assert (np.diff(nn_arrays.center_indices) >= 0).all()
+
+        # sites without neighbors, and neighbors of a subset of sites
+        nn_arrays = struct.get_all_neighbor_arrays(0.5, sites=struct[:3])
+        assert nn_arrays.offsets.tolist() == [0, 0, 0, 0]
+        assert nn_arrays.images.shape == (0, 3)
+
     @pytest.mark.xfail(reason="TODO: need someone to fix this")
     @pytest.mark.skipif(not os.getenv("CI"), reason="Only run this in CI tests")
     def test_get_all_neighbors_crosscheck_old(self):
@@ -1578,6 +1598,78 @@ class TestStructure(MatSciTest):
         struct.make_supercell([1, 1, 2])
         assert set(struct.labels) == {"Si1", "Si2"}
 
+    def test_columnar_sites(self):
+        struct = self.struct.copy()
+        struct.add_site_property("magmom", [1, -1])
+        supercell = struct * [4, 4, 4]
+        # Bulk properties and in-place operations should not build PeriodicSites
+        assert supercell._site_list is None
+        assert supercell.frac_coords.shape == (128, 3)
+        assert supercell.cart_coords.shape == (128, 3)
+        assert supercell.composition == Composition("Si128")
+        assert supercell.site_properties["magmom"][:2] == [1, 1]
+        supercell.translate_sites(range(len(supercell)), [0.1, 0, 0])
+        supercell.apply_operation(SymmOp.from_axis_angle_and_translation([0, 0, 1], 90))
+        supercell.remove_sites([0, 1])
+        supercell.add_oxidation_state_by_element({"Si": 4})
+        assert supercell._site_list is None
+        assert len(supercell) == 126
+        assert supercell.charge == approx(504)
+
+        # Results must match the site-based implementation
+        site_based = struct * [4, 4, 4]
+        assert site_based[0] is site_based.sites[0]
+        site_based._mutable_sites()
+        assert site_based._columns is None
+        site_based.translate_sites(range(len(site_based)), [0.1, 0, 0])
+        site_based.apply_operation(SymmOp.from_axis_angle_and_translation([0, 0, 1], 90))
+        site_based.remove_sites([0, 1])
+        site_based.add_oxidation_state_by_element({"Si": 4})
+        assert_allclose(supercell.frac_coords, site_based.frac_coords)
+        assert supercell.as_dict() == site_based.as_dict()
+        assert supercell == site_based
+
+        # Sites built on access are kept alongside the columns and write through to them
+        site = supercell[0]
+        site.properties["magmom"] = 5
+        site.species = "Ge4+"
+        site.label = "Ge1"
+        supercell[1].frac_coords = [0.5, 0.5, 0.5]
+        supercell[2].x = 1.5
+        assert supercell._columns is not None
+        assert supercell[0] is site
+        assert supercell.site_properties["magmom"][0] == 5
+        assert supercell.composition == Composition({"Si4+": 125, "Ge4+": 1})
+        assert supercell.labels[0] == "Ge1"
+        assert_allclose(supercell.frac_coords[1], [0.5, 0.5, 0.5])
+        assert supercell.cart_coords[2][0] == approx(1.5)
+
+        # Sites follow column operations and detach as plain PeriodicSites
+        supercell.remove_sites([1])
+        supercell.sort(key=lambda site: site.species_string)
+        assert supercell[0] is site
+        assert supercell._columns is not None
+        assert type(site.to_unit_cell()) is PeriodicSite
+        assert type(pickle.loads(pickle.dumps(site))) is PeriodicSite  # noqa: S301
+        assert site.as_dict()["@class"] == "PeriodicSite"
+        assert repr(site).startswith("PeriodicSite: Ge1 (Ge4+)")
+        assert site == PeriodicSite("Ge4+", site.frac_coords, site.lattice, properties={"magmom": 5})
+
+        # Changing the site list itself moves the storage to the sites
+        supercell.append("Si4+", [0, 0, 0])
+        assert supercell._columns is None
+        assert supercell[0] is site
+        assert supercell.composition == Composition({"Si4+": 125, "Ge4+": 1})
+
+    def test_supercell_missing_site_property(self):
+        struct = self.struct.copy()
+        struct[0].properties["magmom"] = 1
+        assert struct[1].properties == {}
+        assert struct.as_dict()["sites"][1]["properties"] == {}
+        with pytest.warns(UserWarning, match="Not all sites have property magmom"):
+            struct.make_supercell([2, 1, 1])
+        assert struct.site_properties["magmom"] == [1, 1, None, None]
+
     def test_disordered_supercell_primitive_cell(self):
         lattice = Lattice.cubic(2)
         coords = [[0.5, 0.5, 0.5]]
@@ -501,6 +501,16 @@ class TestTrajectory(MatSciTest):
             ):
                 Trajectory.from_file(f"{TEST_DIR}/LiMnO2_chgnet_relax.traj")
 
+    def test_from_file_xdatcar_subclass(self):
+        class SubTrajectory(Trajectory):
+            pass
+
+        traj = SubTrajectory.from_file(f"{VASP_OUT_DIR}/XDATCAR_traj")
+        assert type(traj) is SubTrajectory
+        assert len(traj) == len(self.traj)
+        assert traj[-1] == self.traj[-1]
+        assert traj.site_properties == self.traj.site_properties == [{}] * len(traj)
+
     def test_index_error(self):
         with pytest.raises(IndexError, match="index=100 out of range, trajectory only has 100 frames"):
             self.traj[100]
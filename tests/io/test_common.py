@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
+from numpy.testing import assert_allclose
 
 from pymatgen.io.common import PMGDir, VolumetricData
 from pymatgen.util.testing import TEST_FILES_DIR
@@ -24,6 +26,24 @@ def test_cube_io_faithful(tmp_path: Path) -> None:
     assert cube_file.structure == out_cube.structure
 
 
+def test_read_grid() -> None:
+    values = np.arange(24.0)
+    # uniform lines with extra values on the last one, and lines of varying lengths
+    for text in (
+        "header\n" + "\n".join(" ".join(map(str, values[idx : idx + 5])) for idx in range(0, 25, 5)) + " 0.0\nnext\n",
+        "header\n" + "\n".join(" ".join(map(str, row)) for row in np.split(values, [5, 8, 14, 20])) + "\nnext",
+    ):
+        grid, end = VolumetricData._read_grid(text, 7, (2, 3, 4), order="F")
+        assert_allclose(grid, values.reshape((2, 3, 4), order="F"))
+        assert text[end:] in {"next\n", "next"}
+
+        grid, _ = VolumetricData._read_grid(text, 7, (2, 3, 4))
+        assert_allclose(grid, values.reshape((2, 3, 4)))
+
+    with pytest.raises(ValueError, match="Expected 30 values"):
+        VolumetricData._read_grid("1 2 3\n4 5\n", 0, (2, 3, 5))
+
+
 class TestPMGDir:
     def test_getitem(self):
         # Some simple testing of loading and reading since all these were tested in other classes.
@@ -22,6 +22,7 @@ from pymatgen.core.structure import Structure
 from pymatgen.electronic_structure.bandstructure import BandStructure, BandStructureSymmLine
 from pymatgen.electronic_structure.core import Magmom, Orbital, OrbitalType, Spin
 from pymatgen.entries.compatibility import MaterialsProjectCompatibility
+from pymatgen.io.common import VolumetricData
 from pymatgen.io.vasp.inputs import Incar, Kpoints, Poscar, Potcar
 from pymatgen.io.vasp.outputs import (
     WSWQ,
@@ -40,9 +41,11 @@ from pymatgen.io.vasp.outputs import (
     Vaspout,
     VaspParseError,
     Vasprun,
+    VasprunSummary,
     Wavecar,
     Waveder,
     Xdatcar,
+    _parse_vasp_array,
     get_band_structure_from_vasp_multiple_branches,
 )
 from pymatgen.io.wannier90 import Unk
@@ -91,6 +94,61 @@ class TestVasprun(MatSciTest):
         assert vasp_run.md_n_steps == 10
         assert vasp_run.converged_ionic
 
+    def test_lazy(self):
+        filepath = f"{VASP_OUT_DIR}/vasprun.xml.gz"
+        vasp_run = Vasprun(filepath, parse_potcar_file=False, parse_projected_eigen=True)
+        lazy_run = Vasprun(filepath, parse_potcar_file=False, parse_projected_eigen=True, lazy=True)
+        for attr in ("tdos", "eigenvalues", "projected_eigenvalues"):
+            assert attr not in lazy_run.__dict__
+        assert lazy_run.efermi == approx(vasp_run.efermi)
+        assert lazy_run.tdos.densities[Spin.up] == approx(vasp_run.tdos.densities[Spin.up])
+        assert len(lazy_run.pdos) == len(vasp_run.pdos)
+        assert_allclose(lazy_run.eigenvalues[Spin.up], vasp_run.eigenvalues[Spin.up])
+        assert_allclose(lazy_run.projected_eigenvalues[Spin.up], vasp_run.projected_eigenvalues[Spin.up])
+        assert lazy_run.final_structure == vasp_run.final_structure
+        assert lazy_run.as_dict() == vasp_run.as_dict()
+
+        # ionic steps are parsed on access
+        assert len(lazy_run.ionic_steps) == lazy_run.nionic_steps == 29
+        for step, lazy_step in zip(vasp_run.ionic_steps, lazy_run.ionic_steps, strict=True):
+            assert lazy_step["e_fr_energy"] == step["e_fr_energy"]
+            assert lazy_step["structure"] == step["structure"]
+        assert lazy_run.ionic_steps[-1]["electronic_steps"] == vasp_run.ionic_steps[-1]["electronic_steps"]
+        assert [step["e_wo_entrp"] for step in lazy_run.ionic_steps[::10]] == approx(
+            [step["e_wo_entrp"] for step in vasp_run.ionic_steps[::10]]
+        )
+        with pytest.raises(IndexError):
+            lazy_run.ionic_steps[29]
+
+        lazy_run = Vasprun(filepath, parse_potcar_file=False, parse_dos=False, lazy=True)
+        assert not hasattr(lazy_run, "tdos")
+        assert lazy_run.projected_eigenvalues is None
+
+        lazy_run = Vasprun(filepath, parse_potcar_file=False, ionic_step_skip=10, ionic_step_offset=1, lazy=True)
+        assert lazy_run.nionic_steps == 29
+        assert [step["e_fr_energy"] for step in lazy_run.ionic_steps] == approx(
+            [step["e_fr_energy"] for step in vasp_run.ionic_steps[1::10]]
+        )
+
+        # md_data is collected in the first pass rather than parsed again on access
+        lazy_run = Vasprun(f"{VASP_OUT_DIR}/vasprun.ml_md.xml.gz", lazy=True)
+        assert "md_data" in lazy_run.__dict__
+        assert len(lazy_run.md_data) == 100
+        assert lazy_run.md_data[-1]["energy"]["total"] == approx(-491.51831988)
+        vasp_run = Vasprun(f"{VASP_OUT_DIR}/vasprun.ml_md.xml.gz")
+        assert_allclose(lazy_run.md_data[50]["forces"], vasp_run.md_data[50]["forces"])
+        assert lazy_run.md_data[50]["structure"] == vasp_run.md_data[50]["structure"]
+        assert len(lazy_run.ionic_steps) == len(vasp_run.ionic_steps)
+
+    def test_parse_vasp_array(self):
+        elem = xml.etree.ElementTree.fromstring("<varray><v> 1 2 3 </v><v> 4 5 6 </v></varray>")
+        assert_allclose(_parse_vasp_array(elem), [[1, 2, 3], [4, 5, 6]])
+
+        # ragged rows are not reshaped into a grid, even if the total count divides evenly
+        elem = xml.etree.ElementTree.fromstring("<varray><v> 1 2 3 </v><v> 4 </v></varray>")
+        with pytest.raises(ValueError, match="inhomogeneous"):
+            _parse_vasp_array(elem)
+
     def test_vasprun_ediffg_set_to_0(self):
         # Test for case where EDIFFG is set to 0. This should pass if all ionic steps
         # complete and are electronically converged.
@@ -140,7 +198,7 @@ class TestVasprun(MatSciTest):
             match="Additional unlabelled dielectric data in vasprun.xml are stored as unlabelled.",
         ):
             vr = Vasprun(f"{VASP_OUT_DIR}/vasprun.dielectric_bad.xml.gz")
-            assert "unlabelled" in vr.dielectric_data
+        assert "unlabelled" in vr.dielectric_data
 
     def test_bad_vasprun(self):
         with pytest.raises(xml.etree.ElementTree.ParseError):
@@ -1137,6 +1195,30 @@ class TestOutcar:
         assert outcar.data["piezo_tensor"][1][3] == approx(0.35998)
         assert outcar.data["piezo_tensor"][2][5] == approx(0.35997)
 
+    def test_read_sections(self):
+        filepath = f"{VASP_OUT_DIR}/OUTCAR.lepsilon.gz"
+        outcar = Outcar(filepath)
+        outcar.read_piezo_tensor()
+        outcar.read_electrostatic_potential()
+
+        sections = ("piezo_tensor", "electrostatic_potential", "elastic_tensor")
+        with pytest.raises(IndexError):
+            Outcar(filepath, sections=sections)
+
+        outcar2 = Outcar(filepath, sections=sections[:2])
+        assert outcar2.data["piezo_tensor"] == outcar.data["piezo_tensor"]
+        assert outcar2.electrostatic_potential == outcar.electrostatic_potential
+        assert outcar2._text is None
+
+        # sections that are not in the file are not parsed
+        outcar2.read_sections(["freq_dielectric", "internal_strain_tensor"])
+        assert outcar2._section_offsets["freq_dielectric"] is None
+        assert outcar2.dielectric_energies.shape == (0,)
+        assert len(outcar2.internal_strain_tensor) == 2
+
+        with pytest.raises(ValueError, match=r"Unknown sections \['lepsilon_tensor'\]"):
+            outcar2.read_sections(["lepsilon_tensor"])
+
     def test_core_state_eigen(self):
         filepath = f"{VASP_OUT_DIR}/OUTCAR.CL.gz"
         cl = Outcar(filepath).read_core_state_eigen()
@@ -1527,6 +1609,37 @@ class TestBSVasprun(MatSciTest):
         assert {*vrun_dct["output"]} >= {"eigenvalues", "eigenvalues_kpoints_opt"}
 
 
+class TestVasprunSummary(MatSciTest):
+    def test_relaxation(self):
+        filepath = f"{TEST_DIR}/fixtures/relaxation/vasprun.xml.gz"
+        vasprun = Vasprun(filepath, parse_potcar_file=False)
+        summary = VasprunSummary(filepath, parse_potcar_file=False)
+        assert summary.nionic_steps == vasprun.nionic_steps == 3
+        assert len(summary.ionic_steps) == 1
+        assert summary.ionic_steps[-1]["forces"] == approx(vasprun.ionic_steps[-1]["forces"])
+        assert summary.final_energy == approx(vasprun.final_energy)
+        assert summary.final_structure == vasprun.final_structure
+        assert summary.initial_structure == vasprun.initial_structure
+        assert summary.parameters == vasprun.parameters
+        assert summary.converged_ionic == vasprun.converged_ionic
+        assert summary.eigenvalues is None
+        assert summary.get_computed_entry().as_dict() == vasprun.get_computed_entry().as_dict()
+
+    def test_skipped_blocks(self):
+        filepath = f"{TEST_DIR}/fixtures/kpoints_opt/vasprun.xml.gz"
+        summary = VasprunSummary(filepath, parse_potcar_file=False)
+        assert summary.efermi is None
+        assert summary.eigenvalues is None
+        assert summary.kpoints_opt_props.eigenvalues is None
+        assert summary.final_energy == approx(Vasprun(filepath, parse_potcar_file=False).final_energy)
+
+        # MD steps of ML runs are counted without parsing them
+        summary = VasprunSummary(f"{VASP_OUT_DIR}/vasprun.ml_md.xml.gz", parse_potcar_file=False)
+        assert summary.nionic_steps == 20
+        assert summary.md_n_steps == 100
+        assert summary.converged_ionic
+
+
 class TestOszicar(MatSciTest):
     def test_init(self):
         fpath = f"{VASP_OUT_DIR}/OSZICAR"
@@ -1590,6 +1703,53 @@ class TestLocpot(MatSciTest):
         assert locpot.dim == (2, 2, 5)
         assert {str(ele) for ele in locpot.structure.composition} == {"Mg", "Si"}
 
+    def test_cache(self):
+        copyfile(f"{VASP_OUT_DIR}/LOCPOT.gz", filepath := f"{self.tmp_path}/LOCPOT.gz")
+        locpot = Locpot.from_file(filepath)
+        assert os.listdir(self.tmp_path) == ["LOCPOT.gz"]
+        Locpot.from_file(filepath, cache=True)
+        assert os.path.isfile(f"{filepath}.pmg_cache.npy")
+
+        cached = Locpot.from_file(filepath, cache=True)
+        assert isinstance(cached.data["total"], np.memmap)
+        assert_allclose(cached.data["total"], locpot.data["total"], rtol=0, atol=0)
+        assert cached.structure == locpot.structure
+        assert cached.name == locpot.name
+        assert_allclose(cached.get_average_along_axis(0), locpot.get_average_along_axis(0))
+        assert_allclose(cached.linear_slice([0, 0, 0], [1, 1, 1]), locpot.linear_slice([0, 0, 0], [1, 1, 1]))
+
+        # changes are not written to the cache
+        cached.data["total"][:] = 0
+        assert_allclose(Locpot.from_file(filepath, cache=True).data["total"], locpot.data["total"])
+
+        # the cache is not used once the file changes
+        os.utime(filepath, ns=(0, 0))
+        assert not isinstance(Locpot.from_file(filepath, cache=True).data["total"], np.memmap)
+
+        # the cache can be kept in another directory
+        Locpot.from_file(filepath, cache=(cache_dir := f"{self.tmp_path}/cache"))
+        assert len(os.listdir(cache_dir)) == 2
+        cached = Locpot.from_file(filepath, cache=cache_dir)
+        assert isinstance(cached.data["total"], np.memmap)
+        assert_allclose(cached.data["total"], locpot.data["total"], rtol=0, atol=0)
+
+        # memory maps that are not copy-on-write are copied into memory
+        np.save(npy_path := f"{self.tmp_path}/total.npy", locpot.data["total"])
+        poscar, _data, _data_aug = Locpot.parse_file(filepath)
+        read_only = Locpot(poscar, {"total": np.load(npy_path, mmap_mode="r")})
+        assert not isinstance(read_only.data["total"], np.memmap)
+        read_only.data["total"] += 1
+        assert_allclose(np.load(npy_path), locpot.data["total"])
+
+    @pytest.mark.skipif(h5py is None, reason="h5py required for HDF5 support.")
+    def test_hdf5_mmap(self):
+        locpot = Locpot.from_file(f"{VASP_OUT_DIR}/LOCPOT.gz")
+        locpot.to_hdf5(out_path := f"{self.tmp_path}/locpot.hdf5")
+        mapped = VolumetricData.from_hdf5(out_path, mmap=True)
+        assert isinstance(mapped.data["total"], np.memmap)
+        assert_allclose(mapped.data["total"], locpot.data["total"])
+        assert mapped.value_at(0.3, 0.2, 0.1) == approx(locpot.value_at(0.3, 0.2, 0.1))
+
 
 class TestChgcar(MatSciTest):
     @classmethod
@@ -1630,6 +1790,14 @@ class TestChgcar(MatSciTest):
         actual = self.chgcar_fe3o4.get_integrated_diff(0, 3, 6)
         assert_allclose(actual[:, 1], expected)
 
+    def test_parse_aug(self):
+        chgcar = Chgcar.from_file(f"{VASP_OUT_DIR}/CHGCAR.spin.gz", parse_aug=False)
+        assert chgcar.data_aug == {"total": None, "diff": None}
+        for key, data in self.chgcar_spin.data.items():
+            assert_allclose(chgcar.data[key], data)
+        assert self.chgcar_spin.data_aug["total"][0] == "augmentation occupancies   1  15\n"
+        assert self.chgcar_spin.data_aug["total"][-1] == "  0.600000000000E+00\n"
+
     def test_write(self):
         self.chgcar_spin.write_file(out_path := f"{self.tmp_path}/CHGCAR_pmg")
         with open(out_path, encoding="utf-8") as file:
@@ -1850,6 +2018,47 @@ class TestProcar(MatSciTest):
         d2 = procar.get_projection_on_elements(struct)
         assert d2[Spin.up][2][2] == approx({"Na": 0.688, "Li": 0.042})
 
+    def test_storage(self):
+        struct = Structure(Lattice.cubic(3.0), ["Li", "Li", "O"], [[0, 0, 0], [0.5, 0.5, 0.5], [0.25, 0.25, 0.25]])
+        procar = Procar(f"{VASP_OUT_DIR}/PROCAR.phase.gz")
+        elem_proj = procar.get_projection_on_elements(struct)
+
+        procar_f32 = Procar(f"{VASP_OUT_DIR}/PROCAR.phase.gz", storage="float32")
+        assert procar_f32.data[Spin.up].dtype == np.float32
+        assert procar_f32.phase_factors[Spin.up].dtype == np.complex64
+        assert_allclose(procar_f32.data[Spin.down], procar.data[Spin.down])
+
+        procar_sparse = Procar(f"{VASP_OUT_DIR}/PROCAR.phase.gz", storage="sparse")
+        shape = (procar.nkpoints * procar.nbands * procar.nions, len(procar.orbitals))
+        assert procar_sparse.data[Spin.up].shape == shape
+        assert procar_sparse.data[Spin.up].nnz == np.count_nonzero(procar.data[Spin.up])
+        assert_allclose(procar_sparse.data[Spin.up].toarray(), procar.data[Spin.up].reshape(shape))
+        assert procar_sparse.phase_factors[Spin.down].toarray()[0, 0] == approx(0.372 - 0.654j)
+
+        procar_summed = Procar(f"{VASP_OUT_DIR}/PROCAR.phase.gz", storage="summed")
+        assert procar_summed.data is None
+        assert procar_summed.phase_factors == {}
+        assert_allclose(procar_summed.ion_projections[Spin.up], procar.data[Spin.up].sum(axis=3))
+        assert_allclose(procar_summed.orbital_projections[Spin.up], procar.data[Spin.up].sum(axis=1))
+
+        for other in (procar_f32, procar_sparse, procar_summed):
+            for orbital in ("s", "px"):
+                for spin, occu in procar.get_occupation(2, orbital).items():
+                    assert other.get_occupation(2, orbital)[spin] == approx(occu, abs=1e-6)
+            other_proj = other.get_projection_on_elements(struct)
+            for spin in (Spin.up, Spin.down):
+                assert other_proj[spin][3][5] == approx(elem_proj[spin][3][5], abs=1e-6)
+
+        with pytest.raises(ValueError, match="Unknown storage='csr'"):
+            Procar(f"{VASP_OUT_DIR}/PROCAR.simple", storage="csr")
+
+        # SOC projections and multiple PROCARs
+        filepaths = [f"{VASP_OUT_DIR}/PROCAR.split1.gz", f"{VASP_OUT_DIR}/PROCAR.split2.gz"]
+        procar = Procar(filepaths)
+        procar_sparse = Procar(filepaths, storage="sparse")
+        assert_allclose(procar_sparse.xyz_data["x"].toarray(), procar.xyz_data["x"].reshape(-1, 9))
+        assert procar_sparse.get_occupation(1, "s") == approx(procar.get_occupation(1, "s"))
+
 
 class TestXdatcar:
     def test_init(self):
@@ -1891,6 +2100,65 @@ class TestXdatcar:
         # ensure XDATCAR can be read even when formatting is poor
         xdatcar = Xdatcar(f"{VASP_OUT_DIR}/XDATCAR.bad_fmt.gz")
         assert isinstance(xdatcar, Xdatcar)
+        lazy = Xdatcar(f"{VASP_OUT_DIR}/XDATCAR.bad_fmt.gz", lazy=True)
+        assert_allclose(lazy.get_frac_coords(), xdatcar.get_frac_coords())
+
+    def test_lazy(self):
+        for filename in ("XDATCAR_4", "XDATCAR_6", "XDATCAR_monatomic.gz"):
+            xdatcar = Xdatcar(f"{VASP_OUT_DIR}/{filename}")
+            lazy = Xdatcar(f"{VASP_OUT_DIR}/{filename}", lazy=True)
+            assert not isinstance(lazy.structures, list)
+            assert len(lazy) == len(xdatcar)
+            assert list(lazy) == xdatcar.structures
+            assert lazy[-1] == xdatcar[-1]
+            assert lazy[1:3] == xdatcar[1:3]
+            assert lazy.comment == xdatcar.comment
+            assert lazy.get_str() == xdatcar.get_str()
+
+            frac_coords = lazy.get_frac_coords()
+            assert frac_coords.shape == (len(xdatcar), len(xdatcar[0]), 3)
+            assert_allclose(frac_coords, xdatcar.get_frac_coords())
+            assert_allclose(lazy.get_lattices(), [struct.lattice.matrix for struct in xdatcar])
+
+        # ionic step range
+        xdatcar = Xdatcar(f"{VASP_OUT_DIR}/XDATCAR_6")
+        lazy = Xdatcar(f"{VASP_OUT_DIR}/XDATCAR_6", ionicstep_start=2, ionicstep_end=4, lazy=True)
+        assert list(lazy) == xdatcar.structures[1:3]
+        assert lazy.get_lattices()[0] != pytest.approx(lazy.get_lattices()[1])
+
+    def test_lazy_compressed_random_access(self, tmp_path):
+        xdatcar = Xdatcar(f"{VASP_OUT_DIR}/XDATCAR_6")
+        assert Xdatcar(f"{VASP_OUT_DIR}/XDATCAR_6", lazy=True).structures._decompressed is None
+        with open(f"{VASP_OUT_DIR}/XDATCAR_6", mode="rb") as file, gzip.open(f"{tmp_path}/XDATCAR.gz", "wb") as gz:
+            copyfileobj(file, gz)
+
+        # frames of compressed files are read from a decompressed copy made while indexing
+        lazy = Xdatcar(f"{tmp_path}/XDATCAR.gz", lazy=True)
+        assert lazy.structures._decompressed is not None
+        assert [lazy[idx] for idx in (3, 0, 2, 1)] == [xdatcar[idx] for idx in (3, 0, 2, 1)]
+        assert list(lazy) == xdatcar.structures
+        assert_allclose(lazy.get_frac_coords(), xdatcar.get_frac_coords())
+
+    def test_incomplete_last_frame(self, tmp_path):
+        xdatcar = Xdatcar(f"{VASP_OUT_DIR}/XDATCAR_5")
+        with open(f"{VASP_OUT_DIR}/XDATCAR_5", encoding="utf-8") as file:
+            lines = file.readlines()
+        with open(filepath := f"{tmp_path}/XDATCAR", mode="w", encoding="utf-8") as file:
+            file.writelines(lines[:-2])
+        for lazy in (False, True):
+            with pytest.warns(UserWarning, match="last frame .* is incomplete and is skipped, as it has 1 of 3 sites"):
+                truncated = Xdatcar(filepath, lazy=lazy)
+            assert list(truncated) == xdatcar.structures[:-1]
+
+    def test_get_trajectory(self):
+        xdatcar = Xdatcar(f"{VASP_OUT_DIR}/XDATCAR_6", lazy=True)
+        traj = xdatcar.get_trajectory(constant_lattice=False)
+        assert len(traj) == len(xdatcar)
+        assert traj[-1] == xdatcar[-1]
+        assert_allclose(traj.lattice[-1], xdatcar[-1].lattice.matrix)
+
+        traj = xdatcar.get_trajectory()
+        assert_allclose(traj.lattice, xdatcar[0].lattice.matrix)
 
 
 class TestDynmat:
@@ -1986,21 +2254,10 @@ class TestWavecar(MatSciTest):
             sys.stdout = saved_stdout
 
     def test_n2_45210(self):
-        wavecar = Wavecar(f"{VASP_OUT_DIR}/WAVECAR.N2.45210")
-        assert wavecar.filename == f"{VASP_OUT_DIR}/WAVECAR.N2.45210"
-        assert wavecar.efermi == approx(-5.7232, abs=1e-4)
-        assert wavecar.encut == approx(25.0)
-        assert wavecar.nb == 9
-        assert wavecar.nk == 1
-        assert_allclose(wavecar.a, self.latt_mat)
-        assert_allclose(wavecar.b, self.recip_latt_mat)
-        assert wavecar.vol == approx(self.vol)
-        assert len(wavecar.kpoints) == wavecar.nk
-        assert len(wavecar.coeffs) == wavecar.nk
-        assert len(wavecar.coeffs[0]) == wavecar.nb
-        assert len(wavecar.band_energy) == wavecar.nk
-        assert wavecar.band_energy[0].shape == (wavecar.nb, 3)
-        assert len(wavecar.Gpoints[0]) <= 257
+        # The records of this file only hold single precision coefficients,
+        # so they are too short for the double precision of rtag=45210
+        with pytest.raises(ValueError, match="Record of 2064 bytes is too short for 257 coefficients"):
+            Wavecar(f"{VASP_OUT_DIR}/WAVECAR.N2.45210")
 
     def test_n2_spin(self):
         w = Wavecar(f"{VASP_OUT_DIR}/WAVECAR.N2.spin")
@@ -2161,6 +2418,45 @@ class TestWavecar(MatSciTest):
         assert chgcar.data["total"].size == np.prod(wavecar.ng * 2)
         assert_allclose(chgcar.data["total"], 0.0)
 
+    def test_get_parchg_batched(self):
+        poscar = Poscar.from_file(f"{VASP_IN_DIR}/POSCAR")
+
+        wavecar = self.wavecar
+        meshes = wavecar.fft_mesh(0, [5, 2])
+        assert meshes.shape == (2, *wavecar.ng)
+        assert_allclose(meshes[0], wavecar.fft_mesh(0, 5))
+        assert_allclose(meshes[1], wavecar.fft_mesh(0, 2))
+
+        bands = range(wavecar.nb)
+        expected = sum(wavecar.get_parchg(poscar, 0, band, spin=0).data["total"] for band in bands)
+        for batch_size in (1, 4, 16):
+            chgcar = wavecar.get_parchg(poscar, 0, bands, spin=0, batch_size=batch_size)
+            assert_allclose(chgcar.data["total"], expected)
+
+        chgcar = wavecar.get_parchg(poscar, [0, 0], bands, spin=0, n_jobs=2)
+        assert_allclose(chgcar.data["total"], 2 * expected)
+
+        wavecar = Wavecar(f"{VASP_OUT_DIR}/WAVECAR.N2.spin")
+        single = [wavecar.get_parchg(poscar, 0, band, scale=1).data for band in (0, 3)]
+        chgcar = wavecar.get_parchg(poscar, 0, [0, 3], scale=1)
+        assert_allclose(chgcar.data["total"], single[0]["total"] + single[1]["total"])
+        assert_allclose(chgcar.data["diff"], single[0]["diff"] + single[1]["diff"])
+
+    def test_mmap(self):
+        for filename in ("WAVECAR.N2", "WAVECAR.N2.spin", "WAVECAR.H2_low_symm.gamma", "WAVECAR.H2.ncl"):
+            wavecar = Wavecar(f"{VASP_OUT_DIR}/{filename}")
+            wavecar_mmap = Wavecar(f"{VASP_OUT_DIR}/{filename}", mmap=True)
+            coeffs = wavecar.coeffs if wavecar.spin == 1 else wavecar.coeffs[1]
+            coeffs_mmap = wavecar_mmap.coeffs if wavecar.spin == 1 else wavecar_mmap.coeffs[1]
+            for k in range(wavecar.nk):
+                for b in range(wavecar.nb):
+                    assert_allclose(coeffs_mmap[k][b], coeffs[k][b])
+            assert_allclose(wavecar_mmap.fft_mesh(0, 1, spin=1), wavecar.fft_mesh(0, 1, spin=1))
+
+        wavecar = Wavecar(f"{VASP_OUT_DIR}/WAVECAR.N2", mmap=True)
+        assert wavecar.coeffs[0][0].dtype == np.complex64
+        assert not wavecar.coeffs[0][0].flags.writeable
+
     def test_write_unks(self):
         unk_std = Unk.from_file(f"{TEST_FILES_DIR}/io/wannier90/UNK.N2.std")
         unk_ncl = Unk.from_file(f"{TEST_FILES_DIR}/io/wannier90/UNK.H2.ncl")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from io import StringIO
+
 from pymatgen.util.io_utils import micro_pyawk
 from pymatgen.util.testing import VASP_OUT_DIR, MatSciTest
 
@@ -16,3 +18,8 @@ class TestFunc(MatSciTest):
 
         micro_pyawk(f"{VASP_OUT_DIR}/OUTCAR.gz", [["POTCAR:(.*)", f2, f]])
         assert len(data) == 6
+
+        # open text streams are searched directly
+        micro_pyawk(StringIO("POTCAR: PAW_PBE Li 17Jan2003\nNIONS = 1\n"), [["POTCAR:(.*)", f2, f]])
+        assert data[-1] == "PAW_PBE Li 17Jan2003"
+        assert len(data) == 7